@@ -7,7 +7,8 @@ interface for handling both HDF4 and HDF5 file formats (although the aim is
 to deprecate the former in the future), and includes utilities for managing
 PSI-specific data conventions.
 
-The public API is re-exported directly from :mod:`psi_io.psi_io`.  For
+The public API is re-exported directly from :mod:`psi_io.psi_io`; the
+:py:mod:`asyncio` versions of the readers live in :mod:`psi_io.aio`.  For
 example datasets used in the gallery examples, see the ``psi-data-utils``
 package (:mod:`psi_data`) and its `documentation
 <https://predsci.com/doc/psi-data-utils/index.html>`_.
@@ -18,12 +19,16 @@ from .mesh import *
 from .units import *
 from .models import *
 from .mhd_io import *
+from .migrate import *
+from .catalog import *
 
 __all__ = [*psi_io.__all__,
            *mesh.__all__,
            *units.__all__,
            *models.__all__,
-           *mhd_io.__all__]
+           *mhd_io.__all__,
+           *migrate.__all__,
+           *catalog.__all__]
 
 try:
     from importlib.metadata import version as _pkg_version
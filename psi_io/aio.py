@@ -0,0 +1,287 @@
+r"""Asynchronous (:py:mod:`asyncio`) front-end to the functional read API.
+
+The coroutines in this module mirror :func:`~psi_io.psi_io.read_hdf_data`,
+:func:`~psi_io.psi_io.read_hdf_by_index`, :func:`~psi_io.psi_io.read_hdf_by_value`,
+:func:`~psi_io.psi_io.read_hdf_by_ivalue`, :func:`~psi_io.psi_io.read_hdf_meta` and
+:func:`~psi_io.psi_io.np_interpolate_slice_from_hdf` – they take the same arguments
+and return the same values – but run the blocking read on a dedicated thread pool,
+so that the event loop keeps serving other requests in the meantime.
+
+Two limits apply to the reads submitted through this module:
+
+- at most :func:`configure_executor` ``max_workers`` reads run at once (the size of
+  the thread pool; :data:`AIO_MAX_WORKERS` by default);
+- reads of the same file are serialized: they wait for their turn *in the event
+  loop* rather than in a worker thread, so a slow file (*e.g.* on a congested NFS
+  mount) holds at most one worker, however many requests for it are pending.
+
+Because :py:mod:`pyhdf` is not thread-safe, all HDF4 files share a single turn.
+
+.. code-block:: python
+
+    from psi_io import aio
+
+    async def handler(request):
+        f, r, t, p = await aio.read_hdf_by_value(request.path, 15, None, None)
+        ...
+
+This module is not re-exported by :mod:`psi_io`, since its coroutines share the
+names of the synchronous readers; import it as ``from psi_io import aio``.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "read_hdf_data",
+    "read_hdf_by_index",
+    "read_hdf_by_value",
+    "read_hdf_by_ivalue",
+    "read_hdf_meta",
+    "np_interpolate_slice_from_hdf",
+    "configure_executor",
+    "shutdown_executor",
+]
+
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from psi_io import psi_io as _sync
+from psi_io.psi_io import PathLike, HdfDataMeta, _H4_LOCK
+
+
+AIO_MAX_WORKERS = 8
+"""Default maximum number of reads run concurrently by the coroutines of this module"""
+
+
+_H4_TURN = '<hdf4>'
+"""Serialization key shared by every HDF4 file (see :func:`_turn_key`)"""
+
+
+_EXECUTOR_LOCK = threading.Lock()
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_MAX_WORKERS = AIO_MAX_WORKERS
+
+_TURNS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+"""Per-event-loop mapping of serialization keys to ``[asyncio.Lock, n_pending]`` entries"""
+
+
+def configure_executor(max_workers: int) -> None:
+    """
+    Set the maximum number of reads run concurrently by :mod:`psi_io.aio`.
+
+    The current thread pool is shut down (without waiting: reads already
+    running complete in the background) and a new pool of *max_workers*
+    threads is created on the next read.
+
+    Parameters
+    ----------
+    max_workers : int
+        The maximum number of concurrent reads.
+
+    Raises
+    ------
+    ValueError
+        If *max_workers* is not a positive integer.
+
+    Examples
+    --------
+    >>> from psi_io import aio
+    >>> aio.configure_executor(32)
+    >>> aio.configure_executor(aio.AIO_MAX_WORKERS)
+    """
+    global _MAX_WORKERS
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be a positive integer; got {max_workers}")
+    with _EXECUTOR_LOCK:
+        _MAX_WORKERS = int(max_workers)
+        _shutdown(wait=False)
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    """
+    Shut down the thread pool of :mod:`psi_io.aio`.
+
+    A new pool is created on the next read, so this is mostly useful at
+    application shutdown (or in tests).
+
+    Parameters
+    ----------
+    wait : bool, optional
+        If ``True`` (default), wait for the running reads to complete.
+
+    Examples
+    --------
+    >>> from psi_io import aio
+    >>> aio.shutdown_executor()
+    """
+    with _EXECUTOR_LOCK:
+        _shutdown(wait)
+
+
+async def read_hdf_data(ifile: PathLike, /, *args, **kwargs) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """
+    Asynchronous version of :func:`~psi_io.psi_io.read_hdf_data`.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from psi_io import aio
+    >>> from psi_data import fetch_mas_data
+    >>> data, r, t, p = asyncio.run(aio.read_hdf_data(fetch_mas_data().cor_br))
+    >>> data.shape
+    (299, 142, 255)
+    """
+    return await _run(_sync.read_hdf_data, ifile, *args, **kwargs)
+
+
+async def read_hdf_by_index(ifile: PathLike, /, *xi, **kwargs) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """
+    Asynchronous version of :func:`~psi_io.psi_io.read_hdf_by_index`.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from psi_io import aio
+    >>> from psi_data import fetch_mas_data
+    >>> f, r, t, p = asyncio.run(aio.read_hdf_by_index(fetch_mas_data().cor_br, 0, None, None))
+    >>> f.shape
+    (299, 142, 1)
+    """
+    return await _run(_sync.read_hdf_by_index, ifile, *xi, **kwargs)
+
+
+async def read_hdf_by_value(ifile: PathLike, /, *xi, **kwargs) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """
+    Asynchronous version of :func:`~psi_io.psi_io.read_hdf_by_value`.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from psi_io import aio
+    >>> from psi_data import fetch_mas_data
+    >>> f, r, t, p = asyncio.run(aio.read_hdf_by_value(fetch_mas_data().cor_br, 15, None, None))
+    >>> f.shape
+    (299, 142, 2)
+    """
+    return await _run(_sync.read_hdf_by_value, ifile, *xi, **kwargs)
+
+
+async def read_hdf_by_ivalue(ifile: PathLike, /, *xi, **kwargs) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """
+    Asynchronous version of :func:`~psi_io.psi_io.read_hdf_by_ivalue`.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from psi_io import aio
+    >>> from psi_data import fetch_mas_data
+    >>> f, *_ = asyncio.run(aio.read_hdf_by_ivalue(fetch_mas_data().cor_br, 2.7, None, None))
+    >>> f.shape
+    (299, 142, 2)
+    """
+    return await _run(_sync.read_hdf_by_ivalue, ifile, *xi, **kwargs)
+
+
+async def read_hdf_meta(ifile: PathLike, /, *args, **kwargs) -> List[HdfDataMeta]:
+    """
+    Asynchronous version of :func:`~psi_io.psi_io.read_hdf_meta`.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from psi_io import aio
+    >>> from psi_data import fetch_mas_data
+    >>> meta, = asyncio.run(aio.read_hdf_meta(fetch_mas_data().cor_br))  # doctest: +SKIP
+    >>> meta.shape  # doctest: +SKIP
+    (299, 142, 255)
+    """
+    return await _run(_sync.read_hdf_meta, ifile, *args, **kwargs)
+
+
+async def np_interpolate_slice_from_hdf(ifile: PathLike, /, *xi, **kwargs) -> Tuple[np.ndarray, ...]:
+    """
+    Asynchronous version of :func:`~psi_io.psi_io.np_interpolate_slice_from_hdf`.
+
+    The bracketing read and the interpolation both run in the worker thread.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from psi_io import aio
+    >>> from psi_data import fetch_mas_data
+    >>> f, t, p = asyncio.run(aio.np_interpolate_slice_from_hdf(fetch_mas_data().cor_br, 15, None, None))
+    >>> f.shape
+    (299, 142)
+    """
+    return await _run(_sync.np_interpolate_slice_from_hdf, ifile, *xi, **kwargs)
+
+
+async def _run(func: Callable, ifile: PathLike, /, *args, **kwargs) -> Any:
+    """Run ``func(ifile, *args, **kwargs)`` on the thread pool, once it is the turn of *ifile*.
+
+    Cancelling the awaiting task releases the turn, but a read already
+    started in a worker runs to completion.
+    """
+    loop = asyncio.get_running_loop()
+    async with _turn(loop, _turn_key(ifile)):
+        return await loop.run_in_executor(_executor(), partial(_call, func, ifile, *args, **kwargs))
+
+
+def _call(func: Callable, ifile: PathLike, /, *args, **kwargs) -> Any:
+    """Call *func* in a worker thread, holding the process-wide HDF4 lock for HDF4 files."""
+    if Path(ifile).suffix == '.hdf':
+        with _H4_LOCK:
+            return func(ifile, *args, **kwargs)
+    return func(ifile, *args, **kwargs)
+
+
+def _turn_key(ifile: PathLike) -> str:
+    """Return the key that reads of *ifile* are serialized on: its absolute path (or :data:`_H4_TURN`).
+
+    The path is made absolute lexically, without resolving symbolic links, since this
+    runs on the event loop and must not touch the filesystem.
+    """
+    if Path(ifile).suffix == '.hdf':
+        return _H4_TURN
+    return os.path.abspath(os.fspath(ifile))
+
+
+@asynccontextmanager
+async def _turn(loop: asyncio.AbstractEventLoop, key: str):
+    """Hold the turn of *key* in *loop*; the lock of a key is dropped once no read is pending on it."""
+    turns: Dict[str, list] = _TURNS.setdefault(loop, {})
+    entry = turns.setdefault(key, [asyncio.Lock(), 0])
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del turns[key]
+
+
+def _executor() -> ThreadPoolExecutor:
+    """Return the thread pool of this module, creating it on first use."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix='psi_io.aio')
+        return _EXECUTOR
+
+
+def _shutdown(wait: bool) -> None:
+    """Shut down and forget the thread pool; the caller holds :data:`_EXECUTOR_LOCK`."""
+    global _EXECUTOR
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=wait)
+        _EXECUTOR = None
@@ -0,0 +1,412 @@
+r"""Persistent, incrementally updated catalog of the HDF files of a run directory.
+
+Finding *e.g.* every ``vr`` file between sequences 100 and 500 on a given grid
+otherwise means calling :func:`~psi_io.psi_io.read_hdf_meta` on every file of a
+(possibly very large) output directory.  An :class:`HdfCatalog` scans the
+directory once – in parallel, since :py:mod:`pyhdf` is not thread-safe the files
+are spread across a *process* pool – and stores the quantity and sequence number
+parsed from each file name (see :func:`~psi_io.models.extract_quantity_from_filepath`
+and :func:`~psi_io.models.extract_sequence_from_filepath`) together with the
+shape, dtype, scale ranges and attributes of each dataset in a local SQLite
+database.  Later updates only re-scan the files added or modified (by
+modification time and size) since, and queries are answered from the database
+alone.
+
+.. code-block:: python
+
+    from psi_io.catalog import HdfCatalog
+
+    with HdfCatalog('/data/mas_run') as catalog:
+        catalog.update(workers=16)
+        entries = catalog.query('vr', sequence=(100, 500), shape=(255, 142, 300))
+        paths = [entry.path for entry in entries]
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "HdfCatalog",
+    "CatalogEntry",
+    "CatalogUpdateInfo",
+]
+
+import json
+import os
+import sqlite3
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence, Dict, List, Tuple, Union, Iterable, Any
+
+import numpy as np
+
+from psi_io.psi_io import PathLike, HdfScaleMeta, read_hdf_meta, find_hdf_files, _file_stat
+from psi_io.models import extract_quantity_from_filepath, extract_sequence_from_filepath
+
+
+CATALOG_NAME = "psi_io_catalog.sqlite"
+"""Default file name of the catalog database (written to the catalogued directory)"""
+
+
+_CATALOG_VERSION = 1
+"""Schema version of the catalog database (stored as its ``user_version``)"""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    quantity TEXT,
+    sequence INTEGER,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS datasets (
+    path TEXT NOT NULL REFERENCES files (path) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    shape TEXT NOT NULL,
+    attr TEXT NOT NULL,
+    scales TEXT NOT NULL,
+    PRIMARY KEY (path, name)
+);
+CREATE INDEX IF NOT EXISTS files_quantity_sequence ON files (quantity, sequence);
+CREATE INDEX IF NOT EXISTS datasets_shape ON datasets (shape);
+"""
+
+
+CatalogEntry = namedtuple('CatalogEntry', ['path', 'quantity', 'sequence', 'name', 'type', 'shape', 'attr', 'scales'])
+CatalogEntry.__doc__ = """
+    A dataset recorded in an :class:`HdfCatalog`.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path to the HDF file.
+    quantity : str | None
+        The quantity parsed from the file name, if any.
+    sequence : int | None
+        The sequence number parsed from the file name, if any.
+    name : str
+        The dataset identifier.
+    type : numpy.dtype
+        The data type of the dataset.
+    shape : tuple[int, ...]
+        The shape of the dataset (as returned by :func:`~psi_io.psi_io.read_hdf_meta`).
+    attr : dict[str, Any]
+        The attributes of the dataset, as stored in JSON: arrays are returned as
+        lists, and values that JSON cannot represent as strings.
+    scales : list[HdfScaleMeta]
+        The name, type, length and range (``imin``/``imax``) of each scale, in
+        the PSI (:math:`r, \\theta, \\phi`) dimension order; their ``attr`` are empty.
+    """
+
+
+CatalogUpdateInfo = namedtuple('CatalogUpdateInfo', ['scanned', 'unchanged', 'removed', 'failed'])
+CatalogUpdateInfo.__doc__ = """
+    Named tuple reporting the outcome of :meth:`HdfCatalog.update`.
+
+    Parameters
+    ----------
+    scanned : int
+        Number of new or modified files whose metadata were read.
+    unchanged : int
+        Number of files that were already up to date in the catalog.
+    removed : int
+        Number of files dropped from the catalog since they no longer exist.
+    failed : int
+        Number of scanned files whose metadata could not be read.
+    """
+
+
+class HdfCatalog:
+    """Queryable SQLite index of the HDF files below a directory.
+
+    The catalog records, for every HDF4 (``.hdf``) and HDF5 (``.h5``) file selected
+    by ``pattern``, the quantity and sequence number parsed from its name and the
+    metadata of each of its datasets (see :class:`CatalogEntry`).  Paths are stored
+    relative to ``root``, so the directory can be moved along with its catalog.
+
+    Parameters
+    ----------
+    root : PathLike
+        The directory to catalog.
+    catalog : PathLike, optional
+        The path to the SQLite database, created if needed.  If ``None``,
+        :data:`CATALOG_NAME` in ``root`` is used.
+    pattern : str, optional
+        The glob pattern (relative to ``root``) selecting the files to catalog;
+        files without an ``.hdf`` or ``.h5`` extension are ignored.  Default is
+        ``'**/*'``.
+
+    Notes
+    -----
+    An :class:`HdfCatalog` is a context manager; the database connection is
+    closed on exit (or by :meth:`close`).  The catalog is empty until
+    :meth:`update` is first called.
+
+    Files whose metadata cannot be read are recorded (see :attr:`errors`) rather
+    than aborting the update; like every other file they are only re-scanned
+    once modified.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data
+    >>> from psi_io.catalog import HdfCatalog
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     for seq in (1, 2, 3):
+    ...         _ = write_hdf_data(Path(d) / f"vr00{seq}.h5", np.ones((4, 3), dtype=np.float32))
+    ...     with HdfCatalog(d) as catalog:
+    ...         catalog.update(workers=1)
+    ...         [entry.path.name for entry in catalog.query('vr', sequence=(2, None))]
+    CatalogUpdateInfo(scanned=3, unchanged=0, removed=0, failed=0)
+    ['vr002.h5', 'vr003.h5']
+    """
+
+    def __init__(self,
+                 root: PathLike,
+                 catalog: Optional[PathLike] = None,
+                 pattern: str = "**/*"):
+        self._root = Path(root)
+        if not self._root.is_dir():
+            raise NotADirectoryError(f"'{self._root}' is not a directory")
+        self._path = Path(catalog) if catalog is not None else self._root / CATALOG_NAME
+        self._pattern = pattern
+        self._db = _connect(self._path)
+
+    def __enter__(self) -> 'HdfCatalog':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def __repr__(self) -> str:
+        state = 'closed' if self.closed else f'{len(self)} files'
+        return f"<{type(self).__name__} '{self._root}' ({state})>"
+
+    @property
+    def root(self) -> Path:
+        """The catalogued directory."""
+        return self._root
+
+    @property
+    def path(self) -> Path:
+        """The path to the catalog database."""
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        """Whether the database connection has been closed."""
+        return self._db is None
+
+    @property
+    def errors(self) -> Dict[Path, str]:
+        """The files whose metadata could not be read, mapped to the error message."""
+        rows = self._execute("SELECT path, error FROM files WHERE error IS NOT NULL ORDER BY path")
+        return {self._root / path: error for path, error in rows}
+
+    def update(self,
+               workers: Optional[int] = None,
+               force: bool = False,
+               ) -> CatalogUpdateInfo:
+        """
+        Bring the catalog up to date with the files on disk.
+
+        New files and files whose modification time or size changed are scanned
+        (in parallel), and files that no longer exist are dropped.
+
+        Parameters
+        ----------
+        workers : int, optional
+            The number of worker processes.  If ``None``, :func:`os.cpu_count` is
+            used; ``1`` scans the files sequentially in the calling process.
+        force : bool, optional
+            If ``True``, re-scan every file.  Default is ``False``.
+
+        Returns
+        -------
+        out : CatalogUpdateInfo
+            The number of files scanned, unchanged, removed and failed.
+
+        Raises
+        ------
+        ValueError
+            If the catalog is closed.
+        """
+        _, sources = find_hdf_files(self._root, self._pattern)
+        stats = {}
+        for src in sources:
+            if src.suffix in ('.hdf', '.h5'):
+                stats[src.relative_to(self._root).as_posix()] = _file_stat(src)
+        known = {path: (mtime_ns, size)
+                 for path, mtime_ns, size in self._execute("SELECT path, mtime_ns, size FROM files")}
+
+        removed = [path for path in known if path not in stats]
+        pending = [path for path, stat in stats.items() if force or known.get(path) != stat]
+        failed = 0
+        with self._db:
+            self._db.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in removed])
+            for path, (stat, meta, error) in zip(pending, _scan_files([self._root / p for p in pending], workers)):
+                self._db.execute("DELETE FROM files WHERE path = ?", (path,))
+                self._db.execute("INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                                 (path, *stat, *_parse_filename(Path(path)), error))
+                self._db.executemany("INSERT INTO datasets VALUES (?, ?, ?, ?, ?, ?)",
+                                     [(path, *row) for row in meta])
+                failed += error is not None
+        return CatalogUpdateInfo(len(pending), len(stats) - len(pending), len(removed), failed)
+
+    def query(self,
+              quantity: Union[str, Sequence[str], None] = None,
+              sequence: Union[int, Tuple[Optional[int], Optional[int]], None] = None,
+              shape: Optional[Sequence[int]] = None,
+              dtype: Any = None,
+              dataset_id: Optional[str] = None,
+              ) -> List[CatalogEntry]:
+        """
+        Return the catalogued datasets matching every given criterion.
+
+        Parameters
+        ----------
+        quantity : str | Sequence[str], optional
+            The quantity (or quantities) parsed from the file names, *e.g.* ``'vr'``.
+        sequence : int | tuple[int | None, int | None], optional
+            A sequence number, or an inclusive ``(first, last)`` range (either
+            bound may be ``None``).
+        shape : Sequence[int], optional
+            The dataset shape (in the order of :func:`~psi_io.psi_io.read_hdf_meta`).
+        dtype : DTypeLike, optional
+            The dataset data type (byte order is ignored).
+        dataset_id : str, optional
+            The dataset identifier, *e.g.* ``'Data'``.
+
+        Returns
+        -------
+        out : list[CatalogEntry]
+            The matching datasets, ordered by quantity, sequence, path and name.
+
+        Raises
+        ------
+        ValueError
+            If the catalog is closed.
+        """
+        clauses, params = [], []
+        if quantity is not None:
+            quantities = [quantity] if isinstance(quantity, str) else list(quantity)
+            clauses.append(f"f.quantity IN ({', '.join('?' * len(quantities))})")
+            params.extend(q.lower() for q in quantities)
+        if sequence is not None:
+            first, last = (sequence, sequence) if np.isscalar(sequence) else sequence
+            if first is not None:
+                clauses.append("f.sequence >= ?")
+                params.append(int(first))
+            if last is not None:
+                clauses.append("f.sequence <= ?")
+                params.append(int(last))
+        if shape is not None:
+            clauses.append("d.shape = ?")
+            params.append(json.dumps([int(n) for n in shape]))
+        if dtype is not None:
+            clauses.append("d.type = ?")
+            params.append(np.dtype(dtype).name)
+        if dataset_id is not None:
+            clauses.append("d.name = ?")
+            params.append(dataset_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._execute("SELECT f.path, f.quantity, f.sequence, d.name, d.type, d.shape, d.attr, d.scales "
+                             "FROM datasets d JOIN files f USING (path) "
+                             f"{where} ORDER BY f.quantity, f.sequence, f.path, d.name", params)
+        return [CatalogEntry(self._root / path, quantity, sequence, name, np.dtype(type_),
+                             tuple(json.loads(shape)), json.loads(attr),
+                             [HdfScaleMeta(name_, np.dtype(type_), tuple(shape_), {}, imin, imax)
+                              for name_, type_, shape_, imin, imax in json.loads(scales)])
+                for path, quantity, sequence, name, type_, shape, attr, scales in rows]
+
+    def close(self) -> None:
+        """Close the database connection.  Closing a closed catalog has no effect."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """Execute a read-only statement on the database."""
+        if self._db is None:
+            raise ValueError("I/O operation on a closed catalog")
+        return self._db.execute(sql, params)
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Open (creating or, after a schema change, rebuilding) the catalog database at *path*."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA foreign_keys = ON")
+    db.execute("PRAGMA journal_mode = WAL")
+    if db.execute("PRAGMA user_version").fetchone()[0] != _CATALOG_VERSION:
+        with db:
+            db.execute("DROP TABLE IF EXISTS datasets")
+            db.execute("DROP TABLE IF EXISTS files")
+            db.execute(f"PRAGMA user_version = {_CATALOG_VERSION}")
+    db.executescript(_SCHEMA)
+    return db
+
+
+def _parse_filename(ifile: Path) -> Tuple[Optional[str], Optional[int]]:
+    """Return the quantity and sequence number parsed from the name of *ifile*."""
+    return extract_quantity_from_filepath(ifile), extract_sequence_from_filepath(ifile)
+
+
+def _scan_files(paths: Sequence[Path], workers: Optional[int]) -> Iterable[Tuple]:
+    """Run :func:`_scan_one` over *paths*, yielding the results in order."""
+    if not paths:
+        return
+    if workers == 1 or len(paths) == 1:
+        yield from map(_scan_one, paths)
+        return
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_scan_one, paths, chunksize=max(1, len(paths) // (4 * workers)))
+
+
+def _scan_one(ifile: Path) -> Tuple[Tuple[int, int], List[Tuple], Optional[str]]:
+    """Read the metadata of one file as ``(stat, rows, error)``.
+
+    The file is stat'ed before it is read, so that a file modified meanwhile is
+    re-scanned by the next update.  Errors are caught and returned so that one bad
+    file does not abort an update.
+    """
+    stat = _file_stat(ifile)
+    try:
+        rows = [_dataset_row(meta, ifile.suffix == '.hdf') for meta in read_hdf_meta(ifile)]
+    except Exception as e:
+        return stat, [], f"{type(e).__name__}: {e}"
+    return stat, rows, None
+
+
+def _dataset_row(meta, hdf4: bool) -> Tuple[str, str, str, str, str]:
+    """Return the ``datasets`` columns (but the path) of the :class:`~psi_io.psi_io.HdfDataMeta` *meta*.
+
+    HDF4 scales are listed in the array dimension order, and are reversed into the
+    PSI dimension order of HDF5 scales.
+    """
+    scales = reversed(meta.scales) if hdf4 else meta.scales
+    return (meta.name,
+            np.dtype(meta.type).name,
+            json.dumps([int(n) for n in meta.shape]),
+            json.dumps(meta.attr, default=_json_default),
+            json.dumps([[s.name, np.dtype(s.type).name, [int(n) for n in s.shape], s.imin, s.imax]
+                        for s in scales], default=_json_default))
+
+
+def _json_default(value: Any) -> Any:
+    """Convert the values found in HDF attributes that :py:mod:`json` cannot serialize."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+    return str(value)
@@ -85,6 +85,10 @@ Public API
 :func:`remesh_array`
     Shift an array from one mesh stagger to another by averaging adjacent elements
     along each axis that needs to move from half mesh to main mesh.
+:func:`coarsen_array`, :func:`coarsen_scale`
+    Halve the resolution of an array (or a coordinate scale) while keeping its
+    mesh stagger, *e.g.* to build the overview levels of a multi-resolution
+    pyramid.
 
 Examples
 --------
@@ -110,6 +114,8 @@ from __future__ import annotations
 __all__ = [
     "Mesh",
     "remesh_array",
+    "coarsen_array",
+    "coarsen_scale",
 ]
 
 import functools
@@ -989,3 +995,207 @@ def remesh_array(data: np.ndarray,
         return data
     remesh = Mesh.parse(imesh, data.ndim).remesh(omesh)
     return _remesh_array(data, remesh, order=order)
+
+
+def _coarsen_indices(n: int) -> np.ndarray:
+    """Return the fine main-mesh nodes kept when an axis of *n* nodes is coarsened by two.
+
+    Every other node is kept, together with the last node when *n* is even, so
+    that the coarse axis spans the same interval as the fine one.
+
+    Examples
+    --------
+    >>> from psi_io.mesh import _coarsen_indices
+    >>> _coarsen_indices(5)
+    array([0, 2, 4])
+    >>> _coarsen_indices(6)
+    array([0, 2, 4, 5])
+    """
+    index = np.arange(0, n, 2)
+    if n > 1 and not n % 2:
+        index = np.append(index, n - 1)
+    return index
+
+
+def _coarsen_main(arr: np.ndarray,
+                  axis: int,
+                  weighted: bool = True
+                  ) -> np.ndarray:
+    """Coarsen a main-mesh axis by two, keeping every other node and both boundary nodes.
+
+    Interior nodes are full-weighted (``0.25, 0.5, 0.25``) with their
+    neighbours when *weighted* is ``True``; nodes on the boundary (or with
+    *weighted* ``False``) are injected unchanged.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.mesh import _coarsen_main
+    >>> _coarsen_main(np.array([0., 4., 0., 4., 0.]), axis=0)
+    array([0., 2., 0.])
+    >>> _coarsen_main(np.array([0., 4., 0., 4., 0., 4.]), axis=0)
+    array([0., 2., 2., 4.])
+    >>> _coarsen_main(np.array([0., 4., 0., 4., 0., 4.]), axis=0, weighted=False)
+    array([0., 0., 0., 4.])
+    """
+    keep = _coarsen_indices(arr.shape[axis])
+    centre = np.take(arr, keep, axis=axis)
+    inner = keep[1:-1]
+    if not weighted or not inner.size:
+        return centre * 1.0
+    out = centre * 1.0
+    lower = np.take(arr, inner - 1, axis=axis)
+    upper = np.take(arr, inner + 1, axis=axis)
+    index = [slice(None)] * arr.ndim
+    index[axis] = slice(1, 1 + inner.size)
+    out[tuple(index)] = 0.5 * out[tuple(index)] + 0.25 * (lower + upper)
+    return out
+
+
+def _coarsen_half(arr: np.ndarray,
+                  axis: int
+                  ) -> np.ndarray:
+    """Coarsen a half-mesh axis by two, averaging pairs of interior cells.
+
+    The half mesh of an axis with ``n`` main-mesh nodes has ``n + 1`` points:
+    a ghost cell on each side and ``n - 1`` interior cells.  The coarse cell
+    between coarse nodes ``x[2j - 2]`` and ``x[2j]`` is the average of the two
+    fine cells it contains; when ``n`` is even, the last coarse cell (between
+    ``x[n - 2]`` and ``x[n - 1]``) is a single fine cell and is carried over
+    unchanged.  The ghost cells are rebuilt from the coarse interior cells so
+    that the boundary values, midway between a ghost and its neighbouring
+    interior cell, are unchanged: a ghost mirroring the first (last) interior
+    cell about the boundary node remains such a mirror on the coarse mesh.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.mesh import _coarsen_half
+    >>> _coarsen_half(np.array([-1., 1., 3., 5., 7., 9.]), axis=0)
+    array([-2.,  2.,  6., 10.])
+    >>> _coarsen_half(np.array([-1., 1., 3., 5., 7., 9., 11.]), axis=0)
+    array([-2.,  2.,  6.,  9., 11.])
+    """
+    m = arr.shape[axis]
+    if m < 3:
+        return arr * 1.0
+    npairs = (m - 2) // 2
+    lower = np.take(arr, np.arange(1, 2 * npairs, 2), axis=axis)
+    upper = np.take(arr, np.arange(2, 2 * npairs + 1, 2), axis=axis)
+    tail = np.take(arr, np.arange(2 * npairs + 1, m - 1), axis=axis)
+    inner = np.concatenate([0.5 * (lower + upper), tail], axis=axis)
+    # boundary value = (ghost + first interior cell) / 2, on the fine and the coarse mesh alike
+    first = (np.take(arr, [0], axis=axis) + np.take(arr, [1], axis=axis)
+             - np.take(inner, [0], axis=axis))
+    last = (np.take(arr, [m - 1], axis=axis) + np.take(arr, [m - 2], axis=axis)
+            - np.take(inner, [-1], axis=axis))
+    return np.concatenate([first, inner, last], axis=axis)
+
+
+def coarsen_array(data: np.ndarray,
+                  imesh: MeshLike = 'main',
+                  order: ArrayOrdering = 'F',
+                  levels: int = 1) -> np.ndarray:
+    r"""Halve the resolution of an array along every axis, keeping its mesh stagger.
+
+    Each level coarsens every axis by a factor of two with a block average
+    that respects the staggering of the axis:
+
+    - **Main mesh** — every other node is kept (``x[::2]``, plus the last node
+      when the axis has an even number of nodes, so that the coarse axis spans
+      the same interval), and interior nodes are full-weighted with their
+      neighbours (weights ``1/4, 1/2, 1/4``).  Boundary nodes are kept unchanged.
+    - **Half mesh** — each coarse cell is the average of the two fine cells it
+      contains (or the single fine cell of a last, one-cell-wide coarse
+      interval), so that the coarse half mesh again lies halfway between the
+      coarse main-mesh nodes.  The ghost cells at either end are rebuilt so that
+      the boundary values (the averages of a ghost and its neighbouring interior
+      cell) are kept unchanged.
+
+    An axis with :math:`n` main-mesh nodes therefore becomes an axis with
+    :math:`\lfloor n / 2 \rfloor + 1` nodes (for :math:`n > 1`), and its half mesh
+    shrinks from :math:`n + 1` to :math:`\lfloor n / 2 \rfloor + 2` points, so coarsened
+    arrays can still be remeshed with :func:`remesh_array`.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Input array on the stagger described by *imesh*.
+    imesh : MeshLike, optional
+        Mesh stagger of *data* in any form accepted by :data:`MeshLike`.
+        Default is ``'main'``.
+    order : ArrayOrdering, optional
+        Memory-order convention controlling how mesh-code bits map to numpy
+        axes; see :data:`ArrayOrdering`.  Default is ``'F'``.
+    levels : int, optional
+        Number of times to coarsen the array.  Default is ``1``.
+
+    Returns
+    -------
+    out : np.ndarray
+        The coarsened array, in floating point.
+
+    See Also
+    --------
+    coarsen_scale : Coarsen a coordinate scale to match.
+    remesh_array : Move an array between mesh staggers.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.mesh import coarsen_array
+    >>> br = np.ones((128, 64, 57))   # shape (Nφ, Nθ, Nr); Nr is half-mesh size
+    >>> coarsen_array(br, imesh=0b100).shape
+    (65, 33, 30)
+    >>> coarsen_array(br, imesh=0b100, levels=2).shape
+    (33, 17, 16)
+    """
+    mesh = Mesh.parse(imesh, data.ndim)
+    flags = tuple(mesh)
+    if order == 'F':
+        flags = flags[::-1]
+    for _ in range(levels):
+        for axis, half in enumerate(flags):
+            data = _coarsen_half(data, axis) if half else _coarsen_main(data, axis)
+    return data
+
+
+def coarsen_scale(scale: np.ndarray,
+                  half: bool = False,
+                  levels: int = 1) -> np.ndarray:
+    """Coarsen a coordinate scale to match :func:`coarsen_array`.
+
+    Main-mesh scales keep every other node (no weighting is applied to the
+    coordinates); half-mesh scales are averaged as in :func:`coarsen_array`,
+    and their ghost points are rebuilt to mirror the coarse interior points
+    about the boundaries.
+
+    Parameters
+    ----------
+    scale : np.ndarray
+        One-dimensional coordinate array.
+    half : bool, optional
+        Whether the scale lies on the half mesh.  Default is ``False``.
+    levels : int, optional
+        Number of times to coarsen the scale.  Default is ``1``.
+
+    Returns
+    -------
+    out : np.ndarray
+        The coarsened scale, in the dtype of *scale*.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.mesh import coarsen_scale
+    >>> coarsen_scale(np.arange(5.0))
+    array([0., 2., 4.])
+    >>> coarsen_scale(np.arange(6.0))
+    array([0., 2., 4., 5.])
+    >>> coarsen_scale(np.arange(6.0) - 0.5, half=True)
+    array([-1.,  1.,  3.,  5.])
+    """
+    out = np.asarray(scale)
+    for _ in range(levels):
+        out = _coarsen_half(out, 0) if half else _coarsen_main(out, 0, weighted=False)
+    return out.astype(np.asarray(scale).dtype, copy=False)
@@ -62,7 +62,7 @@ from abc import abstractmethod, ABC
 from collections import namedtuple, UserDict
 from collections.abc import Sequence, Iterable, Collection
 from functools import partial
-from itertools import repeat, chain
+from itertools import repeat, chain, product
 from pathlib import Path
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Optional, Literal, ClassVar, Mapping
@@ -71,13 +71,10 @@ import h5py as h5
 import astropy.units as u
 from astropy.table import QTable
 from numpy.lib.recfunctions import structured_to_unstructured
-try:
-    from scipy.interpolate import RegularGridInterpolator
-except ImportError:
-    RegularGridInterpolator = None  # type: ignore[assignment,misc]
 
 if TYPE_CHECKING:
     from astropy.units.typing import UnitLike, QuantityLike
+    from numpy.typing import DTypeLike
 
 try:
     import pyhdf.SD as h4
@@ -98,9 +95,34 @@ from psi_io.models import (ModelType,
 from psi_io.units import decompose_mas_units
 from psi_io.psi_io import (PathLike,
                            PSI_DATA_ID,
+                           CONVERT_SLAB_NBYTES,
+                           READ_STRATEGIES,
+                           InterpolationPlan,
+                           PointQuery,
+                           RegridPlan,
                            SDC_TYPE_CONVERSIONS,
+                           BufferPool,
+                           _default_tile_shape,
                            _dispatch_by_ext,
-                           _except_no_scipy, )
+                           _H4_LOCK,
+                           _h5_memmap,
+                           _h5_read_direct,
+                           _h5_read_points,
+                           _h5_sequence_scales,
+                           _interpolate_by_points,
+                           _interpolate_by_tile,
+                           _level_dataset_id,
+                           _linear_interpolator,
+                           _NpGridInterpolator,
+                           _plan_positions,
+                           _planned_window,
+                           _read_h4_slabs,
+                           _read_only,
+                           _refresh_h5_dataset,
+                           _resolve_out,
+                           _selection_shape,
+                           _storage_layout,
+                           _META_CACHE, )
 
 class MetaDataWarning(UserWarning):
     """Warning raised when HDF metadata is missing, ambiguous, or inconsistent.
@@ -174,7 +196,7 @@ _BASE_SLOTS = ('_ref', '_id', '_cache', '_name', '_desc', '_unit', '_scalar', '_
 _SCALE_SLOTS = _BASE_SLOTS
 """Slot names for :class:`_HdfScale` subclasses (identical to :data:`_BASE_SLOTS`)."""
 
-_DATA_SLOTS = _BASE_SLOTS + ('_filepath', '_sequence', '_model', '_scales', '_icache')
+_DATA_SLOTS = _BASE_SLOTS + ('_filepath', '_sequence', '_model', '_scales', '_icache', '_levels', '_swmr')
 """Slot names for :class:`_HdfData` subclasses; extends :data:`_BASE_SLOTS` with data-reader fields."""
 
 
@@ -224,17 +246,25 @@ unit : str
     String representation of the coordinate unit.
 """
 
-CacheType = Optional[Literal['lazy', 'eager']]
-"""Type alias for the three valid cache modes.
+CacheType = Optional[Literal['lazy', 'eager', 'mmap']]
+"""Type alias for the four valid cache modes.
 
 ``'lazy'``
     Cache the full data array on the first full-array read.
 ``'eager'``
     Cache immediately at construction time via :meth:`_HdfArray.load`.
+``'mmap'``
+    Memory-map the dataset at construction time, so that reads are (read-only)
+    views that touch only the pages they need.  Datasets that cannot be mapped
+    (see :func:`~psi_io.psi_io.read_hdf_data`), including every HDF4 dataset,
+    fall back to ``'lazy'`` caching.
 ``None``
     Never cache; every read goes to disk.
 """
 
+_CACHE_MODES = {'lazy', 'eager', 'mmap', None}
+"""Set of valid :data:`CacheType` values."""
+
 
 def _interpolate_dim(arr: QuantityLike,
                      axis: int,
@@ -417,7 +447,9 @@ def _parse_islice_args(*args,
 
     Converts each element of *args* to a :class:`slice` and adjusts the stop
     index when the axis needs remeshing (to include the extra element required
-    for averaging).
+    for averaging).  Strided slices are normalized to explicit
+    ``(start, stop, step)`` bounds, with the stop index of a remeshed axis
+    extended by one in the same way.
 
     Parameters
     ----------
@@ -437,22 +469,31 @@ def _parse_islice_args(*args,
     Raises
     ------
     ValueError
-        If a slice yields an empty dimension or uses a non-unit step.
+        If a slice yields an empty dimension or uses a non-positive step.
 
     Examples
     --------
     >>> list(_parse_islice_args(None, 1, shape=(10, 5), remesh=(False, False)))
     [slice(None, None, None), slice(1, 2, None)]
+    >>> list(_parse_islice_args((None, None, 4), shape=(10,), remesh=(True,)))
+    [slice(0, 10, 4)]
     """
     for arg, size, rmesh in zip(args, shape, remesh):
         slice_ = _cast_to_slice(arg)
+        if slice_.step is not None and slice_.step < 1:
+            raise ValueError(f"Slice argument {arg!r} has a step size of {slice_.step}, "
+                             f"but only positive steps are supported.")
+        if slice_.step not in {None, 1}:
+            start, stop, step = slice_.indices(size - bool(rmesh))
+            if stop <= start:
+                raise ValueError(f"Slice argument {arg!r} yields an empty dimension.")
+            yield slice(start, stop + bool(rmesh), step)
+            continue
         if rmesh and slice_.stop is not None:
             slice_ = slice(slice_.start, slice_.stop + 1, slice_.step)
         start, stop, step = slice_.indices(size - bool(rmesh))
         if stop <= start:
             raise ValueError(f"Slice argument {arg!r} yields an empty dimension.")
-        if step != 1:
-            raise ValueError(f"Slice argument {arg!r} has a step size of {step}, but only step=1 is supported.")
         yield slice_
 
 
@@ -573,6 +614,92 @@ def _apply_units(data: u.Quantity,
     return data.to(unit)
 
 
+def _apply_units_inplace(data: u.Quantity,
+                         unit: Optional[UnitLike]) -> u.Quantity:
+    """In-place variant of :func:`_apply_units` for a :class:`~u.Quantity` viewing an output buffer.
+
+    Parameters
+    ----------
+    data : Quantity
+        Floating-point data in code units; converted in place.
+    unit : str | Unit | None
+        Requested output unit (see :func:`_apply_units`).
+
+    Returns
+    -------
+    out : Quantity
+        *data*, in the requested unit.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import astropy.units as u
+    >>> buffer = np.ones(2)
+    >>> data = _apply_units_inplace(u.Quantity(buffer, u.Gauss, copy=False), u.T)
+    >>> data.unit, buffer
+    (Unit("T"), array([0.0001, 0.0001]))
+    """
+    target = _apply_units(1.0 * data.unit, unit).unit
+    if target != data.unit:
+        data <<= target
+    return data
+
+
+def _resolve_quantity_out(out: np.ndarray | BufferPool | None,
+                          shape: tuple[int, ...],
+                          dtype: np.dtype,
+                          strict: bool = False) -> np.ndarray:
+    """Return the floating-point array a :class:`~u.Quantity` of *shape* is read into.
+
+    Integer *dtype* values are promoted to ``float64`` when acquiring from a
+    :class:`~psi_io.psi_io.BufferPool` (or allocating, if *out* is ``None``),
+    since a :class:`~u.Quantity` cannot wrap an integer buffer without copying it.
+
+    Raises
+    ------
+    TypeError
+        If *out* is an array with a non-floating-point dtype.
+    ValueError
+        If *out* is an array whose shape is not *shape* – or, with *strict*,
+        whose dtype is not *dtype*.
+    """
+    buffer = _resolve_out(out, shape, dtype if np.dtype(dtype).kind in 'fc' else np.float64, strict)
+    if buffer.dtype.kind not in 'fc':
+        raise TypeError(f"out must have a floating-point dtype; got {buffer.dtype}")
+    return buffer
+
+
+def _copy_to_out(data: u.Quantity, out: np.ndarray | BufferPool, strict: bool = False) -> u.Quantity:
+    """Copy *data* into *out* (an array, or a pool to acquire one from) and return a view of it."""
+    buffer = _resolve_quantity_out(out, data.shape, data.dtype, strict)
+    np.copyto(buffer, data.value, casting='unsafe')
+    return u.Quantity(buffer, data.unit, copy=False)
+
+
+def _float_dtype(dtype: Optional[DTypeLike]) -> Optional[np.dtype]:
+    """Return the requested output *dtype* of a reader as a :class:`numpy.dtype` (``None`` passes through).
+
+    Raises
+    ------
+    TypeError
+        If *dtype* is not a floating-point (or complex) dtype – reader output is
+        wrapped in a :class:`~u.Quantity` and may be remeshed or interpolated.
+
+    Examples
+    --------
+    >>> _float_dtype('float32')
+    dtype('float32')
+    >>> _float_dtype(None) is None
+    True
+    """
+    if dtype is None:
+        return None
+    dtype = np.dtype(dtype)
+    if dtype.kind not in 'fc':
+        raise TypeError(f"dtype must be a floating-point dtype; got {dtype}")
+    return dtype
+
+
 def _cast_to_slice(input: None | int | slice | Sequence) -> slice:
     """Convert a dimension index argument to a :class:`slice` object.
 
@@ -638,7 +765,7 @@ class _HdfArray(ABC):
     _vcache : np.ndarray | None
         In-memory copy of the full dataset array, or ``None`` when not cached.
     _cache : CacheType
-        Active cache mode: ``'lazy'``, ``'eager'``, or ``None``.
+        Active cache mode: ``'lazy'``, ``'eager'``, ``'mmap'``, or ``None``.
 
     See Also
     --------
@@ -663,22 +790,22 @@ class _HdfArray(ABC):
             Passed to :meth:`_parse_inputs` by subclass constructors.
         cache : CacheType, optional
             Cache mode.  ``'lazy'`` caches on first full read, ``'eager'`` loads
-            immediately, ``None`` disables caching entirely.  Default is
-            ``'lazy'``.
+            immediately, ``'mmap'`` memory-maps the dataset (where possible), and
+            ``None`` disables caching entirely.  Default is ``'lazy'``.
         **kwargs : object
             Metadata keyword arguments forwarded to :meth:`_parse_inputs`.
 
         Raises
         ------
         ValueError
-            If *cache* is not one of ``'lazy'``, ``'eager'``, or ``None``, or if
+            If *cache* is not one of ``'lazy'``, ``'eager'``, ``'mmap'``, or ``None``, or if
             metadata cannot be resolved from *kwargs*.
         """
         self._vcache = None
         self._cache = cache and cache.lower()
-        if self._cache not in {'lazy', 'eager', None}:
+        if self._cache not in _CACHE_MODES:
             raise ValueError(f"Invalid cache method: {cache!r}. "
-                             f"Expected 'lazy', 'eager', or None.")
+                             f"Expected 'lazy', 'eager', 'mmap', or None.")
 
         try:
             self._set_metadata(**self._parse_inputs(**kwargs))
@@ -687,6 +814,8 @@ class _HdfArray(ABC):
 
         if self._cache == 'eager':
             self.load(recursive=False)
+        elif self._cache == 'mmap':
+            self._vcache = self._memmap()
 
 
     def __str__(self):
@@ -957,7 +1086,7 @@ class _HdfArray(ABC):
         Returns
         -------
         out : str | None
-            ``'lazy'``, ``'eager'``, or ``None``.
+            ``'lazy'``, ``'eager'``, ``'mmap'``, or ``None``.
         """
         return self._cache
 
@@ -969,19 +1098,22 @@ class _HdfArray(ABC):
         ----------
         method : CacheType
             New cache mode.  Setting ``'eager'`` calls :meth:`load`; setting
-            ``None`` calls :meth:`clear`.
+            ``'mmap'`` maps the dataset (if possible); setting ``None`` calls
+            :meth:`clear`.
 
         Raises
         ------
         ValueError
-            If *method* is not ``'lazy'``, ``'eager'``, or ``None``.
+            If *method* is not ``'lazy'``, ``'eager'``, ``'mmap'``, or ``None``.
         """
         self._cache = method and method.lower()
-        if self._cache not in {'lazy', 'eager', None}:
+        if self._cache not in _CACHE_MODES:
             raise ValueError(f"Invalid cache method: {method!r}. "
-                             f"Expected 'lazy', 'eager', or None.")
+                             f"Expected 'lazy', 'eager', 'mmap', or None.")
         if self._cache == 'eager':
             self.load()
+        elif self._cache == 'mmap' and self._vcache is None:
+            self._vcache = self._memmap()
         elif self._cache is None:
             self.clear()
 
@@ -1006,6 +1138,38 @@ class _HdfArray(ABC):
         """Return the HDF dataset identified by *id_*."""
         ...
 
+    def _memmap(self) -> Optional[np.memmap]:
+        """Return a read-only memory map of the dataset, or ``None`` if it cannot be mapped."""
+        return None
+
+    def _read_direct(self, args: tuple, out: np.ndarray) -> None:
+        """Read ``dataset[args]`` (a storage-order index tuple) into *out*."""
+        out[...] = self.dataset[args]
+
+    def _read_as(self, args: tuple, dtype: Optional[np.dtype]) -> np.ndarray:
+        """Return ``self[args]`` (a physical-order slice tuple) in *dtype*.
+
+        Uncached slices are read through :meth:`_read_direct` into an array of
+        *dtype*, so HDF5 converts them as they are read; the cache is neither
+        used to hold nor filled with converted data.  Strided slices may be read
+        through their bounding box, as chosen by the read planner (see
+        :func:`~psi_io.psi_io.plan_hdf_read`).
+        """
+        if self._vcache is None:
+            split = _planned_window(self.dataset, args[::-1] if self._reverse else args)
+            if split is not None:
+                window, relative = split
+                return self._read_as(window[::-1] if self._reverse else window, dtype)[relative]
+        if dtype is None:
+            return self[args]
+        if self._reverse:
+            args = args[::-1]
+        if self._vcache is not None:
+            return self._vcache[args].astype(dtype, copy=False)
+        buffer = np.empty(_selection_shape(self._shape, args), dtype)
+        self._read_direct(args, buffer)
+        return buffer
+
     @abstractmethod
     def _parse_inputs(self, **kwargs) -> dict:
         """Parse and merge file attributes with keyword overrides into a metadata dict."""
@@ -1062,7 +1226,9 @@ class _HdfArray(ABC):
         Parameters
         ----------
         *args : int | tuple | slice | None
-            Index-space axis arguments in physical ``(r, t, p)`` order.
+            Index-space axis arguments in physical ``(r, t, p)`` order.  A
+            ``(start, stop, step)`` tuple or a stepped :class:`slice` reads
+            every ``step``-th element; the scales are decimated to match.
         unit : UnitLike | None, optional
             Output unit.  Default is ``None`` (code units).
         mesh : MeshLike | None, optional
@@ -1110,7 +1276,7 @@ class _HdfArray(ABC):
         """
         return self.read(*args, **kwargs)
 
-    def _read(self, *args, remesh: tuple[bool,...]) -> u.Quantity:
+    def _read(self, *args, remesh: tuple[bool,...], dtype: Optional[np.dtype] = None) -> u.Quantity:
         """Read and remesh the dataset slice, applying the physical unit.
 
         Parameters
@@ -1119,21 +1285,91 @@ class _HdfArray(ABC):
             Per-axis slice objects in storage order.
         remesh : tuple[bool, ...]
             Per-axis remesh flags.
+        dtype : np.dtype | None, optional
+            The dtype to read the slice in (see :meth:`_read_as`).  Default is
+            ``None`` (the stored dtype).
 
         Returns
         -------
         out : Quantity
             Sliced and remeshed data multiplied by :attr:`unit`.
+
+        Notes
+        -----
+        A strided axis that needs remeshing is read as two strided selections –
+        the lower and upper neighbour of each output point – which are then
+        averaged, so the stride still limits what is read from the file.
         """
-        return _remesh_array(self[args], remesh=remesh, order=self.order) * self.unit
+        if isinstance(remesh, bool):
+            remesh = (remesh,) * len(args)
+        strided = tuple(bool(rmesh) and slice_.step not in {None, 1}
+                        for slice_, rmesh in zip(args, remesh))
+        if not any(strided):
+            return _remesh_array(self._read_as(args, dtype), remesh=remesh, order=self.order) * self.unit
+        neighbours = [(slice(slice_.start, slice_.stop - 1, slice_.step),
+                       slice(slice_.start + 1, slice_.stop, slice_.step)) if stride else (slice_,)
+                      for slice_, stride in zip(args, strided)]
+        residual = tuple(bool(rmesh) and not stride for rmesh, stride in zip(remesh, strided))
+        odata = sum(_remesh_array(self._read_as(corner, dtype), remesh=residual, order=self.order)
+                    for corner in product(*neighbours))
+        return odata / (1 << sum(strided)) * self.unit
+
+    def _read_into(self,
+                   *args: slice,
+                   unit: Optional[UnitLike],
+                   transpose: bool,
+                   out: np.ndarray | BufferPool | None,
+                   dtype: Optional[np.dtype] = None) -> u.Quantity:
+        """Read a slice straight into *out*, converting it to *unit* in place.
+
+        The slice is copied from the cache when one is held, and otherwise read
+        through :meth:`_read_direct` (HDF5's ``read_direct`` for h5 files), so no
+        intermediate array is allocated.  No remeshing is applied.  With *dtype*,
+        *out* may be ``None`` (a new array of *dtype* is allocated) and must
+        otherwise have that dtype.
 
-    def load(self, **kwargs):
+        Parameters
+        ----------
+        *args : slice
+            Per-axis slice objects in physical order.
+        unit : UnitLike | None
+            Output unit.
+        transpose : bool
+            Whether *out* holds the slice transposed from storage order.
+        out : np.ndarray | BufferPool | None
+            The output array, or a pool to acquire it from.
+        dtype : np.dtype | None, optional
+            The dtype to read the slice in.  Default is ``None`` (the dtype of
+            *out*, or the stored dtype).
+
+        Returns
+        -------
+        out : Quantity
+            A view of the filled output array.
+        """
+        shape = _selection_shape(self.shape, args)
+        if self._reverse:
+            shape, args = shape[::-1], args[::-1]
+        buffer = _resolve_quantity_out(out, shape[::-1] if transpose else shape, dtype or self.dtype,
+                                       strict=dtype is not None)
+        target = buffer.T if transpose else buffer
+        if self._vcache is not None:
+            np.copyto(target, self._vcache[args], casting='unsafe')
+        else:
+            self._read_direct(args, target)
+        return _apply_units_inplace(u.Quantity(buffer, self.unit, copy=False), unit)
+
+    def load(self, dtype: Optional[DTypeLike] = None, **kwargs):
         """Load the full dataset into the in-memory cache.
 
         Has no effect (emits :exc:`CacheWarning`) when ``cache=None``.
 
         Parameters
         ----------
+        dtype : DTypeLike | None, optional
+            The dtype to hold the cache in, converted as it is read.  A memory
+            map (``cache='mmap'``) is only used if the stored dtype is *dtype*.
+            Default is ``None`` (the stored dtype).
         **kwargs : object
             Accepted but ignored; present for subclass override compatibility.
 
@@ -1146,7 +1382,13 @@ class _HdfArray(ABC):
         if self._cache is None:
             warnings.warn(f"{self.__class__.__name__}({self}) has caching disabled; load() has no effect.", CacheWarning, stacklevel=3)
             return
-        self._vcache = self.dataset[:]
+        converts = dtype is not None and np.dtype(dtype) != self.dtype
+        self._vcache = self._memmap() if self._cache == 'mmap' and not converts else None
+        if self._vcache is None and converts:
+            self._vcache = np.empty(self._shape, dtype)
+            self._read_direct((slice(None),) * len(self._shape), self._vcache)
+        elif self._vcache is None:
+            self._vcache = self.dataset[:]
 
     def clear(self, **kwargs):
         """Release the in-memory data cache.
@@ -1209,6 +1451,23 @@ class _HdfScale(_HdfArray, ABC):
         self._id = dataset_id
         super().__init__(**kwargs)
 
+    def __getitem__(self, args: str | int | slice | tuple):
+        """Index into the scale, serving uncached reads from the process-wide scale cache.
+
+        Coordinate scales are tiny and immutable for a given file, so rather
+        than reading the HDF dataset on every access (as with ``cache=None``)
+        the full scale is read once per file through
+        :func:`~psi_io.psi_io.configure_meta_cache`'s cache, and indexed in
+        memory.  The returned arrays are read-only views.
+        """
+        if isinstance(args, str) or self._vcache is not None:
+            return super().__getitem__(args)
+        values = _META_CACHE.get(self._ref._filepath, ('scale', self._id),
+                                 lambda: _read_only(self.dataset[:]))
+        if self._cache:
+            self._vcache = values
+        return values[args]
+
     def validate_metadata(self) -> None:
         """Validate scale-specific metadata, warning on dimensionality or name issues."""
         super().validate_metadata()
@@ -1267,8 +1526,8 @@ class _HdfData(_HdfArray, ABC):
     ----------
     _filepath : pathlib.Path
         Absolute path to the open HDF file.
-    _icache : RegularGridInterpolator | None
-        Cached scipy interpolator, or ``None`` if not yet built.
+    _icache : RegularGridInterpolator | _NpGridInterpolator | None
+        Cached interpolator, or ``None`` if not yet built.
 
     See Also
     --------
@@ -1280,6 +1539,7 @@ class _HdfData(_HdfArray, ABC):
     def __init__(self,
                  ifile: PathLike,
                  dataset_id: Optional[str] = None,
+                 swmr: bool = False,
                  **kwargs):
         """Open an HDF file and initialize the reader with resolved metadata.
 
@@ -1292,6 +1552,9 @@ class _HdfData(_HdfArray, ABC):
         dataset_id : str | None, optional
             Dataset key within the HDF file.  Defaults to the PSI standard
             identifier for the given format.
+        swmr : bool, optional
+            Open the file for single-writer/multiple-reader reading (HDF5 only);
+            see :meth:`H5Data.refresh`.  Default is ``False``.
         **kwargs : object
             Metadata keyword arguments (``model``, ``name``, ``unit``, ``mesh``,
             etc.) forwarded to :meth:`_parse_inputs` and :meth:`_set_metadata`.
@@ -1301,8 +1564,9 @@ class _HdfData(_HdfArray, ABC):
         FileNotFoundError
             If *ifile* does not exist.
         ValueError
-            If the file extension does not match the expected format, or if
-            metadata cannot be resolved.
+            If the file extension does not match the expected format, if
+            *swmr* is requested for an HDF4 file, or if metadata cannot be
+            resolved.
         """
         ifile = Path(ifile)
         hdfv = f'h{self._HDFN}'
@@ -1312,10 +1576,15 @@ class _HdfData(_HdfArray, ABC):
             raise ValueError(f"File '{ifile}' does not have the correct extension for "
                              f"{self._HDFN} files (expected '{_HDF_EXT_MAPPING[hdfv]}' extension).")
 
+        if swmr and self._HDFN != 5:
+            raise ValueError("SWMR is only supported for HDF5 (.h5) files")
+
         self._filepath: Path = ifile
-        self._ref = self.read_file(ifile)
+        self._swmr: bool = bool(swmr)
+        self._ref = self.read_file(ifile, swmr=self._swmr)
         self._id = dataset_id or PSI_DATA_ID[hdfv]
         self._icache = None
+        self._levels = {}
         super().__init__(**kwargs)
 
     def __enter__(self):
@@ -1333,8 +1602,8 @@ class _HdfData(_HdfArray, ABC):
 
     @classmethod
     @abstractmethod
-    def read_file(cls, ifile: PathLike):
-        """Open the HDF file at *ifile* and return the format-specific file handle."""
+    def read_file(cls, ifile: PathLike, swmr: bool = False):
+        """Open the HDF file at *ifile* (for SWMR reading, with *swmr*) and return the format-specific file handle."""
         ...
 
     @property
@@ -1381,7 +1650,7 @@ class _HdfData(_HdfArray, ABC):
 
     @property
     def interp_cached(self) -> bool:
-        """Whether a :class:`~scipy.interpolate.RegularGridInterpolator` is cached.
+        """Whether an interpolator (see :meth:`interp`) is cached.
 
         Returns
         -------
@@ -1485,7 +1754,11 @@ class _HdfData(_HdfArray, ABC):
              unit: Optional[str | UnitLike] = None,
              mesh: Optional[MeshLike] = None,
              order: Optional[ArrayOrdering] = None,
-             scales: bool = True) -> u.Quantity | tuple[u.Quantity, ...]:
+             scales: bool = True,
+             out: Optional[np.ndarray | BufferPool] = None,
+             level: int = 0,
+             dtype: Optional[DTypeLike] = None,
+             ) -> u.Quantity | tuple[u.Quantity, ...]:
         """Read data by index with optional unit conversion and coordinate scales.
 
         .. attention::
@@ -1497,7 +1770,9 @@ class _HdfData(_HdfArray, ABC):
         Parameters
         ----------
         *args : int | tuple | slice | None
-            Index-space axis arguments in physical ``(r, t, p)`` order.
+            Index-space axis arguments in physical ``(r, t, p)`` order.  A
+            ``(start, stop, step)`` tuple or a stepped :class:`slice` reads
+            every ``step``-th element; the scales are decimated to match.
         unit : UnitLike | None, optional
             Output unit.  Default is ``None`` (code units).
         mesh : MeshLike | None, optional
@@ -1507,67 +1782,194 @@ class _HdfData(_HdfArray, ABC):
             Default is ``None``.
         scales : bool, optional
             If ``True`` (default), return coordinate slices alongside data.
+        out : np.ndarray | BufferPool | None, optional
+            A floating-point array to write the data into, or a
+            :class:`~psi_io.psi_io.BufferPool` to acquire one from, instead of
+            allocating a new array.  It must have the shape of the returned
+            data.  Default is ``None``.
+        level : int, optional
+            The overview level to read from (see :meth:`level`); the index
+            arguments refer to the grid of that level.  Default is ``0`` (the
+            full-resolution dataset).
+        dtype : DTypeLike | None, optional
+            The floating-point dtype to return the data in.  The slice is
+            converted as it is read (by HDF5 itself for h5 files), so no
+            array of the stored dtype is allocated; *out* must then have this
+            dtype.  The scales keep their stored dtype.  Default is ``None``
+            (the stored dtype).
 
         Returns
         -------
         data : Quantity
             Sliced data array with the specified mesh staggering, units, and ordering
-            applied.
+            applied.  When *out* is given, a view of the filled output array.
         *scales : Quantity
             Sliced scales (only returned when *scales* is ``True``).
 
+        Raises
+        ------
+        TypeError
+            If *dtype* is not a floating-point dtype.
+
+        Notes
+        -----
+        Without remeshing, *out* is filled directly from the file (or the cache)
+        and converted to *unit* in place, so repeated reads into the same
+        array – or into arrays recycled through a
+        :class:`~psi_io.psi_io.BufferPool` – allocate nothing for the data.
+        Remeshed data is computed as usual and then copied into *out*.
+
+        Strides are passed down to the HDF selection, so only the decimated
+        elements are read from the file.  On a remeshed axis, each output point
+        averages the two elements that straddle it; both are read as strided
+        selections rather than reading the full range.
+
         Examples
         --------
         >>> data, r, t, p = reader.read()  # doctest: +SKIP
+        >>> preview, r, t, p = reader.read((None, None, 4), (None, None, 4), (None, None, 4))  # doctest: +SKIP
+        >>> buffer = np.empty(reader.shape[::-1], dtype=reader.dtype)  # doctest: +SKIP
+        >>> data = reader.read(scales=False, out=buffer)  # doctest: +SKIP
         >>> data_gauss = reader.read(scales=False, unit='Gauss')  # doctest: +SKIP
+        >>> overview, r, t, p = reader.read(level=2)  # doctest: +SKIP
+        >>> data32 = reader.read(scales=False, dtype='float32')  # doctest: +SKIP
         """
+        if level:
+            return self.level(level).read(*args, unit=unit, mesh=mesh, order=order, scales=scales, out=out,
+                                          dtype=dtype)
+        dtype = _float_dtype(dtype)
         remesh = self.mesh >> mesh
         args = _expand_args(*args, ndim=self.ndim)
         sargs = tuple(_parse_islice_args(*args, shape=self.shape, remesh=remesh))
-        odata = _apply_units(self._read(*sargs, remesh=remesh), unit=unit)
-        if order is not None and order.upper() != self.order:
-            odata = odata.T
+        transpose = order is not None and order.upper() != self.order
+        odata = self._read_output(*sargs, remesh=remesh, unit=unit, transpose=transpose, out=out, dtype=dtype)
         if not scales:
             return odata
         oscales = (scale._read(sarg, remesh=rmesh) for scale, sarg, rmesh in zip(self.scales, sargs, remesh))
         return odata, *oscales
 
+    def level(self, level: int) -> '_HdfData':
+        """Return a reader for an overview level of the dataset.
+
+        Overview levels are downsampled copies of the dataset stored in the
+        same file (see :func:`~psi_io.psi_io.build_hdf_pyramid`); level ``k``
+        is coarsened by ``2**k`` along every axis and keeps the mesh stagger of
+        the dataset.  The returned reader shares this reader's metadata and
+        cache mode, and supports the full reader API (:meth:`read`,
+        :meth:`vslice`, :meth:`interp`, …).
+
+        Parameters
+        ----------
+        level : int
+            The overview level.  ``0`` returns this reader.
+
+        Returns
+        -------
+        out : _HdfData
+            The reader of the requested level.  Readers are created on first
+            use and closed together with this reader.
+
+        Raises
+        ------
+        ValueError
+            If *level* is negative, or positive for an HDF4 file.
+        KeyError
+            If the requested level is not stored in the file.
+
+        Examples
+        --------
+        >>> overview = reader.level(2)  # doctest: +SKIP
+        >>> overview.shape  # doctest: +SKIP
+        (...)
+        """
+        if level == 0:
+            return self
+        if level not in self._levels:
+            self._levels[level] = type(self)(self._filepath,
+                                             dataset_id=_level_dataset_id(self._filepath, self._id, level),
+                                             swmr=self._swmr,
+                                             cache=self._cache,
+                                             model=self._model,
+                                             name=self._name,
+                                             desc=self._desc,
+                                             unit=self._unit,
+                                             scalar=self._scalar,
+                                             mesh=self._mesh,
+                                             order=self._order,
+                                             sequence=self._sequence,
+                                             scales=self.scales._fields,
+                                             validate=False)
+        return self._levels[level]
+
     def interp(self,
                data,
                unit: Optional[str | UnitLike] = None,
+               engine: Optional[Literal['scipy', 'numpy']] = None,
+               tile_shape: Optional[int | Sequence[int]] = None,
+               workers: Optional[int] = 1,
+               strategy: Literal['auto', 'window', 'tiles', 'points', 'full'] = 'auto',
                **kwargs
                ) -> u.Quantity:
         """Interpolate the dataset at arbitrary spatial positions.
 
-        Builds or reuses a :class:`~scipy.interpolate.RegularGridInterpolator`
-        and evaluates it at the positions given by *data*.  When caching is
-        disabled (``cache=None``), a minimal bounding-box slice is read on each
-        call.  When caching is enabled, the interpolator is cached and reused for
-        subsequent calls that fall within the same grid extent.
+        Builds or reuses a linear interpolator – a
+        :class:`~scipy.interpolate.RegularGridInterpolator` or its pure-NumPy
+        counterpart – and evaluates it at the positions given by *data*.  When caching is
+        disabled (``cache=None``), the data needed are read on each call, as
+        chosen by the read planner (see *strategy*).  When caching is enabled, the interpolator is cached and reused for
+        subsequent calls that fall within the same grid extent (and engine).
 
         Parameters
         ----------
-        data : ArrayLike | Table
+        data : ArrayLike | Table | InterpolationPlan
             Positions to interpolate, as a :class:`~astropy.table.Table`-like :math:`N \\times S` array,
             where :math:`\\lvert N \\rvert` is the number of positions, and :math:`\\lvert S \\rvert`
             is the number of scales. When columns do not possess a unit, they are cast to the
-            corresponding scale's units.
+            corresponding scale's units.  An :class:`~psi_io.psi_io.InterpolationPlan` built
+            on the (code unit) scales of the dataset is applied to the window it
+            requires, without building an interpolator; *engine* and *kwargs* are then ignored.
         unit : UnitLike | None, optional
             Output unit.  Default is ``None`` (code units).
+        engine : {'scipy', 'numpy'} | None, optional
+            The interpolation engine (see :func:`~psi_io.psi_io.instantiate_linear_interpolator`).
+            The NumPy engine interpolates in the dtype of the data, and does not
+            require scipy.  If ``None`` (default), scipy is used when it is
+            installed (or the engine of the cached interpolator, if any).
+        tile_shape : int | Sequence[int] | None, optional
+            If given, partition the grid into tiles of this many cells along each
+            axis (in physical order), and read and interpolate only the tiles that
+            hold positions – see :func:`~psi_io.psi_io.interpolate_positions_from_hdf`.
+            No interpolator is cached.  This implies ``strategy='tiles'``; if
+            ``None`` (default), tiles follow the chunks of the dataset.
+        workers : int | None, optional
+            The maximum number of tiles read and interpolated concurrently (with
+            *tile_shape*).  Default is ``1`` (sequential).
+        strategy : {'auto', 'window', 'tiles', 'points', 'full'}, optional
+            How the data are read when caching is disabled: the bounding box of
+            the positions, the tiles they occupy, the corners of their cells with
+            one point selection (HDF5 only), or the whole dataset – see
+            :func:`~psi_io.psi_io.interpolate_positions_from_hdf`.  With ``'auto'``
+            (default), the cheapest strategy for the storage layout of the dataset
+            is chosen (see :func:`~psi_io.psi_io.plan_hdf_read`).  When caching is
+            enabled, ``'auto'`` uses the cached interpolator (as does ``'window'``),
+            while ``'tiles'``, ``'points'`` and ``'full'`` bypass it.
         **kwargs : object
-            Forwarded to :class:`~scipy.interpolate.RegularGridInterpolator`.
+            Forwarded to the interpolator.
             Notable keywords: ``bounds_error`` (default ``True``),
             ``fill_value`` (default ``None``).
 
         Returns
         -------
         out : Quantity
-            Interpolated values of shape ``(N,)``.
+            Interpolated values of shape ``(N,)`` (or of the shape of the plan).
 
         Raises
         ------
         ImportError
-            If scipy is not installed.
+            If *engine* is ``'scipy'`` and scipy is not installed.
+        ValueError
+            If *data* is a plan built on a different grid, or if *strategy* is
+            unknown (or ``'points'`` for an HDF4 file).
 
         Examples
         --------
@@ -1575,8 +1977,21 @@ class _HdfData(_HdfArray, ABC):
         >>> import astropy.units as u
         >>> positions = np.column_stack([[1.5, 2.0], [1.57, 1.57], [0.1, 0.2]])
         >>> result = reader.interp(positions)  # doctest: +SKIP
+        >>> result = reader.interp(positions, engine='numpy')  # doctest: +SKIP
+        >>> result = reader.interp(positions, tile_shape=32, workers=4)  # doctest: +SKIP
+        >>> result = reader.interp(positions, strategy='points')  # doctest: +SKIP
+
+        Sample the same positions from many readers on the same grid.
+
+        >>> from psi_io import InterpolationPlan
+        >>> plan = InterpolationPlan([scale[:] for scale in reader.scales], *positions.T)  # doctest: +SKIP
+        >>> result = reader.interp(plan)  # doctest: +SKIP
         """
-        _except_no_scipy()
+        if isinstance(data, InterpolationPlan):
+            if not data.matches(*(scale[:] for scale in self.scales)):
+                raise ValueError(f"The grid of {self.__class__.__name__}({self}) differs from the grid of the plan")
+            window = self.read(*data.window, scales=False, order='F')
+            return _apply_units(data.apply(window.value) << window.unit, unit=unit)
         positions = QTable(data, names=self.scales._fields, units=[scale.unit for scale in self.scales])
         positions = structured_to_unstructured(positions.as_array())
 
@@ -1584,31 +1999,203 @@ class _HdfData(_HdfArray, ABC):
         vslice_args = [(np.min(positions[:, i]), np.max(positions[:, i]))
                        for i in range(positions.shape[-1])]
 
+        if strategy not in READ_STRATEGIES:
+            raise ValueError(f"strategy must be one of {list(READ_STRATEGIES)}; got {strategy!r}")
+        if strategy == 'points' and self._HDFN != 5:
+            raise ValueError("Point selections require an HDF5 (.h5) file")
+        if tile_shape is not None:
+            strategy = 'tiles'
+        elif self._cache is not None and strategy == 'auto':
+            strategy = 'cache'
+        if strategy in ('auto', 'tiles', 'points'):
+            layout = _storage_layout(self.dataset)
+            if not self._reverse:
+                layout = layout._replace(shape=layout.shape[::-1],
+                                         chunks=layout.chunks and layout.chunks[::-1])
+            scales = [scale[:] for scale in self.scales]
+            if strategy == 'auto':
+                strategy = _plan_positions(layout, scales, positions, points=self._HDFN == 5).strategy
+        if strategy in ('tiles', 'points'):
+            if bounds_error and any(lo < s[0] or hi > s[-1] for s, (lo, hi) in zip(scales, vslice_args)):
+                raise ValueError(f"One of the positions is outside the grid of {self.__class__.__name__}({self})")
+        if strategy == 'points':
+            read = lambda coords: _h5_read_points(self.dataset, coords if self._reverse else coords[:, ::-1])
+            odata = _interpolate_by_points(positions, scales, read, layout.shape, engine=engine,
+                                           fill_value=kwargs.get('fill_value', np.nan))
+            return _apply_units(odata << self.unit, unit=unit)
+        if strategy == 'tiles':
+            odata = _interpolate_by_tile(positions, scales,
+                                         lambda window: self.read(*window, scales=False, order='F').value,
+                                         tile_shape or _default_tile_shape(layout), engine=engine, workers=workers,
+                                         lock=_H4_LOCK if Path(self._filepath).suffix == '.hdf' else None,
+                                         **{'bounds_error': False, **kwargs})
+            return _apply_units(odata << self.unit, unit=unit)
+
+        if strategy == 'full':
+            data, *scales = self.read(scales=True, order='C')
+            return _apply_units(
+                _linear_interpolator([scale.value for scale in scales], data.value, engine=engine,
+                                     **kwargs)(positions) << self.unit,
+                unit=unit,
+            )
         if self._cache is None:
             data, *scales = self.vslice(*vslice_args, bounds_error=bounds_error, order='C')
             return _apply_units(
-                RegularGridInterpolator(scales, data, **kwargs)(positions) << self.unit,
+                _linear_interpolator(scales, data, engine=engine, **kwargs)(positions) << self.unit,
                 unit=unit,
             )
 
         needs_build = (
             self._icache is None
+            or (engine is not None and isinstance(self._icache, _NpGridInterpolator) != (engine == 'numpy'))
             or any(lo < g[0] or hi > g[-1]
                    for g, (lo, hi) in zip(self._icache.grid, vslice_args))
         )
 
         if needs_build:
+            if engine is None and self._icache is not None:
+                engine = 'numpy' if isinstance(self._icache, _NpGridInterpolator) else 'scipy'
             if self.data_cached:
                 arr = self._vcache[:].T if self._reverse else self._vcache[:]
-                self._icache = RegularGridInterpolator(
-                    [scale[:] for scale in self.scales], arr, **kwargs
+                self._icache = _linear_interpolator(
+                    [scale[:] for scale in self.scales], arr, engine=engine, **kwargs
                 )
             else:
                 data, *scales = self.vslice(*vslice_args, bounds_error=bounds_error, order='C')
-                self._icache = RegularGridInterpolator(scales, data, **kwargs)
+                self._icache = _linear_interpolator(scales, data, engine=engine, **kwargs)
 
         return _apply_units(self._icache(positions) << self.unit, unit=unit)
 
+    def point_query(self,
+                    bounds_error: bool = True,
+                    fill_value: Optional[float] = np.nan,
+                    ) -> PointQuery:
+        """Return a low-latency query interpolating the dataset at one position at a time.
+
+        The query is bound to the open dataset of this reader (or to its cache,
+        when the data are cached) and to its scales, so each call only locates
+        the position and reads the corners of its cell – see
+        :class:`~psi_io.psi_io.PointQuery`.  It is valid until the reader is closed.
+
+        Parameters
+        ----------
+        bounds_error : bool, optional
+            If ``True`` (default), raise a :exc:`ValueError` for positions outside the grid.
+        fill_value : float | None, optional
+            The value returned outside the grid when ``bounds_error`` is ``False``;
+            if ``None``, the values are extrapolated.  Default is ``nan``.
+
+        Returns
+        -------
+        out : PointQuery
+            A callable taking the coordinates of a position in physical
+            ``(r, t, p)`` order and code units, and returning a float in code
+            units (see :attr:`unit`).
+
+        Examples
+        --------
+        >>> query = reader.point_query()  # doctest: +SKIP
+        >>> query(15.0, np.pi/2, 1.0)  # doctest: +SKIP
+        """
+        return PointQuery(self._vcache if self.data_cached else self.dataset,
+                          *(scale[:] for scale in self.scales),
+                          bounds_error=bounds_error, fill_value=fill_value, order=self.order)
+
+    def regrid(self,
+               *args,
+               unit: Optional[str | UnitLike] = None,
+               order: Optional[ArrayOrdering] = None,
+               scales: bool = True,
+               out: Optional[np.ndarray | BufferPool] = None,
+               dtype: Optional[DTypeLike] = None,
+               slab_nbytes: int = CONVERT_SLAB_NBYTES,
+               bounds_error: bool = True,
+               fill_value: Optional[float] = np.nan,
+               ) -> u.Quantity | tuple[u.Quantity, ...]:
+        """Resample the dataset onto a new rectilinear grid by separable linear interpolation.
+
+        The dataset is interpolated one axis at a time with sparse 1D
+        interpolation matrices (see :class:`~psi_io.psi_io.RegridPlan`), and read in
+        hyperslabs of its slowest varying (*e.g.* :math:`\\phi`) axis, so only the
+        resampled array is held in memory.
+
+        Parameters
+        ----------
+        *args : ArrayLike | Quantity | None | RegridPlan
+            The target scale of each axis in physical ``(r, t, p)`` order (in
+            code units, unless given as a :class:`~u.Quantity`), or ``None`` to
+            keep an axis as is.  Alternatively, a single
+            :class:`~psi_io.psi_io.RegridPlan` built on the (code unit) scales of
+            the dataset, to reuse its interpolation matrices across quantities.
+        unit : UnitLike | None, optional
+            Output unit.  Default is ``None`` (code units).
+        order : ArrayOrdering | None, optional
+            Transpose the output if it differs from storage order.
+            Default is ``None``.
+        scales : bool, optional
+            If ``True`` (default), return the scales of the new grid alongside data.
+        out : np.ndarray | BufferPool | None, optional
+            A floating-point array (*e.g.* a :class:`~numpy.memmap`) to write the
+            resampled data into, or a :class:`~psi_io.psi_io.BufferPool` to acquire
+            one from.  Default is ``None``.
+        dtype : DTypeLike | None, optional
+            The floating-point dtype to read and resample the data in.  Default is
+            ``None`` (the stored dtype).
+        slab_nbytes : int, optional
+            The largest size (in bytes) of the hyperslab read at a time.  Default
+            is :data:`~psi_io.psi_io.CONVERT_SLAB_NBYTES`.
+        bounds_error : bool, optional
+            If ``True`` (default), raise a :exc:`ValueError` if a target value is
+            outside the grid.  Ignored when a plan is given.
+        fill_value : float | None, optional
+            The value returned outside the grid when ``bounds_error`` is ``False``;
+            if ``None``, the values are extrapolated.  Default is ``nan``.  Ignored
+            when a plan is given.
+
+        Returns
+        -------
+        data : Quantity
+            The resampled data.
+        *scales : Quantity
+            The scales of the new grid (only returned when *scales* is ``True``).
+
+        Raises
+        ------
+        ValueError
+            If more target scales than axes, or a plan built on a different grid,
+            are given, or if a target value is outside the grid and *bounds_error*
+            is ``True``.
+
+        Examples
+        --------
+        >>> data, r, t, p = reader.regrid(np.geomspace(1, 30, 200), None, None)  # doctest: +SKIP
+        >>> from psi_io import RegridPlan
+        >>> plan = RegridPlan([scale[:] for scale in reader.scales], r_new, t_new, p_new)  # doctest: +SKIP
+        >>> data = reader.regrid(plan, scales=False)  # doctest: +SKIP
+        """
+        if len(args) == 1 and isinstance(args[0], RegridPlan):
+            plan = args[0]
+            if not plan.matches(*(scale[:] for scale in self.scales)):
+                raise ValueError(f"The grid of {self.__class__.__name__}({self}) differs from the grid of the plan")
+        elif len(args) > self.ndim:
+            raise ValueError(f"Expected at most {self.ndim} target scales; got {len(args)}")
+        else:
+            targets = [arg.to_value(scale.unit) if isinstance(arg, u.Quantity) else arg
+                       for arg, scale in zip((*args, *(None,)*(self.ndim - len(args))), self.scales)]
+            plan = RegridPlan([scale[:] for scale in self.scales], *targets,
+                              bounds_error=bounds_error, fill_value=fill_value)
+        dtype = _float_dtype(dtype)
+        transpose = (order or self.order).upper() != 'F'
+        buffer = None
+        if out is not None:
+            buffer = _resolve_quantity_out(out, plan.shape[::-1] if transpose else plan.shape, dtype or self.dtype)
+        odata = plan._stream(lambda window: self.read(*window, scales=False, order='F', dtype=dtype).value,
+                             None if buffer is None else (buffer.T if transpose else buffer),
+                             slab_nbytes)
+        odata = _apply_units_inplace(u.Quantity(odata.T if transpose else odata, self.unit, copy=False), unit)
+        if not scales:
+            return odata
+        return odata, *(u.Quantity(target, scale.unit) for target, scale in zip(plan.scales, self.scales))
 
     def vslice(self,
                *args,
@@ -1617,6 +2204,8 @@ class _HdfData(_HdfArray, ABC):
                order: Optional[ArrayOrdering] = None,
                scales: bool = True,
                bounds_error: bool = True,
+               out: Optional[np.ndarray | BufferPool] = None,
+               dtype: Optional[DTypeLike] = None,
                ) -> u.Quantity | tuple[u.Quantity, ...]:
         """Read data by physical coordinate value with linear interpolation.
 
@@ -1655,11 +2244,22 @@ class _HdfData(_HdfArray, ABC):
         bounds_error : bool, optional
             If ``True`` (default), raise :exc:`ValueError` when a physical value
             is outside the coordinate range.
+        out : np.ndarray | BufferPool | None, optional
+            A floating-point array to write the data into, or a
+            :class:`~psi_io.psi_io.BufferPool` to acquire one from, instead of
+            allocating a new array.  It must have the shape of the returned
+            data.  Interpolated data is computed as usual and copied into
+            *out*.  Default is ``None``.
+        dtype : DTypeLike | None, optional
+            The floating-point dtype to return the data in – see :meth:`read`.
+            The bracketing slice is read in this dtype and interpolated in it.
+            Default is ``None`` (the stored dtype).
 
         Returns
         -------
         data : Quantity
-            Interpolated or sliced data array.
+            Interpolated or sliced data array.  When *out* is given, a view of
+            the filled output array.
         *scales : Quantity
             Sliced scales (only returned when ``scales`` is ``True``).
 
@@ -1668,12 +2268,15 @@ class _HdfData(_HdfArray, ABC):
         ValueError
             If *bounds_error* is ``True`` and a physical value falls outside the
             coordinate range.
+        TypeError
+            If *dtype* is not a floating-point dtype.
 
         Examples
         --------
         >>> # Extract the r = 2.5 solar radii surface
         >>> data, r, t, p = reader.vslice(2.5 * u.R_sun)  # doctest: +SKIP
         """
+        dtype = _float_dtype(dtype)
         remesh = self.mesh >> mesh
         args = _expand_args(*args, ndim=self.ndim)
         varg_pairs = _parse_vslice_args(*args, scales=self.scales, remesh=remesh)
@@ -1696,37 +2299,72 @@ class _HdfData(_HdfArray, ABC):
                 if svalue[-1] is not None and not np.isinf(svalue[-1]) and svalue[-1] > remeshed_scales[i][-1]:
                     raise ValueError(f"Value {svalue[-1]} is above the interpolation range {remeshed_scales[i][-1]}.")
 
-        pre_slice_data = _apply_units(self._read(*slice_args, remesh=remesh), unit)
+        transpose = order is not None and order.upper() != self.order
         if all(not sm for sm in slice_mask):
-            if order is not None and order.upper() != self.order:
-                pre_slice_data = pre_slice_data.T
+            pre_slice_data = self._read_output(*slice_args, remesh=remesh, unit=unit, transpose=transpose, out=out,
+                                               dtype=dtype)
             if not scales:
                 return pre_slice_data
             return pre_slice_data, *remeshed_scales
 
+        pre_slice_data = _apply_units(self._read(*slice_args, remesh=remesh, dtype=dtype), unit)
         pre_slice_scales = [sscale if sm else None for sscale, sm in zip(remeshed_scales, slice_mask)]
         pre_slice_values = [sv if sm else None for sv, sm in zip(slice_values, slice_mask)]
 
         sliced_data = _slice_array(pre_slice_data, pre_slice_scales, pre_slice_values, self.order)
-        if order is not None and order.upper() != self.order:
+        if transpose:
             sliced_data = sliced_data.T
+        if dtype is not None:
+            sliced_data = sliced_data.astype(dtype, copy=False)
+        if out is not None:
+            sliced_data = _copy_to_out(sliced_data, out, strict=dtype is not None)
         if not scales:
             return sliced_data
         sliced_scales = (psvalue if psvalue is not None else sscale for psvalue, sscale in zip(pre_slice_values, remeshed_scales))
         return sliced_data, *sliced_scales
 
-    def load(self, interp: bool = False, recursive: bool = True):
+    def _read_output(self,
+                     *args: slice,
+                     remesh: tuple[bool, ...],
+                     unit: Optional[UnitLike],
+                     transpose: bool,
+                     out: Optional[np.ndarray | BufferPool],
+                     dtype: Optional[np.dtype] = None) -> u.Quantity:
+        """Read, remesh and convert a slice, transposing it and filling *out* as requested.
+
+        Un-remeshed slices are read straight into *out* – or, with *dtype*, into
+        a new array of that dtype (see :meth:`_read_into`); otherwise the result
+        is computed as usual and then copied into *out*.
+        """
+        if (out is not None or dtype is not None) and not any(remesh):
+            return self._read_into(*args, unit=unit, transpose=transpose, out=out, dtype=dtype)
+        odata = _apply_units(self._read(*args, remesh=remesh, dtype=dtype), unit)
+        if transpose:
+            odata = odata.T
+        return odata if out is None else _copy_to_out(odata, out, strict=dtype is not None)
+
+    def load(self, interp: bool = False, recursive: bool = True, dtype: Optional[DTypeLike] = None):
         """Load the data array and optionally build the interpolator into memory.
 
         Parameters
         ----------
         interp : bool, optional
-            If ``True``, also build and cache the
-            :class:`~scipy.interpolate.RegularGridInterpolator` after loading
-            the data.  Requires scipy.  Default is ``False``.
+            If ``True``, also build and cache the interpolator of :meth:`interp`
+            after loading the data (with scipy if it is installed, and NumPy
+            otherwise).  Default is ``False``.
         recursive : bool, optional
             If ``True`` (default), also call :meth:`load` on each coordinate
             scale reader.
+        dtype : DTypeLike | None, optional
+            The floating-point dtype to hold the data cache in, converted as it
+            is read (*e.g.* ``'float32'`` to halve the footprint of a float64
+            dataset).  Subsequent reads served from the cache return this
+            dtype.  The scales keep their stored dtype.  Default is ``None``.
+
+        Raises
+        ------
+        TypeError
+            If *dtype* is not a floating-point dtype.
 
         Examples
         --------
@@ -1740,14 +2378,13 @@ class _HdfData(_HdfArray, ABC):
         if self._cache is None:
             warnings.warn(f"{self.__class__.__name__}({self}) has caching disabled; load() has no effect.", CacheWarning, stacklevel=3)
             return
-        super().load()
+        super().load(dtype=_float_dtype(dtype))
         if recursive:
             for scale in self.scales:
                 scale.load()
         if interp:
-            _except_no_scipy()
             arr = self._vcache[:].T if self._reverse else self._vcache[:]
-            self._icache = RegularGridInterpolator(
+            self._icache = _linear_interpolator(
                 [scale[:] for scale in self.scales], arr
             )
 
@@ -1830,6 +2467,14 @@ class _H5ArrayMixin:
         """Return the h5py Dataset at key *id_* from the open file."""
         return self._ref[id_]
 
+    def _memmap(self) -> Optional[np.memmap]:
+        """Memory-map the h5py Dataset if it is contiguous and unfiltered (see :func:`~psi_io.psi_io._h5_memmap`)."""
+        return _h5_memmap(self.dataset)
+
+    def _read_direct(self, args: tuple, out: np.ndarray) -> None:
+        """Read ``dataset[args]`` into *out* with :meth:`h5py.Dataset.read_direct` when possible."""
+        _h5_read_direct(self.dataset, args, out)
+
 
 class _H4ArrayMixin:
     """Mixin that provides HDF4 (pyhdf) property implementations for :class:`_HdfArray`.
@@ -1881,6 +2526,10 @@ class _H4ArrayMixin:
         """Return the pyhdf SDS object at key *id_* from the open SD file."""
         return self._ref.select(id_)
 
+    def _read_direct(self, args: tuple, out: np.ndarray) -> None:
+        """Read ``dataset[args]`` into *out* one hyperslab at a time (see :func:`~psi_io.psi_io._read_h4_slabs`)."""
+        _read_h4_slabs(self.dataset, args, out)
+
 
 class H4Scale(_H4ArrayMixin, _HdfScale):
     """HDF4 coordinate scale reader.
@@ -1915,6 +2564,10 @@ class H4Data(_H4ArrayMixin, _HdfData):
     :class:`_HdfData` (PSI data metadata, slicing, and interpolation).  Uses
     ``pyhdf.SD`` to open ``.hdf`` files.
 
+    Reads into an ``out`` array or in another ``dtype`` (including
+    ``load(dtype=...)``) stream the dataset from its SDS one hyperslab at a
+    time, so that the data is not held twice in memory.
+
     Instances are normally obtained via :func:`PsiData`.
 
     See Also
@@ -1923,8 +2576,8 @@ class H4Data(_H4ArrayMixin, _HdfData):
     PsiData : Public factory function.
     """
     @classmethod
-    def read_file(cls, ifile: PathLike):
-        """Open an HDF4 file for reading and return the pyhdf ``SD`` object."""
+    def read_file(cls, ifile: PathLike, swmr: bool = False):
+        """Open an HDF4 file for reading and return the pyhdf ``SD`` object (*swmr* is not supported)."""
         return h4.SD(str(ifile), h4.SDC.READ)
 
     def open(self):
@@ -1975,18 +2628,21 @@ class H5Data(_H5ArrayMixin, _HdfData):
     """
 
     @classmethod
-    def read_file(cls, ifile: PathLike):
-        """Open an HDF5 file for reading and return the :class:`h5py.File` handle."""
-        return h5.File(ifile, 'r')
+    def read_file(cls, ifile: PathLike, swmr: bool = False):
+        """Open an HDF5 file for reading (SWMR reading, with *swmr*) and return the :class:`h5py.File` handle."""
+        return h5.File(ifile, 'r', swmr=swmr)
 
     def open(self):
         """Re-open the HDF5 file if it was previously closed.  Returns ``self``."""
         if not self._ref:
-            self._ref = self.read_file(self._filepath)
+            self._ref = self.read_file(self._filepath, swmr=self._swmr)
         return self
 
     def close(self):
-        """Close the HDF5 file handle.  Returns ``self``."""
+        """Close the HDF5 file handle (and those of any overview-level readers).  Returns ``self``."""
+        for reader in self._levels.values():
+            reader.close()
+        self._levels.clear()
         if self._ref is not None:
             self._ref.close()
             self._ref = None
@@ -1998,6 +2654,41 @@ class H5Data(_H5ArrayMixin, _HdfData):
             _ref.close()
             self._ref = None
 
+    def refresh(self) -> 'H5Data':
+        """Catch up with the data flushed by an SWMR writer since the file was opened (or last refreshed).
+
+        A reader opened with ``swmr=True`` sees the file as it was when opened:
+        this refreshes the extents and values of the dataset and of its scales
+        (see :meth:`h5py.Dataset.refresh`), and releases the cached data and
+        interpolator.
+
+        Returns
+        -------
+        out : H5Data
+            This reader.
+
+        Examples
+        --------
+        >>> reader = PsiData('br.h5', model='mas', swmr=True)  # doctest: +SKIP
+        >>> data = reader.refresh().read(scales=False)  # doctest: +SKIP
+        """
+        self._refresh_datasets()
+        self._reset_cache()
+        return self
+
+    def _refresh_datasets(self) -> None:
+        """Refresh the dataset and the scale datasets attached to it."""
+        _refresh_h5_dataset(self._ref[self._id])
+
+    def _reset_cache(self) -> None:
+        """Release the data and interpolator caches, reloading (or re-mapping) the data in the eager (mmap) modes."""
+        self._vcache = None
+        self._icache = None
+        if self._cache == 'eager':
+            self.load(recursive=False)
+        elif self._cache == 'mmap':
+            self._vcache = self._memmap()
+
     def _get_dims(self) -> Sequence:
         return self.dataset.dims
 
@@ -2009,6 +2700,166 @@ class H5Data(_H5ArrayMixin, _HdfData):
                                         dim, scale in zip(dims, Scales._fields)))
 
 
+class _H5SequenceEntry:
+    """One entry of an HDF5 sequence dataset, viewed as a dataset of its own.
+
+    Implements the subset of the :class:`h5py.Dataset` interface used by the
+    readers: every selection is prefixed with the index of the entry along the
+    leading (time) axis of the sequence dataset.
+    """
+
+    __slots__ = ('_dataset', '_index')
+
+    def __init__(self, dataset: h5.Dataset, index: int):
+        self._dataset = dataset
+        self._index = index
+
+    def __getitem__(self, args):
+        if not isinstance(args, tuple):
+            args = (args,)
+        return self._dataset[(self._index, *args)]
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._dataset.shape[1:]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dataset.dtype
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.dtype.itemsize
+
+    @property
+    def ndim(self) -> int:
+        return self._dataset.ndim - 1
+
+    @property
+    def attrs(self):
+        return self._dataset.attrs
+
+    @property
+    def dims(self) -> tuple:
+        return tuple(self._dataset.dims)[:-1]
+
+    def read_direct(self, dest: np.ndarray, source_sel: Optional[tuple] = None) -> None:
+        self._dataset.read_direct(dest, source_sel=(self._index, *(source_sel or ())))
+
+
+class H5SequenceData(H5Data):
+    """HDF5 reader for one entry of a sequence file.
+
+    A sequence file (see :class:`~psi_io.psi_io.HdfSequenceWriter`) stacks the
+    successive sequences of a quantity along the leading axis of one dataset.
+    This reader presents the entry of a single sequence – selected with the
+    ``sequence`` argument of :func:`PsiData`, or later by assigning
+    :attr:`sequence` – exactly as :class:`H5Data` presents a per-sequence file.
+
+    Instances are normally obtained via :func:`PsiData`.
+
+    See Also
+    --------
+    H5Data : Reader for a per-sequence HDF5 file.
+    PsiData : Public factory function.
+    """
+
+    def __init__(self,
+                 ifile: PathLike,
+                 dataset_id: Optional[str] = None,
+                 **kwargs):
+        self._index = 0
+        super().__init__(ifile, dataset_id, **kwargs)
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the entry being read.
+
+        Assigning a sequence number switches the reader to that entry (and
+        releases the cached data of the previous one).
+
+        Raises
+        ------
+        KeyError
+            If the file holds no entry for the assigned sequence number.
+        """
+        return self._sequence
+
+    @sequence.setter
+    def sequence(self, value: int):
+        """Switch the reader to the entry of sequence *value*."""
+        self._index = self._entry_index(value)
+        self._sequence = int(value)
+        self._reset_cache()
+
+    @property
+    def sequences(self) -> np.ndarray:
+        """Sequence numbers of every entry of the file, in increasing order.
+
+        For a reader opened with ``swmr=True``, the entries appended since the
+        file was opened are included, and can be selected through :attr:`sequence`.
+        """
+        if self._swmr:
+            self._refresh_datasets()
+        return _h5_sequence_scales(self._ref[self._id])[0][:]
+
+    @property
+    def times(self) -> np.ndarray:
+        """Simulation time of every entry of the file."""
+        if self._swmr:
+            self._refresh_datasets()
+        return _h5_sequence_scales(self._ref[self._id])[1][:]
+
+    @property
+    def time(self) -> float:
+        """Simulation time of the entry being read."""
+        return float(_h5_sequence_scales(self._ref[self._id])[1][self._index])
+
+    def _dataset(self, id_: str):
+        """Return the h5py Dataset at key *id_*, viewing the sequence dataset as its current entry."""
+        dataset = self._ref[id_]
+        return _H5SequenceEntry(dataset, self._index) if id_ == self._id else dataset
+
+    def _memmap(self) -> Optional[np.memmap]:
+        """Sequence datasets are chunked, and cannot be memory-mapped."""
+        return None
+
+    def _parse_inputs(self, **kwargs) -> dict:
+        """Resolve metadata as :class:`H5Data` does, defaulting the sequence to the first entry."""
+        attrs = super()._parse_inputs(**kwargs)
+        if 'sequence' not in kwargs:
+            attrs['sequence'] = self.sequences[0]
+        return attrs
+
+    def _set_metadata(self, *, sequence: int = 0, **kwargs) -> None:
+        """Select the entry of *sequence*, then apply the metadata as :class:`H5Data` does."""
+        self._index = self._entry_index(sequence)
+        super()._set_metadata(sequence=sequence, **kwargs)
+
+    def _entry_index(self, sequence: int) -> int:
+        """Return the index of the entry of *sequence* along the time axis."""
+        sequences = self.sequences
+        index = int(np.searchsorted(sequences, sequence))
+        if index == len(sequences) or sequences[index] != sequence:
+            raise KeyError(f"File '{self._filepath}' holds no entry for sequence {sequence}")
+        return index
+
+
+def _h5_reader(ifile: PathLike, /, *args, **kwargs) -> H5Data:
+    """Return an :class:`H5SequenceData` reader for a sequence file, and an :class:`H5Data` reader otherwise."""
+    dataset_id = (args[0] if args else kwargs.get('dataset_id')) or PSI_DATA_ID['h5']
+    if Path(ifile).is_file():
+        with H5Data.read_file(ifile, swmr=kwargs.get('swmr', False)) as hdf:
+            dataset = hdf.get(dataset_id)
+            if isinstance(dataset, h5.Dataset) and _h5_sequence_scales(dataset) is not None:
+                return H5SequenceData(ifile, *args, **kwargs)
+    return H5Data(ifile, *args, **kwargs)
+
+
 def PsiData(ifile: PathLike, /,
             *args,
             **kwargs):
@@ -2033,7 +2884,9 @@ def PsiData(ifile: PathLike, /,
     By default the reader is **lazy** (``cache='lazy'``): array data is
     transferred from disk only on access, and a full-array read is then cached on
     the reader.  Pass ``cache='eager'`` to load the data immediately at
-    construction, or ``cache=None`` to disable caching entirely.
+    construction, ``cache='mmap'`` to memory-map contiguous, uncompressed HDF5
+    datasets (so that random access reads only the pages it touches), or
+    ``cache=None`` to disable caching entirely.
 
     .. warning:: **POT3D unit convention**
 
@@ -2100,7 +2953,9 @@ def PsiData(ifile: PathLike, /,
     name : str, optional
         Override the quantity name inferred from the filename or file attributes.
     sequence : int, optional
-        Override the time-step sequence number.
+        Override the time-step sequence number.  For a sequence file (see
+        :class:`~psi_io.psi_io.HdfSequenceWriter`), select the entry to read
+        instead; defaults to the first entry of the file.
     unit : UnitLike, optional
         Override the code-to-physical unit from the quantity's
         :class:`~psi_io.models.ModelProps` entry.  Accepts any string parseable by
@@ -2138,13 +2993,22 @@ def PsiData(ifile: PathLike, /,
         Override the human-readable description.  Optional; defaults to ``''``.
     cache : CacheType, optional
         Cache mode.  ``'lazy'`` (default) caches the array on the first full
-        read, ``'eager'`` loads it immediately, and ``None`` disables caching.
+        read, ``'eager'`` loads it immediately, ``'mmap'`` memory-maps it
+        (falling back to ``'lazy'`` for datasets that cannot be mapped), and
+        ``None`` disables caching.
+    swmr : bool, optional
+        Open an HDF5 file for single-writer/multiple-reader reading, *e.g.* to
+        follow a run written by an :class:`~psi_io.psi_io.HdfSequenceWriter`
+        with ``swmr=True``.  The sequences of a sequence file are then kept up
+        to date, and :meth:`H5Data.refresh` catches up with the writer
+        explicitly.  Default is ``False``.
 
     Returns
     -------
-    out : H5Data | H4Data
+    out : H5Data | H5SequenceData | H4Data
         Open reader implementing the full :class:`_HdfData` API.  Concrete type
-        depends on the file extension.
+        depends on the file extension, and on whether an HDF5 file is a
+        sequence file.
 
     Raises
     ------
@@ -2153,6 +3017,8 @@ def PsiData(ifile: PathLike, /,
         metadata cannot be resolved.
     FileNotFoundError
         If *ifile* does not exist.
+    KeyError
+        If a sequence file holds no entry for *sequence*.
 
     See Also
     --------
@@ -2184,5 +3050,18 @@ def PsiData(ifile: PathLike, /,
     >>> reader.unit          # MAS_n  # doctest: +SKIP
     >>> reader.mesh          # Mesh(HALF, HALF, HALF)  # doctest: +SKIP
     >>> reader.data_cached   # False  # doctest: +SKIP
+
+    Read two sequences of a sequence file:
+
+    >>> reader = PsiData('br.h5', model='mas', sequence=1001)  # doctest: +SKIP
+    >>> data, r, t, p = reader.read()  # doctest: +SKIP
+    >>> reader.sequence = 1002  # doctest: +SKIP
+    >>> data, r, t, p = reader.read()  # doctest: +SKIP
+
+    Follow a run while it is being written, reading its latest sequence:
+
+    >>> reader = PsiData('br.h5', model='mas', swmr=True)  # doctest: +SKIP
+    >>> reader.sequence = reader.sequences[-1]  # doctest: +SKIP
+    >>> data, r, t, p = reader.read()  # doctest: +SKIP
     """
-    return _dispatch_by_ext(ifile, H4Data, H5Data, *args, **kwargs)
+    return _dispatch_by_ext(ifile, H4Data, _h5_reader, *args, **kwargs)
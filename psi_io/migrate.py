@@ -0,0 +1,414 @@
+r"""Parallel, resumable batch conversion of legacy HDF4 files to HDF5.
+
+This module migrates whole directory trees of PSI HDF4 (``.hdf``) files to HDF5
+(``.h5``) on top of :func:`~psi_io.psi_io.convert` (every dataset) or
+:func:`~psi_io.psi_io.convert_psih4_to_psih5` (the primary PSI dataset only).
+
+Because :py:mod:`pyhdf` is not thread-safe, files are spread across a *process*
+pool.  Each conversion is written to a temporary file that is atomically moved into
+place once it has been verified, so an interrupted migration never leaves a
+truncated output behind.  Progress is appended to a JSON Lines manifest, one record
+per file; re-running a migration skips every file whose source and output are
+unchanged (by modification time and size) since they were recorded.
+
+.. code-block:: python
+
+    from psi_io.migrate import migrate_hdf4_to_hdf5
+
+    records = migrate_hdf4_to_hdf5('/data/mas_runs', '/data/mas_runs_h5', workers=32)
+
+The same functionality is available from the command line::
+
+    psi-io-migrate /data/mas_runs /data/mas_runs_h5 --workers 32 --compression gzip
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "migrate_hdf4_to_hdf5",
+    "dataset_checksums",
+    "MigrationRecord",
+]
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional, Sequence, Dict, List, Tuple, Union, Iterable, Any
+
+import numpy as np
+
+from psi_io.psi_io import (PathLike,
+                           PSI_DATA_ID,
+                           CONVERT_SLAB_NBYTES,
+                           convert,
+                           convert_psih4_to_psih5,
+                           read_hdf_meta,
+                           read_hdf_scales,
+                           iter_hdf_slabs,
+                           find_hdf_files,
+                           )
+
+# The failures of a single file that are recorded in the manifest (instead of
+# aborting the migration): h5py reports I/O and format errors as OSError,
+# KeyError or ValueError, and pyhdf as HDF4Error.
+try:
+    from pyhdf.error import HDF4Error
+    _MIGRATION_ERRORS = (OSError, ValueError, KeyError, RuntimeError, ImportError, HDF4Error)
+except ImportError:
+    _MIGRATION_ERRORS = (OSError, ValueError, KeyError, RuntimeError, ImportError)
+
+
+MANIFEST_NAME = "psi_io_migration.jsonl"
+"""Default file name of the migration manifest (written to the output root)"""
+
+
+MigrationRecord = namedtuple('MigrationRecord', ['source', 'output', 'status', 'checksums', 'error'])
+MigrationRecord.__doc__ = """
+    Outcome of migrating a single HDF4 file.
+
+    Parameters
+    ----------
+    source : str
+        The path to the source HDF4 file.
+    output : str
+        The path to the output HDF5 file.
+    status : {'converted', 'skipped', 'failed'}
+        ``'skipped'`` files were already up to date.
+    checksums : dict[str, str]
+        The per-dataset checksums of the output (see :func:`dataset_checksums`).
+        Empty for failed files and for files converted with ``verify=False``.
+    error : str | None
+        The error message of a failed conversion.
+    """
+
+
+def dataset_checksums(ifile: PathLike, /,
+                      dataset_ids: Optional[Sequence[str]] = None,
+                      slab_nbytes: int = CONVERT_SLAB_NBYTES,
+                      ) -> Dict[str, str]:
+    """
+    Compute a format-independent checksum of each dataset in an HDF file.
+
+    The checksum covers the dataset's dtype, shape, values and scales, read one
+    hyperslab at a time, and is independent of the file format, byte order,
+    chunking and compression.  An HDF4 file and its HDF5 conversion therefore
+    yield the same checksums.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF4 (.hdf) or HDF5 (.h5) file.
+    dataset_ids : Sequence[str], optional
+        The datasets to checksum.  If ``None``, every (non-scale) dataset is used.
+    slab_nbytes : int, optional
+        The approximate size (in bytes) of each hyperslab read from the file.
+        Default is :data:`~psi_io.psi_io.CONVERT_SLAB_NBYTES`.
+
+    Returns
+    -------
+    out : dict[str, str]
+        A mapping of dataset identifiers to hexadecimal BLAKE2b digests.
+
+    Raises
+    ------
+    ValueError
+        If the file does not have a ``.hdf`` or ``.h5`` extension.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data
+    >>> from psi_io.migrate import dataset_checksums
+    >>> f = np.ones((4, 3), dtype=np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     out = write_hdf_data(Path(d) / "out.h5", f)
+    ...     list(dataset_checksums(out))
+    ['Data']
+    """
+    meta = {m.name: m for m in read_hdf_meta(ifile)}
+    if dataset_ids is None:
+        dataset_ids = list(meta)
+    checksums = {}
+    for dataid in dataset_ids:
+        dtype = np.dtype(meta[dataid].type).newbyteorder('<')
+        shape = tuple(meta[dataid].shape)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{dtype.str}{shape}".encode())
+        for slab in iter_hdf_slabs(ifile, dataid, slab_nbytes):
+            digest.update(np.ascontiguousarray(slab, dtype=dtype).tobytes())
+        for scale in read_hdf_scales(ifile, dataid):
+            if scale is not None:
+                scale = np.ascontiguousarray(scale, dtype=scale.dtype.newbyteorder('<'))
+                digest.update(scale.tobytes())
+        checksums[dataid] = digest.hexdigest()
+    return checksums
+
+
+def migrate_hdf4_to_hdf5(source: Union[PathLike, str],
+                         dest: Optional[PathLike] = None,
+                         *,
+                         pattern: str = "**/*.hdf",
+                         psi: bool = False,
+                         workers: Optional[int] = None,
+                         manifest: Optional[PathLike] = None,
+                         verify: bool = True,
+                         force: bool = False,
+                         **kwargs
+                         ) -> List[MigrationRecord]:
+    """
+    Convert a tree of HDF4 files to HDF5 in parallel, resuming earlier runs.
+
+    Parameters
+    ----------
+    source : PathLike | str
+        A directory (searched with ``pattern``) or a glob pattern
+        (*e.g.* ``'/data/run*/**/br*.hdf'``) selecting the HDF4 files.
+    dest : PathLike, optional
+        The root directory of the outputs.  The layout of the files relative to
+        ``source`` (or to the non-wildcard prefix of the glob) is preserved below
+        ``dest``.  If ``None``, each output is written alongside its source.
+    pattern : str, optional
+        The glob pattern used when ``source`` is a directory.  Default is ``'**/*.hdf'``.
+    psi : bool, optional
+        If ``True``, convert only the primary PSI dataset (``'Data-Set-2'`` → ``'Data'``)
+        with :func:`~psi_io.psi_io.convert_psih4_to_psih5`; otherwise every dataset is
+        converted (under its original name) with :func:`~psi_io.psi_io.convert`.
+        Default is ``False``.
+    workers : int, optional
+        The number of worker processes.  If ``None``, :func:`os.cpu_count` is used;
+        ``1`` converts the files sequentially in the calling process.
+    manifest : PathLike, optional
+        The path to the JSON Lines manifest.  If ``None``, :data:`MANIFEST_NAME` in
+        ``dest`` (or in the source root if ``dest`` is ``None``) is used.
+    verify : bool, optional
+        If ``True``, compare the :func:`dataset_checksums` of every output against its
+        source before moving it into place.  Default is ``True``.
+    force : bool, optional
+        If ``True``, convert every file even if its output is up to date.
+        Default is ``False``.
+    **kwargs
+        Keyword arguments forwarded to the converter, *viz.* ``chunks``, ``compression``,
+        ``compression_opts``, ``shuffle``, ``fletcher32`` and ``slab_nbytes``.
+
+    Returns
+    -------
+    out : list[MigrationRecord]
+        One record per selected file, in the order the files were found.
+
+    Notes
+    -----
+    An output is *up to date* when the manifest holds a successful record for its
+    source whose source and output modification times and sizes match the files
+    on disk.  Files converted by other means (*i.e.* absent from the manifest) are
+    treated as up to date if the output exists and is newer than the source.
+
+    Failed conversions are recorded in the manifest (and retried by the next run)
+    rather than aborting the migration.
+
+    See Also
+    --------
+    dataset_checksums : Format-independent per-dataset checksums.
+    psi_io.psi_io.convert : Single-file HDF4 ↔ HDF5 converter.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data
+    >>> from psi_io.migrate import migrate_hdf4_to_hdf5
+    >>> with tempfile.TemporaryDirectory() as d:  # doctest: +SKIP
+    ...     _ = write_hdf_data(Path(d) / "br001.hdf", np.ones((4, 3), dtype=np.float32))
+    ...     [r.status for r in migrate_hdf4_to_hdf5(d, workers=1)]
+    ...     [r.status for r in migrate_hdf4_to_hdf5(d, workers=1)]
+    ['converted']
+    ['skipped']
+    """
+    root, sources = find_hdf_files(source, pattern)
+    dest = Path(dest) if dest is not None else root
+    manifest = Path(manifest) if manifest is not None else dest / MANIFEST_NAME
+    previous = _read_manifest(manifest)
+
+    records: Dict[int, MigrationRecord] = {}
+    tasks = []
+    for i, src in enumerate(sources):
+        out = dest / src.relative_to(root).with_suffix('.h5')
+        if not force and _is_up_to_date(src, out, previous.get(str(src))):
+            records[i] = MigrationRecord(str(src), str(out), 'skipped',
+                                         previous.get(str(src), {}).get('checksums', {}), None)
+        else:
+            tasks.append((i, (str(src), str(out), psi, verify, kwargs)))
+
+    manifest.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest, 'a') as log:
+        for i, entry in _run_tasks(tasks, workers):
+            records[i] = MigrationRecord(*(entry[k] for k in MigrationRecord._fields))
+            log.write(json.dumps(entry) + '\n')
+            log.flush()
+
+    return [records[i] for i in range(len(sources))]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command-line entry point (``psi-io-migrate``) for :func:`migrate_hdf4_to_hdf5`.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        The command-line arguments (excluding the program name).
+        If ``None``, :data:`sys.argv` is used.
+
+    Returns
+    -------
+    out : int
+        The exit status: ``0`` if every file was converted or skipped, ``1`` otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="psi-io-migrate",
+        description="Convert a tree of PSI HDF4 (.hdf) files to HDF5 (.h5) in parallel.")
+    parser.add_argument("source", help="source directory or glob pattern of HDF4 files")
+    parser.add_argument("dest", nargs="?", default=None,
+                        help="output root directory (default: alongside the sources)")
+    parser.add_argument("--pattern", default="**/*.hdf",
+                        help="glob pattern used when SOURCE is a directory (default: %(default)s)")
+    parser.add_argument("--psi", action="store_true",
+                        help="convert only the primary PSI dataset ('Data-Set-2' -> 'Data')")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--manifest", default=None,
+                        help=f"path to the resumable manifest (default: DEST/{MANIFEST_NAME})")
+    parser.add_argument("--no-verify", dest="verify", action="store_false",
+                        help="skip the per-dataset checksum verification")
+    parser.add_argument("--force", action="store_true",
+                        help="convert files even if their outputs are up to date")
+    parser.add_argument("--compression", choices=["gzip", "lzf"], default=None,
+                        help="HDF5 compression filter")
+    parser.add_argument("--compression-opts", type=int, default=None,
+                        help="compression filter options (e.g. the gzip level)")
+    parser.add_argument("--shuffle", action="store_true",
+                        help="apply the byte-shuffle filter before compression")
+    parser.add_argument("--fletcher32", action="store_true",
+                        help="store a Fletcher-32 checksum with every HDF5 chunk")
+    parser.add_argument("--chunks", choices=["auto"], default=None,
+                        help="chunk the HDF5 datasets")
+    parser.add_argument("--slab-mib", type=int, default=CONVERT_SLAB_NBYTES >> 20,
+                        help="size of the hyperslab held in memory, in MiB (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    records = migrate_hdf4_to_hdf5(args.source, args.dest,
+                                   pattern=args.pattern,
+                                   psi=args.psi,
+                                   workers=args.workers,
+                                   manifest=args.manifest,
+                                   verify=args.verify,
+                                   force=args.force,
+                                   chunks=args.chunks,
+                                   compression=args.compression,
+                                   compression_opts=args.compression_opts,
+                                   shuffle=args.shuffle,
+                                   fletcher32=args.fletcher32,
+                                   slab_nbytes=args.slab_mib << 20)
+
+    counts = {status: 0 for status in ('converted', 'skipped', 'failed')}
+    for record in records:
+        counts[record.status] += 1
+        if record.status == 'failed':
+            print(f"FAILED {record.source}: {record.error}", file=sys.stderr)
+    print(", ".join(f"{n} {status}" for status, n in counts.items()))
+    return int(counts['failed'] > 0)
+
+
+def _read_manifest(manifest: Path) -> Dict[str, Dict[str, Any]]:
+    """Read the latest manifest entry of every source file; a truncated last line is ignored."""
+    entries = {}
+    if manifest.is_file():
+        with open(manifest) as log:
+            for line in log:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                entries[entry['source']] = entry
+    return entries
+
+
+def _file_stat(ifile: Path) -> Tuple[int, int]:
+    """Return the modification time (ns) and size of *ifile*."""
+    stat = ifile.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _is_up_to_date(src: Path, out: Path, entry: Optional[Dict[str, Any]]) -> bool:
+    """Return whether *out* is an up-to-date conversion of *src* (see :func:`migrate_hdf4_to_hdf5`)."""
+    if not out.is_file():
+        return False
+    if entry is None:
+        return out.stat().st_mtime_ns >= src.stat().st_mtime_ns
+    return (entry['status'] == 'converted'
+            and entry['output'] == str(out)
+            and list(_file_stat(src)) == [entry['source_mtime_ns'], entry['source_size']]
+            and list(_file_stat(out)) == [entry['output_mtime_ns'], entry['output_size']])
+
+
+def _run_tasks(tasks: Sequence[Tuple[int, tuple]], workers: Optional[int]) -> Iterable[Tuple[int, Dict]]:
+    """Run :func:`_migrate_one` over *tasks*, yielding ``(index, entry)`` pairs as they complete."""
+    if not tasks:
+        return
+    if workers == 1 or len(tasks) == 1:
+        for i, task in tasks:
+            yield i, _migrate_one(*task)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_migrate_one, *task): i for i, task in tasks}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _migrate_one(source: str, output: str, psi: bool, verify: bool, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert (and verify) a single file; return its manifest entry.
+
+    The conversion is written to a temporary file alongside *output*, which is
+    moved into place only once it has been verified.  I/O and format errors
+    (:data:`_MIGRATION_ERRORS`) are caught and reported in the returned entry so
+    that one bad file does not abort a batch; anything else is a bug and propagates.
+    """
+    src, out = Path(source), Path(output)
+    partial = out.with_name(f"{out.stem}.partial{out.suffix}")
+    entry = dict(source=source, output=output, status='failed', checksums={}, error=None)
+    try:
+        source_stat = _file_stat(src)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        if psi:
+            pairs = [(PSI_DATA_ID['h4'], PSI_DATA_ID['h5'])]
+            convert_psih4_to_psih5(src, partial, **kwargs)
+        else:
+            pairs = [(meta.name, meta.name) for meta in read_hdf_meta(src)]
+            convert(src, partial, **kwargs)
+        if verify:
+            slab_nbytes = kwargs.get('slab_nbytes', CONVERT_SLAB_NBYTES)
+            expected = dataset_checksums(src, [a for a, _ in pairs], slab_nbytes)
+            result = dataset_checksums(partial, [b for _, b in pairs], slab_nbytes)
+            for a, b in pairs:
+                if expected[a] != result[b]:
+                    raise ValueError(f"Checksum mismatch between dataset '{a}' and its conversion '{b}'")
+            entry['checksums'] = result
+        if _file_stat(src) != source_stat:
+            raise RuntimeError("Source file was modified during conversion")
+        os.replace(partial, out)
+        entry['status'] = 'converted'
+        entry.update(zip(('source_mtime_ns', 'source_size'), source_stat))
+        entry.update(zip(('output_mtime_ns', 'output_size'), _file_stat(out)))
+    except _MIGRATION_ERRORS as e:
+        entry['error'] = f"{type(e).__name__}: {e}"
+        partial.unlink(missing_ok=True)
+    return entry
+
+
+if __name__ == "__main__":
+    sys.exit(main())
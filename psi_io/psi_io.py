@@ -15,7 +15,7 @@ Writing full datasets:
     :func:`write_hdf_data`, :func:`wrhdf_1d`, :func:`wrhdf_2d`, :func:`wrhdf_3d`
 
 Reading file metadata:
-    :func:`read_hdf_meta`, :func:`read_rtp_meta`
+    :func:`read_hdf_meta`, :func:`read_rtp_meta`, :func:`read_hdf_scales`
 
 Reading dataset subsets:
     :func:`get_scales_1d`, :func:`get_scales_2d`, :func:`get_scales_3d`,
@@ -25,8 +25,31 @@ Interpolating data:
     :func:`np_interpolate_slice_from_hdf`, :func:`sp_interpolate_slice_from_hdf`,
     :func:`interpolate_positions_from_hdf`
 
+Reading a slice from a sequence of files:
+    :func:`read_hdf_series` (and :func:`find_hdf_files` to select them)
+
 Converting between formats:
-    :func:`convert`, :func:`convert_psih4_to_psih5`
+    :func:`convert`, :func:`convert_psih4_to_psih5` (and :func:`iter_hdf_slabs` to
+    stream a dataset by hyperslab)
+
+Multi-resolution (pyramid) storage:
+    :func:`build_hdf_pyramid`, :func:`read_hdf_levels` (and the ``level`` argument
+    of :func:`read_hdf_data` and :func:`read_hdf_by_index`)
+
+Reusing open file handles:
+    :func:`configure_handle_pool`, :func:`handle_pool_info`, :func:`clear_handle_pool`
+
+Caching coordinate scales and metadata:
+    :func:`configure_meta_cache`, :func:`meta_cache_info`, :func:`clear_meta_cache`
+
+Reusing output buffers:
+    :class:`BufferPool` (passed as the ``out`` argument of the read routines)
+
+Writing several datasets to one file:
+    :class:`HdfWriter`
+
+Appending the sequences of a run to one file:
+    :class:`HdfSequenceWriter`, :func:`read_hdf_sequences`
 
 See Also
 --------
@@ -52,6 +75,7 @@ from __future__ import annotations
 __all__ = [
     "read_hdf_meta",
     "read_rtp_meta",
+    "read_hdf_scales",
 
     "get_scales_1d",
     "get_scales_2d",
@@ -64,6 +88,15 @@ __all__ = [
     "np_interpolate_slice_from_hdf",
     "sp_interpolate_slice_from_hdf",
     "interpolate_positions_from_hdf",
+    "InterpolationPlan",
+    "PointQuery",
+    "RegridPlan",
+    "regrid_hdf_data",
+    "ReadPlan",
+    "plan_hdf_read",
+
+    "read_hdf_series",
+    "find_hdf_files",
 
     "instantiate_linear_interpolator",
     "interpolate_point_from_1d_slice",
@@ -81,18 +114,45 @@ __all__ = [
     "wrhdf_3d",
 
     "convert",
-    "convert_psih4_to_psih5"
+    "convert_psih4_to_psih5",
+    "iter_hdf_slabs",
+
+    "build_hdf_pyramid",
+    "read_hdf_levels",
+
+    "configure_handle_pool",
+    "handle_pool_info",
+    "clear_handle_pool",
+
+    "configure_meta_cache",
+    "meta_cache_info",
+    "clear_meta_cache",
+
+    "BufferPool",
+
+    "HdfWriter",
+    "HdfSequenceWriter",
+    "read_hdf_sequences",
 ]
 
+import glob
 import math
-from collections import namedtuple
+import threading
+import weakref
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from itertools import product
 from pathlib import Path
 from types import MappingProxyType
-from typing import Optional, Literal, Tuple, Sequence, List, Dict, Union, Callable, Any, Mapping
+from typing import (Optional, Literal, Tuple, Sequence, List, Dict, Union, Callable, Any, Mapping,
+                    Iterator)
 
 import numpy as np
 import h5py as h5
 
+from psi_io.mesh import Mesh, MeshLike, coarsen_array, coarsen_scale
+
 # -----------------------------------------------------------------------------
 # Optional Imports and Import Checking
 # -----------------------------------------------------------------------------
@@ -220,6 +280,92 @@ HdfExtType = Literal['.hdf', '.h5']
 """Type alias for possible HDF file extensions"""
 
 
+ChunkType = Union[bool, Literal['auto'], Tuple[int, ...], None]
+"""Type alias for the chunk layout requested when writing a dataset
+
+``None`` or ``False`` requests contiguous storage (unless a filter requires chunking),
+``'auto'`` the PSI access-pattern chooser :func:`_auto_chunk_shape`, ``True`` h5py's
+own heuristic, and a tuple an explicit chunk shape."""
+
+
+CONVERT_SLAB_NBYTES = 1 << 26
+"""Default size (in bytes) of the hyperslab held in memory by :func:`convert` (and by chunked HDF4 reads)"""
+
+
+INTERP_CHUNK_SIZE = 1 << 16
+"""Default number of positions evaluated at a time by the NumPy interpolation engine
+
+Each position of a chunk holds a cell index and a weight per dimension, so chunks of
+64 Ki positions keep the temporaries of a 3D interpolation to a few MiB."""
+
+
+INTERP_ENGINES = ('scipy', 'numpy')
+"""Engines available to the linear interpolation routines (see :func:`instantiate_linear_interpolator`)"""
+
+
+UNION_MERGE_GAP = 8
+"""Largest number of unneeded indices read to merge two bracket windows into one hyperslab
+
+When several target values are requested along an axis (see :func:`read_hdf_by_value`),
+their bracket windows are read with one hyperslab per run of windows separated by at
+most this many indices."""
+
+
+AUTO_CHUNK_NBYTES = 1 << 18
+"""Target chunk size (in bytes) used by :func:`_auto_chunk_shape`
+
+Chunks of 256 KiB fit comfortably in HDF5's default 1 MiB chunk cache, while remaining
+large enough to keep the chunk index small for multi-GB cubes."""
+
+
+READ_REQUEST_NBYTES = 1 << 14
+"""Cost (in equivalent bytes) charged by the read planner for every separate read request
+
+:func:`plan_hdf_read` ranks read strategies by the bytes they read plus this overhead
+per request – a seek, a hyperslab or a chunk lookup – so that reading a few unneeded
+bytes at once wins over reading only the needed bytes in many small pieces."""
+
+
+READ_POINT_NBYTES = 1 << 8
+"""Cost (in equivalent bytes) charged by the read planner for every element of an HDF5 point selection"""
+
+
+INTERP_TILE_SIZE = 32
+"""Number of grid cells along each dimension of the tiles considered by the read planner for unchunked datasets"""
+
+
+READ_STRATEGIES = ('auto', 'window', 'tiles', 'points', 'full')
+"""Strategies accepted by :func:`interpolate_positions_from_hdf` (see :func:`plan_hdf_read`)"""
+
+
+POINT_LOOKUP_BINS = 4
+"""Number of lookup-table bins per grid cell used by the bracket search of :class:`PointQuery`
+
+The bins are uniform over each scale, so on a stretched grid (*e.g.* a radial scale) a
+bin may span several of the smallest cells; the search then walks a few cells forward."""
+
+
+PYRAMID_GROUP = 'pyramid'
+"""Name of the HDF5 group holding the overview levels of a multi-resolution pyramid
+
+Level ``k`` of dataset ``<id>`` is stored as ``<PYRAMID_GROUP>/<id>/<k>/<id>``, next to
+its own coordinate scales (see :func:`build_hdf_pyramid`)."""
+
+
+SEQUENCE_SCALE_ID = 'sequence'
+"""Name of the scale holding the sequence numbers of a sequence file
+
+A sequence file (see :class:`HdfSequenceWriter`) stacks the successive sequences of
+a quantity along the leading (slowest-varying) axis of one dataset; this scale, and
+the :data:`TIME_SCALE_ID` scale, are attached to that axis.  The scales of a sequence
+dataset other than ``'Data'`` are stored as ``<dataset_id>_sequence`` and
+``<dataset_id>_time``, so that one file can hold several sequence datasets."""
+
+
+TIME_SCALE_ID = 'time'
+"""Name of the scale holding the simulation time of each entry of a sequence file"""
+
+
 HdfScaleMeta = namedtuple('HdfScaleMeta', ['name', 'type', 'shape', 'attr', 'imin', 'imax'])
 """
     Named tuple storing metadata for a single HDF scale (coordinate) dimension.
@@ -316,7 +462,10 @@ def _dtype_to_sdc(dtype: np.dtype):
 def _dispatch_by_ext(ifile: PathLike,
                      hdf4_func: Callable,
                      hdf5_func: Callable,
-                     *args: Any, **kwargs: Any
+                     *args: Any,
+                     pooled: bool = False,
+                     swmr_read: bool = False,
+                     **kwargs: Any
                      ):
     """
     Dispatch function to call HDF4 or HDF5 specific functions based on file extension.
@@ -331,6 +480,19 @@ def _dispatch_by_ext(ifile: PathLike,
         The function to call for HDF5 files.
     *args : Any
         Positional arguments to pass to the selected function.
+    pooled : bool, optional
+        If ``True`` and the module-level handle pool is enabled (see
+        :func:`configure_handle_pool`), an open read-only handle is leased from
+        the pool and passed to the selected function in place of ``ifile``.
+        Only functions that accept an open handle (*i.e.* the ``_read_*``
+        helpers) should be dispatched this way.  Default is ``False``.
+    swmr_read : bool, optional
+        If ``True``, the HDF5 file is opened for single-writer/multiple-reader
+        (SWMR) reading, the dataset ``kwargs['dataset_id']`` is refreshed, and
+        the handle is passed in place of ``ifile`` (the pool is bypassed, so
+        that the latest extents written by an SWMR writer are seen).  As with
+        ``pooled``, only the ``_read_*`` helpers should be dispatched this way.
+        Default is ``False``.
     **kwargs : Any
         Keyword arguments to pass to the selected function.
 
@@ -342,7 +504,8 @@ def _dispatch_by_ext(ifile: PathLike,
     Raises
     ------
     ValueError
-        If the file does not have a `.hdf` or `.h5` extension.
+        If the file does not have a `.hdf` or `.h5` extension, or if ``swmr_read``
+        is requested for an HDF4 file.
     ImportError
         If the file is HDF4 and the `pyhdf` package is not available.
 
@@ -357,414 +520,1341 @@ def _dispatch_by_ext(ifile: PathLike,
     """
     ipath = Path(ifile)
     if ipath.suffix == '.h5':
-        return hdf5_func(ifile, *args, **kwargs)
-    if ipath.suffix == '.hdf':
+        func = hdf5_func
+    elif ipath.suffix == '.hdf':
         _except_no_pyhdf()
-        return hdf4_func(ifile, *args, **kwargs)
-    raise ValueError("File must be HDF4 (.hdf) or HDF5 (.h5)")
+        func = hdf4_func
+    else:
+        raise ValueError("File must be HDF4 (.hdf) or HDF5 (.h5)")
+    if swmr_read:
+        if func is hdf4_func:
+            raise ValueError("SWMR is only supported for HDF5 (.h5) files")
+        # HDF5 refuses to open a file for SWMR reading while it is open without SWMR.
+        _HANDLE_POOL.evict(ifile)
+        with h5.File(ifile, 'r', swmr=True) as handle:
+            dataset = handle.get(kwargs.get('dataset_id') or PSI_DATA_ID['h5'])
+            if isinstance(dataset, h5.Dataset):
+                _refresh_h5_dataset(dataset)
+            return func(handle, *args, **kwargs)
+    if pooled and _HANDLE_POOL.maxsize:
+        with _HANDLE_POOL.lease(ifile) as handle:
+            return func(handle, *args, **kwargs)
+    return func(ifile, *args, **kwargs)
+
+
+def _file_stat(ifile: Path) -> Tuple[int, int]:
+    """Return the modification time (ns) and size of *ifile*."""
+    stat = ifile.stat()
+    return stat.st_mtime_ns, stat.st_size
 
 
 # -----------------------------------------------------------------------------
-# "Classic" HDF reading and writing routines adapted from psihdf.py or psi_io.py.
+# Pooled file handles for the functional read API.
 # -----------------------------------------------------------------------------
 
 
-def rdhdf_1d(hdf_filename: PathLike
-             ) -> Tuple[np.ndarray, np.ndarray]:
-    """Read a 1D PSI-style HDF5 or HDF4 file.
+HandlePoolInfo = namedtuple('HandlePoolInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+"""
+    Named tuple reporting the statistics of an :class:`HdfHandlePool`.
 
     Parameters
     ----------
-    hdf_filename : PathLike
-        The path to the 1D HDF5 (.h5) or HDF4 (.hdf) file to read.
+    hits : int
+        Number of handle requests served by an already-open handle.
+    misses : int
+        Number of handle requests that required opening the file.
+    evictions : int
+        Number of handles closed to keep the pool within ``maxsize`` or
+        because the underlying file changed on disk.
+    maxsize : int
+        The maximum number of handles held open by the pool.
+    currsize : int
+        The number of handles currently held open by the pool.
+"""
 
-    Returns
-    -------
-    x : np.ndarray
-        1D coordinate scale array.
-    f : np.ndarray
-        1D data array.
 
-    See Also
-    --------
-    read_hdf_data : Generic HDF data reading routine.
+class _PooledHandle:
+    """An open HDF file handle together with its lease bookkeeping."""
+
+    __slots__ = ('handle', 'leases', 'retired')
+
+    def __init__(self, handle):
+        self.handle = handle
+        self.leases = 0
+        self.retired = False
+
+    def close(self):
+        """Close the handle now, or once the last lease is released."""
+        self.retired = True
+        if not self.leases:
+            _close_handle(self.handle)
+
+
+class HdfHandlePool:
+    """Bounded LRU pool of open HDF4/HDF5 file handles.
+
+    Handles are keyed by ``(resolved path, mtime, mode)`` so that a file which is
+    rewritten on disk is transparently reopened rather than served from a stale
+    handle.  When the pool grows beyond ``maxsize`` the least recently used
+    handle is closed (``h5py.File.close`` for HDF5, ``pyhdf.SD.SD.end`` for
+    HDF4).  Handles that are leased at the time of eviction are closed when
+    their last lease is released.
+
+    The functional read API (:func:`read_hdf_data`, :func:`read_hdf_by_index`,
+    :func:`read_hdf_meta`, *etc.*) leases handles from the module-level pool
+    configured through :func:`configure_handle_pool`; instantiating this class
+    directly is only needed for private pools.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of handles held open.  A value of ``0`` disables
+        pooling (every lease opens and closes the file).  Default is ``0``.
 
     Examples
     --------
-    >>> from psi_io import rdhdf_1d
-    >>> from psi_data import fetch_example_radial_scale
-    >>> filepath = fetch_example_radial_scale()
-    >>> x, f = rdhdf_1d(filepath)
-    >>> x.shape, f.shape
-    ((121,), (121,))
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data
+    >>> from psi_io.psi_io import HdfHandlePool
+    >>> pool = HdfHandlePool(maxsize=4)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     fp = write_hdf_data(Path(d) / "out.h5", np.ones((3, 4)))
+    ...     for _ in range(3):
+    ...         with pool.lease(fp) as hdf:
+    ...             shape = hdf['Data'].shape
+    ...     info = pool.info()
+    ...     pool.clear()
+    >>> info
+    HandlePoolInfo(hits=2, misses=1, evictions=0, maxsize=4, currsize=1)
     """
-    return _rdhdf_nd(hdf_filename, dimensionality=1)
 
+    def __init__(self, maxsize: int = 0):
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+        self._maxsize = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.resize(maxsize)
+
+    def __len__(self) -> int:
+        """Return the number of handles currently held open by the pool."""
+        return len(self._entries)
+
+    def __contains__(self, ifile: PathLike) -> bool:
+        """Return ``True`` if any handle to *ifile* is currently pooled."""
+        ipath = str(Path(ifile).resolve())
+        with self._lock:
+            return any(key[0] == ipath for key in self._entries)
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of handles held open by the pool."""
+        return self._maxsize
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of pooled handles, closing any excess.
+
+        Parameters
+        ----------
+        maxsize : int
+            The new maximum number of handles; ``0`` disables pooling and
+            closes every pooled handle.
+
+        Raises
+        ------
+        ValueError
+            If *maxsize* is negative.
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative; got {maxsize}")
+        with self._lock:
+            self._maxsize = int(maxsize)
+            self._trim()
+
+    @contextmanager
+    def lease(self, ifile: PathLike, mode: Literal['r', 'r+'] = 'r'):
+        """Lease an open handle to *ifile* for the duration of a ``with`` block.
+
+        Parameters
+        ----------
+        ifile : PathLike
+            The path to an existing HDF4 (.hdf) or HDF5 (.h5) file.
+        mode : {'r', 'r+'}, optional
+            The access mode used to open the file.  Default is ``'r'``.
+
+        Yields
+        ------
+        handle : h5py.File | pyhdf.SD.SD
+            The open file handle.  It must not be closed by the caller.
+
+        Raises
+        ------
+        FileNotFoundError
+            If *ifile* does not exist.
+        """
+        ipath = Path(ifile).resolve()
+        key = (str(ipath), ipath.stat().st_mtime_ns, mode)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+                self._discard(lambda k: k[0] == key[0] and k[2] == mode)
+                entry = _PooledHandle(_open_handle(ipath, mode))
+                if self._maxsize:
+                    self._entries[key] = entry
+                    self._trim()
+                else:
+                    entry.retired = True
+            entry.leases += 1
+        try:
+            yield entry.handle
+        finally:
+            with self._lock:
+                entry.leases -= 1
+                if entry.retired and not entry.leases:
+                    _close_handle(entry.handle)
+
+    def evict(self, ifile: PathLike) -> None:
+        """Close every pooled handle to *ifile*, *e.g.* before it is overwritten.
+
+        Parameters
+        ----------
+        ifile : PathLike
+            The path whose handles should be closed.  Paths that are not
+            pooled are ignored.
+        """
+        ipath = str(Path(ifile).resolve())
+        with self._lock:
+            self._discard(lambda k: k[0] == ipath)
+
+    def clear(self) -> None:
+        """Close every pooled handle and reset the statistics."""
+        with self._lock:
+            self._discard(lambda k: True)
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> HandlePoolInfo:
+        """Return the pool statistics as a :data:`HandlePoolInfo` named tuple."""
+        with self._lock:
+            return HandlePoolInfo(self._hits, self._misses, self._evictions,
+                                  self._maxsize, len(self._entries))
+
+    def _discard(self, predicate: Callable[[tuple], bool]) -> None:
+        """Close and remove every entry whose key satisfies *predicate*."""
+        for key in [k for k in self._entries if predicate(k)]:
+            self._entries.pop(key).close()
+            self._evictions += 1
+
+    def _trim(self) -> None:
+        """Close least-recently-used entries until the pool fits in ``maxsize``."""
+        while len(self._entries) > self._maxsize:
+            _, entry = self._entries.popitem(last=False)
+            entry.close()
+            self._evictions += 1
+
+
+def _open_handle(ifile: Path, mode: Literal['r', 'r+'] = 'r'):
+    """Open an HDF4 or HDF5 file handle based on the file extension."""
+    if ifile.suffix == '.h5':
+        return h5.File(ifile, mode)
+    if ifile.suffix == '.hdf':
+        _except_no_pyhdf()
+        return h4.SD(str(ifile), h4.SDC.READ if mode == 'r' else h4.SDC.WRITE)
+    raise ValueError("File must be HDF4 (.hdf) or HDF5 (.h5)")
 
-def rdhdf_2d(hdf_filename: PathLike
-             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """Read a 2D PSI-style HDF5 or HDF4 file.
 
-    The data in the HDF file is assumed to be ordered X, Y in Fortran order.
-    Each dimension is assumed to have a 1D scale associated with it that
-    describes the rectilinear grid coordinates.
+def _close_handle(handle) -> None:
+    """Close an HDF4 (``end``) or HDF5 (``close``) file handle."""
+    if isinstance(handle, h5.File):
+        handle.close()
+    else:
+        handle.end()
+
+
+@contextmanager
+def _open_h5(ifile: Union[PathLike, h5.File]):
+    """Yield an open :class:`h5py.File` for *ifile*, closing it on exit if opened here.
 
     Parameters
     ----------
-    hdf_filename : PathLike
-        The path to the 2D HDF5 (.h5) or HDF4 (.hdf) file to read.
+    ifile : PathLike | h5py.File
+        Either the path to an HDF5 file, or an already-open handle (*e.g.* one
+        leased from :class:`HdfHandlePool`), which is yielded as-is and left open.
 
-    Returns
-    -------
-    x : np.ndarray
-        1D coordinate scale array for the X dimension.
-    y : np.ndarray
-        1D coordinate scale array for the Y dimension.
-    f : np.ndarray
-        2D data array, C-ordered with shape ``(ny, nx)`` in Python.
+    Yields
+    ------
+    hdf : h5py.File
+        The open file handle.
+    """
+    if isinstance(ifile, h5.File):
+        yield ifile
+    else:
+        with h5.File(ifile, 'r') as hdf:
+            yield hdf
 
-    Notes
-    -----
-    Because Fortran uses column-major ordering and Python uses row-major
-    ordering, the data array is returned with reversed axis order relative to
-    how it is stored on disk.  The first returned scale always corresponds to
-    the *slowest* varying dimension in the data array (i.e. the last axis).
 
-    See Also
-    --------
-    read_hdf_data : Generic HDF data reading routine.
+@contextmanager
+def _open_h4(ifile: Union[PathLike, Any]):
+    """Yield an open :class:`pyhdf.SD.SD` for *ifile*, ending it on exit if opened here.
 
-    Examples
-    --------
-    >>> from psi_io import rdhdf_2d
-    >>> from psi_data import fetch_mas_quantities
-    >>> filepath = fetch_mas_quantities().ch_pm
-    >>> x, y, f = rdhdf_2d(filepath)
-    >>> f.shape == (y.shape[0], x.shape[0])
-    True
+    Parameters
+    ----------
+    ifile : PathLike | pyhdf.SD.SD
+        Either the path to an HDF4 file, or an already-open handle (*e.g.* one
+        leased from :class:`HdfHandlePool`), which is yielded as-is and left open.
+
+    Yields
+    ------
+    hdf : pyhdf.SD.SD
+        The open file handle.
     """
-    return _rdhdf_nd(hdf_filename, dimensionality=2)
+    if H4_AVAILABLE and isinstance(ifile, h4.SD):
+        yield ifile
+    else:
+        hdf = h4.SD(str(ifile))
+        try:
+            yield hdf
+        finally:
+            hdf.end()
 
 
-def rdhdf_3d(hdf_filename: PathLike
-             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-    """Read a 3D PSI-style HDF5 or HDF4 file.
+_HANDLE_POOL = HdfHandlePool()
+"""Module-level handle pool leased by the functional read API."""
 
-    The data in the HDF file is assumed to be ordered X, Y, Z in Fortran order.
-    Each dimension is assumed to have a 1D scale associated with it that
-    describes the rectilinear grid coordinates.
+
+def configure_handle_pool(maxsize: int) -> None:
+    """
+    Set the size of the handle pool used by the functional read API.
+
+    When enabled, :func:`read_hdf_data`, :func:`read_hdf_by_index`,
+    :func:`read_hdf_by_value`, :func:`read_hdf_by_ivalue`, :func:`read_hdf_meta`,
+    :func:`read_rtp_meta` and the ``get_scales_*`` routines reuse open file
+    handles instead of opening and closing the file on every call.  This is
+    most useful when the same files are sliced repeatedly.
 
     Parameters
     ----------
-    hdf_filename : PathLike
-        The path to the 3D HDF5 (.h5) or HDF4 (.hdf) file to read.
+    maxsize : int
+        The maximum number of files held open at once.  ``0`` (the default
+        state at import) disables pooling and closes all pooled handles.
 
-    Returns
-    -------
-    x : np.ndarray
-        1D coordinate scale array for the X dimension.
-    y : np.ndarray
-        1D coordinate scale array for the Y dimension.
-    z : np.ndarray
-        1D coordinate scale array for the Z dimension.
-    f : np.ndarray
-        3D data array, C-ordered with shape ``(nz, ny, nx)`` in Python.
+    Raises
+    ------
+    ValueError
+        If *maxsize* is negative.
 
     Notes
     -----
-    Because Fortran uses column-major ordering and Python uses row-major
-    ordering, the data array is returned with reversed axis order relative to
-    how it is stored on disk.  For PSI spherical datasets the returned shapes
-    follow the convention ``f.shape == (n_phi, n_theta, n_r)`` with scales
-    returned in physical order ``(r, theta, phi)``.
+    Pooled handles are keyed by the resolved path, modification time and
+    access mode, so files that change on disk are reopened automatically.
+    The writers in this module (:func:`write_hdf_data`, :func:`write_hdf_meta`,
+    *etc.*) evict pooled handles to their target before opening it.  Files
+    written by other means in the same process should be evicted first with
+    :func:`clear_handle_pool`, since HDF5 does not allow a file to be opened
+    for writing while a read-only handle to it is open.
 
     See Also
     --------
-    read_hdf_data : Generic HDF data reading routine.
+    handle_pool_info : Return the pool statistics.
+    clear_handle_pool : Close every pooled handle.
 
     Examples
     --------
-    >>> from psi_io import rdhdf_3d
-    >>> from psi_data import fetch_mas_data
-    >>> filepath = fetch_mas_data().cor_br
-    >>> r, t, p, f = rdhdf_3d(filepath)
-    >>> f.shape == (p.shape[0], t.shape[0], r.shape[0])
-    True
+    >>> from psi_io import configure_handle_pool, handle_pool_info
+    >>> configure_handle_pool(128)
+    >>> handle_pool_info().maxsize
+    128
+    >>> configure_handle_pool(0)
     """
-    return _rdhdf_nd(hdf_filename, dimensionality=3)
+    _HANDLE_POOL.resize(maxsize)
 
 
-def wrhdf_1d(hdf_filename: PathLike,
-             x: np.ndarray,
-             f: np.ndarray,
-             **kwargs) -> None:
-    """Write a 1D PSI-style HDF5 or HDF4 file.
-
-    Parameters
-    ----------
-    hdf_filename : PathLike
-        The path to the 1D HDF5 (.h5) or HDF4 (.hdf) file to write.
-    x : np.ndarray
-        1D array of scales.
-    f : np.ndarray
-        1D array of data.
-    **kwargs
-        Additional keyword arguments passed through to the underlying
-        :func:`~psi_io.psi_io.write_hdf_data` routine, specifically:
+def handle_pool_info() -> HandlePoolInfo:
+    """
+    Return the statistics of the handle pool used by the functional read API.
 
-        - ``dataset_id`` : str | None
-            The identifier of the dataset to write.
-            If None, a default dataset is used ('Data-Set-2' for HDF4 and 'Data' for HDF5).
-        - ``sync_dtype``: bool
-            If True, the data type of the scales will be matched to that of the data array.
+    Returns
+    -------
+    out : HandlePoolInfo
+        Named tuple of ``(hits, misses, evictions, maxsize, currsize)``.
 
-        Omitting these will yield the same behavior as the legacy routines, *i.e.* writing to
-        the default PSI dataset IDs for HDF4/HDF5 files and synchronizing datatypes between
-        the dataset and scales.
+    See Also
+    --------
+    configure_handle_pool : Enable, disable or resize the pool.
 
-    Raises
-    ------
-    ValueError
-        If the file does not have a ``.hdf`` or ``.h5`` extension.
-    KeyError
-        If, for HDF4 files, the data or scale dtype is not supported by
-        :py:mod:`pyhdf`.  See :func:`write_hdf_data` for the full dtype
-        support table.
+    Examples
+    --------
+    >>> from psi_io import handle_pool_info
+    >>> handle_pool_info()  # doctest: +SKIP
+    HandlePoolInfo(hits=0, misses=0, evictions=0, maxsize=0, currsize=0)
+    """
+    return _HANDLE_POOL.info()
 
-    Notes
-    -----
-    This routine is provided for backward compatibility with existing PSI codes that
-    expect this API signature.  The underlying implementation dispatches to
-    :func:`~psi_io.psi_io.write_hdf_data`, but the argument order and default
-    behavior (sync dtype, default dataset IDs) are preserved.
 
-    .. warning::
-       When called with its default arguments this routine **writes to the default PSI
-       dataset IDs for HDF4/HDF5 files and synchronizes dtypes between the dataset and
-       scales.**  This behavior is required for interoperability with certain Fortran-based
-       PSI tools.
+def clear_handle_pool() -> None:
+    """
+    Close every handle held by the functional read API's pool and reset its statistics.
 
     See Also
     --------
-    write_hdf_data : Generic HDF data writing routine.
+    configure_handle_pool : Enable, disable or resize the pool.
 
     Examples
     --------
-    >>> import tempfile, numpy as np
-    >>> from pathlib import Path
-    >>> from psi_io import wrhdf_1d, rdhdf_1d
-    >>> x = np.linspace(0.0, 1.0, 50, dtype=np.float32)
-    >>> f = np.sin(x)
-    >>> with tempfile.TemporaryDirectory() as d:
-    ...     wrhdf_1d(Path(d) / "out.h5", x, f)
-    ...     x2, f2 = rdhdf_1d(Path(d) / "out.h5")
-    ...     np.array_equal(f, f2)
-    True
+    >>> from psi_io import clear_handle_pool
+    >>> clear_handle_pool()
     """
-    return _wrhdf_nd(hdf_filename, f, x, dimensionality=1, **kwargs)
+    _HANDLE_POOL.clear()
 
 
-def wrhdf_2d(hdf_filename: PathLike,
-             x: np.ndarray,
-             y: np.ndarray,
-             f: np.ndarray,
-             **kwargs) -> None:
-    """Write a 2D PSI-style HDF5 or HDF4 file.
+class BufferPool:
+    """Free list of reusable NumPy arrays for repeated reads of the same shape.
 
-    The data in the HDF file will appear as X,Y in Fortran order.
+    Passing a pool as the ``out`` argument of the read API (:func:`read_hdf_data`,
+    :func:`read_hdf_by_index`, :func:`read_hdf_by_value`, :func:`read_hdf_by_ivalue`,
+    and :meth:`~psi_io.mhd_io._HdfData.read`/:meth:`~psi_io.mhd_io._HdfData.vslice`)
+    fills an array acquired from the pool instead of allocating a new one.  Once the
+    caller is done with the result it hands the array back with :meth:`release`, so a
+    loop that repeatedly reads selections of the same shape allocates nothing after
+    its first iteration.
 
-    Each dimension requires a 1D "scale" associated with it that
-    describes the rectilinear grid coordinates in each dimension.
+    Idle arrays are keyed by ``(shape, dtype)``.  At most ``maxbuffers`` idle arrays
+    are kept per key; any excess is dropped on release.
 
     Parameters
     ----------
-    hdf_filename : PathLike
-        The path to the 2D HDF5 (.h5) or HDF4 (.hdf) file to write.
-    x : np.ndarray
-        1D array of scales in the X dimension.
-    y : np.ndarray
-        1D array of scales in the Y dimension.
-    f : np.ndarray
-        2D data array, C-ordered with shape ``(ny, nx)`` in Python.
-    **kwargs
-        Additional keyword arguments passed through to the underlying
-        :func:`~psi_io.psi_io.write_hdf_data` routine, specifically:
+    maxbuffers : int, optional
+        The maximum number of idle arrays kept per ``(shape, dtype)``.
+        Default is ``4``.
 
-        - ``dataset_id`` : str | None
-            The identifier of the dataset to write.
-            If None, a default dataset is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
-        - ``sync_dtype``: bool
-            If True, the data type of the scales will be matched to that of the data array.
+    Raises
+    ------
+    ValueError
+        If *maxbuffers* is negative.
 
-        Omitting these will yield the same behavior as the legacy routines, *i.e.* writing to
-        the default PSI dataset IDs for HDF4/HDF5 files and synchronizing datatypes between
-        the dataset and scales.
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io import BufferPool
+    >>> pool = BufferPool()
+    >>> a = pool.acquire((2, 3), 'f4')
+    >>> pool.release(a)
+    >>> pool.acquire((2, 3), 'f4') is a
+    True
+    >>> with pool.borrow((4,), np.float64) as b:
+    ...     b.shape
+    (4,)
+    >>> len(pool)
+    1
+    """
+
+    def __init__(self, maxbuffers: int = 4):
+        if maxbuffers < 0:
+            raise ValueError(f"maxbuffers must be non-negative; got {maxbuffers}")
+        self._maxbuffers = int(maxbuffers)
+        self._idle: Dict[tuple, List[np.ndarray]] = {}
+        self._leased = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of idle arrays held by the pool."""
+        with self._lock:
+            return sum(map(len, self._idle.values()))
+
+    @property
+    def maxbuffers(self) -> int:
+        """The maximum number of idle arrays kept per ``(shape, dtype)``."""
+        return self._maxbuffers
+
+    def acquire(self, shape: Sequence[int], dtype: Any = np.float64) -> np.ndarray:
+        """Return a C-contiguous array of the given shape and dtype.
+
+        The contents of the array are undefined (as with :func:`numpy.empty`).
+
+        Parameters
+        ----------
+        shape : Sequence[int]
+            The shape of the array.
+        dtype : DTypeLike, optional
+            The dtype of the array.  Default is ``float64``.
+
+        Returns
+        -------
+        out : np.ndarray
+            An idle array from the pool, or a newly allocated one.
+        """
+        key = (tuple(map(int, shape)), np.dtype(dtype))
+        with self._lock:
+            idle = self._idle.get(key)
+            array = idle.pop() if idle else np.empty(*key)
+            self._leased[id(array)] = array
+        return array
+
+    def release(self, array: np.ndarray) -> None:
+        """Hand an array obtained from :meth:`acquire` back to the pool.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            The acquired array, or any view of it (*e.g.* the
+            :class:`~astropy.units.Quantity` returned by
+            :meth:`~psi_io.mhd_io._HdfData.read`).
+
+        Raises
+        ------
+        ValueError
+            If *array* is not (a view of) an array leased from this pool.
+        """
+        with self._lock:
+            base = array
+            while base is not None and self._leased.get(id(base)) is not base:
+                base = base.base
+            if base is None:
+                raise ValueError("array was not acquired from this pool, or was already released")
+            del self._leased[id(base)]
+            idle = self._idle.setdefault((base.shape, base.dtype), [])
+            if len(idle) < self._maxbuffers:
+                idle.append(base)
+
+    @contextmanager
+    def borrow(self, shape: Sequence[int], dtype: Any = np.float64):
+        """Acquire an array for the duration of a ``with`` block.
+
+        Parameters
+        ----------
+        shape : Sequence[int]
+            The shape of the array.
+        dtype : DTypeLike, optional
+            The dtype of the array.  Default is ``float64``.
+
+        Yields
+        ------
+        out : np.ndarray
+            The acquired array; it is released when the block exits.
+        """
+        array = self.acquire(shape, dtype)
+        try:
+            yield array
+        finally:
+            self.release(array)
+
+    def clear(self) -> None:
+        """Drop every idle array held by the pool."""
+        with self._lock:
+            self._idle.clear()
+
+
+# -----------------------------------------------------------------------------
+# Cached coordinate scales and dataset metadata.
+# -----------------------------------------------------------------------------
+
+
+MetaCacheInfo = namedtuple('MetaCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+"""
+    Named tuple reporting the statistics of an :class:`HdfMetaCache`.
+
+    Parameters
+    ----------
+    hits : int
+        Number of lookups served from the cache.
+    misses : int
+        Number of lookups that required reading the file.
+    maxsize : int
+        The maximum number of files whose metadata is cached.
+    currsize : int
+        The number of files whose metadata is currently cached.
+"""
+
+
+class HdfMetaCache:
+    """Bounded LRU cache of coordinate scales and dataset metadata, per file.
+
+    Scales and metadata are tiny and immutable for a given file, so the
+    value-based read API (:func:`read_hdf_by_value`,
+    :func:`np_interpolate_slice_from_hdf`, *etc.*), :func:`read_hdf_meta` and the
+    scale readers of :mod:`psi_io.mhd_io` look them up here rather than
+    re-reading them from disk on every call.  Entries are keyed by
+    ``(resolved path, mtime, ctime, inode, size)``, so a file that is rewritten
+    on disk – even within the resolution of its modification time, or replaced
+    by another file – is transparently re-read; when more than ``maxsize``
+    files are cached the least recently used file is dropped.
+
+    Cached arrays are read-only.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of files whose metadata is cached.  A value of
+        ``0`` disables caching.  Default is ``128``.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data
+    >>> from psi_io.psi_io import HdfMetaCache
+    >>> cache = HdfMetaCache(maxsize=4)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     fp = write_hdf_data(Path(d) / "out.h5", np.ones(3), np.arange(3.0))
+    ...     for _ in range(3):
+    ...         size = cache.get(fp, 'size', lambda: 3)
+    ...     info = cache.info()
+    >>> size, info
+    (3, MetaCacheInfo(hits=2, misses=1, maxsize=4, currsize=1))
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+        self._maxsize = 0
+        self._hits = 0
+        self._misses = 0
+        self.resize(maxsize)
+
+    def __len__(self) -> int:
+        """Return the number of files whose metadata is currently cached."""
+        return len(self._entries)
+
+    def __contains__(self, ifile: PathLike) -> bool:
+        """Return ``True`` if any metadata of *ifile* is currently cached."""
+        ipath = str(Path(ifile).resolve())
+        with self._lock:
+            return any(key[0] == ipath for key in self._entries)
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of files whose metadata is cached."""
+        return self._maxsize
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of cached files, dropping any excess.
+
+        Parameters
+        ----------
+        maxsize : int
+            The new maximum number of files; ``0`` disables caching and drops
+            every entry.
+
+        Raises
+        ------
+        ValueError
+            If *maxsize* is negative.
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative; got {maxsize}")
+        with self._lock:
+            self._maxsize = int(maxsize)
+            self._trim()
+
+    def get(self, ifile: PathLike, item: Any, loader: Callable[[], Any]) -> Any:
+        """Return the cached *item* of *ifile*, calling *loader* to read it on a miss.
+
+        Parameters
+        ----------
+        ifile : PathLike
+            The path to the HDF file the item belongs to.
+        item : Hashable
+            The key of the item within the file's entry, *e.g.*
+            ``('scales', dataset_id)``.
+        loader : Callable[[], Any]
+            Reads the item from the file.  Called without the cache lock held.
+
+        Returns
+        -------
+        out : Any
+            The cached (or freshly loaded) item.  Files that cannot be
+            :func:`~os.stat`-ed are never cached.
+        """
+        try:
+            ipath = Path(ifile).resolve()
+            stat = ipath.stat()
+        except OSError:
+            return loader()
+        key = (str(ipath), stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and item in entry:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[item]
+            self._misses += 1
+        value = loader()
+        if self._maxsize:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    self._discard(lambda k: k[0] == key[0])
+                    entry = self._entries[key] = {}
+                entry[item] = value
+                self._entries.move_to_end(key)
+                self._trim()
+        return value
+
+    def evict(self, ifile: PathLike) -> None:
+        """Drop every cached item of *ifile*, *e.g.* before it is overwritten.
+
+        Parameters
+        ----------
+        ifile : PathLike
+            The path whose metadata should be dropped.  Paths that are not
+            cached are ignored.
+        """
+        ipath = str(Path(ifile).resolve())
+        with self._lock:
+            self._discard(lambda k: k[0] == ipath)
+
+    def clear(self) -> None:
+        """Drop every cached item and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> MetaCacheInfo:
+        """Return the cache statistics as a :data:`MetaCacheInfo` named tuple."""
+        with self._lock:
+            return MetaCacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+    def _discard(self, predicate: Callable[[tuple], bool]) -> None:
+        """Remove every entry whose key satisfies *predicate*."""
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+
+    def _trim(self) -> None:
+        """Remove least-recently-used entries until the cache fits in ``maxsize``."""
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+_META_CACHE = HdfMetaCache()
+"""Module-level scale and metadata cache used by the read API."""
+
+
+def configure_meta_cache(maxsize: int) -> None:
+    """
+    Set the number of files whose coordinate scales and metadata are cached.
+
+    :func:`read_hdf_by_value`, :func:`read_hdf_meta` and the value-based
+    slicing and interpolation routines (including
+    :meth:`~psi_io.mhd_io._HdfData.vslice`) read coordinate scales and dataset
+    metadata through a process-wide cache, so that repeated value lookups on
+    the same file are pure in-memory :func:`~numpy.searchsorted` operations
+    followed by a single hyperslab read of the data.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of files cached at once.  ``0`` disables the cache.
+        The default at import is ``128``.
 
     Raises
     ------
     ValueError
-        If the file does not have a ``.hdf`` or ``.h5`` extension.
-    KeyError
-        If, for HDF4 files, the data or scale dtype is not supported by
-        :py:mod:`pyhdf`.  See :func:`write_hdf_data` for the full dtype
-        support table.
+        If *maxsize* is negative.
 
     Notes
     -----
-    This routine is provided for backward compatibility with existing PSI codes that
-    expect this API signature.  The underlying implementation dispatches to
-    :func:`~psi_io.psi_io.write_hdf_data`, but the argument order and default
-    behavior (sync dtype, default dataset IDs) are preserved.
+    Entries are keyed by the resolved path, modification time and size of the
+    file, so files that change on disk are re-read automatically.  The writers
+    in this module also drop the entries of their target.
 
-    .. warning::
-       When called with its default arguments this routine **writes to the default PSI
-       dataset IDs for HDF4/HDF5 files and synchronizes dtypes between the dataset and
-       scales.**  This behavior is required for interoperability with certain Fortran-based
-       PSI tools.
+    See Also
+    --------
+    meta_cache_info : Return the cache statistics.
+    clear_meta_cache : Drop every cached entry.
+
+    Examples
+    --------
+    >>> from psi_io import configure_meta_cache, meta_cache_info
+    >>> configure_meta_cache(16)
+    >>> meta_cache_info().maxsize
+    16
+    >>> configure_meta_cache(128)
+    """
+    _META_CACHE.resize(maxsize)
+
+
+def meta_cache_info() -> MetaCacheInfo:
+    """
+    Return the statistics of the process-wide scale and metadata cache.
+
+    Returns
+    -------
+    out : MetaCacheInfo
+        Named tuple of ``(hits, misses, maxsize, currsize)``.
 
     See Also
     --------
-    write_hdf_data : Generic HDF data writing routine.
+    configure_meta_cache : Enable, disable or resize the cache.
 
     Examples
     --------
-    >>> import tempfile, numpy as np
-    >>> from pathlib import Path
-    >>> from psi_io import wrhdf_2d, rdhdf_2d
-    >>> x = np.linspace(0.0, 2*np.pi, 64, dtype=np.float32)
-    >>> y = np.linspace(0.0, np.pi, 32, dtype=np.float32)
-    >>> f = np.outer(np.sin(x), np.cos(y)).astype(np.float32)
-    >>> with tempfile.TemporaryDirectory() as d:
-    ...     wrhdf_2d(Path(d) / "out.h5", x, y, f)
-    ...     x2, y2, f2 = rdhdf_2d(Path(d) / "out.h5")
-    ...     np.array_equal(f, f2)
-    True
+    >>> from psi_io import meta_cache_info
+    >>> meta_cache_info()  # doctest: +SKIP
+    MetaCacheInfo(hits=0, misses=0, maxsize=128, currsize=0)
     """
-    return _wrhdf_nd(hdf_filename, f, x, y, dimensionality=2, **kwargs)
+    return _META_CACHE.info()
 
 
-def wrhdf_3d(hdf_filename: PathLike,
-             x: np.ndarray,
-             y: np.ndarray,
-             z: np.ndarray,
-             f: np.ndarray,
-             **kwargs) -> None:
-    """Write a 3D PSI-style HDF5 or HDF4 file.
+def clear_meta_cache() -> None:
+    """
+    Drop every entry of the process-wide scale and metadata cache and reset its statistics.
 
-    The data in the HDF file will appear as X,Y,Z in Fortran order.
+    See Also
+    --------
+    configure_meta_cache : Enable, disable or resize the cache.
 
-    Each dimension requires a 1D "scale" associated with it that
-    describes the rectilinear grid coordinates in each dimension.
+    Examples
+    --------
+    >>> from psi_io import clear_meta_cache
+    >>> clear_meta_cache()
+    """
+    _META_CACHE.clear()
 
-    Parameters
-    ----------
-    hdf_filename : PathLike
-        The path to the 3D HDF5 (.h5) or HDF4 (.hdf) file to write.
-    x : np.ndarray
-        1D array of scales in the X dimension.
-    y : np.ndarray
-        1D array of scales in the Y dimension.
-    z : np.ndarray
-        1D array of scales in the Z dimension.
-    f : np.ndarray
-        3D data array, C-ordered with shape ``(nz, ny, nx)`` in Python.
-    **kwargs
-        Additional keyword arguments passed through to the underlying
-        :func:`~psi_io.psi_io.write_hdf_data` routine, specifically:
 
-        - ``dataset_id`` : str | None
-            The identifier of the dataset to write.
-            If None, a default dataset is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
-        - ``sync_dtype``: bool
-            If True, the data type of the scales will be matched to that of the data array.
+# -----------------------------------------------------------------------------
+# Writing several datasets to one open file.
+# -----------------------------------------------------------------------------
 
-        Omitting these will yield the same behavior as the legacy routines, *i.e.* writing to
-        the default PSI dataset IDs for HDF4/HDF5 files and synchronizing datatypes between
-        the dataset and scales.
+
+class HdfWriter:
+    """Write several datasets (and their attributes) to one HDF4 or HDF5 file in a single pass.
+
+    Where :func:`write_hdf_data` creates a file holding a single dataset, a
+    writer keeps its file open across any number of :meth:`add_dataset` calls,
+    so that a multi-quantity snapshot is written without reopening (or
+    truncating) the file.  In HDF5 files, a scale equal to one already written
+    is shared rather than stored again.  Attributes set with :meth:`set_attrs`
+    are queued and written together by :meth:`flush` – which :meth:`close`
+    calls before closing the file.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF file to write.
+    mode : {'w', 'a'}, optional
+        ``'w'`` creates the file, truncating any existing one; ``'a'`` adds
+        datasets to an existing file (creating it if needed).  Default is ``'w'``.
 
     Raises
     ------
     ValueError
-        If the file does not have a ``.hdf`` or ``.h5`` extension.
-    KeyError
-        If, for HDF4 files, the data or scale dtype is not supported by
-        :py:mod:`pyhdf`.  See :func:`write_hdf_data` for the full dtype
-        support table.
+        If the file does not have a ``.hdf`` or ``.h5`` extension, or if *mode*
+        is invalid.
+
+    See Also
+    --------
+    write_hdf_data : Write a single dataset to a new file.
+    write_hdf_meta : Add attributes to an existing file.
 
     Notes
     -----
-    This routine is provided for backward compatibility with existing PSI codes that
-    expect this API signature.  The underlying implementation dispatches to
-    :func:`~psi_io.psi_io.write_hdf_data`, but the argument order and default
-    behavior (sync dtype, default dataset IDs) are preserved.
+    Scales are shared by value: an HDF5 scale equal to an existing ``dimN``
+    dataset, or to any other scale written by the writer, is attached to it,
+    and a new one is stored as ``<dataset_id>_dimN`` (as in :func:`convert`).
+    The writer remembers the scales it has written, so sharing does not read
+    them back from the file.
+    HDF4 stores a scale with every dimension of every dataset, so nothing is
+    shared there.
 
-    .. warning::
-       When called with its default arguments this routine **writes to the default PSI
-       dataset IDs for HDF4/HDF5 files and synchronizes dtypes between the dataset and
-       scales.**  This behavior is required for interoperability with certain Fortran-based
-       PSI tools.
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import HdfWriter, read_hdf_meta
+    >>> r, t, p = np.linspace(1, 2, 5), np.linspace(0, np.pi, 4), np.linspace(0, 2*np.pi, 3)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     with HdfWriter(Path(d) / "snapshot.h5") as writer:
+    ...         _ = writer.add_dataset(np.zeros((3, 4, 5)), r, t, p, dataset_id='br', units='Gauss')
+    ...         _ = writer.add_dataset(np.ones((3, 4, 5)), r, t, p, dataset_id='vr', units='km/s')
+    ...         writer.set_attrs(run='example')
+    ...     [meta.name for meta in read_hdf_meta(Path(d) / "snapshot.h5")]
+    ['br', 'vr']
+    """
+
+    def __init__(self, ifile: PathLike, mode: Literal['w', 'a'] = 'w'):
+        if mode not in ('w', 'a'):
+            raise ValueError(f"mode must be 'w' or 'a'; got {mode!r}")
+        self._path = Path(ifile)
+        self._file = _dispatch_by_ext(self._path, _open_h4_writer, _open_h5_writer, mode)
+        self._datasets: List[str] = []
+        self._scales: Dict[str, np.ndarray] = {}
+        self._attrs: Dict[Optional[str], Dict[str, Any]] = {}
+
+    def __enter__(self) -> 'HdfWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self._path)!r}, datasets={self._datasets!r}, closed={self.closed!r})"
+
+    @property
+    def path(self) -> Path:
+        """The path to the file being written."""
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        """``True`` once the writer has been closed."""
+        return self._file is None
+
+    @property
+    def datasets(self) -> Tuple[str, ...]:
+        """The identifiers of the datasets added so far, in order."""
+        return tuple(self._datasets)
+
+    def add_dataset(self,
+                    data: np.ndarray,
+                    *scales: Union[np.ndarray, None],
+                    dataset_id: Optional[str] = None,
+                    sync_dtype: bool = False,
+                    strict: bool = True,
+                    chunks: ChunkType = None,
+                    compression: Union[Literal['gzip', 'lzf'], int, None] = None,
+                    compression_opts: Optional[int] = None,
+                    shuffle: bool = False,
+                    fletcher32: bool = False,
+                    pyramid: int = 0,
+                    pyramid_mesh: Optional[MeshLike] = None,
+                    **kwargs) -> str:
+        """Write a dataset, its scales and its attributes to the file.
+
+        The arguments are those of :func:`write_hdf_data`.
+
+        Returns
+        -------
+        out : str
+            The identifier of the written dataset.
+
+        Raises
+        ------
+        ValueError
+            If the writer is closed, if the file already holds a dataset named
+            *dataset_id*, or if chunking, shuffle, fletcher32, non-gzip
+            compression or pyramid options are requested for an HDF4 file.
+        """
+        h4file = self._path.suffix == '.hdf'
+        dataid = dataset_id or PSI_DATA_ID['h4' if h4file else 'h5']
+        self._check_open()
+        if dataid in (self._file.datasets() if h4file else self._file):
+            raise ValueError(f"{self._path} already holds a dataset named {dataid!r}")
+        data = np.asarray(data)
+        options = dict(sync_dtype=sync_dtype, strict=strict, chunks=chunks, compression=compression,
+                       compression_opts=compression_opts, shuffle=shuffle, fletcher32=fletcher32)
+        if h4file:
+            if pyramid:
+                raise ValueError("Pyramid levels are only supported for HDF5 (.h5) files")
+            with _create_h4_dataset(self._file, dataid, data.shape, data.dtype, scales,
+                                    attrs=kwargs, **options) as sds_id:
+                _write_h4_sds(sds_id, data, compressed=compression is not None)
+        else:
+            with _create_h5_dataset(self._file, dataid, data.shape, data.dtype, scales,
+                                    attrs=kwargs, data=data, shared_scales=self._scales, **options):
+                pass
+            if pyramid:
+                _write_h5_pyramid(self._file, dataid, data, scales, pyramid,
+                                  mesh=kwargs.get('mesh', 'main') if pyramid_mesh is None else pyramid_mesh,
+                                  attrs=kwargs, **options)
+        self._datasets.append(dataid)
+        return dataid
+
+    def set_attrs(self, dataset_id: Optional[str] = None, /, **attrs) -> None:
+        """Queue attributes for the file root, or for a dataset, to be written by :meth:`flush`.
+
+        Parameters
+        ----------
+        dataset_id : str | None, optional
+            The dataset to attach the attributes to; ``None`` (the default)
+            attaches them to the file root (see :func:`write_hdf_meta`).
+        **attrs
+            The attributes.  Later values replace queued values of the same name.
+
+        Raises
+        ------
+        ValueError
+            If the writer is closed.
+        """
+        self._check_open()
+        self._attrs.setdefault(dataset_id, {}).update(attrs)
+
+    def flush(self) -> None:
+        """Write the queued attributes and flush the file to disk.
+
+        Raises
+        ------
+        ValueError
+            If the writer is closed.
+        KeyError
+            If attributes were queued for a dataset that is not in the file.
+        """
+        self._check_open()
+        attrs, self._attrs = self._attrs, {}
+        if self._path.suffix == '.hdf':
+            for dataid, values in attrs.items():
+                if dataid is None:
+                    _set_h4_attrs(self._file, values)
+                else:
+                    sds_id = self._file.select(dataid)
+                    try:
+                        _set_h4_attrs(sds_id, values)
+                    finally:
+                        sds_id.endaccess()
+        else:
+            for dataid, values in attrs.items():
+                (self._file if dataid is None else self._file[dataid]).attrs.update(values)
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush the queued attributes and close the file.  Closing twice has no effect."""
+        if self._file is None:
+            return
+        try:
+            self.flush()
+        finally:
+            if self._path.suffix == '.hdf':
+                self._file.end()
+            else:
+                self._file.close()
+            self._file = None
+            self._scales.clear()
+
+    def _check_open(self) -> None:
+        if self._file is None:
+            raise ValueError(f"{type(self).__name__}({str(self._path)!r}) is closed")
+
+
+class HdfSequenceWriter:
+    """Append the successive sequences of a quantity to one HDF5 dataset with an unlimited time axis.
+
+    MAS and POT3D write one file per sequence (``br001001.h5``, ``br001002.h5``,
+    …).  A *sequence file* instead stacks the sequences of a quantity along the
+    leading (slowest-varying) axis of a single chunked, resizable dataset: a run
+    is held in one file, and reading one sequence is a single contiguous
+    hyperslab.  The sequence number and simulation time of every entry are
+    stored in the companion scales :data:`SEQUENCE_SCALE_ID` and
+    :data:`TIME_SCALE_ID` (prefixed with ``<dataset_id>_`` for a dataset other
+    than ``'Data'``), attached to the time axis.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF5 file to write.
+    dataset_id : str | None, optional
+        The identifier of the dataset.  If ``None``, ``'Data'`` is used.
+        Default is ``None``.
+    mode : {'a', 'w'}, optional
+        ``'a'`` appends to the sequence file (creating it if needed); ``'w'``
+        creates the file, truncating any existing one.  Default is ``'a'``.
+    chunks : ChunkType, optional
+        The chunk shape of a *single* sequence.  If ``None`` (default), each
+        sequence is stored as one chunk; ``'auto'`` and tuples are interpreted
+        as in :func:`write_hdf_data`.  Chunks always hold one entry of the time axis.
+    compression, compression_opts, shuffle, fletcher32
+        Filter options of the dataset – see :func:`write_hdf_data`.
+    swmr : bool, optional
+        If ``True``, write the file in single-writer/multiple-reader (SWMR) mode,
+        so that readers opened with ``swmr=True`` can follow the run while it is
+        being written (see Notes).  Default is ``False``.
+
+    Raises
+    ------
+    ValueError
+        If the file does not have a ``.h5`` extension, if *mode* is invalid, or if
+        the file holds a dataset *dataset_id* that is not a sequence dataset.
 
     See Also
     --------
-    write_hdf_data : Generic HDF data writing routine.
+    read_hdf_sequences : Read the sequence numbers and times of a sequence file.
+    psi_io.mhd_io.PsiData : Read one sequence of a sequence file.
+
+    Notes
+    -----
+    The dataset of a sequence file has the shape ``(n_entries, *shape)``, where
+    ``shape`` is that of a single sequence.  Following the PSI (Fortran) axis
+    order, the scales of a sequence are attached to the first dimensions of the
+    dataset, and the sequence scale to the last one: the functional readers
+    therefore see a sequence file as a dataset with one more dimension, *e.g.*
+    ``read_hdf_by_index(ifile, None, None, None, k)`` reads entry ``k``.
+
+    Sequence numbers must increase from one entry to the next.
+
+    In SWMR mode, the file is written in the latest HDF5 file format, SWMR
+    writing starts once the dataset exists (*i.e.* with the first entry of a new
+    file) and every entry is flushed to disk as soon as it is appended.  Readers
+    opened with ``swmr=True`` – :func:`read_hdf_by_index` and the other functional
+    readers, or :func:`~psi_io.mhd_io.PsiData` – then see every complete entry,
+    without waiting for the writer to close the file.  Since SWMR does not allow
+    attributes to change once writing has started, the attributes of the dataset
+    can only be given with the first entry.  A file appended to in SWMR mode
+    must have been created in SWMR mode.
 
     Examples
     --------
     >>> import tempfile, numpy as np
     >>> from pathlib import Path
-    >>> from psi_io import wrhdf_3d, rdhdf_3d
-    >>> r = np.linspace(1.0, 5.0, 10, dtype=np.float32)
-    >>> t = np.linspace(0.0, np.pi, 20, dtype=np.float32)
-    >>> p = np.linspace(0.0, 2*np.pi, 30, dtype=np.float32)
-    >>> f = np.ones((30, 20, 10), dtype=np.float32)
+    >>> from psi_io import HdfSequenceWriter, read_hdf_sequences, read_hdf_by_index
+    >>> r, t, p = np.linspace(1, 2, 5), np.linspace(0, np.pi, 4), np.linspace(0, 2*np.pi, 3)
     >>> with tempfile.TemporaryDirectory() as d:
-    ...     wrhdf_3d(Path(d) / "out.h5", r, t, p, f)
-    ...     r2, t2, p2, f2 = rdhdf_3d(Path(d) / "out.h5")
-    ...     np.array_equal(f, f2)
-    True
+    ...     with HdfSequenceWriter(Path(d) / "br.h5") as writer:
+    ...         for i, sequence in enumerate((1001, 1002, 1003)):
+    ...             _ = writer.append(np.full((3, 4, 5), i, dtype=np.float32), r, t, p,
+    ...                               sequence=sequence, time=10.0 * i)
+    ...     sequences, times = read_hdf_sequences(Path(d) / "br.h5")
+    ...     f, *_ = read_hdf_by_index(Path(d) / "br.h5", None, None, None, 1)
+    >>> sequences, times
+    (array([1001, 1002, 1003]), array([ 0., 10., 20.]))
+    >>> f.shape, float(f.max())
+    ((1, 3, 4, 5), 1.0)
     """
-    return _wrhdf_nd(hdf_filename, f, x, y, z, dimensionality=3, **kwargs)
 
+    def __init__(self,
+                 ifile: PathLike,
+                 dataset_id: Optional[str] = None,
+                 mode: Literal['a', 'w'] = 'a',
+                 chunks: ChunkType = None,
+                 compression: Union[Literal['gzip', 'lzf'], int, None] = None,
+                 compression_opts: Optional[int] = None,
+                 shuffle: bool = False,
+                 fletcher32: bool = False,
+                 swmr: bool = False,
+                 ):
+        if mode not in ('w', 'a'):
+            raise ValueError(f"mode must be 'w' or 'a'; got {mode!r}")
+        self._path = Path(ifile)
+        if self._path.suffix != '.h5':
+            raise ValueError("Sequence files are only supported for HDF5 (.h5) files")
+        self._id = dataset_id or PSI_DATA_ID['h5']
+        self._swmr = swmr
+        self._storage = dict(chunks=chunks, compression=compression, compression_opts=compression_opts,
+                             shuffle=shuffle, fletcher32=fletcher32)
+        self._file = _open_h5_writer(self._path, mode, swmr=swmr)
+        self._scales: Tuple[Optional[np.ndarray], ...] = ()
+        if self._id in self._file:
+            if _h5_sequence_scales(self._file[self._id]) is None:
+                self._file.close()
+                raise ValueError(f"{self._path} holds a dataset {self._id!r} that is not a sequence dataset")
+            self._scales = tuple(dim[0][:] if dim else None for dim in self._file[self._id].dims)[:-1]
+            if swmr:
+                self._file.swmr_mode = True
+
+    def __enter__(self) -> 'HdfSequenceWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.sequences)
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}({str(self._path)!r}, dataset_id={self._id!r}, "
+                f"entries={None if self.closed else len(self)!r}, closed={self.closed!r})")
+
+    @property
+    def path(self) -> Path:
+        """The path to the file being written."""
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        """``True`` once the writer has been closed."""
+        return self._file is None
+
+    @property
+    def swmr(self) -> bool:
+        """``True`` if the file is written in SWMR mode."""
+        return self._swmr
+
+    @property
+    def sequences(self) -> np.ndarray:
+        """The sequence numbers of the entries written so far (including those of an appended file)."""
+        self._check_open()
+        if self._id not in self._file:
+            return np.empty(0, dtype=np.int64)
+        return _h5_sequence_scales(self._file[self._id])[0][:]
+
+    def append(self,
+               data: np.ndarray,
+               *scales: Union[np.ndarray, None],
+               sequence: int,
+               time: float = np.nan,
+               strict: bool = True,
+               **kwargs) -> int:
+        """Append one sequence to the dataset.
+
+        The first entry creates the dataset, its scales and its attributes;
+        later entries must have the same shape and share its grid.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            The values of the sequence.  Later entries are converted to the
+            dtype of the first one.
+        *scales : np.ndarray | None
+            The scales of the sequence (in :math:`r, \\theta, \\phi` order).
+            They are stored with the first entry, and checked against the
+            stored ones for later entries.
+        sequence : int
+            The sequence number of the entry; it must exceed that of the
+            previous entry.
+        time : float, optional
+            The simulation time of the entry.  Default is ``NaN``.
+        strict : bool, optional
+            See :func:`write_hdf_data`.
+        **kwargs
+            Attributes of the dataset (*e.g.* ``unit`` or ``mesh``), written –
+            or updated – along with the entry.  In SWMR mode, attributes can
+            only be given with the first entry of a new file.
+
+        Returns
+        -------
+        out : int
+            The index of the entry along the time axis.
+
+        Raises
+        ------
+        ValueError
+            If the writer is closed, if *sequence* does not exceed the previous
+            sequence number, if the shape or scales of the entry differ from
+            those of the dataset, or if attributes are given to an SWMR writer
+            after its first entry.
+        """
+        self._check_open()
+        data = np.asarray(data)
+        if self._id not in self._file:
+            self._create(data, scales, kwargs, strict)
+            kwargs = {}
+            if self._swmr:
+                self._file.swmr_mode = True
+        elif self._swmr and kwargs:
+            raise ValueError("Attributes cannot be changed once SWMR writing has started")
+        dataset = self._file[self._id]
+        seqs, times = _h5_sequence_scales(dataset)
+        index = len(seqs)
+        if index and sequence <= seqs[-1]:
+            raise ValueError(f"Sequence numbers must increase; got {sequence} after {seqs[-1]}")
+        if data.shape != dataset.shape[1:]:
+            raise ValueError(f"Entry has shape {data.shape}, but {self._path} stores entries "
+                             f"of shape {dataset.shape[1:]}")
+        if any(scale is not None and (stored is None or not np.array_equal(scale, stored))
+               for scale, stored in zip(scales, self._scales)):
+            raise ValueError(f"Entry does not share the grid of {self._path}")
+        for key, value in kwargs.items():
+            try:
+                dataset.attrs[key] = value
+            except TypeError as e:
+                if strict:
+                    raise TypeError(f"Failed to set attribute '{key}' on dataset '{self._id}'") from e
+                print(f"Warning: Failed to set attribute '{key}' on dataset '{self._id}'; skipping.")
+        # The sequence scale is extended last, so that an SWMR reader that sees
+        # the sequence number of an entry also sees its values.
+        for target, value in ((dataset, data), (times, time), (seqs, sequence)):
+            target.resize(index + 1, axis=0)
+            target[index] = value
+            if self._swmr:
+                target.flush()
+        return index
+
+    def flush(self) -> None:
+        """Flush the file to disk, *e.g.* so that other processes see the entries written so far.
+
+        Raises
+        ------
+        ValueError
+            If the writer is closed.
+        """
+        self._check_open()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the file.  Closing twice has no effect."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _create(self,
+                data: np.ndarray,
+                scales: Sequence[Union[np.ndarray, None]],
+                attrs: Mapping[str, Any],
+                strict: bool) -> None:
+        """Create the (empty) dataset of entries shaped like *data*, with its scales and the sequence scales."""
+        storage = dict(self._storage)
+        frame_chunks = _h5_storage_options(data.shape, data.dtype, chunks=storage.pop('chunks') or data.shape,
+                                           **storage).get('chunks', data.shape)
+        chunks = True if frame_chunks is True else (1, *frame_chunks)
+        with _create_h5_dataset(self._file, self._id, (0, *data.shape), data.dtype, scales, attrs=attrs,
+                                strict=strict, chunks=chunks, maxshape=(None, *data.shape),
+                                **storage) as dataset:
+            dim = dataset.dims[data.ndim]
+            prefix = '' if self._id == PSI_DATA_ID['h5'] else f"{self._id}_"
+            for scale_id, dtype in ((SEQUENCE_SCALE_ID, np.int64), (TIME_SCALE_ID, np.float64)):
+                scale = self._file.create_dataset(prefix + scale_id, shape=(0,), maxshape=(None,),
+                                                  dtype=dtype, chunks=True)
+                scale.make_scale(scale_id)
+                dim.attach_scale(scale)
+            dim.label = SEQUENCE_SCALE_ID
+        scales = tuple(None if scale is None else np.asarray(scale) for scale in scales)
+        self._scales = scales + (None,) * (data.ndim - len(scales))
+
+    def _check_open(self) -> None:
+        if self._file is None:
+            raise ValueError(f"{type(self).__name__}({str(self._path)!r}) is closed")
 
-def get_scales_1d(filename: PathLike
-                  ) -> np.ndarray:
-    """Return the coordinate scale of a 1D PSI-style HDF5 or HDF4 dataset.
 
-    Does not load the data array, so this is efficient for large files.
+# -----------------------------------------------------------------------------
+# "Classic" HDF reading and writing routines adapted from psihdf.py or psi_io.py.
+# -----------------------------------------------------------------------------
+
+
+def rdhdf_1d(hdf_filename: PathLike
+             ) -> Tuple[np.ndarray, np.ndarray]:
+    """Read a 1D PSI-style HDF5 or HDF4 file.
 
     Parameters
     ----------
-    filename : PathLike
+    hdf_filename : PathLike
         The path to the 1D HDF5 (.h5) or HDF4 (.hdf) file to read.
 
     Returns
     -------
     x : np.ndarray
         1D coordinate scale array.
+    f : np.ndarray
+        1D data array.
+
+    See Also
+    --------
+    read_hdf_data : Generic HDF data reading routine.
 
     Examples
     --------
-    >>> from psi_io import get_scales_1d
+    >>> from psi_io import rdhdf_1d
     >>> from psi_data import fetch_example_radial_scale
     >>> filepath = fetch_example_radial_scale()
-    >>> x = get_scales_1d(filepath)
-    >>> x.ndim
-    1
+    >>> x, f = rdhdf_1d(filepath)
+    >>> x.shape, f.shape
+    ((121,), (121,))
     """
-    return _dispatch_by_ext(filename, _get_scales_nd_h4, _get_scales_nd_h5,
-                            dimensionality=1)
+    return _rdhdf_nd(hdf_filename, dimensionality=1)
 
 
-def get_scales_2d(filename: PathLike
-                  ) -> Tuple[np.ndarray, np.ndarray]:
-    """Return the coordinate scales of a 2D PSI-style HDF5 or HDF4 dataset.
+def rdhdf_2d(hdf_filename: PathLike
+             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Read a 2D PSI-style HDF5 or HDF4 file.
 
-    Does not load the data array, so this is efficient for large files.
     The data in the HDF file is assumed to be ordered X, Y in Fortran order.
+    Each dimension is assumed to have a 1D scale associated with it that
+    describes the rectilinear grid coordinates.
 
     Parameters
     ----------
-    filename : PathLike
+    hdf_filename : PathLike
         The path to the 2D HDF5 (.h5) or HDF4 (.hdf) file to read.
 
     Returns
@@ -773,30 +1863,43 @@ def get_scales_2d(filename: PathLike
         1D coordinate scale array for the X dimension.
     y : np.ndarray
         1D coordinate scale array for the Y dimension.
+    f : np.ndarray
+        2D data array, C-ordered with shape ``(ny, nx)`` in Python.
+
+    Notes
+    -----
+    Because Fortran uses column-major ordering and Python uses row-major
+    ordering, the data array is returned with reversed axis order relative to
+    how it is stored on disk.  The first returned scale always corresponds to
+    the *slowest* varying dimension in the data array (i.e. the last axis).
+
+    See Also
+    --------
+    read_hdf_data : Generic HDF data reading routine.
 
     Examples
     --------
-    >>> from psi_io import get_scales_2d
+    >>> from psi_io import rdhdf_2d
     >>> from psi_data import fetch_mas_quantities
     >>> filepath = fetch_mas_quantities().ch_pm
-    >>> x, y = get_scales_2d(filepath)
-    >>> x.ndim, y.ndim
-    (1, 1)
+    >>> x, y, f = rdhdf_2d(filepath)
+    >>> f.shape == (y.shape[0], x.shape[0])
+    True
     """
-    return _dispatch_by_ext(filename, _get_scales_nd_h4, _get_scales_nd_h5,
-                            dimensionality=2)
+    return _rdhdf_nd(hdf_filename, dimensionality=2)
 
 
-def get_scales_3d(filename: PathLike
-                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """Return the coordinate scales of a 3D PSI-style HDF5 or HDF4 dataset.
+def rdhdf_3d(hdf_filename: PathLike
+             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Read a 3D PSI-style HDF5 or HDF4 file.
 
-    Does not load the data array, so this is efficient for large files.
     The data in the HDF file is assumed to be ordered X, Y, Z in Fortran order.
+    Each dimension is assumed to have a 1D scale associated with it that
+    describes the rectilinear grid coordinates.
 
     Parameters
     ----------
-    filename : PathLike
+    hdf_filename : PathLike
         The path to the 3D HDF5 (.h5) or HDF4 (.hdf) file to read.
 
     Returns
@@ -807,1868 +1910,5602 @@ def get_scales_3d(filename: PathLike
         1D coordinate scale array for the Y dimension.
     z : np.ndarray
         1D coordinate scale array for the Z dimension.
+    f : np.ndarray
+        3D data array, C-ordered with shape ``(nz, ny, nx)`` in Python.
+
+    Notes
+    -----
+    Because Fortran uses column-major ordering and Python uses row-major
+    ordering, the data array is returned with reversed axis order relative to
+    how it is stored on disk.  For PSI spherical datasets the returned shapes
+    follow the convention ``f.shape == (n_phi, n_theta, n_r)`` with scales
+    returned in physical order ``(r, theta, phi)``.
+
+    See Also
+    --------
+    read_hdf_data : Generic HDF data reading routine.
 
     Examples
     --------
-    >>> from psi_io import get_scales_3d
+    >>> from psi_io import rdhdf_3d
     >>> from psi_data import fetch_mas_data
     >>> filepath = fetch_mas_data().cor_br
-    >>> r, t, p = get_scales_3d(filepath)
-    >>> r.ndim, t.ndim, p.ndim
-    (1, 1, 1)
-    """
-    return _dispatch_by_ext(filename, _get_scales_nd_h4, _get_scales_nd_h5,
-                            dimensionality=3)
-
-
-# -----------------------------------------------------------------------------
-# "Updated" HDF reading and slicing routines for Hdf4 and Hdf5 datasets.
-# -----------------------------------------------------------------------------
-
-
-def read_hdf_meta(ifile: PathLike, /,
-                  dataset_id: Optional[str] = None
-                  ) -> List[HdfDataMeta]:
+    >>> r, t, p, f = rdhdf_3d(filepath)
+    >>> f.shape == (p.shape[0], t.shape[0], r.shape[0])
+    True
     """
-    Read metadata from an HDF4 (.hdf) or HDF5 (.h5) file.
-
-    This function provides a unified interface to read metadata from both HDF4 and HDF5 files.
+    return _rdhdf_nd(hdf_filename, dimensionality=3)
 
-    .. warning::
-       Unlike elsewhere in this module, the scales and datasets are read **as is**, *i.e.* without
-       reordering scales to match PSI's Fortran data ecosystem.
 
-    .. warning::
-       Unlike elsewhere in this module, when ``None`` is passed to ``dataset_id``, all (non-scale)
-       datasets are returned (instead of the default psi datasets *e.g.* 'Data-Set-2' or 'Data').
-       This will, effectively, return the standard PSI datasets when reading PSI-style HDF files.
+def wrhdf_1d(hdf_filename: PathLike,
+             x: np.ndarray,
+             f: np.ndarray,
+             **kwargs) -> None:
+    """Write a 1D PSI-style HDF5 or HDF4 file.
 
     Parameters
     ----------
-    ifile : PathLike
-        The path to the HDF file to read.
-    dataset_id : str | None, optional
-        The identifier of the dataset for which to read metadata.
-        If ``None``, metadata for **all** datasets is returned.  Default is ``None``.
-
-    Returns
-    -------
-    out : list[HdfDataMeta]
-        A list of :class:`HdfDataMeta` named tuples, one per dataset (or one
-        for the requested *dataset_id*).  Each object exposes:
-
-        ``name`` — dataset name (e.g. ``'Data'`` or ``'Data-Set-2'``).
-
-        ``type`` — NumPy dtype string of the stored array.
-
-        ``shape`` — array shape tuple.
+    hdf_filename : PathLike
+        The path to the 1D HDF5 (.h5) or HDF4 (.hdf) file to write.
+    x : np.ndarray
+        1D array of scales.
+    f : np.ndarray
+        1D array of data.
+    **kwargs
+        Additional keyword arguments passed through to the underlying
+        :func:`~psi_io.psi_io.write_hdf_data` routine, specifically:
 
-        ``attr`` — :class:`dict` of attribute key-value pairs attached to the
-        dataset.  Empty when no attributes are present.
+        - ``dataset_id`` : str | None
+            The identifier of the dataset to write.
+            If None, a default dataset is used ('Data-Set-2' for HDF4 and 'Data' for HDF5).
+        - ``sync_dtype``: bool
+            If True, the data type of the scales will be matched to that of the data array.
+        - ``chunks``, ``compression``, ``compression_opts``, ``shuffle``, ``fletcher32``
+            HDF5 storage options; see :func:`~psi_io.psi_io.write_hdf_data`.
 
-        ``scales`` — list of :class:`HdfScaleMeta` objects, one per
-        coordinate dimension.  Each :class:`HdfScaleMeta` similarly carries
-        an ``attr`` dict for scale-level attributes.
+        Omitting these will yield the same behavior as the legacy routines, *i.e.* writing to
+        the default PSI dataset IDs for HDF4/HDF5 files and synchronizing datatypes between
+        the dataset and scales.
 
     Raises
     ------
     ValueError
         If the file does not have a ``.hdf`` or ``.h5`` extension.
+    KeyError
+        If, for HDF4 files, the data or scale dtype is not supported by
+        :py:mod:`pyhdf`.  See :func:`write_hdf_data` for the full dtype
+        support table.
 
     Notes
     -----
-    This function delegates to :func:`_read_h5_meta` for HDF5 files and
-    :func:`_read_h4_meta` for HDF4 files based on the file extension.
+    This routine is provided for backward compatibility with existing PSI codes that
+    expect this API signature.  The underlying implementation dispatches to
+    :func:`~psi_io.psi_io.write_hdf_data`, but the argument order and default
+    behavior (sync dtype, default dataset IDs) are preserved.
 
-    Although this function is designed to read metadata for dataset objects, it is possible
-    to read metadata for coordinate variables (scales) by passing their names to
-    ``dataset_id``, *e.g.* ``'dim1'``, ``'dim2'``, etc.  However, this is not the
-    intended use case.
+    .. warning::
+       When called with its default arguments this routine **writes to the default PSI
+       dataset IDs for HDF4/HDF5 files and synchronizes dtypes between the dataset and
+       scales.**  This behavior is required for interoperability with certain Fortran-based
+       PSI tools.
+
+    See Also
+    --------
+    write_hdf_data : Generic HDF data writing routine.
 
     Examples
     --------
-    >>> from psi_io import read_hdf_meta
-    >>> from psi_data import fetch_mas_data
-    >>> filepath = fetch_mas_data().cor_br
-    >>> meta = read_hdf_meta(filepath)
-    >>> meta[0].name
-    'Data'
-    >>> meta[0].shape
-    (299, 142, 255)
-    >>> meta[0].attr                        # attributes attached to the dataset
-    {}
-    >>> len(meta[0].scales)                 # one HdfScaleMeta per dimension
-    3
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import wrhdf_1d, rdhdf_1d
+    >>> x = np.linspace(0.0, 1.0, 50, dtype=np.float32)
+    >>> f = np.sin(x)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     wrhdf_1d(Path(d) / "out.h5", x, f)
+    ...     x2, f2 = rdhdf_1d(Path(d) / "out.h5")
+    ...     np.array_equal(f, f2)
+    True
     """
+    return _wrhdf_nd(hdf_filename, f, x, dimensionality=1, **kwargs)
 
-    return _dispatch_by_ext(ifile, _read_h4_meta, _read_h5_meta,
-                            dataset_id=dataset_id)
 
+def wrhdf_2d(hdf_filename: PathLike,
+             x: np.ndarray,
+             y: np.ndarray,
+             f: np.ndarray,
+             **kwargs) -> None:
+    """Write a 2D PSI-style HDF5 or HDF4 file.
 
-def read_rtp_meta(ifile: PathLike, /) -> Dict:
-    """
-    Read the scale metadata for PSI's 3D cubes.
+    The data in the HDF file will appear as X,Y in Fortran order.
+
+    Each dimension requires a 1D "scale" associated with it that
+    describes the rectilinear grid coordinates in each dimension.
 
     Parameters
     ----------
-    ifile : PathLike
-        The path to the HDF file to read.
+    hdf_filename : PathLike
+        The path to the 2D HDF5 (.h5) or HDF4 (.hdf) file to write.
+    x : np.ndarray
+        1D array of scales in the X dimension.
+    y : np.ndarray
+        1D array of scales in the Y dimension.
+    f : np.ndarray
+        2D data array, C-ordered with shape ``(ny, nx)`` in Python.
+    **kwargs
+        Additional keyword arguments passed through to the underlying
+        :func:`~psi_io.psi_io.write_hdf_data` routine, specifically:
 
-    Returns
-    -------
-    out : dict
-        A dictionary containing the RTP metadata.
-        The value for each key ('r', 't', and 'p') is a tuple containing:
+        - ``dataset_id`` : str | None
+            The identifier of the dataset to write.
+            If None, a default dataset is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+        - ``sync_dtype``: bool
+            If True, the data type of the scales will be matched to that of the data array.
+        - ``chunks``, ``compression``, ``compression_opts``, ``shuffle``, ``fletcher32``
+            HDF5 storage options; see :func:`~psi_io.psi_io.write_hdf_data`.
 
-        1. The scale length
-        2. The scale's value at the first index
-        3. The scale's value at the last index
+        Omitting these will yield the same behavior as the legacy routines, *i.e.* writing to
+        the default PSI dataset IDs for HDF4/HDF5 files and synchronizing datatypes between
+        the dataset and scales.
 
     Raises
     ------
     ValueError
-        If the file does not have a `.hdf` or `.h5` extension.
+        If the file does not have a ``.hdf`` or ``.h5`` extension.
+    KeyError
+        If, for HDF4 files, the data or scale dtype is not supported by
+        :py:mod:`pyhdf`.  See :func:`write_hdf_data` for the full dtype
+        support table.
 
     Notes
     -----
-    This function delegates to :func:`_read_h5_rtp` for HDF5 files and
-    :func:`_read_h4_rtp` for HDF4 files based on the file extension.
+    This routine is provided for backward compatibility with existing PSI codes that
+    expect this API signature.  The underlying implementation dispatches to
+    :func:`~psi_io.psi_io.write_hdf_data`, but the argument order and default
+    behavior (sync dtype, default dataset IDs) are preserved.
+
+    .. warning::
+       When called with its default arguments this routine **writes to the default PSI
+       dataset IDs for HDF4/HDF5 files and synchronizes dtypes between the dataset and
+       scales.**  This behavior is required for interoperability with certain Fortran-based
+       PSI tools.
+
+    See Also
+    --------
+    write_hdf_data : Generic HDF data writing routine.
 
     Examples
     --------
-    >>> from psi_io import read_rtp_meta
-    >>> from psi_data import fetch_mas_data
-    >>> filepath = fetch_mas_data().cor_br
-    >>> meta = read_rtp_meta(filepath)
-    >>> sorted(meta.keys())
-    ['p', 'r', 't']
-    >>> len(meta['r'])
-    3
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import wrhdf_2d, rdhdf_2d
+    >>> x = np.linspace(0.0, 2*np.pi, 64, dtype=np.float32)
+    >>> y = np.linspace(0.0, np.pi, 32, dtype=np.float32)
+    >>> f = np.outer(np.sin(x), np.cos(y)).astype(np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     wrhdf_2d(Path(d) / "out.h5", x, y, f)
+    ...     x2, y2, f2 = rdhdf_2d(Path(d) / "out.h5")
+    ...     np.array_equal(f, f2)
+    True
     """
-    return _dispatch_by_ext(ifile, _read_h4_rtp, _read_h5_rtp)
+    return _wrhdf_nd(hdf_filename, f, x, y, dimensionality=2, **kwargs)
 
 
-def read_hdf_data(ifile: PathLike, /,
-                  dataset_id: Optional[str] = None,
-                  return_scales: bool = True,
-                  ) -> Tuple[np.ndarray]:
-    """
-    Read data from an HDF4 (.hdf) or HDF5 (.h5) file.
+def wrhdf_3d(hdf_filename: PathLike,
+             x: np.ndarray,
+             y: np.ndarray,
+             z: np.ndarray,
+             f: np.ndarray,
+             **kwargs) -> None:
+    """Write a 3D PSI-style HDF5 or HDF4 file.
+
+    The data in the HDF file will appear as X,Y,Z in Fortran order.
+
+    Each dimension requires a 1D "scale" associated with it that
+    describes the rectilinear grid coordinates in each dimension.
 
     Parameters
     ----------
-    ifile : PathLike
-         The path to the HDF file to read.
-    dataset_id : str | None, optional
-        The identifier of the dataset to read.
-        If ``None``, a default dataset is used (``'Data-Set-2'`` for HDF4 and
-        ``'Data'`` for HDF5).  Default is ``None``.
-    return_scales : bool, optional
-        If ``True``, the coordinate scale arrays for each dimension are also
-        returned.  Default is ``True``.
+    hdf_filename : PathLike
+        The path to the 3D HDF5 (.h5) or HDF4 (.hdf) file to write.
+    x : np.ndarray
+        1D array of scales in the X dimension.
+    y : np.ndarray
+        1D array of scales in the Y dimension.
+    z : np.ndarray
+        1D array of scales in the Z dimension.
+    f : np.ndarray
+        3D data array, C-ordered with shape ``(nz, ny, nx)`` in Python.
+    **kwargs
+        Additional keyword arguments passed through to the underlying
+        :func:`~psi_io.psi_io.write_hdf_data` routine, specifically:
 
-    Returns
-    -------
-    out : np.ndarray | tuple[np.ndarray, ...]
-        The data array.  If ``return_scales`` is ``True``, returns a tuple
-        ``(data, scale_0, scale_1, ...)`` with one scale per dimension.
+        - ``dataset_id`` : str | None
+            The identifier of the dataset to write.
+            If None, a default dataset is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+        - ``sync_dtype``: bool
+            If True, the data type of the scales will be matched to that of the data array.
+        - ``chunks``, ``compression``, ``compression_opts``, ``shuffle``, ``fletcher32``
+            HDF5 storage options; see :func:`~psi_io.psi_io.write_hdf_data`.
+
+        Omitting these will yield the same behavior as the legacy routines, *i.e.* writing to
+        the default PSI dataset IDs for HDF4/HDF5 files and synchronizing datatypes between
+        the dataset and scales.
 
     Raises
     ------
     ValueError
         If the file does not have a ``.hdf`` or ``.h5`` extension.
-
-    See Also
-    --------
-    read_hdf_by_index : Read HDF datasets by index.
-    read_hdf_by_value : Read HDF datasets by value ranges.
-    read_hdf_by_ivalue : Read HDF datasets by subindex values.
+    KeyError
+        If, for HDF4 files, the data or scale dtype is not supported by
+        :py:mod:`pyhdf`.  See :func:`write_hdf_data` for the full dtype
+        support table.
 
     Notes
     -----
-    This function delegates to :func:`_read_h5_data` for HDF5 files and
-    :func:`_read_h4_data` for HDF4 files based on the file extension.
+    This routine is provided for backward compatibility with existing PSI codes that
+    expect this API signature.  The underlying implementation dispatches to
+    :func:`~psi_io.psi_io.write_hdf_data`, but the argument order and default
+    behavior (sync dtype, default dataset IDs) are preserved.
+
+    .. warning::
+       When called with its default arguments this routine **writes to the default PSI
+       dataset IDs for HDF4/HDF5 files and synchronizes dtypes between the dataset and
+       scales.**  This behavior is required for interoperability with certain Fortran-based
+       PSI tools.
+
+    See Also
+    --------
+    write_hdf_data : Generic HDF data writing routine.
 
     Examples
     --------
-    >>> from psi_io import read_hdf_data
-    >>> from psi_data import fetch_mas_data
-    >>> filepath = fetch_mas_data().cor_br
-    >>> data, r, t, p = read_hdf_data(filepath)
-    >>> data.shape
-    (299, 142, 255)
-    >>> r.shape, t.shape, p.shape
-    ((255,), (142,), (299,))
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import wrhdf_3d, rdhdf_3d
+    >>> r = np.linspace(1.0, 5.0, 10, dtype=np.float32)
+    >>> t = np.linspace(0.0, np.pi, 20, dtype=np.float32)
+    >>> p = np.linspace(0.0, 2*np.pi, 30, dtype=np.float32)
+    >>> f = np.ones((30, 20, 10), dtype=np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     wrhdf_3d(Path(d) / "out.h5", r, t, p, f)
+    ...     r2, t2, p2, f2 = rdhdf_3d(Path(d) / "out.h5")
+    ...     np.array_equal(f, f2)
+    True
     """
-    return _dispatch_by_ext(ifile, _read_h4_data, _read_h5_data,
-                            dataset_id=dataset_id, return_scales=return_scales)
+    return _wrhdf_nd(hdf_filename, f, x, y, z, dimensionality=3, **kwargs)
 
 
-def read_hdf_by_index(ifile: PathLike, /,
-                      *xi: Union[int, Tuple[Union[int, None], Union[int, None]], None],
-                      dataset_id: Optional[str] = None,
-                      return_scales: bool = True,
-                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
-    r"""
-    Read data from an HDF4 (.hdf) or HDF5 (.h5) file by index.
+def get_scales_1d(filename: PathLike
+                  ) -> np.ndarray:
+    """Return the coordinate scale of a 1D PSI-style HDF5 or HDF4 dataset.
 
-    .. attention::
-       For each dimension, the *minimum* number of elements returned is 1 *e.g.*
-       if 3 ints are passed (as positional `*xi` arguments) for a 3D dataset,
-       the resulting subset will have a shape of (1, 1, 1,) with scales of length 1.
+    Does not load the data array, so this is efficient for large files.
 
     Parameters
     ----------
-    ifile : PathLike
-       The path to the HDF file to read.
-    *xi : int | tuple[int | None, int | None] | None
-       Indices or ranges for each dimension of the `n`-dimensional dataset.
-       Use None for a dimension to select all indices. If no arguments are passed,
-       the entire dataset (and its scales) will be returned – see
-       :func:`~psi_io.psi_io.read_hdf_data`.
-    dataset_id : str | None, optional
-       The identifier of the dataset to read.
-       If ``None``, a default dataset is used (``'Data-Set-2'`` for HDF4 and
-       ``'Data'`` for HDF5).  Default is ``None``.
-    return_scales : bool, optional
-       If ``True``, the coordinate scale arrays for each dimension are also
-       returned.  Default is ``True``.
+    filename : PathLike
+        The path to the 1D HDF5 (.h5) or HDF4 (.hdf) file to read.
 
     Returns
     -------
-    out : np.ndarray | tuple[np.ndarray, ...]
-       The selected data array.  If ``return_scales`` is ``True``, returns a
-       tuple ``(data, scale_0, scale_1, ...)`` with one scale per dimension.
-
-    Raises
-    ------
-    ValueError
-       If the file does not have a ``.hdf`` or ``.h5`` extension.
+    x : np.ndarray
+        1D coordinate scale array.
 
-    See Also
+    Examples
     --------
-    read_hdf_by_value : Read HDF datasets by value ranges.
-    read_hdf_by_ivalue : Read HDF datasets by subindex values.
-    read_hdf_data : Read entire HDF datasets.
+    >>> from psi_io import get_scales_1d
+    >>> from psi_data import fetch_example_radial_scale
+    >>> filepath = fetch_example_radial_scale()
+    >>> x = get_scales_1d(filepath)
+    >>> x.ndim
+    1
+    """
+    return _dispatch_by_ext(filename, _get_scales_nd_h4, _get_scales_nd_h5,
+                            dimensionality=1, pooled=True)
 
-    Notes
-    -----
-    This function delegates to :func:`_read_h5_by_index` for HDF5 files and
-    :func:`_read_h4_by_index` for HDF4 files based on the file extension.
 
-    This function assumes Fortran (column-major) ordering for compatibility with
-    PSI's data ecosystem.  For an :math:`n`-dimensional array of shape
-    :math:`(D_0, D_1, \ldots, D_{n-1})` the scales satisfy
-    :math:`|x_i| = |D_{(n-1)-i}|`.  For example, a 3D dataset of shape
-    :math:`(D_\phi, D_\theta, D_r)` has scales :math:`r, \theta, \phi`.
+def get_scales_2d(filename: PathLike
+                  ) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the coordinate scales of a 2D PSI-style HDF5 or HDF4 dataset.
 
-    Each ``*xi`` argument is forwarded to Python's built-in :class:`slice` to
-    extract the desired subset without reading the entire dataset into memory.
+    Does not load the data array, so this is efficient for large files.
+    The data in the HDF file is assumed to be ordered X, Y in Fortran order.
+
+    Parameters
+    ----------
+    filename : PathLike
+        The path to the 2D HDF5 (.h5) or HDF4 (.hdf) file to read.
+
+    Returns
+    -------
+    x : np.ndarray
+        1D coordinate scale array for the X dimension.
+    y : np.ndarray
+        1D coordinate scale array for the Y dimension.
 
     Examples
     --------
-    Import a 3D HDF5 cube.
-
-    >>> from psi_data import fetch_mas_data
-    >>> from psi_io import read_hdf_by_index
-    >>> filepath = fetch_mas_data().cor_br
+    >>> from psi_io import get_scales_2d
+    >>> from psi_data import fetch_mas_quantities
+    >>> filepath = fetch_mas_quantities().ch_pm
+    >>> x, y = get_scales_2d(filepath)
+    >>> x.ndim, y.ndim
+    (1, 1)
+    """
+    return _dispatch_by_ext(filename, _get_scales_nd_h4, _get_scales_nd_h5,
+                            dimensionality=2, pooled=True)
 
-    Extract a radial slice at the first radial index from a 3D cube:
 
-    >>> f, r, t, p = read_hdf_by_index(filepath, 0, None, None)
-    >>> f.shape, r.shape, t.shape, p.shape
-    ((299, 142, 1), (1,), (142,), (299,))
+def get_scales_3d(filename: PathLike
+                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the coordinate scales of a 3D PSI-style HDF5 or HDF4 dataset.
 
-    Extract a phi slice at the 90th index from a 3D cube:
+    Does not load the data array, so this is efficient for large files.
+    The data in the HDF file is assumed to be ordered X, Y, Z in Fortran order.
 
-    >>> f, r, t, p = read_hdf_by_index(filepath, None, None, 90)
-    >>> f.shape, r.shape, t.shape, p.shape
-    ((1, 142, 255), (255,), (142,), (1,))
+    Parameters
+    ----------
+    filename : PathLike
+        The path to the 3D HDF5 (.h5) or HDF4 (.hdf) file to read.
 
-    Extract up to the 20th radial index with phi indices 10 to 25:
+    Returns
+    -------
+    x : np.ndarray
+        1D coordinate scale array for the X dimension.
+    y : np.ndarray
+        1D coordinate scale array for the Y dimension.
+    z : np.ndarray
+        1D coordinate scale array for the Z dimension.
 
-    >>> f, r, t, p = read_hdf_by_index(filepath, (None, 20), None, (10, 25))
-    >>> f.shape, r.shape, t.shape, p.shape
-    ((15, 142, 20), (20,), (142,), (15,))
+    Examples
+    --------
+    >>> from psi_io import get_scales_3d
+    >>> from psi_data import fetch_mas_data
+    >>> filepath = fetch_mas_data().cor_br
+    >>> r, t, p = get_scales_3d(filepath)
+    >>> r.ndim, t.ndim, p.ndim
+    (1, 1, 1)
     """
-    if not xi:
-        return read_hdf_data(ifile, dataset_id=dataset_id, return_scales=return_scales)
-    return _dispatch_by_ext(ifile, _read_h4_by_index, _read_h5_by_index,
-                            *xi, dataset_id=dataset_id, return_scales=return_scales)
+    return _dispatch_by_ext(filename, _get_scales_nd_h4, _get_scales_nd_h5,
+                            dimensionality=3, pooled=True)
 
 
-def read_hdf_by_value(ifile: PathLike, /,
-                      *xi: Union[float, Tuple[float, float], None],
-                      dataset_id: Optional[str] = None,
-                      return_scales: bool = True,
-                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
+# -----------------------------------------------------------------------------
+# "Updated" HDF reading and slicing routines for Hdf4 and Hdf5 datasets.
+# -----------------------------------------------------------------------------
+
+
+def read_hdf_meta(ifile: PathLike, /,
+                  dataset_id: Optional[str] = None,
+                  swmr: bool = False,
+                  ) -> List[HdfDataMeta]:
     """
-    Read data from an HDF4 (.hdf) or HDF5 (.h5) file by value.
+    Read metadata from an HDF4 (.hdf) or HDF5 (.h5) file.
 
-    .. note::
-       For each dimension, the minimum number of elements returned is 2 *e.g.*
-       if 3 floats are passed (as positional `*xi` arguments) for a 3D dataset,
-       the resulting subset will have a shape of (2, 2, 2,) with scales of length 2.
+    This function provides a unified interface to read metadata from both HDF4 and HDF5 files.
+
+    .. warning::
+       Unlike elsewhere in this module, the scales and datasets are read **as is**, *i.e.* without
+       reordering scales to match PSI's Fortran data ecosystem.
+
+    .. warning::
+       Unlike elsewhere in this module, when ``None`` is passed to ``dataset_id``, all (non-scale)
+       datasets are returned (instead of the default psi datasets *e.g.* 'Data-Set-2' or 'Data').
+       This will, effectively, return the standard PSI datasets when reading PSI-style HDF files.
 
     Parameters
     ----------
     ifile : PathLike
         The path to the HDF file to read.
-    *xi : float | tuple[float, float] | None
-        Values or value ranges corresponding to each dimension of the `n`-dimensional
-        dataset specified by ``dataset_id``.  Pass ``None`` for a dimension to
-        select all indices.  If no arguments are passed, the entire dataset (and
-        its scales) will be returned.
     dataset_id : str | None, optional
-        The identifier of the dataset to read.
-        If ``None``, a default dataset is used (``'Data-Set-2'`` for HDF4 and
-        ``'Data'`` for HDF5).  Default is ``None``.
-    return_scales : bool, optional
-        If ``True``, the coordinate scale arrays for each dimension are also
-        returned.  Default is ``True``.
+        The identifier of the dataset for which to read metadata.
+        If ``None``, metadata for **all** datasets is returned.  Default is ``None``.
+    swmr : bool, optional
+        If ``True``, open the file for single-writer/multiple-reader reading, so
+        that the file can be read while an SWMR writer is appending to it (HDF5
+        only; the metadata cache is bypassed).  Default is ``False``.
 
     Returns
     -------
-    out : np.ndarray | tuple[np.ndarray, ...]
-        The selected data array.  If ``return_scales`` is ``True``, returns a
-        tuple ``(data, scale_0, scale_1, ...)`` with one scale per dimension.
+    out : list[HdfDataMeta]
+        A list of :class:`HdfDataMeta` named tuples, one per dataset (or one
+        for the requested *dataset_id*).  Each object exposes:
+
+        ``name`` — dataset name (e.g. ``'Data'`` or ``'Data-Set-2'``).
+
+        ``type`` — NumPy dtype string of the stored array.
+
+        ``shape`` — array shape tuple.
+
+        ``attr`` — :class:`dict` of attribute key-value pairs attached to the
+        dataset.  Empty when no attributes are present.
+
+        ``scales`` — list of :class:`HdfScaleMeta` objects, one per
+        coordinate dimension.  Each :class:`HdfScaleMeta` similarly carries
+        an ``attr`` dict for scale-level attributes.
 
     Raises
     ------
     ValueError
         If the file does not have a ``.hdf`` or ``.h5`` extension.
 
-    See Also
-    --------
-    read_hdf_by_index : Read HDF datasets by index.
-    read_hdf_by_ivalue : Read HDF datasets by subindex values.
-    read_hdf_data : Read entire HDF datasets.
-    sp_interpolate_slice_from_hdf : Interpolate slices using SciPy's
-        :class:`~scipy.interpolate.RegularGridInterpolator`.
-    np_interpolate_slice_from_hdf : Linear/bilinear/trilinear interpolation
-        using vectorized NumPy routines.
-
     Notes
     -----
-    This function delegates to :func:`_read_h5_by_value` for HDF5 files and
-    :func:`_read_h4_by_value` for HDF4 files based on the file extension.
-
-    This function assumes that the dataset is Fortran (or column-major) ordered *viz.* for
-    compatibility with PSI's data ecosystem; as such, a given :math:`n`-dimensional array,
-    of shape :math:`(D_0, D_1, ..., D_{n-1})`, has scales :math:`(x_0, x_1, ..., x_{n-1})`,
-    such that :math:`| x_i | = | D_{(n-1)-i} |`. For example, a 3D dataset with shape
-    :math:`(D_p, D_t, D_r)` has scales :math:`r, t, p` corresponding to the radial, theta,
-    and phi dimensions respectively.
-
-    This function extracts a subset of the given dataset/scales without reading the
-    entire data into memory. For a given scale :math:`x_j`, if:
+    This function delegates to :func:`_read_h5_meta` for HDF5 files and
+    :func:`_read_h4_meta` for HDF4 files based on the file extension.
 
-    - *i)* a single float is provided (:math:`a`), the function will return a 2-element
-      subset of the scale (:math:`xʹ_j`) such that :math:`xʹ_j[0] <= a < xʹ_j[1]`.
-    - *ii)* a (float, float) tuple is provided (:math:`a_0, a_1`), the function will return an
-      *m*-element subset of the scale (:math:`xʹ_j`) where
-      :math:`xʹ_j[0] <= a_0` and :math:`xʹ_j[m-1] > a_1`.
-    - *iii)* a **None** value is provided, the function will return the entire scale :math:`x_j`
+    Although this function is designed to read metadata for dataset objects, it is possible
+    to read metadata for coordinate variables (scales) by passing their names to
+    ``dataset_id``, *e.g.* ``'dim1'``, ``'dim2'``, etc.  However, this is not the
+    intended use case.
 
-    The returned subset can then be passed to a linear interpolation routine to extract the
-    "slice" at the desired fixed dimensions.
+    The metadata is served from the process-wide cache configured through
+    :func:`configure_meta_cache`; each call returns new lists and attribute
+    dictionaries, so mutating the result does not affect later calls.
 
     Examples
     --------
-    Import a 3D HDF5 cube.
-
+    >>> from psi_io import read_hdf_meta
     >>> from psi_data import fetch_mas_data
-    >>> from psi_io import read_hdf_by_value
     >>> filepath = fetch_mas_data().cor_br
+    >>> meta = read_hdf_meta(filepath)
+    >>> meta[0].name
+    'Data'
+    >>> meta[0].shape
+    (299, 142, 255)
+    >>> meta[0].attr                        # attributes attached to the dataset
+    {}
+    >>> len(meta[0].scales)                 # one HdfScaleMeta per dimension
+    3
+    """
+    if swmr:
+        meta = _dispatch_by_ext(ifile, _read_h4_meta, _read_h5_meta, dataset_id=dataset_id, swmr_read=True)
+    else:
+        meta = _META_CACHE.get(ifile, ('meta', dataset_id),
+                               lambda: _dispatch_by_ext(ifile, _read_h4_meta, _read_h5_meta,
+                                                        dataset_id=dataset_id, pooled=True))
+    return [m._replace(attr=dict(m.attr), scales=[sm._replace(attr=dict(sm.attr)) for sm in m.scales])
+            for m in meta]
 
-    Extract a radial slice at r=15 from a 3D cube:
 
-    >>> f, r, t, p = read_hdf_by_value(filepath, 15, None, None)
-    >>> f.shape, r.shape, t.shape, p.shape
-    ((299, 142, 2), (2,), (142,), (299,))
+def read_rtp_meta(ifile: PathLike, /) -> Dict:
+    """
+    Read the scale metadata for PSI's 3D cubes.
 
-    Extract a phi slice at p=1.57 from a 3D cube:
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF file to read.
 
-    >>> f, r, t, p = read_hdf_by_value(filepath, None, None, 1.57)
-    >>> f.shape, r.shape, t.shape, p.shape
-    ((2, 142, 255), (255,), (142,), (2,))
+    Returns
+    -------
+    out : dict
+        A dictionary containing the RTP metadata.
+        The value for each key ('r', 't', and 'p') is a tuple containing:
 
-    Extract the values between 3.2 and 6.4 (in the radial dimension) and with
-    phi equal to 4.5
+        1. The scale length
+        2. The scale's value at the first index
+        3. The scale's value at the last index
 
-    >>> f, r, t, p = read_hdf_by_value(filepath, (3.2, 6.4), None, 4.5)
-    >>> f.shape, r.shape, t.shape, p.shape
-    ((2, 142, 35), (35,), (142,), (2,))
-    """
-    if not xi:
-        return read_hdf_data(ifile, dataset_id=dataset_id, return_scales=return_scales)
-    return _dispatch_by_ext(ifile, _read_h4_by_value, _read_h5_by_value,
-                            *xi, dataset_id=dataset_id, return_scales=return_scales)
+    Raises
+    ------
+    ValueError
+        If the file does not have a `.hdf` or `.h5` extension.
 
+    Notes
+    -----
+    This function delegates to :func:`_read_h5_rtp` for HDF5 files and
+    :func:`_read_h4_rtp` for HDF4 files based on the file extension.
 
-def read_hdf_by_ivalue(ifile: PathLike, /,
-                      *xi: Union[float, Tuple[float, float], None],
-                      dataset_id: Optional[str] = None,
-                      return_scales: bool = True,
-                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
-    r"""
-    Read data from an HDF4 (.hdf) or HDF5 (.h5) file by subindex value.
+    Examples
+    --------
+    >>> from psi_io import read_rtp_meta
+    >>> from psi_data import fetch_mas_data
+    >>> filepath = fetch_mas_data().cor_br
+    >>> meta = read_rtp_meta(filepath)
+    >>> sorted(meta.keys())
+    ['p', 'r', 't']
+    >>> len(meta['r'])
+    3
+    """
+    return _dispatch_by_ext(ifile, _read_h4_rtp, _read_h5_rtp, pooled=True)
 
-    Unlike :func:`read_hdf_by_value` (which works in physical coordinate space),
-    this function accepts fractional *index* positions and returns the minimal
-    bracketing subset required for interpolation.
 
-    .. note::
-       For each dimension the minimum number of elements returned is 2.  For
-       example, passing 3 scalar floats for a 3D dataset yields a subset of
-       shape ``(2, 2, 2)`` with index arrays of length 2.
+def read_hdf_scales(ifile: PathLike, /,
+                    dataset_id: Optional[str] = None,
+                    swmr: bool = False,
+                    ) -> Tuple[Optional[np.ndarray], ...]:
+    """
+    Read the scale of every dimension of a dataset, without reading the dataset itself.
 
     Parameters
     ----------
     ifile : PathLike
         The path to the HDF file to read.
-    *xi : float | tuple[float, float] | None
-        Fractional index values or ranges for each dimension of the
-        ``n``-dimensional dataset.  Pass ``None`` to select an entire dimension.
-        If no arguments are passed, the full dataset is returned.
     dataset_id : str | None, optional
-        The identifier of the dataset to read.  If ``None``, a default dataset
-        is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
-        Default is ``None``.
-    return_scales : bool, optional
-        If ``True``, 0-based index arrays (generated with :func:`~numpy.arange`)
-        are returned for each dimension alongside the data.  These are always
-        index-space arrays regardless of whether the dataset has physical
-        coordinate scales.  Default is ``True``.
+        The identifier of the dataset whose scales are read.  If ``None``, a default
+        dataset is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+    swmr : bool, optional
+        If ``True``, open the file for single-writer/multiple-reader reading
+        (HDF5 only; the metadata cache is bypassed).  Default is ``False``.
 
     Returns
     -------
-    out : np.ndarray | tuple[np.ndarray, ...]
-        The selected data array.  If ``return_scales`` is ``True``, returns a
-        tuple ``(data, idx_0, idx_1, ...)`` with one index array per dimension.
+    out : tuple[np.ndarray | None, ...]
+        The scales in PSI (Fortran) order, ``None`` for a dimension without a scale.
+        The arrays are shared through the metadata cache and are read-only.
 
     Raises
     ------
     ValueError
-        If the file does not have a ``.hdf`` or ``.h5`` extension.
+        If the file does not have a `.hdf` or `.h5` extension.
 
     See Also
     --------
-    read_hdf_by_index : Read HDF datasets by integer index.
-    read_hdf_by_value : Read HDF datasets by physical coordinate value.
-    read_hdf_data : Read entire HDF datasets.
-    sp_interpolate_slice_from_hdf : Interpolate slices using SciPy's
-        :class:`~scipy.interpolate.RegularGridInterpolator`.
-    np_interpolate_slice_from_hdf : Linear/bilinear/trilinear interpolation
-        using vectorized NumPy routines.
-
-    Notes
-    -----
-    This function delegates to :func:`_read_h5_by_ivalue` for HDF5 files and
-    :func:`_read_h4_by_ivalue` for HDF4 files based on the file extension.
-
-    For a given dimension with scale :math:`x_j`, the bracketing rule is:
-
-    - *single float* :math:`a` → returns
-      :math:`x_j[\lfloor a \rfloor], x_j[\lceil a \rceil]`.
-    - *(float, float)* :math:`(a_0, a_1)` → returns
-      :math:`x_j[\lfloor a_0 \rfloor], \ldots, x_j[\lceil a_1 \rceil]`.
-    - ``None`` → returns the entire scale :math:`x_j`.
+    get_scales_1d, get_scales_2d, get_scales_3d : Read the scales of a 1D, 2D or 3D dataset.
 
     Examples
     --------
-    >>> from psi_data import fetch_mas_data
-    >>> from psi_io import read_hdf_by_ivalue
-    >>> filepath = fetch_mas_data().cor_br
-
-    Extract a 2-element bracket around fractional radial index 2.7:
-
-    >>> f, r_idx, t_idx, p_idx = read_hdf_by_ivalue(filepath, 2.7, None, None)
-    >>> r_idx.shape
-    (2,)
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data, read_hdf_scales
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     out = write_hdf_data(Path(d) / "out.h5", np.zeros((3, 4)), np.arange(4.))
+    ...     [None if scale is None else scale.shape for scale in read_hdf_scales(out)]
+    [(4,), None]
     """
-    if not xi:
-        return read_hdf_data(ifile, dataset_id=dataset_id, return_scales=return_scales)
-    return _dispatch_by_ext(ifile, _read_h4_by_ivalue, _read_h5_by_ivalue,
-                            *xi, dataset_id=dataset_id, return_scales=return_scales)
+    return _cached_scales(ifile, dataset_id, swmr=swmr)
 
 
-def write_hdf_data(ifile: PathLike, /,
-                   data: np.ndarray,
-                   *scales: Sequence[Union[np.ndarray, None]],
-                   dataset_id: Optional[str] = None,
-                   sync_dtype: bool = False,
-                   strict: bool = True,
-                   **kwargs
-                   ) -> Path:
+def read_hdf_data(ifile: PathLike, /,
+                  dataset_id: Optional[str] = None,
+                  return_scales: bool = True,
+                  memmap: bool = False,
+                  out: Union[np.ndarray, BufferPool, None] = None,
+                  level: int = 0,
+                  dtype: Any = None,
+                  swmr: bool = False,
+                  chunked: bool = False,
+                  ) -> Tuple[np.ndarray]:
     """
-    Write data to an HDF4 (.hdf) or HDF5 (.h5) file.
-
-    Following PSI conventions, the data array is assumed to be Fortran-ordered,
-    with the scales provided in the order corresponding to each dimension *e.g.* a
-    3D dataset with shape (Dp, Dt, Dr) has scales r, t, p corresponding to the
-    radial, theta, and phi dimensions respectively.
+    Read data from an HDF4 (.hdf) or HDF5 (.h5) file.
 
     Parameters
     ----------
     ifile : PathLike
-        The path to the HDF file to write.
-    data : np.ndarray
-        The data array to write.
-    *scales : Sequence[np.ndarray | None]
-        The scales (coordinate arrays) for each dimension.
+         The path to the HDF file to read.
     dataset_id : str | None, optional
-        The identifier of the dataset to write.  If ``None``, a default dataset
-        is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
-        Default is ``None``.
-    sync_dtype : bool, optional
-        If ``True``, the scale dtypes are cast to match the data array dtype.
-        This mimics the behavior of PSI's legacy HDF writing routines and ensures
-        compatibility with Fortran tools that require uniform precision between
-        datasets and their scales.  Default is ``False``.
-    strict : bool, optional
-        If ``True``, raise an error if any dataset attribute cannot be written to
-        the target format.  If ``False``, a warning is printed and the attribute
-        is skipped.  Default is ``True``.
-    **kwargs
-        Key-value pairs of dataset attributes to attach to the dataset.
+        The identifier of the dataset to read.
+        If ``None``, a default dataset is used (``'Data-Set-2'`` for HDF4 and
+        ``'Data'`` for HDF5).  Default is ``None``.
+    return_scales : bool, optional
+        If ``True``, the coordinate scale arrays for each dimension are also
+        returned.  Default is ``True``.
+    memmap : bool, optional
+        If ``True``, return a read-only :class:`numpy.memmap` of the dataset
+        instead of reading it into memory, whenever the dataset is eligible
+        (see Notes).  Default is ``False``.
+    out : np.ndarray | BufferPool | None, optional
+        An array to read the data into, or a :class:`BufferPool` to acquire one
+        from, instead of allocating a new array.  The array must have the shape
+        of the selection; the values are cast to its dtype.  The filled array is
+        returned in place of a new one.  Default is ``None``.
+    level : int, optional
+        The overview level to read (HDF5 only): ``0`` reads the dataset itself,
+        and level ``k`` a copy downsampled by ``2**k`` along every axis (with
+        matching scales) – see :func:`build_hdf_pyramid`.  Default is ``0``.
+    dtype : DTypeLike | None, optional
+        The dtype to return the data in.  HDF5 data is converted by the HDF5
+        library as it is read, so no array of the stored dtype is allocated; an
+        *out* array must then have this dtype.  The scales keep their stored
+        dtype.  Default is ``None`` (the stored dtype).
+    swmr : bool, optional
+        If ``True``, open the file for single-writer/multiple-reader reading, so
+        that a file still being written by an SWMR writer (*e.g.* an
+        :class:`HdfSequenceWriter` with ``swmr=True``) is read as of its latest
+        flush (HDF5 only).  Default is ``False``.
+    chunked : bool, optional
+        If ``True``, read HDF4 data one hyperslab (of at most
+        :data:`CONVERT_SLAB_NBYTES`, along the slowest varying axis) at a time,
+        straight into the output array (see Notes).  HDF5 data is always read
+        this way.  Default is ``False``.
 
     Returns
     -------
-    out : Path
-        The path to the written HDF file.
+    out : np.ndarray | tuple[np.ndarray, ...]
+        The data array.  If ``return_scales`` is ``True``, returns a tuple
+        ``(data, scale_0, scale_1, ...)`` with one scale per dimension.
 
     Raises
     ------
     ValueError
-        If the file does not have a ``.hdf`` or ``.h5`` extension.
+        If the file does not have a ``.hdf`` or ``.h5`` extension, if *out*
+        does not have the shape (or the requested *dtype*) of the dataset, if
+        both *memmap* and *out* are given, or if a non-zero *level* is
+        requested for an HDF4 file.
     KeyError
-        If, for HDF4 files, the data or scale dtype is not supported by
-        :py:mod:`pyhdf`.  See the dtype support table in the Notes section.
+        If the requested *level* is not stored in the file.
+
+    See Also
+    --------
+    read_hdf_by_index : Read HDF datasets by index.
+    read_hdf_by_value : Read HDF datasets by value ranges.
+    read_hdf_by_ivalue : Read HDF datasets by subindex values.
+    BufferPool : Reuse output arrays across repeated reads.
 
     Notes
     -----
-    This function delegates to :func:`_write_h5_data` for HDF5 files and
-    :func:`_write_h4_data` for HDF4 files based on the file extension.
+    This function delegates to :func:`_read_h5_data` for HDF5 files and
+    :func:`_read_h4_data` for HDF4 files based on the file extension.
 
-    If no scales are provided the dataset is written without coordinate variables.
-    The number of scales may be less than or equal to the number of dimensions;
-    pass ``None`` for dimensions that should not have an attached scale.
+    With ``memmap=True``, HDF5 datasets stored contiguously, without filters
+    (compression, checksums, ...) and in an allocated, uncompressed region of a
+    regular file – *i.e.* every dataset written by :func:`write_hdf_data` with
+    its default storage options – are mapped directly from the file with
+    :class:`numpy.memmap`.  No data is read until it is accessed, and only the
+    pages touched are read.  Any other dataset (including every HDF4 dataset)
+    falls back to a regular read.  The mapping remains valid after the file is
+    closed, but must not outlive a rewrite of the file.
+
+    With ``out``, HDF5 data is read straight into the (C-contiguous) output
+    array with :meth:`h5py.Dataset.read_direct`, so repeated reads into the same
+    array – or into arrays recycled through a :class:`BufferPool` – do not
+    allocate.  HDF4 data is read into a temporary array and copied.
+
+    With ``dtype``, HDF5 data is read with :meth:`h5py.Dataset.read_direct` into
+    an array of that dtype, the conversion being done by HDF5 chunk by chunk –
+    *e.g.* a float64 cube can be read as float32 with only the float32 array in
+    memory.  A memory map is only returned if the stored dtype is *dtype*.  The
+    HDF4 library has no such conversion: the data is read, then cast.
+
+    HDF4 reads into *out* or in another *dtype* thus hold the data twice – the
+    whole dataset as stored, and the output array.  With ``chunked=True`` the
+    dataset is instead copied into the output one hyperslab at a time, so that
+    only the output and a single hyperslab are resident at once.
 
-    The table below summarizes dtype support across formats.  HDF4 support is
-    determined by the :data:`DTYPE_TO_SDC` mapping; HDF5 support is provided
-    by :mod:`h5py`.
+    Examples
+    --------
+    >>> from psi_io import read_hdf_data
+    >>> from psi_data import fetch_mas_data
+    >>> filepath = fetch_mas_data().cor_br
+    >>> data, r, t, p = read_hdf_data(filepath)
+    >>> data.shape
+    (299, 142, 255)
+    >>> r.shape, t.shape, p.shape
+    ((255,), (142,), (299,))
 
-    .. list-table:: NumPy dtype support by format
-       :header-rows: 1
-       :widths: 20 20 20
-
-       * - dtype
-         - HDF4 (``.hdf``)
-         - HDF5 (``.h5``)
-       * - ``float16``
-         - No
-         - Yes
-       * - ``float32``
-         - Yes
-         - Yes
-       * - ``float64``
-         - Yes
-         - Yes
-       * - ``int8``
-         - Yes
-         - Yes
-       * - ``int16``
-         - Yes
-         - Yes
-       * - ``int32``
-         - Yes
-         - Yes
-       * - ``int64``
-         - No
-         - Yes
-       * - ``uint8``
-         - Yes
-         - Yes
-       * - ``uint16``
-         - Yes
-         - Yes
-       * - ``uint32``
-         - Yes
-         - Yes
-       * - ``uint64``
-         - No
-         - Yes
-       * - ``complex64``
-         - No
-         - Yes
-       * - ``complex128``
-         - No
-         - Yes
-       * - ``bool``
-         - Yes (stored as ``uint8``)
-         - Yes
-
-    See Also
-    --------
-    wrhdf_1d : Write 1D HDF files.
-    wrhdf_2d : Write 2D HDF files.
-    wrhdf_3d : Write 3D HDF files.
+    Read the data at half precision, converting as it is read:
 
-    Examples
-    --------
-    >>> import tempfile, numpy as np
-    >>> from pathlib import Path
-    >>> from psi_io import write_hdf_data, read_hdf_data
-    >>> r = np.linspace(1.0, 5.0, 10, dtype=np.float32)
-    >>> t = np.linspace(0.0, np.pi, 20, dtype=np.float32)
-    >>> p = np.linspace(0.0, 2*np.pi, 30, dtype=np.float32)
-    >>> f = np.ones((30, 20, 10), dtype=np.float32)
-    >>> with tempfile.TemporaryDirectory() as d:
-    ...     _ = write_hdf_data(Path(d) / "out.h5", f, r, t, p)
-    ...     data, r2, t2, p2 = read_hdf_data(Path(d) / "out.h5")
-    ...     data.shape
-    (30, 20, 10)
+    >>> data, *_ = read_hdf_data(filepath, dtype='float16')
+    >>> data.dtype
+    dtype('float16')
     """
-    return _dispatch_by_ext(ifile, _write_h4_data, _write_h5_data, data,
-                            *scales, dataset_id=dataset_id, sync_dtype=sync_dtype, strict=strict, **kwargs)
+    if memmap and out is not None:
+        raise ValueError("memmap and out are mutually exclusive")
+    return _dispatch_by_ext(ifile, _read_h4_data, _read_h5_data,
+                            dataset_id=_level_dataset_id(ifile, dataset_id, level),
+                            return_scales=return_scales, memmap=memmap, out=out, dtype=dtype, chunked=chunked,
+                            pooled=True, swmr_read=swmr)
 
 
-def write_hdf_meta(ifile: PathLike, /,
-                   meta: Optional[Mapping[str, Mapping[str, Any]]] = None,
-                   **kwargs) -> Path:
-    """
-    Add or update attributes on an existing HDF4 (.hdf) or HDF5 (.h5) file.
+def read_hdf_by_index(ifile: PathLike, /,
+                      *xi: Union[int, slice, Tuple[Union[int, None], ...], None],
+                      dataset_id: Optional[str] = None,
+                      return_scales: bool = True,
+                      memmap: bool = False,
+                      out: Union[np.ndarray, BufferPool, None] = None,
+                      level: int = 0,
+                      dtype: Any = None,
+                      swmr: bool = False,
+                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    r"""
+    Read data from an HDF4 (.hdf) or HDF5 (.h5) file by index.
 
-    Unlike :func:`write_hdf_data`, this function does **not** create or overwrite
-    any dataset — it only attaches attribute key-value pairs to the file root
-    (via ``**kwargs``) or to named datasets within the file (via ``meta``).
+    .. attention::
+       For each dimension, the *minimum* number of elements returned is 1 *e.g.*
+       if 3 ints are passed (as positional `*xi` arguments) for a 3D dataset,
+       the resulting subset will have a shape of (1, 1, 1,) with scales of length 1.
 
     Parameters
     ----------
     ifile : PathLike
-        Path to an existing HDF file.  The file must already contain any
-        datasets referenced by *meta*.
-    meta : Mapping[str, Mapping[str, Any]] | None, optional
-        Per-dataset attributes.  Each key is a dataset name (e.g. ``'Data'``
-        for HDF5, ``'Data-Set-2'`` for HDF4); the corresponding value is a
-        mapping of attribute name → attribute value to attach to that dataset.
-        ``None`` (the default) applies no per-dataset attributes.
-    **kwargs
-        File-level (root) attributes.  For HDF5 files these are written to
-        the root group; for HDF4 files they are written as SD-level global
-        attributes.  They do **not** appear on any dataset and will not be
-        returned by :func:`read_hdf_meta`.
+       The path to the HDF file to read.
+    *xi : int | slice | tuple[int | None, ...] | None
+       Indices or ranges for each dimension of the `n`-dimensional dataset.
+       A range is a :class:`slice` or a ``(start, stop)`` or
+       ``(start, stop, step)`` tuple; a step selects every ``step``-th element.
+       Use None for a dimension to select all indices. If no arguments are passed,
+       the entire dataset (and its scales) will be returned – see
+       :func:`~psi_io.psi_io.read_hdf_data`.
+    dataset_id : str | None, optional
+       The identifier of the dataset to read.
+       If ``None``, a default dataset is used (``'Data-Set-2'`` for HDF4 and
+       ``'Data'`` for HDF5).  Default is ``None``.
+    return_scales : bool, optional
+       If ``True``, the coordinate scale arrays for each dimension are also
+       returned.  Default is ``True``.
+    memmap : bool, optional
+       If ``True``, return a read-only view of a :class:`numpy.memmap` of the
+       dataset (rather than a copy) whenever the dataset is eligible – see
+       :func:`read_hdf_data`.  Default is ``False``.
+    out : np.ndarray | BufferPool | None, optional
+       An array to read the data into, or a :class:`BufferPool` to acquire one
+       from, instead of allocating a new array.  The array must have the shape
+       of the selection; the values are cast to its dtype.  The filled array is
+       returned in place of a new one.  Default is ``None``.
+    level : int, optional
+       The overview level to read from (HDF5 only) – see :func:`read_hdf_data`.
+       The indices refer to the grid of that level.  Default is ``0``.
+    dtype : DTypeLike | None, optional
+       The dtype to return the data in, converted as it is read – see
+       :func:`read_hdf_data`.  Default is ``None`` (the stored dtype).
+    swmr : bool, optional
+       If ``True``, read a file being written by an SWMR writer – see
+       :func:`read_hdf_data`.  Default is ``False``.
 
     Returns
     -------
-    out : Path
-        The path to the modified HDF file.
+    out : np.ndarray | tuple[np.ndarray, ...]
+       The selected data array.  If ``return_scales`` is ``True``, returns a
+       tuple ``(data, scale_0, scale_1, ...)`` with one scale per dimension.
 
     Raises
     ------
     ValueError
-        If the file does not have a ``.hdf`` or ``.h5`` extension.
+       If the file does not have a ``.hdf`` or ``.h5`` extension, if *out*
+       does not have the shape (or the requested *dtype*) of the selection, if
+       both *memmap* and *out* are given, if a step is not a positive integer, or if a non-zero
+       *level* is requested for an HDF4 file.
+    KeyError
+       If the requested *level* is not stored in the file.
+
+    See Also
+    --------
+    read_hdf_by_value : Read HDF datasets by value ranges.
+    read_hdf_by_ivalue : Read HDF datasets by subindex values.
+    read_hdf_data : Read entire HDF datasets.
 
     Notes
     -----
-    This function delegates to :func:`_write_h5_meta` for HDF5 files and
-    :func:`_write_h4_meta` for HDF4 files based on the file extension.
+    This function delegates to :func:`_read_h5_by_index` for HDF5 files and
+    :func:`_read_h4_by_index` for HDF4 files based on the file extension.
 
-    Per-dataset attributes written via *meta* are subsequently accessible
-    through the :attr:`~HdfDataMeta.attr` field of the :class:`HdfDataMeta`
-    named tuple returned by :func:`read_hdf_meta`.
+    This function assumes Fortran (column-major) ordering for compatibility with
+    PSI's data ecosystem.  For an :math:`n`-dimensional array of shape
+    :math:`(D_0, D_1, \ldots, D_{n-1})` the scales satisfy
+    :math:`|x_i| = |D_{(n-1)-i}|`.  For example, a 3D dataset of shape
+    :math:`(D_\phi, D_\theta, D_r)` has scales :math:`r, \theta, \phi`.
 
-    See Also
-    --------
-    write_hdf_data : Write dataset data (and optionally attributes) to a new file.
-    read_hdf_meta  : Read dataset metadata and attributes from an HDF file.
+    Each ``*xi`` argument is forwarded to Python's built-in :class:`slice` to
+    extract the desired subset without reading the entire dataset into memory.
+    Steps are passed to the HDF library as the stride of the selection
+    (an HDF5 hyperslab, or the ``stride`` of ``SDreaddata`` for HDF4), so a
+    decimated read only transfers the selected elements – unless reading the
+    bounding box of the selection at once is cheaper for the storage layout of
+    the dataset, *e.g.* for small steps along a contiguous axis (see
+    :func:`plan_hdf_read`).
 
     Examples
     --------
-    >>> import tempfile, numpy as np
-    >>> from pathlib import Path
-    >>> from psi_io import write_hdf_data, write_hdf_meta, read_hdf_meta
-    >>> f = np.ones((30, 20, 10), dtype=np.float32)
-    >>> with tempfile.TemporaryDirectory() as d:
-    ...     _ = write_hdf_data(Path(d) / "out.h5", f)
-    ...     _ = write_hdf_meta(Path(d) / "out.h5", meta={'Data': {'long_name': 'test field', 'units': 'G'}})
-    ...     meta = read_hdf_meta(Path(d) / "out.h5")
-    ...     meta[0].attr['long_name']
-    'test field'
+    Import a 3D HDF5 cube.
+
+    >>> from psi_data import fetch_mas_data
+    >>> from psi_io import read_hdf_by_index
+    >>> filepath = fetch_mas_data().cor_br
+
+    Extract a radial slice at the first radial index from a 3D cube:
+
+    >>> f, r, t, p = read_hdf_by_index(filepath, 0, None, None)
+    >>> f.shape, r.shape, t.shape, p.shape
+    ((299, 142, 1), (1,), (142,), (299,))
+
+    Extract a phi slice at the 90th index from a 3D cube:
+
+    >>> f, r, t, p = read_hdf_by_index(filepath, None, None, 90)
+    >>> f.shape, r.shape, t.shape, p.shape
+    ((1, 142, 255), (255,), (142,), (1,))
+
+    Extract up to the 20th radial index with phi indices 10 to 25:
+
+    >>> f, r, t, p = read_hdf_by_index(filepath, (None, 20), None, (10, 25))
+    >>> f.shape, r.shape, t.shape, p.shape
+    ((15, 142, 20), (20,), (142,), (15,))
+
+    Read every 4th point in each dimension for a quick-look preview:
+
+    >>> f, r, t, p = read_hdf_by_index(filepath, (None, None, 4), (None, None, 4), slice(None, None, 4))
+    >>> f.shape, r.shape, t.shape, p.shape
+    ((75, 36, 64), (64,), (36,), (75,))
     """
-    return _dispatch_by_ext(ifile, _write_h4_meta, _write_h5_meta, meta, **kwargs)
+    if not xi:
+        return read_hdf_data(ifile, dataset_id=dataset_id, return_scales=return_scales, memmap=memmap, out=out,
+                             level=level, dtype=dtype, swmr=swmr)
+    if memmap and out is not None:
+        raise ValueError("memmap and out are mutually exclusive")
+    return _dispatch_by_ext(ifile, _read_h4_by_index, _read_h5_by_index,
+                            *xi, dataset_id=_level_dataset_id(ifile, dataset_id, level),
+                            return_scales=return_scales, memmap=memmap, out=out, dtype=dtype, pooled=True,
+                            swmr_read=swmr)
 
 
-def convert(ifile: PathLike,
-            ofile: Optional[PathLike] = None,
-            strict: bool = True) -> Path:
+def read_hdf_by_value(ifile: PathLike, /,
+                      *xi: Union[float, Tuple[float, float], np.ndarray, None],
+                      dataset_id: Optional[str] = None,
+                      return_scales: bool = True,
+                      out: Union[np.ndarray, BufferPool, None] = None,
+                      dtype: Any = None,
+                      swmr: bool = False,
+                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
     """
-    Convert an HDF file between HDF4 (.hdf) and HDF5 (.h5) formats.
+    Read data from an HDF4 (.hdf) or HDF5 (.h5) file by value.
 
-    All datasets and their attributes are preserved in the output file.
-    The output format is inferred from the input: `.hdf` → `.h5` and vice versa,
-    unless an explicit output path is provided.
+    .. note::
+       For each dimension, the minimum number of elements returned is 2 *e.g.*
+       if 3 floats are passed (as positional `*xi` arguments) for a 3D dataset,
+       the resulting subset will have a shape of (2, 2, 2,) with scales of length 2.
 
     Parameters
     ----------
     ifile : PathLike
-        The path to the source HDF file.
-    ofile : PathLike, optional
-        The path to the output HDF file.
-        If ``None``, the output file is written alongside the input file
-        with its extension swapped (*e.g.* ``foo.hdf`` → ``foo.h5``).
-    strict : bool, optional
-        If ``True``, raise an error if any dataset attribute cannot be written
-        to the output format.  If ``False``, a warning is printed and the
-        attribute is skipped.  Default is ``True``.
+        The path to the HDF file to read.
+    *xi : float | tuple[float, float] | np.ndarray | None
+        Values or value ranges corresponding to each dimension of the `n`-dimensional
+        dataset specified by ``dataset_id``.  Pass ``None`` for a dimension to
+        select all indices, or an array to select the brackets of several values
+        at once.  If no arguments are passed, the entire dataset (and its scales)
+        will be returned.
+    dataset_id : str | None, optional
+        The identifier of the dataset to read.
+        If ``None``, a default dataset is used (``'Data-Set-2'`` for HDF4 and
+        ``'Data'`` for HDF5).  Default is ``None``.
+    return_scales : bool, optional
+        If ``True``, the coordinate scale arrays for each dimension are also
+        returned.  Default is ``True``.
+    out : np.ndarray | BufferPool | None, optional
+        An array to read the data into, or a :class:`BufferPool` to acquire one
+        from, instead of allocating a new array.  The array must have the shape
+        of the selection; the values are cast to its dtype.  The filled array is
+        returned in place of a new one.  Default is ``None``.
+    dtype : DTypeLike | None, optional
+        The dtype to return the data in, converted as it is read – see
+        :func:`read_hdf_data`.  Default is ``None`` (the stored dtype).
+    swmr : bool, optional
+        If ``True``, read a file being written by an SWMR writer – see
+        :func:`read_hdf_data`.  Default is ``False``.
 
     Returns
     -------
-    out : Path
-        The path to the written output file.
+    out : np.ndarray | tuple[np.ndarray, ...]
+        The selected data array.  If ``return_scales`` is ``True``, returns a
+        tuple ``(data, scale_0, scale_1, ...)`` with one scale per dimension.
 
     Raises
     ------
     ValueError
-        If the input file does not have a ``.hdf`` or ``.h5`` extension.
-    KeyError
-        If, for HDF4 output files, the data or an attribute value has a dtype
-        not supported by :py:mod:`pyhdf` and ``strict`` is ``True``.  See
-        :func:`write_hdf_data` for the full dtype support table.
-    TypeError
-        If, for HDF5 output files, a dataset attribute has a type that cannot be
-        stored as an HDF5 attribute and ``strict`` is ``True``.
+        If the file does not have a ``.hdf`` or ``.h5`` extension, or if *out*
+        does not have the shape (or the requested *dtype*) of the selection.
 
     See Also
     --------
-    convert_psih4_to_psih5 : Specialized PSI-convention HDF4 → HDF5 converter.
-    write_hdf_data : Generic HDF data writing routine.
-    read_hdf_data : Generic HDF data reading routine.
+    read_hdf_by_index : Read HDF datasets by index.
+    read_hdf_by_ivalue : Read HDF datasets by subindex values.
+    read_hdf_data : Read entire HDF datasets.
+    sp_interpolate_slice_from_hdf : Interpolate slices using SciPy's
+        :class:`~scipy.interpolate.RegularGridInterpolator`.
+    np_interpolate_slice_from_hdf : Linear/bilinear/trilinear interpolation
+        using vectorized NumPy routines.
 
-    Examples
-    --------
-    >>> import tempfile
-    >>> from pathlib import Path
-    >>> from psi_io import convert, read_hdf_meta
-    >>> from psi_data import fetch_mas_data
-    >>> h5_path = fetch_mas_data(hdf=5).cor_br
-    >>> with tempfile.TemporaryDirectory() as d:
-    ...     out = convert(h5_path, Path(d) / "br.hdf")
-    ...     meta = read_hdf_meta(out)
-    ...     meta[0].name
-    'Data'
-    """
-    ifile = Path(ifile)
-    if not ofile:
-        ofile = ifile.with_suffix(".hdf") if ifile.suffix == ".h5" else ifile.with_suffix(".h5")
-    else:
-        ofile = Path(ofile)
-    ofile.parent.mkdir(parents=True, exist_ok=True)
+    Notes
+    -----
+    The coordinate scales are read through the process-wide cache configured
+    with :func:`configure_meta_cache`, so repeated calls on the same file only
+    read the selected hyperslab of the data.  When the cache is disabled, the
+    scales are read along with the data by :func:`_read_h5_by_value` or
+    :func:`_read_h4_by_value`.
 
-    meta_data = read_hdf_meta(ifile)
-    for dataset in meta_data:
-        data, *scales = read_hdf_data(ifile, dataset_id=dataset.name, return_scales=True)
-        write_hdf_data(ofile, data, *scales, dataset_id=dataset.name, strict=strict, **dataset.attr)
+    This function assumes that the dataset is Fortran (or column-major) ordered *viz.* for
+    compatibility with PSI's data ecosystem; as such, a given :math:`n`-dimensional array,
+    of shape :math:`(D_0, D_1, ..., D_{n-1})`, has scales :math:`(x_0, x_1, ..., x_{n-1})`,
+    such that :math:`| x_i | = | D_{(n-1)-i} |`. For example, a 3D dataset with shape
+    :math:`(D_p, D_t, D_r)` has scales :math:`r, t, p` corresponding to the radial, theta,
+    and phi dimensions respectively.
 
-    return ofile
+    This function extracts a subset of the given dataset/scales without reading the
+    entire data into memory. For a given scale :math:`x_j`, if:
 
+    - *i)* a single float is provided (:math:`a`), the function will return a 2-element
+      subset of the scale (:math:`xʹ_j`) such that :math:`xʹ_j[0] <= a < xʹ_j[1]`.
+    - *ii)* a (float, float) tuple is provided (:math:`a_0, a_1`), the function will return an
+      *m*-element subset of the scale (:math:`xʹ_j`) where
+      :math:`xʹ_j[0] <= a_0` and :math:`xʹ_j[m-1] > a_1`.
+    - *iii)* a **None** value is provided, the function will return the entire scale :math:`x_j`
+    - *iv)* a :class:`~numpy.ndarray` of values is provided, the function will return the
+      union of the 2-element brackets of every value *i.e.* the sorted, unique indices
+      needed to interpolate to all of them.  The union is read with one hyperslab per run
+      of brackets (see :data:`UNION_MERGE_GAP`), rather than one read per value.
 
-def convert_psih4_to_psih5(ifile: PathLike,
-                          ofile: Optional[PathLike] = None) -> Path:
-    """
-    Convert a PSI-convention HDF4 file to an HDF5 file.
+    The returned subset can then be passed to a linear interpolation routine to extract the
+    "slice" at the desired fixed dimensions – see :func:`np_interpolate_slice_from_hdf`,
+    which interpolates to every value of an array at once.
 
-    Unlike :func:`convert`, this function is specialized for PSI-style HDF4 files:
-    it reads the primary dataset (``'Data-Set-2'``) and writes it under the PSI HDF5
-    dataset name (``'Data'``), preserving the dataset's attributes and scales.
+    Examples
+    --------
+    Import a 3D HDF5 cube.
 
-    Parameters
-    ----------
-    ifile : PathLike
-        The path to the source HDF4 (.hdf) file.
-    ofile : PathLike, optional
-        The path to the output HDF5 (.h5) file.
-        If ``None``, the output file is written alongside the input file with a
-        ``.h5`` extension (*e.g.* ``foo.hdf`` → ``foo.h5``).
+    >>> from psi_data import fetch_mas_data
+    >>> from psi_io import read_hdf_by_value
+    >>> filepath = fetch_mas_data().cor_br
 
-    Returns
-    -------
-    out : Path
-        The path to the written HDF5 file.
+    Extract a radial slice at r=15 from a 3D cube:
 
-    Raises
-    ------
-    ValueError
-        If ``ifile`` does not have a ``.hdf`` extension.
-    ValueError
-        If ``ofile`` does not have a ``.h5`` extension.
-    ImportError
-        If the :py:mod:`pyhdf` package is not available.
+    >>> f, r, t, p = read_hdf_by_value(filepath, 15, None, None)
+    >>> f.shape, r.shape, t.shape, p.shape
+    ((299, 142, 2), (2,), (142,), (299,))
 
-    See Also
-    --------
-    convert : General-purpose HDF4 ↔ HDF5 converter.
-    write_hdf_data : Generic HDF data writing routine.
+    Extract a phi slice at p=1.57 from a 3D cube:
 
-    Examples
-    --------
-    >>> import tempfile
-    >>> from pathlib import Path
-    >>> from psi_io import convert_psih4_to_psih5, read_hdf_meta
-    >>> from psi_data import fetch_mas_data
-    >>> hdf4_path = fetch_mas_data(hdf=4).cor_br
-    >>> with tempfile.TemporaryDirectory() as d:
-    ...     out = convert_psih4_to_psih5(hdf4_path, Path(d) / "br.h5")
-    ...     meta = read_hdf_meta(out)
-    ...     meta[0].name
-    'Data'
-    """
-    ifile = Path(ifile)
-    ofile = ifile.with_suffix(".h5") if not ofile else Path(ofile)
-    if ifile.suffix != ".hdf":
-        raise ValueError(f"Input file must have a .hdf extension; got {ifile.suffix}")
-    if ofile.suffix != ".h5":
-        raise ValueError(f"Output file must have a .h5 extension; got {ofile.suffix}")
-    ofile.parent.mkdir(parents=True, exist_ok=True)
+    >>> f, r, t, p = read_hdf_by_value(filepath, None, None, 1.57)
+    >>> f.shape, r.shape, t.shape, p.shape
+    ((2, 142, 255), (255,), (142,), (2,))
+
+    Extract the values between 3.2 and 6.4 (in the radial dimension) and with
+    phi equal to 4.5
 
+    >>> f, r, t, p = read_hdf_by_value(filepath, (3.2, 6.4), None, 4.5)
+    >>> f.shape, r.shape, t.shape, p.shape
+    ((2, 142, 35), (35,), (142,), (2,))
 
-    data, *scales = read_hdf_data(ifile, dataset_id=PSI_DATA_ID["h4"], return_scales=True)
-    meta_data, *_ = read_hdf_meta(ifile, dataset_id=PSI_DATA_ID["h4"])
+    Extract the brackets of three radial shells with a single call:
+
+    >>> import numpy as np
+    >>> f, r, t, p = read_hdf_by_value(filepath, np.array([2.0, 2.01, 15.0]), None, None)
+    >>> r.shape  # doctest: +SKIP
+    (5,)
+    """
+    if not xi:
+        return read_hdf_data(ifile, dataset_id=dataset_id, return_scales=return_scales, out=out, dtype=dtype,
+                             swmr=swmr)
+    if not _META_CACHE.maxsize:
+        return _dispatch_by_ext(ifile, _read_h4_by_value, _read_h5_by_value, *xi, dataset_id=dataset_id,
+                                return_scales=return_scales, out=out, dtype=dtype, pooled=True, swmr_read=swmr)
+    scales = _cached_scales(ifile, dataset_id, swmr=swmr)
+    if len(xi) != len(scales):
+        raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
+    slices = []
+    for scale, value in zip(scales, xi):
+        if scale is not None:
+            slices.append(_parse_value_selection(scale, value))
+        elif value is None:
+            slices.append(slice(None))
+        else:
+            raise ValueError("Cannot slice by value on dimension without scales")
+    dataset = _dispatch_by_ext(ifile, _read_h4_slab, _read_h5_slab, tuple(reversed(slices)),
+                               dataset_id=dataset_id, out=out, dtype=dtype, pooled=True, swmr_read=swmr)
+    if return_scales:
+        return dataset, *[scale[si].copy() for si, scale in zip(slices, scales) if scale is not None]
+    return dataset
 
-    write_hdf_data(ofile, data, *scales,
-                   dataset_id=PSI_DATA_ID["h5"], **meta_data.attr)
-    return ofile
 
-def instantiate_linear_interpolator(*args, **kwargs):
+def read_hdf_by_ivalue(ifile: PathLike, /,
+                      *xi: Union[float, Tuple[float, float], np.ndarray, None],
+                      dataset_id: Optional[str] = None,
+                      return_scales: bool = True,
+                      out: Union[np.ndarray, BufferPool, None] = None,
+                      dtype: Any = None,
+                      swmr: bool = False,
+                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
     r"""
-    Instantiate a linear interpolator using the provided data and scales.
+    Read data from an HDF4 (.hdf) or HDF5 (.h5) file by subindex value.
+
+    Unlike :func:`read_hdf_by_value` (which works in physical coordinate space),
+    this function accepts fractional *index* positions and returns the minimal
+    bracketing subset required for interpolation.
+
+    .. note::
+       For each dimension the minimum number of elements returned is 2.  For
+       example, passing 3 scalar floats for a 3D dataset yields a subset of
+       shape ``(2, 2, 2)`` with index arrays of length 2.
 
     Parameters
     ----------
-    *args : sequence[array_like]
-        The first argument is the data array.
-        Subsequent arguments are the scales (coordinate arrays) for each dimension.
-    **kwargs : dict
-        Additional keyword arguments to pass to
-        :class:`~scipy.interpolate.RegularGridInterpolator`.
+    ifile : PathLike
+        The path to the HDF file to read.
+    *xi : float | tuple[float, float] | np.ndarray | None
+        Fractional index values or ranges for each dimension of the
+        ``n``-dimensional dataset.  Pass ``None`` to select an entire dimension,
+        or an array to select the union of the brackets of several values (see
+        :func:`read_hdf_by_value`).  If no arguments are passed, the full
+        dataset is returned.
+    dataset_id : str | None, optional
+        The identifier of the dataset to read.  If ``None``, a default dataset
+        is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+        Default is ``None``.
+    return_scales : bool, optional
+        If ``True``, 0-based index arrays (generated with :func:`~numpy.arange`)
+        are returned for each dimension alongside the data.  These are always
+        index-space arrays regardless of whether the dataset has physical
+        coordinate scales.  Default is ``True``.
+    out : np.ndarray | BufferPool | None, optional
+        An array to read the data into, or a :class:`BufferPool` to acquire one
+        from, instead of allocating a new array.  The array must have the shape
+        of the selection; the values are cast to its dtype.  The filled array is
+        returned in place of a new one.  Default is ``None``.
+    dtype : DTypeLike | None, optional
+        The dtype to return the data in, converted as it is read – see
+        :func:`read_hdf_data`.  Default is ``None`` (the stored dtype).
+    swmr : bool, optional
+        If ``True``, read a file being written by an SWMR writer – see
+        :func:`read_hdf_data`.  Default is ``False``.
 
     Returns
     -------
-    out : RegularGridInterpolator
-        An instance of RegularGridInterpolator initialized
-        with the provided data and scales.
+    out : np.ndarray | tuple[np.ndarray, ...]
+        The selected data array.  If ``return_scales`` is ``True``, returns a
+        tuple ``(data, idx_0, idx_1, ...)`` with one index array per dimension.
 
     Raises
     ------
-    ImportError
-        If the ``scipy`` package is not available.
+    ValueError
+        If the file does not have a ``.hdf`` or ``.h5`` extension, or if *out*
+        does not have the shape (or the requested *dtype*) of the selection.
+
+    See Also
+    --------
+    read_hdf_by_index : Read HDF datasets by integer index.
+    read_hdf_by_value : Read HDF datasets by physical coordinate value.
+    read_hdf_data : Read entire HDF datasets.
+    sp_interpolate_slice_from_hdf : Interpolate slices using SciPy's
+        :class:`~scipy.interpolate.RegularGridInterpolator`.
+    np_interpolate_slice_from_hdf : Linear/bilinear/trilinear interpolation
+        using vectorized NumPy routines.
 
     Notes
     -----
-    This function transposes the data array and passes it along with the scales
-    to :class:`~scipy.interpolate.RegularGridInterpolator`.  Given a PSI-style
-    Fortran-ordered 3D dataset, the resulting interpolator can be queried using
-    :math:`(r, \theta, \phi)` coordinates.
+    This function delegates to :func:`_read_h5_by_ivalue` for HDF5 files and
+    :func:`_read_h4_by_ivalue` for HDF4 files based on the file extension.
+
+    For a given dimension with scale :math:`x_j`, the bracketing rule is:
+
+    - *single float* :math:`a` → returns
+      :math:`x_j[\lfloor a \rfloor], x_j[\lceil a \rceil]`.
+    - *(float, float)* :math:`(a_0, a_1)` → returns
+      :math:`x_j[\lfloor a_0 \rfloor], \ldots, x_j[\lceil a_1 \rceil]`.
+    - ``None`` → returns the entire scale :math:`x_j`.
+    - *array* → returns the sorted union of the brackets of every value.
 
     Examples
     --------
-    Import a 3D HDF5 cube.
-
     >>> from psi_data import fetch_mas_data
-    >>> from psi_io import read_hdf_by_value
-    >>> from numpy import pi
+    >>> from psi_io import read_hdf_by_ivalue
     >>> filepath = fetch_mas_data().cor_br
 
-    Read the dataset by value (at 15 R_sun in the radial dimension).
-
-    >>> data_and_scales = read_hdf_by_value(filepath, 15, None, None)
-    >>> interpolator = instantiate_linear_interpolator(*data_and_scales)
-
-    Interpolate at a specific position.
+    Extract a 2-element bracket around fractional radial index 2.7:
 
-    >>> interpolator((15, pi/2, pi))
-    array(-0.00117191)
+    >>> f, r_idx, t_idx, p_idx = read_hdf_by_ivalue(filepath, 2.7, None, None)
+    >>> r_idx.shape
+    (2,)
     """
-    _except_no_scipy()
-    return RegularGridInterpolator(
-        values=args[0].T,
-        points=args[1:],
-        **kwargs)
+    if not xi:
+        return read_hdf_data(ifile, dataset_id=dataset_id, return_scales=return_scales, out=out, dtype=dtype,
+                             swmr=swmr)
+    return _dispatch_by_ext(ifile, _read_h4_by_ivalue, _read_h5_by_ivalue,
+                            *xi, dataset_id=dataset_id, return_scales=return_scales, out=out, dtype=dtype,
+                            pooled=True, swmr_read=swmr)
 
 
-def sp_interpolate_slice_from_hdf(*xi, **kwargs):
+def write_hdf_data(ifile: PathLike, /,
+                   data: np.ndarray,
+                   *scales: Sequence[Union[np.ndarray, None]],
+                   dataset_id: Optional[str] = None,
+                   sync_dtype: bool = False,
+                   strict: bool = True,
+                   chunks: ChunkType = None,
+                   compression: Union[Literal['gzip', 'lzf'], int, None] = None,
+                   compression_opts: Optional[int] = None,
+                   shuffle: bool = False,
+                   fletcher32: bool = False,
+                   pyramid: int = 0,
+                   pyramid_mesh: Optional[MeshLike] = None,
+                   swmr: bool = False,
+                   **kwargs
+                   ) -> Path:
     r"""
-    Interpolate a slice from HDF data using SciPy's `RegularGridInterpolator`.
+    Write data to an HDF4 (.hdf) or HDF5 (.h5) file.
 
-    .. note::
-       Slicing routines result in a dimensional reduction. The dimensions
-       that are fixed (i.e. provided as float values in `*xi`) are removed
-       from the output slice, while the dimensions that are not fixed
-       (*i.e.* provided as None in `*xi`) are retained.
+    Following PSI conventions, the data array is assumed to be Fortran-ordered,
+    with the scales provided in the order corresponding to each dimension *e.g.* a
+    3D dataset with shape (Dp, Dt, Dr) has scales r, t, p corresponding to the
+    radial, theta, and phi dimensions respectively.
 
     Parameters
     ----------
-    *xi : sequence
-        Positional arguments passed-through to :func:`read_hdf_by_value`.
-    **kwargs : dict
-        Keyword arguments passed-through to :func:`read_hdf_by_value`.
-        **NOTE: Instantiating a linear interpolator requires the** ``return_scales``
-        **keyword argument to be set to True; this function overrides
-        any provided value for** ``return_scales`` **to ensure this behavior.**
+    ifile : PathLike
+        The path to the HDF file to write.
+    data : np.ndarray
+        The data array to write.
+    *scales : Sequence[np.ndarray | None]
+        The scales (coordinate arrays) for each dimension.
+    dataset_id : str | None, optional
+        The identifier of the dataset to write.  If ``None``, a default dataset
+        is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+        Default is ``None``.
+    sync_dtype : bool, optional
+        If ``True``, the scale dtypes are cast to match the data array dtype.
+        This mimics the behavior of PSI's legacy HDF writing routines and ensures
+        compatibility with Fortran tools that require uniform precision between
+        datasets and their scales.  Default is ``False``.
+    strict : bool, optional
+        If ``True``, raise an error if any dataset attribute cannot be written to
+        the target format.  If ``False``, a warning is printed and the attribute
+        is skipped.  Default is ``True``.
+    chunks : bool | 'auto' | tuple[int, ...] | None, optional
+        The chunk shape of the written dataset (HDF5 only).  ``'auto'`` selects a
+        shape suited to PSI's constant-:math:`r`, constant-:math:`\theta` and
+        constant-:math:`\phi` slicing (see Notes); ``True`` uses h5py's heuristic;
+        ``None`` writes a contiguous dataset unless a filter is requested, in which
+        case ``'auto'`` is used.  Default is ``None``.
+    compression : {'gzip', 'lzf'} | int | None, optional
+        The compression filter applied to the dataset.  An integer is
+        interpreted by h5py as a gzip level.  HDF4 files only support gzip
+        (deflate), and must then be written in one piece (see Notes).
+        Default is ``None``.
+    compression_opts : int | None, optional
+        Options for the compression filter, *e.g.* the gzip level (0–9).
+        Default is ``None``.
+    shuffle : bool, optional
+        If ``True``, apply the byte-shuffle filter before compression, which
+        usually improves the compression ratio of floating point data (HDF5 only).
+        Default is ``False``.
+    fletcher32 : bool, optional
+        If ``True``, store a Fletcher-32 checksum with every chunk (HDF5 only).
+        Default is ``False``.
+    pyramid : int, optional
+        The number of downsampled overview levels to store next to the dataset
+        (HDF5 only) – see :func:`build_hdf_pyramid`.  Default is ``0``.
+    pyramid_mesh : MeshLike | None, optional
+        The mesh stagger of the data, used to build the overview levels.  If
+        ``None``, the ``mesh`` attribute (if given in ``**kwargs``) is used,
+        otherwise every axis is taken to be on the main mesh.  Default is ``None``.
+    swmr : bool, optional
+        If ``True``, write the file in single-writer/multiple-reader mode (HDF5
+        only): the dataset is created first and its values written in SWMR mode,
+        so that readers opened with ``swmr=True`` (*e.g.* :func:`read_hdf_data`)
+        can open the file while it is being written.  Default is ``False``.
+    **kwargs
+        Key-value pairs of dataset attributes to attach to the dataset.
 
     Returns
     -------
-    data_slice : np.ndarray
-        The interpolated data slice with fixed dimensions removed.
-    scales : list[np.ndarray]
-        Coordinate scale arrays for the retained (non-fixed) dimensions.
+    out : Path
+        The path to the written HDF file.
+
+    Raises
+    ------
+    ValueError
+        If the file does not have a ``.hdf`` or ``.h5`` extension.
+    ValueError
+        If chunking, shuffle, fletcher32, non-gzip compression, pyramid or SWMR
+        options are requested for an HDF4 file.
+    KeyError
+        If, for HDF4 files, the data or scale dtype is not supported by
+        :py:mod:`pyhdf`.  See the dtype support table in the Notes section.
 
     Notes
     -----
-    This function reads data from an HDF file, builds a
-    :class:`~scipy.interpolate.RegularGridInterpolator`, and evaluates it at
-    the requested fixed coordinates to produce the slice.
+    This function delegates to :func:`_write_h5_data` for HDF5 files and
+    :func:`_write_h4_data` for HDF4 files based on the file extension.
+
+    PSI cubes are stored Fortran-ordered with :math:`r` as the fastest varying
+    axis, so a contiguous layout forces a constant-:math:`r` surface read to touch
+    every page of the file.  With ``chunks='auto'`` every axis is chunked to the
+    same fraction of its length (with chunks of roughly :data:`AUTO_CHUNK_NBYTES`),
+    so that a surface of constant :math:`r`, :math:`\theta` or :math:`\phi` reads
+    the same – small – fraction of the file.
+
+    HDF4 datasets are written without copy from C-contiguous arrays in native
+    byte order; other arrays are converted (and written) one hyperslab of at
+    most :data:`CONVERT_SLAB_NBYTES` at a time, unless the dataset is compressed.
+
+    If no scales are provided the dataset is written without coordinate variables.
+    The number of scales may be less than or equal to the number of dimensions;
+    pass ``None`` for dimensions that should not have an attached scale.
+
+    The table below summarizes dtype support across formats.  HDF4 support is
+    determined by the :data:`DTYPE_TO_SDC` mapping; HDF5 support is provided
+    by :mod:`h5py`.
+
+    .. list-table:: NumPy dtype support by format
+       :header-rows: 1
+       :widths: 20 20 20
+
+       * - dtype
+         - HDF4 (``.hdf``)
+         - HDF5 (``.h5``)
+       * - ``float16``
+         - No
+         - Yes
+       * - ``float32``
+         - Yes
+         - Yes
+       * - ``float64``
+         - Yes
+         - Yes
+       * - ``int8``
+         - Yes
+         - Yes
+       * - ``int16``
+         - Yes
+         - Yes
+       * - ``int32``
+         - Yes
+         - Yes
+       * - ``int64``
+         - No
+         - Yes
+       * - ``uint8``
+         - Yes
+         - Yes
+       * - ``uint16``
+         - Yes
+         - Yes
+       * - ``uint32``
+         - Yes
+         - Yes
+       * - ``uint64``
+         - No
+         - Yes
+       * - ``complex64``
+         - No
+         - Yes
+       * - ``complex128``
+         - No
+         - Yes
+       * - ``bool``
+         - Yes (stored as ``uint8``)
+         - Yes
+
+    See Also
+    --------
+    wrhdf_1d : Write 1D HDF files.
+    wrhdf_2d : Write 2D HDF files.
+    wrhdf_3d : Write 3D HDF files.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data, read_hdf_data
+    >>> r = np.linspace(1.0, 5.0, 10, dtype=np.float32)
+    >>> t = np.linspace(0.0, np.pi, 20, dtype=np.float32)
+    >>> p = np.linspace(0.0, 2*np.pi, 30, dtype=np.float32)
+    >>> f = np.ones((30, 20, 10), dtype=np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     _ = write_hdf_data(Path(d) / "out.h5", f, r, t, p)
+    ...     data, r2, t2, p2 = read_hdf_data(Path(d) / "out.h5")
+    ...     data.shape
+    (30, 20, 10)
+    """
+    return _dispatch_by_ext(ifile, _write_h4_data, _write_h5_data, data,
+                            *scales, dataset_id=dataset_id, sync_dtype=sync_dtype, strict=strict,
+                            chunks=chunks, compression=compression, compression_opts=compression_opts,
+                            shuffle=shuffle, fletcher32=fletcher32, pyramid=pyramid,
+                            pyramid_mesh=pyramid_mesh, swmr=swmr, **kwargs)
+
+
+def write_hdf_meta(ifile: PathLike, /,
+                   meta: Optional[Mapping[str, Mapping[str, Any]]] = None,
+                   **kwargs) -> Path:
+    """
+    Add or update attributes on an existing HDF4 (.hdf) or HDF5 (.h5) file.
+
+    Unlike :func:`write_hdf_data`, this function does **not** create or overwrite
+    any dataset — it only attaches attribute key-value pairs to the file root
+    (via ``**kwargs``) or to named datasets within the file (via ``meta``).
+
+    Parameters
+    ----------
+    ifile : PathLike
+        Path to an existing HDF file.  The file must already contain any
+        datasets referenced by *meta*.
+    meta : Mapping[str, Mapping[str, Any]] | None, optional
+        Per-dataset attributes.  Each key is a dataset name (e.g. ``'Data'``
+        for HDF5, ``'Data-Set-2'`` for HDF4); the corresponding value is a
+        mapping of attribute name → attribute value to attach to that dataset.
+        ``None`` (the default) applies no per-dataset attributes.
+    **kwargs
+        File-level (root) attributes.  For HDF5 files these are written to
+        the root group; for HDF4 files they are written as SD-level global
+        attributes.  They do **not** appear on any dataset and will not be
+        returned by :func:`read_hdf_meta`.
+
+    Returns
+    -------
+    out : Path
+        The path to the modified HDF file.
+
+    Raises
+    ------
+    ValueError
+        If the file does not have a ``.hdf`` or ``.h5`` extension.
+
+    Notes
+    -----
+    This function delegates to :func:`_write_h5_meta` for HDF5 files and
+    :func:`_write_h4_meta` for HDF4 files based on the file extension.
+
+    Per-dataset attributes written via *meta* are subsequently accessible
+    through the :attr:`~HdfDataMeta.attr` field of the :class:`HdfDataMeta`
+    named tuple returned by :func:`read_hdf_meta`.
+
+    See Also
+    --------
+    write_hdf_data : Write dataset data (and optionally attributes) to a new file.
+    read_hdf_meta  : Read dataset metadata and attributes from an HDF file.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data, write_hdf_meta, read_hdf_meta
+    >>> f = np.ones((30, 20, 10), dtype=np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     _ = write_hdf_data(Path(d) / "out.h5", f)
+    ...     _ = write_hdf_meta(Path(d) / "out.h5", meta={'Data': {'long_name': 'test field', 'units': 'G'}})
+    ...     meta = read_hdf_meta(Path(d) / "out.h5")
+    ...     meta[0].attr['long_name']
+    'test field'
+    """
+    return _dispatch_by_ext(ifile, _write_h4_meta, _write_h5_meta, meta, **kwargs)
+
+
+def convert(ifile: PathLike,
+            ofile: Optional[PathLike] = None,
+            strict: bool = True,
+            chunks: ChunkType = None,
+            compression: Union[Literal['gzip', 'lzf'], int, None] = None,
+            compression_opts: Optional[int] = None,
+            shuffle: bool = False,
+            fletcher32: bool = False,
+            slab_nbytes: int = CONVERT_SLAB_NBYTES) -> Path:
+    r"""
+    Convert an HDF file between HDF4 (.hdf) and HDF5 (.h5) formats.
+
+    All datasets and their attributes are preserved in the output file.
+    The output format is inferred from the input: `.hdf` → `.h5` and vice versa,
+    unless an explicit output path is provided.
+
+    Datasets are streamed into the (single, open) output file one hyperslab of
+    :math:`\phi` planes at a time, so peak memory is bounded by ``slab_nbytes``
+    rather than by the size of the largest dataset.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the source HDF file.
+    ofile : PathLike, optional
+        The path to the output HDF file.
+        If ``None``, the output file is written alongside the input file
+        with its extension swapped (*e.g.* ``foo.hdf`` → ``foo.h5``).
+    strict : bool, optional
+        If ``True``, raise an error if any dataset attribute cannot be written
+        to the output format.  If ``False``, a warning is printed and the
+        attribute is skipped.  Default is ``True``.
+    chunks, compression, compression_opts, shuffle, fletcher32
+        Storage options for the datasets of an HDF5 output file;
+        see :func:`write_hdf_data`.
+    slab_nbytes : int, optional
+        The approximate size (in bytes) of each hyperslab read from ``ifile``
+        and written to ``ofile``.  At least one :math:`\phi` plane is always
+        copied at a time.  Default is :data:`CONVERT_SLAB_NBYTES` (64 MiB).
+
+    Returns
+    -------
+    out : Path
+        The path to the written output file.
+
+    Raises
+    ------
+    ValueError
+        If the input file does not have a ``.hdf`` or ``.h5`` extension.
+    ValueError
+        If ``ifile`` and ``ofile`` refer to the same file.
+    ValueError
+        If ``compression`` is set for an HDF4 output file and a dataset is
+        larger than ``slab_nbytes`` (see Notes).
+    KeyError
+        If, for HDF4 output files, the data or an attribute value has a dtype
+        not supported by :py:mod:`pyhdf` and ``strict`` is ``True``.  See
+        :func:`write_hdf_data` for the full dtype support table.
+    TypeError
+        If, for HDF5 output files, a dataset attribute has a type that cannot be
+        stored as an HDF5 attribute and ``strict`` is ``True``.
+
+    See Also
+    --------
+    convert_psih4_to_psih5 : Specialized PSI-convention HDF4 → HDF5 converter.
+    write_hdf_data : Generic HDF data writing routine.
+    read_hdf_data : Generic HDF data reading routine.
+
+    Notes
+    -----
+    A compressed HDF4 dataset cannot be written by hyperslab, so when
+    ``compression`` is set for an HDF4 (``.hdf``) output file each dataset is
+    read and written in one piece.  Peak memory is then bounded by the size of
+    the largest dataset; to keep the ``slab_nbytes`` bound, such a conversion
+    raises a :exc:`ValueError` for any dataset larger than ``slab_nbytes``.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from pathlib import Path
+    >>> from psi_io import convert, read_hdf_meta
+    >>> from psi_data import fetch_mas_data
+    >>> h5_path = fetch_mas_data(hdf=5).cor_br
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     out = convert(h5_path, Path(d) / "br.hdf")
+    ...     meta = read_hdf_meta(out)
+    ...     meta[0].name
+    'Data'
+    """
+    ifile = Path(ifile)
+    if not ofile:
+        ofile = ifile.with_suffix(".hdf") if ifile.suffix == ".h5" else ifile.with_suffix(".h5")
+    else:
+        ofile = Path(ofile)
+    ofile.parent.mkdir(parents=True, exist_ok=True)
+
+    datasets = [(dataset.name, dataset.name) for dataset in read_hdf_meta(ifile)]
+    return _stream_convert(ifile, ofile, datasets, slab_nbytes=slab_nbytes, strict=strict,
+                           chunks=chunks, compression=compression,
+                           compression_opts=compression_opts, shuffle=shuffle,
+                           fletcher32=fletcher32)
+
+
+def convert_psih4_to_psih5(ifile: PathLike,
+                          ofile: Optional[PathLike] = None,
+                          chunks: ChunkType = None,
+                          compression: Union[Literal['gzip', 'lzf'], int, None] = None,
+                          compression_opts: Optional[int] = None,
+                          shuffle: bool = False,
+                          fletcher32: bool = False,
+                          slab_nbytes: int = CONVERT_SLAB_NBYTES) -> Path:
+    """
+    Convert a PSI-convention HDF4 file to an HDF5 file.
+
+    Unlike :func:`convert`, this function is specialized for PSI-style HDF4 files:
+    it reads the primary dataset (``'Data-Set-2'``) and writes it under the PSI HDF5
+    dataset name (``'Data'``), preserving the dataset's attributes and scales.
+    As with :func:`convert`, the data are streamed by hyperslab.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the source HDF4 (.hdf) file.
+    ofile : PathLike, optional
+        The path to the output HDF5 (.h5) file.
+        If ``None``, the output file is written alongside the input file with a
+        ``.h5`` extension (*e.g.* ``foo.hdf`` → ``foo.h5``).
+    chunks, compression, compression_opts, shuffle, fletcher32
+        Storage options for the output dataset; see :func:`write_hdf_data`.
+    slab_nbytes : int, optional
+        The approximate size (in bytes) of each copied hyperslab; see :func:`convert`.
+
+    Returns
+    -------
+    out : Path
+        The path to the written HDF5 file.
+
+    Raises
+    ------
+    ValueError
+        If ``ifile`` does not have a ``.hdf`` extension.
+    ValueError
+        If ``ofile`` does not have a ``.h5`` extension.
+    ImportError
+        If the :py:mod:`pyhdf` package is not available.
+
+    See Also
+    --------
+    convert : General-purpose HDF4 ↔ HDF5 converter.
+    write_hdf_data : Generic HDF data writing routine.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from pathlib import Path
+    >>> from psi_io import convert_psih4_to_psih5, read_hdf_meta
+    >>> from psi_data import fetch_mas_data
+    >>> hdf4_path = fetch_mas_data(hdf=4).cor_br
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     out = convert_psih4_to_psih5(hdf4_path, Path(d) / "br.h5")
+    ...     meta = read_hdf_meta(out)
+    ...     meta[0].name
+    'Data'
+    """
+    ifile = Path(ifile)
+    ofile = ifile.with_suffix(".h5") if not ofile else Path(ofile)
+    if ifile.suffix != ".hdf":
+        raise ValueError(f"Input file must have a .hdf extension; got {ifile.suffix}")
+    if ofile.suffix != ".h5":
+        raise ValueError(f"Output file must have a .h5 extension; got {ofile.suffix}")
+    ofile.parent.mkdir(parents=True, exist_ok=True)
+
+    return _stream_convert(ifile, ofile, [(PSI_DATA_ID["h4"], PSI_DATA_ID["h5"])],
+                           slab_nbytes=slab_nbytes, chunks=chunks, compression=compression,
+                           compression_opts=compression_opts, shuffle=shuffle,
+                           fletcher32=fletcher32)
+
+
+def iter_hdf_slabs(ifile: PathLike, /,
+                   dataset_id: Optional[str] = None,
+                   slab_nbytes: int = CONVERT_SLAB_NBYTES,
+                   ) -> Iterator[np.ndarray]:
+    """
+    Read a dataset one hyperslab (of whole planes of its slowest varying axis) at a time.
+
+    This is the streaming read used by :func:`convert`: at most about ``slab_nbytes``
+    of the dataset is held in memory at once, which allows datasets larger than
+    memory to be processed (*e.g.* checksummed) in a single pass.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF file to read.
+    dataset_id : str | None, optional
+        The identifier of the dataset to read.  If ``None``, a default dataset is
+        used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+    slab_nbytes : int, optional
+        The approximate size (in bytes) of each hyperslab.  At least one plane is
+        read at a time.  Default is :data:`CONVERT_SLAB_NBYTES`.
+
+    Yields
+    ------
+    slab : np.ndarray
+        Consecutive hyperslabs, in storage (*i.e.* reversed PSI) order, which
+        concatenated along the first axis form the whole dataset.
+
+    Raises
+    ------
+    ValueError
+        If the file does not have a `.hdf` or `.h5` extension.
+
+    Notes
+    -----
+    The file is held open (outside of the handle pool) until the iterator is
+    exhausted or closed.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data, iter_hdf_slabs
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     out = write_hdf_data(Path(d) / "out.h5", np.zeros((5, 2, 2)))
+    ...     [slab.shape for slab in iter_hdf_slabs(out, slab_nbytes=64)]
+    [(2, 2, 2), (2, 2, 2), (1, 2, 2)]
+    """
+    h4 = Path(ifile).suffix == '.hdf'
+    dataset_id = dataset_id or PSI_DATA_ID['h4' if h4 else 'h5']
+    meta = read_hdf_meta(ifile, dataset_id)[0]
+    with _dispatch_by_ext(ifile, _open_h4, _open_h5) as hdf:
+        dataset = hdf.select(dataset_id) if h4 else hdf[dataset_id]
+        for slab in _iter_slabs(tuple(meta.shape), np.dtype(meta.type).itemsize, slab_nbytes):
+            yield np.asarray(dataset[slab])
+
+
+def build_hdf_pyramid(ifile: PathLike, /,
+                      levels: int,
+                      dataset_id: Optional[str] = None,
+                      mesh: Optional[MeshLike] = None,
+                      chunks: ChunkType = None,
+                      compression: Union[Literal['gzip', 'lzf'], int, None] = None,
+                      compression_opts: Optional[int] = None,
+                      shuffle: bool = False,
+                      fletcher32: bool = False,
+                      ) -> Path:
+    r"""
+    Store downsampled overview levels next to a dataset in an existing HDF5 file.
+
+    Each level halves the resolution of the previous one along every axis, with
+    a block average that respects the mesh stagger of the data (see
+    :func:`~psi_io.mesh.coarsen_array`), so level :math:`k` of a 3D cube holds
+    roughly :math:`8^{-k}` of its values.  The levels are read back with the
+    ``level`` argument of :func:`read_hdf_data`, :func:`read_hdf_by_index` and
+    :meth:`PsiData.read <psi_io.mhd_io._HdfData.read>`.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF5 file; the levels are added in place.
+    levels : int
+        The number of overview levels to store.  Existing levels of the dataset
+        are replaced.
+    dataset_id : str | None, optional
+        The identifier of the dataset.  If ``None``, ``'Data'`` is used.
+        Default is ``None``.
+    mesh : MeshLike | None, optional
+        The mesh stagger of the data.  If ``None``, the dataset's ``mesh``
+        attribute is used if present, otherwise every axis is taken to be on the
+        main mesh.  Default is ``None``.
+    chunks, compression, compression_opts, shuffle, fletcher32
+        Storage options of the overview datasets – see :func:`write_hdf_data`.
+        A chunk shape larger than a level is clipped to it.
+
+    Returns
+    -------
+    out : Path
+        The path to the HDF5 file.
+
+    Raises
+    ------
+    ValueError
+        If the file does not have a ``.h5`` extension, or if *levels* is negative.
+
+    See Also
+    --------
+    read_hdf_levels : List the shapes of the stored levels.
+    write_hdf_data : Write a dataset together with its overview levels.
+
+    Notes
+    -----
+    Level :math:`k` of dataset ``<id>`` is stored as the dataset
+    ``pyramid/<id>/<k>/<id>`` (see :data:`PYRAMID_GROUP`), with its coordinate
+    scales in the same group.  The overview levels are ignored by
+    :func:`read_hdf_meta` and :func:`convert`.
+
+    The levels are computed from the full-resolution dataset, which is read
+    into memory once.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data, build_hdf_pyramid, read_hdf_levels
+    >>> f = np.ones((64, 32, 17), dtype=np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     path = write_hdf_data(Path(d) / "br.h5", f)
+    ...     _ = build_hdf_pyramid(path, 2, mesh=0b100)
+    ...     read_hdf_levels(path)
+    [(64, 32, 17), (33, 17, 10), (17, 9, 6)]
+    """
+    ifile = Path(ifile)
+    if ifile.suffix != ".h5":
+        raise ValueError("Pyramid levels are only supported for HDF5 (.h5) files")
+    if levels < 0:
+        raise ValueError(f"levels must be non-negative; got {levels}")
+    dataset_id = dataset_id or PSI_DATA_ID['h5']
+    _HANDLE_POOL.evict(ifile)
+    _META_CACHE.evict(ifile)
+    with h5.File(ifile, "r+") as h5file:
+        dataset, scales = _select_h5_dataset(h5file, dataset_id)
+        attrs = {k: v for k, v in dataset.attrs.items() if not k.startswith("DIMENSION")}
+        _write_h5_pyramid(h5file, dataset_id, dataset[...], scales, levels,
+                          mesh=attrs.get('mesh', 'main') if mesh is None else mesh,
+                          attrs=attrs, chunks=chunks, compression=compression,
+                          compression_opts=compression_opts, shuffle=shuffle, fletcher32=fletcher32)
+    return ifile
+
+
+def read_hdf_levels(ifile: PathLike, /,
+                    dataset_id: Optional[str] = None
+                    ) -> List[Tuple[int, ...]]:
+    """
+    Return the shapes of a dataset and of each of its stored overview levels.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF file.
+    dataset_id : str | None, optional
+        The identifier of the dataset.  If ``None``, a default dataset is used
+        (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).  Default is ``None``.
+
+    Returns
+    -------
+    out : list[tuple[int, ...]]
+        The shape of level ``k`` at index ``k``; level ``0`` is the dataset itself.
+        HDF4 files never store overview levels.
+
+    See Also
+    --------
+    build_hdf_pyramid : Store overview levels in an existing file.
+
+    Examples
+    --------
+    Choose the coarsest level with at least 64 points along every axis:
+
+    >>> from psi_io import read_hdf_levels, read_hdf_data
+    >>> shapes = read_hdf_levels("br002.h5")  # doctest: +SKIP
+    >>> level = max(k for k, shape in enumerate(shapes) if min(shape) >= 64)  # doctest: +SKIP
+    >>> f, r, t, p = read_hdf_data("br002.h5", level=level)  # doctest: +SKIP
+    """
+    shape = read_hdf_meta(ifile, dataset_id=dataset_id)[0].shape
+    if Path(ifile).suffix != ".h5":
+        return [shape]
+    dataset_id = dataset_id or PSI_DATA_ID['h5']
+    with _open_h5(ifile) as hdf:
+        shapes = [shape]
+        while (level_id := _pyramid_id(dataset_id, len(shapes))) in hdf:
+            shapes.append(hdf[level_id].shape)
+        return shapes
+
+
+def instantiate_linear_interpolator(*args,
+                                    engine: Optional[Literal['scipy', 'numpy']] = None,
+                                    **kwargs):
+    r"""
+    Instantiate a linear interpolator using the provided data and scales.
+
+    Parameters
+    ----------
+    *args : sequence[array_like]
+        The first argument is the data array.
+        Subsequent arguments are the scales (coordinate arrays) for each dimension.
+    engine : {'scipy', 'numpy'} | None, optional
+        The interpolation engine: ``'scipy'`` for
+        :class:`~scipy.interpolate.RegularGridInterpolator`, or ``'numpy'`` for a
+        pure-NumPy multilinear interpolator that preserves the floating-point dtype
+        of the data and evaluates the positions in chunks of :data:`INTERP_CHUNK_SIZE`.
+        If ``None`` (default), SciPy is used when it is installed, and NumPy otherwise.
+    **kwargs : dict
+        Additional keyword arguments to pass to the interpolator (*e.g.*
+        ``bounds_error`` or ``fill_value``; see
+        :class:`~scipy.interpolate.RegularGridInterpolator`).  The NumPy engine
+        only supports ``method='linear'``, and also accepts ``chunk_size``.
+
+    Returns
+    -------
+    out : RegularGridInterpolator | _NpGridInterpolator
+        An interpolator initialized with the provided data and scales.
+
+    Raises
+    ------
+    ImportError
+        If ``engine`` is ``'scipy'`` and the ``scipy`` package is not available.
+    ValueError
+        If ``engine`` is not one of :data:`INTERP_ENGINES`.
+
+    Notes
+    -----
+    This function transposes the data array and passes it along with the scales
+    to the interpolator.  Given a PSI-style Fortran-ordered 3D dataset, the
+    resulting interpolator can be queried using :math:`(r, \theta, \phi)` coordinates.
+
+    Examples
+    --------
+    Import a 3D HDF5 cube.
+
+    >>> from psi_data import fetch_mas_data
+    >>> from psi_io import read_hdf_by_value
+    >>> from numpy import pi
+    >>> filepath = fetch_mas_data().cor_br
+
+    Read the dataset by value (at 15 R_sun in the radial dimension).
+
+    >>> data_and_scales = read_hdf_by_value(filepath, 15, None, None)
+    >>> interpolator = instantiate_linear_interpolator(*data_and_scales)
+
+    Interpolate at a specific position.
+
+    >>> interpolator((15, pi/2, pi))
+    array(-0.00117191)
+
+    The NumPy engine does not require SciPy.
+
+    >>> interpolator = instantiate_linear_interpolator(*data_and_scales, engine='numpy')
+    >>> interpolator((15, pi/2, pi))
+    array(-0.00117191)
+    """
+    return _linear_interpolator(args[1:], args[0].T, engine=engine, **kwargs)
+
+
+def sp_interpolate_slice_from_hdf(*xi, **kwargs):
+    r"""
+    Interpolate a slice from HDF data using SciPy's `RegularGridInterpolator`.
+
+    .. note::
+       Slicing routines result in a dimensional reduction. The dimensions
+       that are fixed (i.e. provided as float values in `*xi`) are removed
+       from the output slice, while the dimensions that are not fixed
+       (*i.e.* provided as None in `*xi`) are retained.
+
+    Parameters
+    ----------
+    *xi : sequence
+        Positional arguments passed-through to :func:`read_hdf_by_value`.
+    **kwargs : dict
+        Keyword arguments passed-through to :func:`read_hdf_by_value`.
+        **NOTE: Instantiating a linear interpolator requires the** ``return_scales``
+        **keyword argument to be set to True; this function overrides
+        any provided value for** ``return_scales`` **to ensure this behavior.**
+
+    Returns
+    -------
+    data_slice : np.ndarray
+        The interpolated data slice with fixed dimensions removed.
+    scales : list[np.ndarray]
+        Coordinate scale arrays for the retained (non-fixed) dimensions.
+
+    Notes
+    -----
+    This function reads data from an HDF file, builds a
+    :class:`~scipy.interpolate.RegularGridInterpolator`, and evaluates it at
+    the requested fixed coordinates to produce the slice.
+
+    .. note::
+       The returned slice is Fortran-ordered, *e.g.* radial slices have shape
+       :math:`(n_\phi, n_\theta)`, and :math:`\phi` slices have shape
+       :math:`(n_r, n_\theta)`.
+
+    .. note::
+       :class:`~scipy.interpolate.RegularGridInterpolator` casts all input data
+       to ``float64`` internally.  PSI HDF datasets stored as ``float32`` will
+       therefore be upcast during interpolation.
+
+    Examples
+    --------
+    >>> from psi_data import fetch_mas_data
+    >>> from psi_io import sp_interpolate_slice_from_hdf
+    >>> from numpy import pi
+    >>> filepath = fetch_mas_data().cor_br
+
+    Fetch a 2D slice at r=15 from 3D map
+
+    >>> slice_, theta_scale, phi_scale = sp_interpolate_slice_from_hdf(filepath, 15, None, None)
+    >>> slice_.shape, theta_scale.shape, phi_scale.shape
+    ((299, 142), (142,), (299,))
+
+    Fetch a single point from 3D map
+
+    >>> point_value, *_ = sp_interpolate_slice_from_hdf(filepath, 1, pi/2, pi)
+    >>> point_value
+    np.float64(-0.20146621106799947)
+    """
+    filepath, *args = xi
+    kwargs.pop('return_scales', None)
+    result = read_hdf_by_value(filepath, *args, **kwargs)
+    interpolator = instantiate_linear_interpolator(*result)
+    grid = [yi[0] if yi[0] is not None else yi[1] for yi in zip(args, result[1:])]
+    slice_ = interpolator(tuple(np.meshgrid(*grid, indexing='ij')))
+    indices = [0 if yi is not None else slice(None, None) for yi in args]
+    return slice_[tuple(indices)].T, *[yi[1] for yi in zip(args, result[1:]) if yi[0] is None]
+
+
+def np_interpolate_slice_from_hdf(ifile: PathLike, /,
+                       *xi: Union[float, Sequence[float], np.ndarray, None],
+                       dataset_id: Optional[str] = None,
+                       by_index: bool = False,
+                       ):
+    """
+    Interpolate a slice from HDF data using linear interpolation.
+
+    .. note::
+       Slicing routines result in a dimensional reduction. The dimensions
+       that are fixed (i.e. provided as float values in `*xi`) are removed
+       from the output slice, while the dimensions that are not fixed
+       (*i.e.* provided as `None` in `*xi`) are retained.  Dimensions given an
+       array of values are retained, with one entry per value.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF file to read.
+    *xi : float | Sequence[float] | np.ndarray | None
+        The target value(s) for each dimension: ``None`` to retain the whole
+        dimension, a float to interpolate to (and remove) it, or a 1D sequence
+        of floats to interpolate to every value at once.
+    dataset_id : str | None, optional
+        The identifier of the dataset to read.  If ``None``, a default dataset
+        is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+        Default is ``None``.
+    by_index : bool, optional
+        If ``True``, use :func:`read_hdf_by_ivalue` to read data by fractional
+        index values.  If ``False``, use :func:`read_hdf_by_value` to read by
+        physical coordinate values.  Default is ``False``.
+
+    Returns
+    -------
+    data_slice : np.ndarray
+        The interpolated data slice with fixed dimensions removed.
+    scales : list[np.ndarray]
+        Coordinate scale arrays for the retained (non-fixed) dimensions; for
+        a dimension given several values, the values themselves.
+
+    Raises
+    ------
+    ValueError
+        If the number of dimensions to interpolate over is not supported.
+
+    Notes
+    -----
+    This function supports linear, bilinear, and trilinear interpolation
+    depending on the number of dimensions fixed in `xi`.
+
+    When any dimension is given several values, the union of their brackets is
+    read in one call (see :func:`read_hdf_by_value`), and the data is
+    interpolated to every value at once with
+    :func:`_np_multilinear_interpolation`, so that *e.g.* 50 radial shells cost
+    one file open and a handful of hyperslab reads.
+
+    Examples
+    --------
+    >>> from psi_data import fetch_mas_data
+    >>> from psi_io import np_interpolate_slice_from_hdf
+    >>> from numpy import pi
+    >>> filepath = fetch_mas_data().cor_br
+
+    Fetch a 2D slice at r=15 from 3D map
+
+    >>> slice_, theta_scale, phi_scale = np_interpolate_slice_from_hdf(filepath, 15, None, None)
+    >>> slice_.shape, theta_scale.shape, phi_scale.shape
+    ((299, 142), (142,), (299,))
+
+    Fetch a single point from 3D map
+
+    >>> point_value, *_ = np_interpolate_slice_from_hdf(filepath, 1, pi/2, pi)
+    >>> point_value
+    np.float32(-0.2014672)
+
+    Fetch 2D slices at three radii, stacked along the radial dimension
+
+    >>> shells, radii, theta_scale, phi_scale = np_interpolate_slice_from_hdf(filepath, [2, 5, 15], None, None)
+    >>> shells.shape, radii
+    ((299, 142, 3), array([ 2.,  5., 15.]))
+
+    """
+    reader = read_hdf_by_value if not by_index else read_hdf_by_ivalue
+    xi = [yi if yi is None or np.ndim(yi) == 0 else np.asarray(yi, dtype=float).ravel() for yi in xi]
+    data, *scales = reader(ifile, *xi, dataset_id=dataset_id, return_scales=True)
+    f_ = np.transpose(data)
+    if any(np.ndim(yi) for yi in xi if yi is not None):
+        return (_np_multilinear_interpolation(xi, scales, f_).T,
+                *[scale if yi is None else yi for yi, scale in zip(xi, scales) if yi is None or np.ndim(yi)])
+    slice_type = sum([yi is not None for yi in xi])
+    if slice_type == 1:
+        return _np_linear_interpolation(xi, scales, f_).T, *[yi[1] for yi in zip(xi, scales) if yi[0] is None]
+    elif slice_type == 2:
+        return _np_bilinear_interpolation(xi, scales, f_).T, *[yi[1] for yi in zip(xi, scales) if yi[0] is None]
+    elif slice_type == 3:
+        return _np_trilinear_interpolation(xi, scales, f_).T, *[yi[1] for yi in zip(xi, scales) if yi[0] is None]
+    else:
+        raise ValueError("Not a valid number of dimensions for supported linear interpolation methods")
+
+
+def interpolate_positions_from_hdf(ifile, *xi,
+                                   engine: Optional[Literal['scipy', 'numpy']] = None,
+                                   tile_shape: Optional[Union[int, Sequence[int]]] = None,
+                                   workers: Optional[int] = 1,
+                                   strategy: Literal['auto', 'window', 'tiles', 'points', 'full'] = 'auto',
+                                   **kwargs):
+    r"""
+    Interpolate at a list of scale positions using SciPy's
+    :class:`~scipy.interpolate.RegularGridInterpolator` (or its NumPy counterpart).
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF file to read.
+    *xi : sequence[np.ndarray]
+       Coordinate values for each dimension of the ``n``-dimensional dataset.
+       Each array must have the same length :math:`m`; the function assembles
+       them into an :math:`m \times n` column stack for interpolation.
+    engine : {'scipy', 'numpy'} | None, optional
+        The interpolation engine (see :func:`instantiate_linear_interpolator`).
+        If ``None`` (default), SciPy is used when it is installed, and NumPy otherwise.
+    tile_shape : int | Sequence[int] | None, optional
+        If given, partition the grid into tiles of this many cells along each
+        dimension (in PSI order), and read and interpolate only the tiles that hold
+        positions (see Notes); this implies ``strategy='tiles'``.  If ``None``
+        (default), tiles follow the chunks of the dataset.
+    workers : int | None, optional
+        The maximum number of tiles read and interpolated concurrently; ``None``
+        uses the thread pool's default.  Default is ``1`` (sequential).
+    strategy : {'auto', 'window', 'tiles', 'points', 'full'}, optional
+        How the data are read: the bounding box of the positions (``'window'``),
+        the tiles they occupy (``'tiles'``), the corners of their cells with a
+        single point selection (``'points'``, HDF5 only), or the whole dataset
+        (``'full'``).  With ``'auto'`` (default), the cheapest strategy for the
+        storage layout of the dataset is chosen (see :func:`plan_hdf_read`).
+    **kwargs
+        The read options ``dataset_id``, ``dtype``, ``swmr`` and ``level`` – see
+        :func:`read_hdf_by_index` – applied whatever the strategy.
+
+    Returns
+    -------
+    out : np.ndarray
+        The interpolated values at the provided positions.
+
+    Raises
+    ------
+    ValueError
+        If *tile_shape* does not hold positive integers, or if *strategy* is
+        unknown (or ``'points'`` for an HDF4 file).
+    TypeError
+        If *kwargs* holds any other keyword argument.
+
+    See Also
+    --------
+    InterpolationPlan : Interpolate the same positions from many files on the same grid.
+    plan_hdf_read : Explain the strategy chosen for a set of positions.
+
+    Notes
+    -----
+    This function reads data from an HDF file, creates a linear interpolator,
+    and interpolates at the provided scale values. For each dimension, the
+    minimum and maximum values from the provided arrays are used to read
+    the necessary subset of data from the HDF file *viz.* to avoid loading
+    the entire dataset into memory.
+
+    For scattered positions (*e.g.* field-line seeds, or several spacecraft) that
+    bounding box is often the whole dataset.  With *tile_shape*, the positions are
+    instead binned by the index-space tile of their grid cell, and every occupied
+    tile is read and interpolated on its own – concurrently, with *workers* – so
+    that the bytes read and the peak memory follow the distribution of the
+    positions rather than their extent.  The values are identical, since linear
+    interpolation only involves the corners of the cell of each position.  For
+    the same reason, a few positions far apart are best read as the
+    :math:`2^n` corners of their cells only, with a point selection.
+
+    Examples
+    --------
+    Import a 3D HDF5 cube.
+
+    >>> from psi_data import fetch_mas_data
+    >>> from psi_io import interpolate_positions_from_hdf
+    >>> import numpy as np
+    >>> filepath = fetch_mas_data().cor_br
+
+    Set up positions to interpolate.
+
+    >>> r_vals = np.array([15, 20, 25])
+    >>> theta_vals = np.array([np.pi/4, np.pi/2, 3*np.pi/4])
+    >>> phi_vals = np.array([0, np.pi, 2*np.pi])
+
+    Interpolate at the specified positions.
+
+    >>> interpolate_positions_from_hdf(filepath, r_vals, theta_vals, phi_vals)
+    array([-1.44383936e-03, -6.70081301e-04,  8.56632460e-05])
+
+    Interpolate without SciPy, in the precision of the dataset.
+
+    >>> interpolate_positions_from_hdf(filepath, r_vals, theta_vals, phi_vals, engine='numpy').shape
+    (3,)
+
+    Read only the :math:`32^3`-cell tiles around the positions.
+
+    >>> interpolate_positions_from_hdf(filepath, r_vals, theta_vals, phi_vals, tile_shape=32, workers=4)
+    array([-1.44383936e-03, -6.70081301e-04,  8.56632460e-05])
+
+    Read only the corners of the cells of the positions.
+
+    >>> interpolate_positions_from_hdf(filepath, r_vals, theta_vals, phi_vals, strategy='points')
+    array([-1.44383936e-03, -6.70081301e-04,  8.56632460e-05])
+    """
+    if strategy not in READ_STRATEGIES:
+        raise ValueError(f"strategy must be one of {list(READ_STRATEGIES)}; got {strategy!r}")
+    if strategy == 'points' and Path(ifile).suffix != '.h5':
+        raise ValueError("Point selections require an HDF5 (.h5) file")
+    unknown = set(kwargs) - {'dataset_id', 'dtype', 'swmr', 'level'}
+    if unknown:
+        raise TypeError(f"interpolate_positions_from_hdf() got an unexpected keyword argument {min(unknown)!r}")
+    dataset_id = _level_dataset_id(ifile, kwargs.pop('dataset_id', None), kwargs.pop('level', 0))
+    kwargs['dataset_id'] = dataset_id
+    swmr = kwargs.get('swmr', False)
+    positions = np.stack([np.ravel(i) for i in np.broadcast_arrays(*xi)], axis=-1)
+    if strategy == 'auto':
+        strategy = 'tiles' if tile_shape is not None else \
+            _plan_positions(_cached_layout(ifile, dataset_id, swmr=swmr), _cached_scales(ifile, dataset_id, swmr),
+                            positions, points=Path(ifile).suffix == '.h5').strategy
+    if strategy in ('tiles', 'points'):
+        scales = _cached_scales(ifile, dataset_id, swmr)
+        if strategy == 'points':
+            def interpolate(ifile, dataset_id=None):
+                with _open_h5(ifile) as hdf:
+                    data = hdf[dataset_id or PSI_DATA_ID['h5']]
+                    return _interpolate_by_points(positions, scales,
+                                                  lambda coords: _h5_read_points(data, coords, kwargs.get('dtype')),
+                                                  data.shape, engine=engine)
+            out = _dispatch_by_ext(ifile, None, interpolate, dataset_id=dataset_id, swmr_read=swmr, pooled=True)
+        else:
+            if tile_shape is None:
+                tile_shape = _default_tile_shape(_cached_layout(ifile, dataset_id, swmr=swmr))
+            read = lambda window: read_hdf_by_index(ifile, *window, return_scales=False, **kwargs)
+            out = _interpolate_by_tile(positions, scales, read, tile_shape, engine=engine, workers=workers,
+                                       lock=_H4_LOCK if Path(ifile).suffix == '.hdf' else None,
+                                       bounds_error=False)
+        return out.reshape(np.broadcast_shapes(*(np.shape(i) for i in xi)))
+    xi_ = [None if strategy == 'full' else (np.nanmin(i), np.nanmax(i)) for i in xi]
+    f, *scales = read_hdf_by_value(ifile, *xi_, **kwargs)
+    interpolator = instantiate_linear_interpolator(f, *scales, engine=engine, bounds_error=False)
+    return interpolator(np.stack(xi, axis=len(xi[0].shape)))
+
+
+class InterpolationPlan:
+    r"""
+    A linear interpolation of fixed positions on a fixed grid, precomputed for reuse.
+
+    Building the plan locates the positions in the grid – *i.e.* the bracket search
+    and weight computation of :func:`interpolate_positions_from_hdf` – once, and
+    records the smallest index window of the dataset that they require.  Applying
+    the plan to any file (or array) on the same grid then costs one windowed read
+    and one gather-multiply-add per cell corner.
+
+    Parameters
+    ----------
+    scales : Sequence[np.ndarray]
+        The strictly ascending coordinate scales of the grid, in PSI (*e.g.*
+        :math:`(r, \theta, \phi)`) order.
+    *xi : np.ndarray
+        Coordinate values for each dimension of the grid.  The arrays must share
+        the same shape, which is the shape of the interpolated values.
+    bounds_error : bool, optional
+        If ``True`` (default), raise a :exc:`ValueError` if a position is outside
+        the grid.
+    fill_value : float | None, optional
+        The value returned at positions outside the grid when ``bounds_error`` is
+        ``False``.  If ``None``, the values are extrapolated.  Default is ``nan``.
+
+    Raises
+    ------
+    ValueError
+        If the number of coordinate arrays does not match the number of scales,
+        or if a position is outside the grid and ``bounds_error`` is ``True``.
+
+    See Also
+    --------
+    interpolate_positions_from_hdf : Interpolate positions from a single file.
+
+    Notes
+    -----
+    The plan stores, for every position, the flat index of its cell in the window
+    and the :math:`2^n` corner weights (in ``float64``, *i.e.* about 72 bytes per
+    position in 3D); since the window is read contiguously, the corners of a cell
+    are at fixed offsets from its first corner.  The weights are cast once to the
+    floating-point dtype of the data they are applied to, which is preserved.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data, InterpolationPlan
+    >>> r, t, p = np.linspace(1, 2, 5), np.linspace(0, np.pi, 4), np.linspace(0, 2*np.pi, 3)
+    >>> plan = InterpolationPlan((r, t, p), np.array([1.1, 1.9]), np.array([0.5, 0.5]), np.array([1.0, 2.0]))
+    >>> plan.window
+    ((0, 5), (0, 2), (0, 2))
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     for i in range(3):
+    ...         _ = write_hdf_data(Path(d) / f"br00{i}.h5", np.full((3, 4, 5), i, dtype=float), r, t, p)
+    ...     [plan(Path(d) / f"br00{i}.h5") for i in range(3)]
+    [array([0., 0.]), array([1., 1.]), array([2., 2.])]
+    """
+
+    __slots__ = ('_grid', '_window', '_shape', '_index', '_offsets', '_weights', '_outside',
+                 '_fill_value', '_cast')
+
+    def __init__(self,
+                 scales: Sequence[np.ndarray],
+                 *xi: np.ndarray,
+                 bounds_error: bool = True,
+                 fill_value: Optional[float] = np.nan):
+        grid = tuple(np.asarray(scale, dtype=np.float64) for scale in scales)
+        if len(xi) != len(grid):
+            raise ValueError(f"Expected {len(grid)} coordinate arrays (one per scale); got {len(xi)}")
+        xi = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in xi))
+        self._grid = grid
+        self._shape = xi[0].shape
+        cells, factors, outside = _grid_cells(grid, np.stack([x.ravel() for x in xi], axis=-1),
+                                              np.dtype(np.float64), bounds_error)
+
+        window, index, offsets, stride = [], 0, np.zeros(1, dtype=np.intp), 1
+        for (lower, upper), scale in zip(cells, grid):
+            start = int(lower.min()) if lower.size else 0
+            stop = int(upper.max()) + 1 if upper.size else scale.size
+            window.append((start, stop))
+            index = index + (lower - start)*stride
+            offsets = np.concatenate([offsets, offsets + (stride if scale.size > 1 else 0)])
+            stride *= stop - start
+        self._window = tuple(window)
+        self._index = np.asarray(index, dtype=np.intp)
+        self._offsets = offsets
+
+        # Corner k has the bit (k >> axis) & 1 along each axis, as enumerated by the offsets.
+        self._weights = np.ones((len(offsets), self._index.size), dtype=np.float64)
+        for k, weight in enumerate(self._weights):
+            for axis, (lower, upper) in enumerate(factors):
+                weight *= upper if (k >> axis) & 1 else lower
+        self._outside = np.flatnonzero(outside) if fill_value is not None else np.empty(0, dtype=np.intp)
+        self._fill_value = fill_value
+        self._cast = {np.dtype(np.float64): self._weights}
+
+    @classmethod
+    def from_hdf(cls,
+                 ifile: PathLike,
+                 *xi: np.ndarray,
+                 dataset_id: Optional[str] = None,
+                 **kwargs) -> 'InterpolationPlan':
+        """
+        Build a plan on the grid of an HDF dataset.
+
+        Parameters
+        ----------
+        ifile : PathLike
+            The path to the HDF file whose scales define the grid.
+        *xi : np.ndarray
+            Coordinate values for each dimension (see :class:`InterpolationPlan`).
+        dataset_id : str | None, optional
+            The identifier of the dataset.  If ``None``, a default dataset is used
+            (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+        **kwargs
+            Keyword arguments forwarded to :class:`InterpolationPlan`.
+
+        Returns
+        -------
+        out : InterpolationPlan
+            The plan.
+
+        Raises
+        ------
+        ValueError
+            If a dimension of the dataset has no scale.
+
+        Examples
+        --------
+        >>> from psi_data import fetch_mas_data
+        >>> from psi_io import InterpolationPlan
+        >>> import numpy as np
+        >>> plan = InterpolationPlan.from_hdf(fetch_mas_data().cor_br, np.array([15, 20]),
+        ...                                   np.array([np.pi/4, np.pi/2]), np.array([0, np.pi]))
+        """
+        scales = _cached_scales(ifile, dataset_id)
+        if any(scale is None for scale in scales):
+            raise ValueError(f"Every dimension of the dataset in {ifile} must have a scale")
+        return cls(scales, *xi, **kwargs)
+
+    @property
+    def grid(self) -> Tuple[np.ndarray, ...]:
+        """The scales of the grid, in PSI order."""
+        return self._grid
+
+    @property
+    def window(self) -> Tuple[Tuple[int, int], ...]:
+        """The ``(start, stop)`` index range read along each dimension, in PSI order."""
+        return self._window
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """The shape of the interpolated values."""
+        return self._shape
+
+    def matches(self, *scales: np.ndarray) -> bool:
+        """Return whether the grid of the plan is the grid of *scales* (in PSI order)."""
+        return len(scales) == len(self._grid) and all(
+            np.shape(scale) == grid.shape and np.array_equal(scale, grid)
+            for scale, grid in zip(scales, self._grid))
+
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        """
+        Interpolate an array on the grid of the plan.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            The values, in storage (*i.e.* reversed PSI) order: either the whole
+            dataset or the window of the plan (see :attr:`window`).
+
+        Returns
+        -------
+        out : np.ndarray
+            The interpolated values, of shape :attr:`shape`, in the dtype of *data*
+            (or ``float64`` for non-floating-point data).
+
+        Raises
+        ------
+        ValueError
+            If *data* has neither the shape of the grid nor that of the window.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from psi_io import InterpolationPlan
+        >>> x, y = np.array([0.0, 1.0, 3.0]), np.array([0.0, 2.0])
+        >>> plan = InterpolationPlan((x, y), np.array([0.5, 2.0]), np.array([1.0, 1.0]))
+        >>> plan.apply(np.add.outer(y, x).astype(np.float32))
+        array([1.5, 3. ], dtype=float32)
+        """
+        data = np.asarray(data)
+        window_shape = tuple(stop - start for start, stop in reversed(self._window))
+        if data.shape == tuple(scale.size for scale in reversed(self._grid)) and data.shape != window_shape:
+            data = data[tuple(slice(start, stop) for start, stop in reversed(self._window))]
+        elif data.shape != window_shape:
+            raise ValueError(f"Expected data of shape {window_shape} (the window of the plan) "
+                             f"or of the shape of the grid; got {data.shape}")
+        dtype = data.dtype if np.issubdtype(data.dtype, np.inexact) else np.dtype(np.float64)
+        weights = self._cast.get(dtype)
+        if weights is None:
+            weights = self._cast[dtype] = self._weights.astype(dtype)
+
+        values = np.ravel(data).astype(dtype, copy=False)
+        out = np.zeros(self._index.size, dtype=dtype)
+        corner = np.empty(self._index.size, dtype=dtype)
+        for offset, weight in zip(self._offsets, weights):
+            np.take(values[offset:], self._index, out=corner)
+            corner *= weight
+            out += corner
+        if self._outside.size:
+            out[self._outside] = self._fill_value
+        return out.reshape(self._shape)
+
+    def __call__(self,
+                 ifile: PathLike,
+                 dataset_id: Optional[str] = None,
+                 validate: bool = True,
+                 **kwargs) -> np.ndarray:
+        """
+        Interpolate the dataset of a file on the grid of the plan.
+
+        Parameters
+        ----------
+        ifile : PathLike
+            The path to the HDF file to read.
+        dataset_id : str | None, optional
+            The identifier of the dataset to read.  If ``None``, a default dataset
+            is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+        validate : bool, optional
+            If ``True`` (default), check that the scales of the dataset (read through
+            the metadata cache, see :func:`configure_meta_cache`) are the grid of the plan.
+        **kwargs
+            Keyword arguments forwarded to :func:`read_hdf_by_index` (*e.g.* ``dtype``
+            or ``out``, a buffer of the shape of the window).
+
+        Returns
+        -------
+        out : np.ndarray
+            The interpolated values (see :meth:`apply`).
+
+        Raises
+        ------
+        ValueError
+            If *validate* is ``True`` and the grid of the dataset differs from the
+            grid of the plan.
+        """
+        if validate and not self.matches(*_cached_scales(ifile, dataset_id)):
+            raise ValueError(f"The grid of the dataset in {ifile} differs from the grid of the plan")
+        data = read_hdf_by_index(ifile, *self._window, dataset_id=dataset_id, return_scales=False, **kwargs)
+        return self.apply(data)
+
+    def __len__(self) -> int:
+        return self._index.size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(shape={self._shape}, window={self._window})"
+
+
+class RegridPlan:
+    r"""
+    A separable linear resampling of a rectilinear grid onto another, precomputed for reuse.
+
+    Along each resampled dimension, the plan stores the 1D interpolation matrix
+    from the source to the target scale – a sparse matrix with at most two
+    non-zeros per row, held as the lower index and weight of every row.  Applying
+    the plan interpolates one axis at a time, so that no coordinate mesh is
+    materialized, and the same plan serves every quantity on the same grid.
+
+    Parameters
+    ----------
+    scales : Sequence[np.ndarray]
+        The strictly ascending coordinate scales of the source grid, in PSI
+        (*e.g.* :math:`(r, \theta, \phi)`) order.
+    *xi : np.ndarray | None
+        The target scale of each dimension, or ``None`` to keep a dimension as is.
+    bounds_error : bool, optional
+        If ``True`` (default), raise a :exc:`ValueError` if a target value is outside
+        the source grid.
+    fill_value : float | None, optional
+        The value returned outside the source grid when ``bounds_error`` is ``False``.
+        If ``None``, the values are extrapolated.  Default is ``nan``.
+
+    Raises
+    ------
+    ValueError
+        If the number of target scales does not match the number of scales, or if a
+        target value is outside the grid and ``bounds_error`` is ``True``.
+
+    See Also
+    --------
+    regrid_hdf_data : Resample the dataset of a file onto a new grid.
+    InterpolationPlan : Interpolate scattered positions.
+
+    Notes
+    -----
+    When applied to a file, the plan streams the dataset in hyperslabs along its
+    slowest varying (*e.g.* :math:`\phi`) axis, each of at most ``slab_nbytes`` bytes,
+    restricted to the index window required by the other dimensions; only the
+    output array is held in memory – or none, if the output is an :class:`~numpy.memmap`
+    or an :class:`h5py.Dataset`.  Ascending target scales keep the slabs compact.
+
+    The resampling is computed in the floating-point dtype of the data, which is
+    preserved (non-floating-point data are resampled in ``float64``).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io import RegridPlan
+    >>> r, t = np.array([1.0, 2.0, 4.0]), np.array([0.0, 1.0])
+    >>> plan = RegridPlan((r, t), np.array([1.5, 3.0]), None)
+    >>> plan.shape
+    (2, 2)
+    >>> plan.apply(np.array([[1.0, 2.0, 4.0], [2.0, 4.0, 8.0]], dtype=np.float32))
+    array([[1.5, 3. ],
+           [3. , 6. ]], dtype=float32)
+    """
+
+    __slots__ = ('_grid', '_scales', '_axes')
+
+    def __init__(self,
+                 scales: Sequence[np.ndarray],
+                 *xi: Optional[np.ndarray],
+                 bounds_error: bool = True,
+                 fill_value: Optional[float] = np.nan):
+        grid = tuple(np.asarray(scale, dtype=np.float64) for scale in scales)
+        if len(xi) != len(grid):
+            raise ValueError(f"Expected {len(grid)} target scales (one per scale); got {len(xi)}")
+        self._grid = grid
+        self._scales, self._axes = [], []
+        for axis, (scale, target) in enumerate(zip(grid, xi)):
+            if target is None:
+                self._scales.append(scale)
+                self._axes.append(None)
+                continue
+            target = np.atleast_1d(np.asarray(target, dtype=np.float64))
+            try:
+                (cells,), (factors,), outside = _grid_cells((scale,), target[:, None], np.dtype(np.float64),
+                                                            bounds_error)
+            except ValueError:
+                raise ValueError(f"One of the target values is out of bounds in dimension {axis}") from None
+            outside = np.flatnonzero(outside) if fill_value is not None else np.empty(0, dtype=np.intp)
+            self._scales.append(target)
+            self._axes.append((*cells, factors[1], outside, fill_value))
+        self._scales = tuple(self._scales)
+
+    @classmethod
+    def from_hdf(cls,
+                 ifile: PathLike,
+                 *xi: Optional[np.ndarray],
+                 dataset_id: Optional[str] = None,
+                 **kwargs) -> 'RegridPlan':
+        """
+        Build a plan from the grid of an HDF dataset.
+
+        Parameters
+        ----------
+        ifile : PathLike
+            The path to the HDF file whose scales define the source grid.
+        *xi : np.ndarray | None
+            The target scale of each dimension (see :class:`RegridPlan`).
+        dataset_id : str | None, optional
+            The identifier of the dataset.  If ``None``, a default dataset is used
+            (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+        **kwargs
+            Keyword arguments forwarded to :class:`RegridPlan`.
+
+        Returns
+        -------
+        out : RegridPlan
+            The plan.
+
+        Raises
+        ------
+        ValueError
+            If a dimension of the dataset has no scale.
+
+        Examples
+        --------
+        >>> from psi_data import fetch_mas_data
+        >>> from psi_io import RegridPlan
+        >>> import numpy as np
+        >>> plan = RegridPlan.from_hdf(fetch_mas_data().cor_br, np.geomspace(1, 30, 100), None, None)
+        """
+        scales = _cached_scales(ifile, dataset_id)
+        if any(scale is None for scale in scales):
+            raise ValueError(f"Every dimension of the dataset in {ifile} must have a scale")
+        return cls(scales, *xi, **kwargs)
+
+    @property
+    def grid(self) -> Tuple[np.ndarray, ...]:
+        """The scales of the source grid, in PSI order."""
+        return self._grid
+
+    @property
+    def scales(self) -> Tuple[np.ndarray, ...]:
+        """The scales of the target grid, in PSI order."""
+        return self._scales
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """The shape of the resampled data, in storage (*i.e.* reversed PSI) order."""
+        return tuple(scale.size for scale in reversed(self._scales))
+
+    @property
+    def window(self) -> Tuple[Tuple[int, int], ...]:
+        """The ``(start, stop)`` index range of the source grid required along each dimension, in PSI order."""
+        return tuple(self._window(axis, slice(None)) for axis in range(len(self._grid)))
+
+    def matches(self, *scales: np.ndarray) -> bool:
+        """Return whether the source grid of the plan is the grid of *scales* (in PSI order)."""
+        return len(scales) == len(self._grid) and all(
+            np.shape(scale) == grid.shape and np.array_equal(scale, grid)
+            for scale, grid in zip(scales, self._grid))
+
+    def apply(self, data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Resample an array on the source grid of the plan.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            The values, in storage (*i.e.* reversed PSI) order: either on the whole
+            source grid or on the window of the plan (see :attr:`window`).
+        out : np.ndarray | None, optional
+            An array of shape :attr:`shape` to write the result into.  Default is ``None``.
+
+        Returns
+        -------
+        out : np.ndarray
+            The resampled values, of shape :attr:`shape`.
+
+        Raises
+        ------
+        ValueError
+            If *data* has neither the shape of the grid nor that of the window,
+            or *out* does not have the shape :attr:`shape`.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from psi_io import RegridPlan
+        >>> plan = RegridPlan((np.array([0.0, 1.0, 3.0]),), np.array([0.5, 2.0]))
+        >>> plan.apply(np.array([0.0, 2.0, 6.0]))
+        array([1., 4.])
+        """
+        data = np.asarray(data)
+        window = self.window
+        window_shape = tuple(stop - start for start, stop in reversed(window))
+        if data.shape == tuple(scale.size for scale in reversed(self._grid)) and data.shape != window_shape:
+            data = data[tuple(slice(start, stop) for start, stop in reversed(window))]
+        elif data.shape != window_shape:
+            raise ValueError(f"Expected data of shape {window_shape} (the window of the plan) "
+                             f"or of the shape of the grid; got {data.shape}")
+        result = self._resample(data, window, (slice(None),)*len(self._grid))
+        if out is None:
+            return result
+        _resolve_out(out, self.shape, result.dtype)[...] = result
+        return out
+
+    def __call__(self,
+                 ifile: PathLike,
+                 dataset_id: Optional[str] = None,
+                 out: Optional[Any] = None,
+                 dtype: Any = None,
+                 slab_nbytes: int = CONVERT_SLAB_NBYTES,
+                 validate: bool = True) -> Any:
+        """
+        Resample the dataset of a file, streaming it by hyperslab.
+
+        Parameters
+        ----------
+        ifile : PathLike
+            The path to the HDF file to read.
+        dataset_id : str | None, optional
+            The identifier of the dataset to read.  If ``None``, a default dataset
+            is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+        out : np.ndarray | h5py.Dataset | None, optional
+            An array-like of shape :attr:`shape` – *e.g.* an :class:`~numpy.memmap`
+            or an :class:`h5py.Dataset` – to write the result into, slab by slab.
+            Default is ``None`` (a new array).
+        dtype : DTypeLike | None, optional
+            The floating-point dtype to read and resample the data in.  Default is
+            ``None`` (the stored dtype).
+        slab_nbytes : int, optional
+            The largest size (in bytes) of the hyperslab read at a time.  Default
+            is :data:`CONVERT_SLAB_NBYTES`.
+        validate : bool, optional
+            If ``True`` (default), check that the scales of the dataset (read through
+            the metadata cache) are the source grid of the plan.
+
+        Returns
+        -------
+        out : np.ndarray | h5py.Dataset
+            The resampled data (*out*, if given).
+
+        Raises
+        ------
+        ValueError
+            If *validate* is ``True`` and the grid of the dataset differs from the
+            grid of the plan, or if *out* does not have the shape :attr:`shape`.
+        """
+        if validate and not self.matches(*_cached_scales(ifile, dataset_id)):
+            raise ValueError(f"The grid of the dataset in {ifile} differs from the grid of the plan")
+        return self._stream(lambda window: read_hdf_by_index(ifile, *window, dataset_id=dataset_id,
+                                                              return_scales=False, dtype=dtype),
+                            out, slab_nbytes)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({tuple(scale.size for scale in self._grid)} -> {self.shape[::-1]})"
+
+    def _window(self, axis: int, rows: slice) -> Tuple[int, int]:
+        """Return the ``(start, stop)`` source index range required by the target *rows* along *axis*."""
+        if self._axes[axis] is None:
+            return rows.indices(self._grid[axis].size)[:2]
+        lower, upper = self._axes[axis][0][rows], self._axes[axis][1][rows]
+        if not lower.size:
+            return 0, 0
+        return int(lower.min()), int(upper.max()) + 1
+
+    def _resample(self, data: np.ndarray, window: Sequence[Tuple[int, int]], rows: Sequence[slice]) -> np.ndarray:
+        """Resample the *window* of the source *data* onto the target *rows* (slices, in PSI order)."""
+        dtype = data.dtype if np.issubdtype(data.dtype, np.inexact) else np.dtype(np.float64)
+        data = data.astype(dtype, copy=False)
+        # The window of a kept axis is its rows; the shrinking axes are resampled first,
+        # to keep the intermediate arrays small.
+        resampled = [axis for axis in range(data.ndim) if self._axes[axis] is not None]
+        sizes = [len(range(*row.indices(scale.size))) for row, scale in zip(rows, self._scales)]
+        for axis in sorted(resampled, key=lambda a: sizes[a]/max(1, window[a][1] - window[a][0])):
+            ax = data.ndim - 1 - axis
+            lower, upper, t, outside, fill_value = self._axes[axis]
+            shape = [-1 if a == ax else 1 for a in range(data.ndim)]
+            t = t[rows[axis]].astype(dtype).reshape(shape)
+            low = np.take(data, lower[rows[axis]] - window[axis][0], axis=ax)
+            high = np.take(data, upper[rows[axis]] - window[axis][0], axis=ax)
+            low *= 1 - t
+            high *= t
+            low += high
+            data = low
+            if outside.size:
+                first, stop = rows[axis].indices(self._scales[axis].size)[:2]
+                inside = outside[(outside >= first) & (outside < stop)] - first
+                data[(slice(None),)*ax + (inside,)] = fill_value
+        return data
+
+    def _stream(self, read: Callable, out: Optional[Any], slab_nbytes: int) -> Any:
+        """Resample by slabs of the slowest varying (last PSI) axis, reading each source window with *read*.
+
+        The output array is allocated, if *out* is ``None``, in the dtype of the first resampled slab.
+        """
+        if out is not None and tuple(out.shape) != self.shape:
+            raise ValueError(f"out has shape {tuple(out.shape)}, but the resampled data has shape {self.shape}")
+        last = len(self._grid) - 1
+        window = list(self.window)
+        plane_size = math.prod(stop - start for start, stop in window[:last])
+        rows, nrows, itemsize = 0, self._scales[last].size, 8
+        while rows < nrows:
+            stop = rows + 1
+            while stop < nrows:
+                start, end = self._window(last, slice(rows, stop + 1))
+                if (end - start)*plane_size*itemsize > slab_nbytes:
+                    break
+                stop += 1
+            window[last] = self._window(last, slice(rows, stop))
+            slab = self._resample(read(tuple(window)), window, (slice(None),)*last + (slice(rows, stop),))
+            if out is None:
+                out = np.empty(self.shape, slab.dtype)
+            out[rows:stop] = slab
+            rows, itemsize = stop, slab.itemsize
+        return out
+
+
+def regrid_hdf_data(ifile: PathLike, /,
+                    *xi: Optional[np.ndarray],
+                    dataset_id: Optional[str] = None,
+                    return_scales: bool = True,
+                    out: Optional[Any] = None,
+                    dtype: Any = None,
+                    slab_nbytes: int = CONVERT_SLAB_NBYTES,
+                    bounds_error: bool = True,
+                    fill_value: Optional[float] = np.nan,
+                    ) -> Union[np.ndarray, Tuple[np.ndarray, ...]]:
+    r"""
+    Resample an HDF dataset onto a new rectilinear grid by separable linear interpolation.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF file to read.
+    *xi : np.ndarray | None
+        The target scale of each dimension, in PSI (*e.g.* :math:`(r, \theta, \phi)`)
+        order, or ``None`` to keep a dimension as is.
+    dataset_id : str | None, optional
+        The identifier of the dataset to read.  If ``None``, a default dataset
+        is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+    return_scales : bool, optional
+        If ``True`` (default), also return the scales of the new grid.
+    out : np.ndarray | h5py.Dataset | None, optional
+        An array-like of the shape of the resampled data – *e.g.* an
+        :class:`~numpy.memmap` or an :class:`h5py.Dataset` – to write the result
+        into, slab by slab.  Default is ``None`` (a new array).
+    dtype : DTypeLike | None, optional
+        The floating-point dtype to read and resample the data in.  Default is
+        ``None`` (the stored dtype).
+    slab_nbytes : int, optional
+        The largest size (in bytes) of the hyperslab read at a time.  Default
+        is :data:`CONVERT_SLAB_NBYTES`.
+    bounds_error : bool, optional
+        If ``True`` (default), raise a :exc:`ValueError` if a target value is outside
+        the grid of the dataset.
+    fill_value : float | None, optional
+        The value returned outside the grid when ``bounds_error`` is ``False``.
+        If ``None``, the values are extrapolated.  Default is ``nan``.
+
+    Returns
+    -------
+    out : np.ndarray | tuple[np.ndarray, ...]
+        The resampled data, in storage (*i.e.* reversed PSI) order.  If ``return_scales``
+        is ``True``, returns a tuple ``(data, scale_0, scale_1, ...)`` with the scales
+        of the new grid.
+
+    Raises
+    ------
+    ValueError
+        If the number of target scales does not match the dimensionality of the
+        dataset, if a dimension of the dataset has no scale, or if a target value
+        is outside the grid and ``bounds_error`` is ``True``.
+
+    See Also
+    --------
+    RegridPlan : Precompute the resampling, to apply it to many files on the same grid.
+    interpolate_positions_from_hdf : Interpolate scattered positions.
+
+    Notes
+    -----
+    This function builds a :class:`RegridPlan` and applies it to the file: the
+    dataset is interpolated one axis at a time with sparse 1D interpolation
+    matrices, rather than at every point of a coordinate mesh, and it is streamed
+    in hyperslabs of its slowest varying (*e.g.* :math:`\phi`) axis.  To resample
+    many quantities onto the same grid, build the plan once.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data, regrid_hdf_data
+    >>> r, t, p = np.linspace(1, 2, 5), np.linspace(0, np.pi, 4), np.linspace(0, 2*np.pi, 3)
+    >>> f = np.broadcast_to(r, (3, 4, 5)).astype(np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     filepath = write_hdf_data(Path(d) / "br001.h5", f, r, t, p)
+    ...     data, r2, t2, p2 = regrid_hdf_data(filepath, np.linspace(1, 2, 11), None, np.linspace(0, np.pi, 7))
+    >>> data.shape, data.dtype
+    ((7, 4, 11), dtype('float32'))
+    >>> np.allclose(data[0, 0], r2)
+    True
+    """
+    plan = RegridPlan.from_hdf(ifile, *xi, dataset_id=dataset_id,
+                               bounds_error=bounds_error, fill_value=fill_value)
+    data = plan(ifile, dataset_id=dataset_id, out=out, dtype=dtype, slab_nbytes=slab_nbytes, validate=False)
+    return (data, *plan.scales) if return_scales else data
+
+
+class ReadPlan(namedtuple('ReadPlan', ['strategy', 'nbytes', 'nchunks', 'nrequests', 'cost', 'alternatives'])):
+    """
+    The read strategy chosen by the read planner, with its estimated I/O.
+
+    Returned by :func:`plan_hdf_read`.  The planner estimates, for every strategy
+    able to serve a request, the bytes read from the file, the chunks touched and
+    the read requests issued, and picks the strategy of lowest cost – the bytes read
+    plus :data:`READ_REQUEST_NBYTES` per request (and :data:`READ_POINT_NBYTES` per
+    element of a point selection).
+
+    Parameters
+    ----------
+    strategy : str
+        The chosen strategy:
+
+        - ``'hyperslab'`` – read the selection as it is;
+        - ``'union'`` – read hyperslabs covering the requested indices (see
+          :func:`read_hdf_by_value`);
+        - ``'window'`` – read the bounding box of the request at once;
+        - ``'tiles'`` – read the tiles of the grid holding positions;
+        - ``'points'`` – read the corners of the cells of the positions with a
+          single HDF5 point selection;
+        - ``'full'`` – read the whole dataset;
+        - ``'cache'`` – the data are already in memory.
+    nbytes : int
+        The number of bytes read from the file by the strategy (whole chunks, for
+        chunked or compressed datasets).
+    nchunks : int
+        The number of chunks touched (``0`` for contiguous datasets).
+    nrequests : int
+        The number of separate reads – contiguous runs, or chunks – issued.
+    cost : int
+        The estimated cost, in equivalent bytes.
+    alternatives : dict[str, tuple]
+        The ``(nbytes, nchunks, nrequests, cost)`` of every strategy considered,
+        including the chosen one.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data, plan_hdf_read
+    >>> r, t, p = np.linspace(1, 2, 100), np.linspace(0, np.pi, 60), np.linspace(0, 2*np.pi, 80)
+    >>> f = np.zeros((80, 60, 100), dtype=np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     filepath = write_hdf_data(Path(d) / "br001.h5", f, r, t, p)
+    ...     plan = plan_hdf_read(filepath, (None, None, 2), 30, None)
+    >>> plan.strategy
+    'window'
+    >>> print(plan.explain())  # doctest: +NORMALIZE_WHITESPACE
+    strategy         bytes   chunks   requests          cost
+      hyperslab      16000        0       4000      65552000
+    * window         31680        0         80       1342400
+    """
+
+    __slots__ = ()
+
+    def explain(self) -> str:
+        """
+        Return a table of the estimated I/O of every strategy considered, the chosen one marked by ``*``.
+
+        Returns
+        -------
+        out : str
+            One line per strategy, with the bytes read, the chunks touched, the
+            read requests issued and the overall cost.
+        """
+        lines = [f"{'strategy':<12}{'bytes':>10}{'chunks':>9}{'requests':>11}{'cost':>14}"]
+        for name, (nbytes, nchunks, nrequests, cost) in self.alternatives.items():
+            marker = '*' if name == self.strategy else ' '
+            lines.append(f"{marker} {name:<10}{nbytes:>10}{nchunks:>9}{nrequests:>11}{cost:>14}")
+        return '\n'.join(lines)
+
+
+def plan_hdf_read(ifile: PathLike, /,
+                  *xi,
+                  method: Literal['index', 'value', 'ivalue', 'positions'] = 'index',
+                  dataset_id: Optional[str] = None,
+                  tile_shape: Optional[Union[int, Sequence[int]]] = None) -> ReadPlan:
+    r"""
+    Plan the read of a request from an HDF dataset, from the storage layout of the dataset.
+
+    The same planner is used by the readers themselves: strided or multi-value
+    selections of :func:`read_hdf_by_index`, :func:`read_hdf_by_value` and
+    :func:`read_hdf_by_ivalue` are read either as they are or through their
+    bounding box, and :func:`interpolate_positions_from_hdf` (with
+    ``strategy='auto'``) reads what this function plans for *positions*.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF file.
+    *xi : Any
+        The request, as passed to the reader of *method* – index or value selections
+        for each dimension, or the coordinate arrays of the positions – in PSI order.
+    method : {'index', 'value', 'ivalue', 'positions'}, optional
+        The reader to plan for: :func:`read_hdf_by_index` (default),
+        :func:`read_hdf_by_value`, :func:`read_hdf_by_ivalue` or
+        :func:`interpolate_positions_from_hdf`.
+    dataset_id : str | None, optional
+        The identifier of the dataset.  If ``None``, a default dataset is used
+        (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+    tile_shape : int | Sequence[int] | None, optional
+        The tile shape (in cells, in PSI order) of the ``'tiles'`` strategy of
+        *positions*.  If ``None`` (default), the chunk shape of the dataset, or
+        :data:`INTERP_TILE_SIZE` cells for unchunked datasets.
+
+    Returns
+    -------
+    out : ReadPlan
+        The chosen strategy; :meth:`ReadPlan.explain` lists the estimated I/O of
+        every strategy considered.
+
+    Raises
+    ------
+    ValueError
+        If *method* is unknown, or if the number of selections does not match the
+        dimensionality of the dataset.
+
+    Notes
+    -----
+    The storage layout – chunk shape and filters – is read once per file and
+    cached alongside its scales (see :func:`configure_meta_cache`).  Point
+    selections are only considered for HDF5 files.  The planner estimates costs;
+    it does not account for the HDF5 chunk cache or the operating system's page
+    cache, which make repeated reads of the same chunks cheaper.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data, plan_hdf_read
+    >>> r, t, p = np.linspace(1, 2, 100), np.linspace(0, np.pi, 60), np.linspace(0, 2*np.pi, 80)
+    >>> f = np.zeros((80, 60, 100), dtype=np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     filepath = write_hdf_data(Path(d) / "br001.h5", f, r, t, p, chunks=(8, 20, 25))
+    ...     plan_hdf_read(filepath, [1.05, 1.95], [0.1, 3.0], [0.2, 6.0], method='positions').strategy
+    'points'
+    """
+    layout = _cached_layout(ifile, dataset_id)
+    ndim = len(layout.shape)
+    if len(xi) != ndim:
+        raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
+    if method == 'positions':
+        scales = _cached_scales(ifile, dataset_id)
+        positions = np.stack([np.ravel(i) for i in np.broadcast_arrays(*xi)], axis=-1)
+        return _plan_positions(layout, scales, positions, tile_shape, points=Path(ifile).suffix == '.h5')
+    if method == 'index':
+        slices = [_parse_index_inputs(value) for value in xi]
+    elif method in ('value', 'ivalue'):
+        scales = _cached_scales(ifile, dataset_id)
+        slices = []
+        for scale, size, value in zip(scales, reversed(layout.shape), xi):
+            if method == 'ivalue':
+                slices.append(_parse_ivalue_selection(size, value))
+            elif scale is not None:
+                slices.append(_parse_value_selection(scale, value))
+            elif value is None:
+                slices.append(slice(None))
+            else:
+                raise ValueError("Cannot slice by value on dimension without scales")
+    else:
+        raise ValueError(f"method must be one of ['index', 'value', 'ivalue', 'positions']; got {method!r}")
+    return _plan_selection(layout, tuple(reversed(slices)))
+
+
+class PointQuery:
+    r"""
+    Low-latency linear interpolation of an HDF dataset at one position at a time.
+
+    The query keeps the dataset open and its scales in memory, and locates a
+    position with a lookup table per axis – uniform bins over the scale, mapping
+    to the first cell of each bin – so that the bracket search takes a few
+    Python operations rather than a binary search.  The :math:`2^n` corners of
+    the cell are then read with a single HDF5 point selection (or, for HDF4, a
+    single :math:`2^n` hyperslab) into preallocated buffers.
+
+    Parameters
+    ----------
+    source : PathLike | h5py.Dataset | pyhdf.SD.SDS | np.ndarray
+        The path to an HDF file – opened here and closed by :meth:`close` – or an
+        open dataset, *e.g.* the :attr:`~psi_io.mhd_io._HdfData.dataset` of a
+        reader, which is left open.  An in-memory array is read by indexing.
+    *scales : np.ndarray
+        The scales of the dataset, in PSI (*e.g.* :math:`(r, \theta, \phi)`)
+        order.  Required with an open dataset; read from the file otherwise.
+    dataset_id : str | None, optional
+        The identifier of the dataset to open (with a path).  If ``None``, a
+        default dataset is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+    bounds_error : bool, optional
+        If ``True`` (default), raise a :exc:`ValueError` for positions outside the grid.
+    fill_value : float | None, optional
+        The value returned outside the grid when ``bounds_error`` is ``False``.
+        If ``None``, the values are extrapolated.  Default is ``nan``.
+    order : {'F', 'C'}, optional
+        The storage order of the dataset: ``'F'`` (default, PSI convention) if
+        its axes are stored in reversed PSI order, ``'C'`` otherwise.
+
+    Raises
+    ------
+    ValueError
+        If the number of scales does not match the dimensionality of the
+        dataset, if a dimension has no scale, or if scales are given with a path.
+
+    See Also
+    --------
+    interpolate_positions_from_hdf : Interpolate many positions at once.
+    InterpolationPlan : Interpolate the same positions from many files.
+
+    Notes
+    -----
+    A query holds preallocated buffers and is serialized by an internal lock
+    (by the process-wide :py:mod:`pyhdf` lock, for HDF4), so a query may be shared
+    between threads; for concurrent queries, create one query per thread.  The
+    values are interpolated in ``float64``, and returned in code units.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data, PointQuery
+    >>> r, t, p = np.linspace(1, 2, 5), np.linspace(0, np.pi, 4), np.linspace(0, 2*np.pi, 3)
+    >>> f = np.add.outer(np.add.outer(p, t), r).astype(np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     filepath = write_hdf_data(Path(d) / "br001.h5", f, r, t, p)
+    ...     with PointQuery(filepath) as query:
+    ...         value = query(1.6, np.pi/2, 1.0)
+    >>> round(value, 6) == round(1.6 + np.pi/2 + 1.0, 6)
+    True
+    """
+
+    __slots__ = ('_handle', '_dataset', '_lock', '_ndim', '_axes', '_bounds_error', '_fill_value',
+                 '_reverse', '_h5', '_coords', '_offsets', '_base', '_fspace', '_mspace', '_values', '_corners')
+
+    def __init__(self,
+                 source: Union[PathLike, Any], /,
+                 *scales: np.ndarray,
+                 dataset_id: Optional[str] = None,
+                 bounds_error: bool = True,
+                 fill_value: Optional[float] = np.nan,
+                 order: Literal['F', 'C'] = 'F'):
+        self._handle = None
+        if isinstance(source, (str, Path)):
+            if scales:
+                raise ValueError("The scales are read from the file; they cannot be given with a path")
+            ipath = Path(source)
+            scales = _cached_scales(ipath, dataset_id)
+            self._handle = _open_handle(ipath)
+        try:
+            if self._handle is not None:
+                source = self._handle[dataset_id or PSI_DATA_ID['h5']] if ipath.suffix == '.h5' \
+                    else self._handle.select(dataset_id or PSI_DATA_ID['h4'])
+            self._bind(source, scales, bounds_error, fill_value, order)
+        except Exception:
+            handle, self._handle = self._handle, None
+            if handle is not None:
+                _close_handle(handle)
+            raise
+
+    def _bind(self,
+              source: Any,
+              scales: Sequence[Optional[np.ndarray]],
+              bounds_error: bool,
+              fill_value: Optional[float],
+              order: Literal['F', 'C']) -> None:
+        """Validate the scales of the open *source* and build the lookup tables and buffers of the query."""
+        self._dataset = source
+        self._h5 = isinstance(source, h5.Dataset)
+        shape = _storage_layout(source).shape
+        if len(scales) != len(shape):
+            raise ValueError(f"Expected {len(shape)} scales; got {len(scales)}")
+        if any(scale is None for scale in scales):
+            raise ValueError("Every dimension of the dataset must have a scale")
+        reverse = str(order).upper() == 'F'
+        self._ndim = ndim = len(scales)
+        self._lock = threading.Lock() if isinstance(source, (h5.Dataset, np.ndarray)) else _H4_LOCK
+        self._bounds_error = bounds_error
+        self._fill_value = fill_value
+
+        axes = []
+        for scale, size in zip(scales, reversed(shape) if reverse else shape):
+            scale = np.asarray(scale, dtype=np.float64)
+            if scale.size != size:
+                raise ValueError(f"A scale has {scale.size} values, but its dimension has {size}")
+            if scale.size == 1:
+                axes.append((scale.tolist(), None, 0.0, 0.0))
+                continue
+            nbins = POINT_LOOKUP_BINS*(scale.size - 1)
+            width = (scale[-1] - scale[0])/nbins
+            table = np.clip(np.searchsorted(scale, scale[0] + width*np.arange(nbins), side='right') - 1,
+                            0, scale.size - 2)
+            axes.append((scale.tolist(), table.tolist(), float(scale[0]), 1/width))
+        self._axes = tuple(axes)
+
+        bits = [[(k >> axis) & 1 if len(axes[axis][0]) > 1 else 0 for axis in range(ndim)]
+                for k in range(1 << ndim)]
+        storage = (lambda index: index[::-1]) if reverse else (lambda index: index)
+        self._corners = [tuple(storage(b)) for b in bits]
+        self._offsets = np.array(self._corners, dtype=np.uint64)
+        self._base = np.empty(ndim, dtype=np.uint64)
+        self._coords = np.empty_like(self._offsets)
+        self._values = np.empty(1 << ndim, dtype=np.float64)
+        self._reverse = reverse
+        if self._h5:
+            self._fspace = source.id.get_space()
+            self._mspace = h5.h5s.create_simple((1 << ndim,))
+
+    def __call__(self, *xi: float) -> float:
+        """
+        Interpolate the dataset at one position.
+
+        Parameters
+        ----------
+        *xi : float
+            The coordinates of the position, in PSI order.
+
+        Returns
+        -------
+        out : float
+            The interpolated value (``fill_value`` outside the grid, and ``nan``
+            if a coordinate is ``nan``).
+
+        Raises
+        ------
+        ValueError
+            If the number of coordinates does not match the dimensionality of the
+            dataset, if the query is closed, or if the position is outside the grid
+            and ``bounds_error`` is ``True``.
+        """
+        if len(xi) != self._ndim:
+            raise ValueError(f"Expected {self._ndim} coordinates; got {len(xi)}")
+        if self._dataset is None:
+            raise ValueError("The query is closed")
+        cells, factors = [], []
+        for x, (scale, table, start, inverse) in zip(xi, self._axes):
+            x = float(x)
+            if table is None:
+                if x != scale[0]:
+                    if x != x:
+                        return math.nan
+                    if self._bounds_error or self._fill_value is not None:
+                        return self._outside(xi)
+                cells.append(0)
+                factors.append(0.0)
+                continue
+            if not scale[0] <= x <= scale[-1]:
+                if x != x:
+                    return math.nan
+                if self._bounds_error or self._fill_value is not None:
+                    return self._outside(xi)
+                i = 0 if x < scale[0] else len(scale) - 2
+            else:
+                i = table[min(int((x - start)*inverse), len(table) - 1)]
+                while scale[i + 1] < x:
+                    i += 1
+            cells.append(i)
+            factors.append((x - scale[i])/(scale[i + 1] - scale[i]))
+
+        with self._lock:
+            values = self._read(cells[::-1] if self._reverse else cells)
+        for t in factors:
+            values = [a + t*(b - a) for a, b in zip(values[0::2], values[1::2])]
+        return values[0]
+
+    def _read(self, base: Sequence[int]) -> List[float]:
+        """Read the corners of the cell whose lower corner is *base* (in storage order), in the order of :attr:`_corners`.
+
+        HDF5 datasets are read with a point selection, HDF4 SDS and arrays as the
+        :math:`2^n` block of the cell.
+        """
+        if self._h5:
+            self._base[:] = base
+            np.add(self._offsets, self._base, out=self._coords)
+            self._fspace.select_elements(self._coords)
+            self._dataset.id.read(self._mspace, self._fspace, self._values)
+            return self._values.tolist()
+        block = self._dataset[tuple(slice(i, i + 2) for i in base)]
+        return [float(block[corner]) for corner in self._corners]
+
+    def _outside(self, xi: Sequence[float]) -> float:
+        """Handle a position outside the grid: raise, or return ``fill_value``."""
+        if self._bounds_error:
+            raise ValueError(f"The position {tuple(float(x) for x in xi)} is outside the grid")
+        return self._fill_value
+
+    @property
+    def ndim(self) -> int:
+        """The number of dimensions of the dataset."""
+        return self._ndim
+
+    @property
+    def closed(self) -> bool:
+        """Whether :meth:`close` has been called."""
+        return self._dataset is None
+
+    def close(self) -> None:
+        """Release the dataset, closing the file if it was opened by the query.  Idempotent."""
+        handle, self._handle, self._dataset = self._handle, None, None
+        if handle is not None:
+            with self._lock:
+                _close_handle(handle)
+
+    def __enter__(self) -> 'PointQuery':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        kind = 'HDF5' if self._h5 else 'array' if isinstance(self._dataset, np.ndarray) else 'HDF4'
+        state = 'closed' if self.closed else f"{kind}, ndim={self._ndim}"
+        return f"{self.__class__.__name__}({state})"
+
+
+def read_hdf_series(ifiles: Union[PathLike, Sequence[PathLike]], /,
+                    *xi: Union[int, float, Tuple[Union[int, float, None], Union[int, float, None]], None],
+                    method: Literal['interp', 'value', 'ivalue', 'index'] = 'interp',
+                    dataset_id: Optional[str] = None,
+                    workers: Optional[int] = None,
+                    executor: Literal['thread', 'process'] = 'thread',
+                    ) -> Tuple[np.ndarray, ...]:
+    r"""
+    Read the same slice from every file of a sequence, concurrently.
+
+    Each file is read with the routine selected by ``method`` and the results are
+    stacked into one preallocated array whose leading axis enumerates the files.
+    The files must share a common grid: the scales are returned once.
+
+    Parameters
+    ----------
+    ifiles : PathLike | Sequence[PathLike]
+        The files to read: a sequence of paths (read in the given order), or a
+        glob pattern (*e.g.* ``'run/br*.h5'``) whose matches are read in sorted order.
+    *xi : int | float | tuple | None
+        The slice specification, passed to the reader of every file.
+    method : {'interp', 'value', 'ivalue', 'index'}, optional
+        The reader applied to each file:
+
+        - ``'interp'`` – :func:`np_interpolate_slice_from_hdf`, *i.e.* fixed dimensions are
+          interpolated and removed (a point, a radial profile, a surface, ...);
+        - ``'value'`` – :func:`read_hdf_by_value`;
+        - ``'ivalue'`` – :func:`read_hdf_by_ivalue`;
+        - ``'index'`` – :func:`read_hdf_by_index`.
+
+        Default is ``'interp'``.
+    dataset_id : str | None, optional
+        The identifier of the dataset to read.  If ``None``, a default dataset
+        is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
+    workers : int | None, optional
+        The maximum number of concurrent reads.  If ``None``, the executor's default
+        is used; ``1`` reads the files sequentially.
+    executor : {'thread', 'process'}, optional
+        The kind of pool used for the reads.  Default is ``'thread'``.
+
+    Returns
+    -------
+    data : np.ndarray
+        The stacked slices, of shape ``(n_files, *slice_shape)``.
+    *scales : np.ndarray
+        The scales of the slice (for ``'interp'``, those of the retained dimensions).
+
+    Raises
+    ------
+    ValueError
+        If no files are selected, if ``method`` or ``executor`` are invalid, or if the
+        files do not share the same grid.
+
+    See Also
+    --------
+    np_interpolate_slice_from_hdf : Interpolate a slice from a single file.
+    read_hdf_by_value : Read a subset of a single file by value.
+
+    Notes
+    -----
+    The first file is read eagerly to size the output array; the remainder are
+    submitted to the pool and written into the output as they complete.
+
+    h5py serializes calls into the HDF5 library, so a thread pool mainly overlaps
+    file-system latency and the NumPy interpolation; for expensive reads (*e.g.*
+    of compressed datasets) a ``'process'`` pool scales better.  Since :py:mod:`pyhdf`
+    is not thread-safe, reads of HDF4 files are serialized within each process.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io import write_hdf_data, read_hdf_series
+    >>> r, t, p = np.linspace(1, 2, 5), np.linspace(0, np.pi, 4), np.linspace(0, 2*np.pi, 3)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     for i in range(4):
+    ...         _ = write_hdf_data(Path(d) / f"br00{i}.h5", np.full((3, 4, 5), i, dtype=float), r, t, p)
+    ...     f, tt, pp = read_hdf_series(f"{d}/br*.h5", 1.5, None, None)
+    ...     f.shape, f[:, 0, 0]
+    ((4, 3, 4), array([0., 1., 2., 3.]))
+    """
+    if method not in _SERIES_READERS:
+        raise ValueError(f"method must be one of {list(_SERIES_READERS)}; got {method!r}")
+    if executor not in ('thread', 'process'):
+        raise ValueError(f"executor must be 'thread' or 'process'; got {executor!r}")
+    if isinstance(ifiles, (str, Path)):
+        ifiles = sorted(glob.glob(str(ifiles), recursive=True)) if glob.has_magic(str(ifiles)) else [ifiles]
+    ifiles = [Path(ifile) for ifile in ifiles]
+    if not ifiles:
+        raise ValueError("No files selected")
+
+    first, *scales = _read_series_member(method, ifiles[0], xi, dataset_id)
+    out = np.empty((len(ifiles), *np.shape(first)), dtype=np.result_type(first))
+    out[0] = first
+
+    def store(i, result):
+        data, *member_scales = result
+        if (np.shape(data) != out.shape[1:] or len(member_scales) != len(scales)
+                or not all(np.array_equal(a, b) for a, b in zip(member_scales, scales))):
+            raise ValueError(f"{ifiles[i]} does not share the grid of {ifiles[0]}")
+        out[i] = data
+
+    if workers == 1 or len(ifiles) < 3:
+        for i, ifile in enumerate(ifiles[1:], 1):
+            store(i, _read_series_member(method, ifile, xi, dataset_id))
+    else:
+        pool = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+        with pool(max_workers=workers) as ex:
+            futures = {ex.submit(_read_series_member, method, ifile, xi, dataset_id): i
+                       for i, ifile in enumerate(ifiles[1:], 1)}
+            for future in as_completed(futures):
+                store(futures[future], future.result())
+    return out, *scales
+
+
+def read_hdf_sequences(ifile: PathLike, /,
+                       dataset_id: Optional[str] = None,
+                       swmr: bool = False,
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the sequence numbers and times of the entries of a sequence file.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the sequence file (see :class:`HdfSequenceWriter`).
+    dataset_id : str | None, optional
+        The identifier of the dataset.  If ``None``, ``'Data'`` is used.
+        Default is ``None``.
+    swmr : bool, optional
+        If ``True``, read a file being written by an SWMR writer – see
+        :func:`read_hdf_data`.  Default is ``False``.
+
+    Returns
+    -------
+    sequences : np.ndarray
+        The (increasing) sequence number of each entry.
+    times : np.ndarray
+        The simulation time of each entry.
+
+    Raises
+    ------
+    ValueError
+        If the file does not have a ``.h5`` extension, or if the dataset is
+        not a sequence dataset.
+
+    See Also
+    --------
+    HdfSequenceWriter : Append sequences to a sequence file.
+
+    Examples
+    --------
+    Read the entry of sequence 1002 from a sequence file:
+
+    >>> import numpy as np
+    >>> from psi_io import read_hdf_sequences, read_hdf_by_index
+    >>> sequences, times = read_hdf_sequences("br.h5")  # doctest: +SKIP
+    >>> k = int(np.searchsorted(sequences, 1002))  # doctest: +SKIP
+    >>> f, r, t, p, _ = read_hdf_by_index("br.h5", None, None, None, k)  # doctest: +SKIP
+    """
+    if Path(ifile).suffix != ".h5":
+        raise ValueError("Sequence files are only supported for HDF5 (.h5) files")
+    return _dispatch_by_ext(ifile, None, _read_h5_sequences, dataset_id=dataset_id, swmr_read=swmr)
+
+
+def find_hdf_files(source: Union[PathLike, str], /,
+                   pattern: str = "**/*.h5",
+                   ) -> Tuple[Path, List[Path]]:
+    """
+    Select the files of a directory tree, or the matches of a glob pattern.
+
+    Parameters
+    ----------
+    source : PathLike | str
+        A directory, searched with ``pattern``, or a glob pattern (*e.g.*
+        ``'run/**/br*.hdf'``) whose matches are selected.
+    pattern : str, optional
+        The (recursive) glob pattern applied when ``source`` is a directory.
+        Default is ``'**/*.h5'``.
+
+    Returns
+    -------
+    root : Path
+        The directory relative to which the files were selected: ``source``
+        itself, or the part of the glob pattern preceding its first wildcard.
+    files : list[Path]
+        The selected files, in sorted order.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from pathlib import Path
+    >>> from psi_io import find_hdf_files
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     (Path(d) / "br001.hdf").touch()
+    ...     root, files = find_hdf_files(Path(d) / "*.hdf")
+    ...     root == Path(d), [f.name for f in files]
+    (True, ['br001.hdf'])
+    """
+    if Path(source).is_dir():
+        root = Path(source)
+        return root, sorted(p for p in root.glob(pattern) if p.is_file())
+    parts = Path(source).parts
+    nprefix = next((i for i, part in enumerate(parts) if glob.has_magic(part)), len(parts) - 1)
+    root = Path(*parts[:nprefix]) if nprefix else Path('.')
+    return root, sorted(Path(p) for p in glob.glob(str(source), recursive=True) if Path(p).is_file())
+
+
+def interpolate_point_from_1d_slice(xi, scalex, values):
+    """
+    Interpolate a point from a 1D slice using linear interpolation.
+
+    Parameters
+    ----------
+    xi : float
+        The coordinate value at which to interpolate.
+    scalex : np.ndarray
+        The coordinate scale array for the dimension.
+    values : np.ndarray
+        The 1D data array to interpolate.
+
+    Returns
+    -------
+    out : np.ndarray
+        The interpolated scalar value as a zero-dimensional array.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.psi_io import interpolate_point_from_1d_slice
+    >>> x = np.linspace(0.0, 1.0, 11)
+    >>> f = x ** 2
+    >>> float(interpolate_point_from_1d_slice(0.5, x, f))
+    0.25
+    """
+    if scalex[0] > scalex[-1]:
+        scalex, values = scalex[::-1], values[::-1]
+    xi_ = int(np.searchsorted(scalex, xi))
+    sx_ = slice(*_check_index_ranges(len(scalex), xi_, xi_))
+    return _np_linear_interpolation([xi], [scalex[sx_]], values[sx_])
+
+
+def interpolate_point_from_2d_slice(xi, yi, scalex, scaley, values):
+    """
+    Interpolate a point from a 2D slice using bilinear interpolation.
+
+    Parameters
+    ----------
+    xi : float
+        The coordinate value for the first dimension.
+    yi : float
+        The coordinate value for the second dimension.
+    scalex : np.ndarray
+        The coordinate scale array for the first dimension.
+    scaley : np.ndarray
+        The coordinate scale array for the second dimension.
+    values : np.ndarray
+        The 2D data array to interpolate, with shape ``(nx, ny)``.
+
+    Returns
+    -------
+    out : np.ndarray
+        The interpolated scalar value as a zero-dimensional array.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.psi_io import interpolate_point_from_2d_slice
+    >>> x = np.linspace(0.0, 1.0, 11)
+    >>> y = np.linspace(0.0, 1.0, 11)
+    >>> f = np.outer(x, y)
+    >>> float(interpolate_point_from_2d_slice(0.5, 0.5, x, y, f))
+    0.25
+    """
+    values = np.transpose(values)
+    if scalex[0] > scalex[-1]:
+        scalex, values = scalex[::-1], values[::-1, :]
+    if scaley[0] > scaley[-1]:
+        scaley, values = scaley[::-1], values[:, ::-1]
+    xi_, yi_ = int(np.searchsorted(scalex, xi)), int(np.searchsorted(scaley, yi))
+    sx_, sy_ = slice(*_check_index_ranges(len(scalex), xi_, xi_)), slice(*_check_index_ranges(len(scaley), yi_, yi_))
+    return _np_bilinear_interpolation([xi, yi], [scalex[sx_], scaley[sy_]], values[(sx_, sy_)])
+
+
+def _rdhdf_nd(hdf_filename: str,
+              dimensionality: int
+              ) -> Tuple[np.ndarray, ...]:
+    """Read an n-dimensional PSI-style HDF file; shared implementation for `rdhdf_1d/2d/3d`.
+
+    Parameters
+    ----------
+    hdf_filename : PathLike
+        The path to the HDF5 (.h5) or HDF4 (.hdf) file to read.
+    dimensionality : int
+        The expected number of dimensions of the dataset.
+
+    Returns
+    -------
+    out : tuple[np.ndarray, ...]
+        The coordinate scales for each dimension followed by the data array.
+
+    Raises
+    ------
+    ValueError
+        If the dataset dimensionality does not match ``dimensionality``.
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _rdhdf_nd
+    >>> from psi_data import fetch_mas_data
+    >>> r, t, p, f = _rdhdf_nd(fetch_mas_data().cor_br, dimensionality=3)
+    >>> f.shape
+    (299, 142, 255)
+    """
+    f, *scales = read_hdf_data(hdf_filename)
+    if f.ndim != dimensionality:
+        err = f'Expected {dimensionality}D data, got {f.ndim}D data instead.'
+        raise ValueError(err)
+    scales = scales or (np.empty(0) for _ in f.shape)
+    return *scales, f
+
+
+def _wrhdf_nd(hdf_filename: str,
+              data: np.ndarray,
+              *scales: Sequence[Union[np.ndarray, None]],
+              dimensionality: int,
+              sync_dtype: bool = True,
+              **kwargs
+              ) -> None:
+    """Write an n-dimensional PSI-style HDF file; shared implementation for `wrhdf_1d/2d/3d`.
+
+    Parameters
+    ----------
+    hdf_filename : PathLike
+        The path to the HDF5 (.h5) or HDF4 (.hdf) file to write.
+    data : np.ndarray
+        The data array to write.
+    *scales : Sequence[np.ndarray | None]
+        The scales (coordinate arrays) for each dimension.
+    dimensionality : int
+        The expected number of dimensions of the data array.
+    sync_dtype : bool
+        If True, scale dtypes are cast to match the data array dtype.
+    **kwargs
+        Additional keyword arguments forwarded to :func:`write_hdf_data`.
+
+    Raises
+    ------
+    ValueError
+        If the data dimensionality does not match ``dimensionality``.
+
+    Examples
+    --------
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io.psi_io import _wrhdf_nd
+    >>> from psi_io import read_hdf_data
+    >>> f = np.ones((10, 20, 30), dtype=np.float32)
+    >>> r = np.linspace(1.0, 5.0, 10, dtype=np.float32)
+    >>> t = np.linspace(0.0, 3.14, 20, dtype=np.float32)
+    >>> p = np.linspace(0.0, 6.28, 30, dtype=np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     _wrhdf_nd(Path(d) / "out.h5", f, r, t, p, dimensionality=3)
+    ...     data, *_ = read_hdf_data(Path(d) / "out.h5")
+    ...     data.shape
+    (10, 20, 30)
+    """
+    if data.ndim != dimensionality:
+        err = f'Expected {dimensionality}D data, got {data.ndim}D data instead.'
+        raise ValueError(err)
+    write_hdf_data(hdf_filename, data, *scales, sync_dtype=sync_dtype, **kwargs)
+
+
+def _get_scales_nd_h5(ifile: Union[ Path, str], /,
+                      dimensionality: int,
+                      dataset_id: Optional[str] = None,
+                      ):
+    """HDF5 (.h5) version of :func:`get_scales_1d` / :func:`get_scales_2d` / :func:`get_scales_3d`.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF5 (.h5) file.
+    dimensionality : int
+        The expected number of dimensions of the dataset.
+    dataset_id : str, optional
+        The identifier of the dataset whose scales are read.
+        If ``None``, the default PSI dataset (``'Data'``) is used.
+
+    Returns
+    -------
+    out : tuple[np.ndarray, ...]
+        The coordinate scale arrays for each dimension.
+
+    Raises
+    ------
+    ValueError
+        If the dataset dimensionality does not match ``dimensionality``.
+    ValueError
+        If any dimension has no associated scale.
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _get_scales_nd_h5
+    >>> from psi_data import fetch_mas_data
+    >>> r, t, p = _get_scales_nd_h5(fetch_mas_data().cor_br, dimensionality=3)
+    >>> r.shape, t.shape, p.shape
+    ((255,), (142,), (299,))
+    """
+    with _open_h5(ifile) as hdf:
+        data = hdf[dataset_id or PSI_DATA_ID['h5']]
+        ndim = data.ndim
+        if ndim != dimensionality:
+            err = f'Expected {dimensionality}D data, got {ndim}D data instead.'
+            raise ValueError(err)
+        scales = []
+        for dim in data.dims:
+            if dim:
+                scales.append(dim[0][:])
+            else:
+                raise ValueError(f'Dimension has no scale associated with it.')
+    return tuple(scales)
+
+
+def _get_scales_nd_h4(ifile: Union[ Path, str], /,
+                      dimensionality: int,
+                      dataset_id: Optional[str] = None,
+                      ):
+    """HDF4 (.hdf) version of :func:`get_scales_1d` / :func:`get_scales_2d` / :func:`get_scales_3d`.
+
+    Parameters
+    ----------
+    ifile : PathLike
+        The path to the HDF4 (.hdf) file.
+    dimensionality : int
+        The expected number of dimensions of the dataset.
+    dataset_id : str, optional
+        The identifier of the dataset whose scales are read.
+        If ``None``, the default PSI dataset (``'Data-Set-2'``) is used.
+
+    Returns
+    -------
+    out : tuple[np.ndarray, ...]
+        The coordinate scale arrays for each dimension.
+
+    Raises
+    ------
+    ValueError
+        If the dataset dimensionality does not match ``dimensionality``.
+    ValueError
+        If any dimension has no associated scale.
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _get_scales_nd_h4
+    >>> from psi_data import fetch_mas_data
+    >>> path = fetch_mas_data(hdf=4).cor_br  # doctest: +SKIP
+    >>> r, t, p = _get_scales_nd_h4(path, dimensionality=3)  # doctest: +SKIP
+    >>> r.shape  # doctest: +SKIP
+    (151,)
+    """
+    with _open_h4(ifile) as hdf:
+        data = hdf.select(dataset_id or PSI_DATA_ID['h4'])
+        ndim = data.info()[1]
+        if ndim != dimensionality:
+            err = f'Expected {dimensionality}D data, got {ndim}D data instead.'
+            raise ValueError(err)
+        scales = []
+        for k_, v_ in reversed(data.dimensions(full=1).items()):
+            if v_[3]:
+                scales.append(hdf.select(k_)[:])
+            else:
+                raise ValueError('Dimension has no scale associated with it.')
+        return tuple(scales)
+
+
+def _read_h5_meta(ifile: PathLike, /,
+                  dataset_id: Optional[str] = None
+                  ):
+    """HDF5 (.h5) version of :func:`read_hdf_meta`.
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _read_h5_meta
+    >>> from psi_data import fetch_mas_data
+    >>> meta = _read_h5_meta(fetch_mas_data().cor_br)
+    >>> meta[0].name
+    'Data'
+    """
+    with _open_h5(ifile) as hdf:
+        # Raises KeyError if ``dataset_id`` not found
+        # If ``dataset_id`` is None, get all non-scale :class:`h5.Dataset`s
+        # (groups – *e.g.* the :data:`PYRAMID_GROUP` of overview levels – are skipped)
+        if dataset_id:
+            datasets = (dataset_id, hdf[dataset_id]),
+        else:
+            datasets = ((k, v) for k, v in hdf.items() if isinstance(v, h5.Dataset) and not v.is_scale)
+
+        # One should avoid multiple calls to ``dimproxy[0]`` – *e.g.* ``dimproxy[0].dtype`` and
+        # ``dimproxy[0].shape`` – because the __getitem__ method creates and returns a new
+        # :class:`~h5.DimensionProxy` object each time it is called. [Does this matter? Probably not.]
+        return [HdfDataMeta(name=k,
+                            type=v.dtype,
+                            shape=v.shape,
+                            # Exclude HDF5 dimension-scale bookkeeping attributes
+                            # (``DIMENSION_LIST`` / ``DIMENSION_LABELS``).  These are
+                            # managed automatically by ``attach_scale`` and hold object
+                            # references that are not real user attributes; surfacing
+                            # them breaks round-trips such as :func:`convert` to HDF4.
+                            attr={ak: av for ak, av in v.attrs.items()
+                                  if not ak.startswith("DIMENSION")},
+                            scales=[HdfScaleMeta(name=dimproxy.label,
+                                                 type=dim.dtype,
+                                                 shape=dim.shape,
+                                                 attr=dict(dim.attrs),
+                                                 imin=dim[0],
+                                                 imax=dim[-1])
+                                    for dimproxy in v.dims if dimproxy and (dim := dimproxy[0])])
+                for k, v in datasets]
+
+
+def _read_h4_meta(ifile: PathLike, /,
+                  dataset_id: Optional[str] = None
+                  ):
+    """HDF4 (.hdf) version of :func:`read_hdf_meta`.
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _read_h4_meta
+    >>> from psi_data import fetch_mas_data
+    >>> meta = _read_h4_meta(fetch_mas_data(hdf=4).cor_br)  # doctest: +SKIP
+    >>> meta[0].name  # doctest: +SKIP
+    'Data-Set-2'
+    """
+    with _open_h4(ifile) as hdf:
+        # Raises HDF4Error if ``dataset_id`` not found
+        # If ``dataset_id`` is None, get all non-scale :class:`pyhdf.SD.SDS`s
+        if dataset_id:
+            datasets = (dataset_id, hdf.select(dataset_id)),
+        else:
+            datasets = ((k, hdf.select(k)) for k in hdf.datasets().keys() if not hdf.select(k).iscoordvar())
+
+        # The inner list comprehension differs in approach from the HDF5 version because calling
+        # ``dimensions(full=1)`` on an :class:`~pyhdf.SD.SDS` returns a dictionary of dimension
+        # dataset identifiers (keys) and tuples containing dimension metadata (values). Even if no
+        # coordinate-variable datasets are defined, this dictionary is still returned; the only
+        # indication that the datasets returned do not exist is that the "type" field (within the
+        # tuple of dimension metadata) is set to 0.
+
+        # Also, one cannot avoid multiple calls to ``hdf.select(k_)`` within the inner list comprehension
+        # because :class:`~pyhdf.SD.SDS` objects do not define a ``__bool__`` method, and the fallback
+        # behavior of Python is to assess if the __len__ method returns a non-zero value (which, in
+        # this case, always returns 0).
+        return [HdfDataMeta(name=k,
+                            type=SDC_TYPE_CONVERSIONS[v.info()[3]],
+                            shape=_cast_shape_tuple(v.info()[2]),
+                            attr=v.attributes(),
+                            scales=[HdfScaleMeta(name=k_,
+                                                 type=SDC_TYPE_CONVERSIONS[v_[3]],
+                                                 shape=_cast_shape_tuple(v_[0]),
+                                                 attr=hdf.select(k_).attributes(),
+                                                 imin=hdf.select(k_)[0],
+                                                 imax=hdf.select(k_)[-1])
+                                    for k_, v_ in v.dimensions(full=1).items() if v_[3]])
+                for k, v in datasets]
+
+
+def _read_h5_rtp(ifile: Union[ Path, str], /):
+    """HDF5 (.h5) version of :func:`read_rtp_meta`.
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _read_h5_rtp
+    >>> from psi_data import fetch_mas_data
+    >>> meta = _read_h5_rtp(fetch_mas_data().cor_br)
+    >>> sorted(meta.keys())
+    ['p', 'r', 't']
+    """
+    with _open_h5(ifile) as hdf:
+        return {k: (hdf[v].size, hdf[v][0], hdf[v][-1])
+                for k, v in zip('rtp', PSI_SCALE_ID['h5'])}
+
+
+def _read_h4_rtp(ifile: Union[ Path, str], /):
+    """HDF4 (.hdf) version of :func:`read_rtp_meta`.
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _read_h4_rtp
+    >>> from psi_data import fetch_mas_data
+    >>> meta = _read_h4_rtp(fetch_mas_data(hdf=4).cor_br)  # doctest: +SKIP
+    >>> sorted(meta.keys())  # doctest: +SKIP
+    ['p', 'r', 't']
+    """
+    with _open_h4(ifile) as hdf:
+        return {k: (hdf.select(v).info()[2], hdf.select(v)[0], hdf.select(v)[-1])
+                for k, v in zip('ptr', PSI_SCALE_ID['h4'])}
+
+
+def _read_h5_data(ifile: PathLike, /,
+                  dataset_id: Optional[str] = None,
+                  return_scales: bool = True,
+                  memmap: bool = False,
+                  out: Union[np.ndarray, BufferPool, None] = None,
+                  dtype: Any = None,
+                  chunked: bool = False,
+                  ) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """HDF5 (.h5) version of :func:`read_hdf_data`.
+
+    HDF5 reads into *out* (or in another *dtype*) are always converted chunk by
+    chunk by HDF5; ``chunked`` is accepted for interface compatibility and ignored.
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _read_h5_data
+    >>> from psi_data import fetch_mas_data
+    >>> data, r, t, p = _read_h5_data(fetch_mas_data().cor_br)
+    >>> data.shape
+    (299, 142, 255)
+    """
+    with _open_h5(ifile) as hdf:
+        data = hdf[dataset_id or PSI_DATA_ID['h5']]
+        converts = dtype is not None and np.dtype(dtype) != data.dtype
+        dataset = _h5_memmap(data) if memmap and not converts else None
+        if out is not None or (dataset is None and converts):
+            dataset = _h5_read_direct(data, None, _resolve_out(out, data.shape, dtype or data.dtype,
+                                                               strict=dtype is not None))
+        elif dataset is None:
+            dataset = data[:]
+        if return_scales:
+            scales = [dim[0][:] for dim in data.dims if dim]
+            return dataset, *scales
+        return dataset
+
+
+def _read_h4_data(ifile: PathLike, /,
+                  dataset_id: Optional[str] = None,
+                  return_scales: bool = True,
+                  memmap: bool = False,
+                  out: Union[np.ndarray, BufferPool, None] = None,
+                  dtype: Any = None,
+                  chunked: bool = False,
+                  ) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """HDF4 (.hdf) version of :func:`read_hdf_data`.
+
+    HDF4 datasets cannot be memory-mapped; ``memmap`` is accepted for
+    interface compatibility and ignored.  With ``out``, the data is read into a
+    temporary array and copied – or, with ``chunked``, one hyperslab at a time
+    (see :func:`_read_h4_slabs`).
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _read_h4_data
+    >>> from psi_data import fetch_mas_data
+    >>> data, *_ = _read_h4_data(fetch_mas_data(hdf=4).cor_br)  # doctest: +SKIP
+    >>> data.shape  # doctest: +SKIP
+    (299, 142, 255)
+    """
+    with _open_h4(ifile) as hdf:
+        data = hdf.select(dataset_id or PSI_DATA_ID['h4'])
+        dataset = (_read_h4_slabs if chunked else _read_h4_selection)(data, (slice(None),), out, dtype)
+        if return_scales:
+            return (dataset,
+                    *[hdf.select(k_)[:] for k_, v_ in reversed(data.dimensions(full=1).items()) if v_[3]])
+        return dataset
+
+
+def _read_h5_by_index(ifile: PathLike, /,
+                      *xi: Union[int, slice, Tuple[Union[int, None], ...], None],
+                      dataset_id: Optional[str] = None,
+                      return_scales: bool = True,
+                      memmap: bool = False,
+                      out: Union[np.ndarray, BufferPool, None] = None,
+                      dtype: Any = None,
+                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """HDF5 (.h5) version of :func:`read_hdf_by_index`.
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _read_h5_by_index
+    >>> from psi_data import fetch_mas_data
+    >>> f, r, t, p = _read_h5_by_index(fetch_mas_data().cor_br, 0, None, None)
+    >>> f.shape
+    (299, 142, 1)
+    """
+    with _open_h5(ifile) as hdf:
+        data = hdf[dataset_id or PSI_DATA_ID['h5']]
+        if len(xi) != data.ndim:
+            raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
+        slices = [_parse_index_inputs(slice_input) for slice_input in xi]
+        mapped = _h5_memmap(data) if memmap and (dtype is None or np.dtype(dtype) == data.dtype) else None
+        dataset = _read_h5_selection(data if mapped is None else mapped, tuple(reversed(slices)), out, dtype)
+        if return_scales:
+            scales = [dim[0][si] for si, dim in zip(slices, data.dims) if dim]
+            return dataset, *scales
+        return dataset
+
+def _read_h4_by_index(ifile: PathLike, /,
+                      *xi: Union[int, slice, Tuple[Union[int, None], ...], None],
+                      dataset_id: Optional[str] = None,
+                      return_scales: bool = True,
+                      memmap: bool = False,
+                      out: Union[np.ndarray, BufferPool, None] = None,
+                      dtype: Any = None,
+                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """HDF4 (.hdf) version of :func:`read_hdf_by_index`.
+
+    HDF4 datasets cannot be memory-mapped; ``memmap`` is accepted for
+    interface compatibility and ignored.  With ``out``, the data is read into a
+    temporary array and copied.
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _read_h4_by_index
+    >>> from psi_data import fetch_mas_data
+    >>> path = fetch_mas_data(hdf=4).cor_br  # doctest: +SKIP
+    >>> f, r, t, p = _read_h4_by_index(path, 0, None, None)  # doctest: +SKIP
+    >>> f.shape  # doctest: +SKIP
+    (299, 142, 1)
+    """
+    with _open_h4(ifile) as hdf:
+        data = hdf.select(dataset_id or PSI_DATA_ID['h4'])
+        ndim = data.info()[1]
+        if len(xi) != ndim:
+            raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
+        slices = [_parse_index_inputs(slice_input) for slice_input in xi]
+        dataset = _read_h4_selection(data, tuple(reversed(slices)), out, dtype)
+        if return_scales:
+            scales = [hdf.select(k_)[si] for si, (k_, v_) in zip(slices, reversed(data.dimensions(full=1).items())) if v_[3]]
+            return dataset, *scales
+        return dataset
+
+
+def _read_h5_by_value(ifile: PathLike, /,
+                      *xi: Union[float, Tuple[float, float], None],
+                      dataset_id: Optional[str] = None,
+                      return_scales: bool = True,
+                      out: Union[np.ndarray, BufferPool, None] = None,
+                      dtype: Any = None,
+                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """HDF5 (.h5) version of :func:`read_hdf_by_value`.
+
+    Examples
+    --------
+    >>> from psi_io.psi_io import _read_h5_by_value
+    >>> from psi_data import fetch_mas_data
+    >>> f, r, t, p = _read_h5_by_value(fetch_mas_data().cor_br, 15, None, None)
+    >>> f.shape
+    (299, 142, 2)
+    """
+    with _open_h5(ifile) as hdf:
+        data = hdf[dataset_id or PSI_DATA_ID['h5']]
+        if len(xi) != data.ndim:
+            raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
+        slices = []
+        for dimproxy, value in zip(data.dims, xi):
+            if dimproxy:
+                slices.append(_parse_value_selection(dimproxy[0][:], value))
+            elif value is None:
+                slices.append(slice(None))
+            else:
+                raise ValueError("Cannot slice by value on dimension without scales")
+        dataset = _read_h5_selection(data, tuple(reversed(slices)), out, dtype)
+        if return_scales:
+            scales = [dim[0][si] for si, dim in zip(slices, data.dims) if dim]
+            return dataset, *scales
+        return dataset
 
-    .. note::
-       The returned slice is Fortran-ordered, *e.g.* radial slices have shape
-       :math:`(n_\phi, n_\theta)`, and :math:`\phi` slices have shape
-       :math:`(n_r, n_\theta)`.
 
-    .. note::
-       :class:`~scipy.interpolate.RegularGridInterpolator` casts all input data
-       to ``float64`` internally.  PSI HDF datasets stored as ``float32`` will
-       therefore be upcast during interpolation.
+def _read_h4_by_value(ifile: PathLike, /,
+                      *xi: Union[float, Tuple[float, float], None],
+                      dataset_id: Optional[str] = None,
+                      return_scales: bool = True,
+                      out: Union[np.ndarray, BufferPool, None] = None,
+                      dtype: Any = None,
+                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """HDF4 (.hdf) version of :func:`read_hdf_by_value`.
 
     Examples
     --------
+    >>> from psi_io.psi_io import _read_h4_by_value
     >>> from psi_data import fetch_mas_data
-    >>> from psi_io import sp_interpolate_slice_from_hdf
-    >>> from numpy import pi
-    >>> filepath = fetch_mas_data().cor_br
-
-    Fetch a 2D slice at r=15 from 3D map
+    >>> path = fetch_mas_data(hdf=4).cor_br  # doctest: +SKIP
+    >>> f, r, t, p = _read_h4_by_value(path, 15, None, None)  # doctest: +SKIP
+    >>> f.shape  # doctest: +SKIP
+    (299, 142, 2)
+    """
+    with _open_h4(ifile) as hdf:
+        data = hdf.select(dataset_id or PSI_DATA_ID['h4'])
+        ndim = data.info()[1]
+        if len(xi) != ndim:
+            raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
+        slices, scales = [], []
+        for (k_, v_), value in zip(reversed(data.dimensions(full=1).items()), xi):
+            if v_[3] != 0:
+                scales.append(hdf.select(k_)[:])
+                slices.append(_parse_value_selection(scales[-1], value))
+            elif value is None:
+                slices.append(slice(None))
+            else:
+                raise ValueError("Cannot slice by value on dimension without scales")
+        dataset = _read_h4_selection(data, tuple(reversed(slices)), out, dtype)
+        if return_scales:
+            scaled = [si for si, (k_, v_) in zip(slices, reversed(data.dimensions(full=1).items())) if v_[3]]
+            return dataset, *[scale[si] for si, scale in zip(scaled, scales)]
+        return dataset
 
-    >>> slice_, theta_scale, phi_scale = sp_interpolate_slice_from_hdf(filepath, 15, None, None)
-    >>> slice_.shape, theta_scale.shape, phi_scale.shape
-    ((299, 142), (142,), (299,))
 
-    Fetch a single point from 3D map
+def _read_h5_by_ivalue(ifile: PathLike, /,
+                       *xi: Union[float, Tuple[float, float], None],
+                       dataset_id: Optional[str] = None,
+                       return_scales: bool = True,
+                       out: Union[np.ndarray, BufferPool, None] = None,
+                       dtype: Any = None,
+                       ) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """HDF5 (.h5) version of :func:`read_hdf_by_ivalue`.
 
-    >>> point_value, *_ = sp_interpolate_slice_from_hdf(filepath, 1, pi/2, pi)
-    >>> point_value
-    np.float64(-0.20146621106799947)
+    Examples
+    --------
+    >>> from psi_io.psi_io import _read_h5_by_ivalue
+    >>> from psi_data import fetch_mas_data
+    >>> f, r_idx, t_idx, p_idx = _read_h5_by_ivalue(fetch_mas_data().cor_br, 2.7, None, None)
+    >>> r_idx.shape
+    (2,)
     """
-    filepath, *args = xi
-    kwargs.pop('return_scales', None)
-    result = read_hdf_by_value(filepath, *args, **kwargs)
-    interpolator = instantiate_linear_interpolator(*result)
-    grid = [yi[0] if yi[0] is not None else yi[1] for yi in zip(args, result[1:])]
-    slice_ = interpolator(tuple(np.meshgrid(*grid, indexing='ij')))
-    indices = [0 if yi is not None else slice(None, None) for yi in args]
-    return slice_[tuple(indices)].T, *[yi[1] for yi in zip(args, result[1:]) if yi[0] is None]
+    with _open_h5(ifile) as hdf:
+        data = hdf[dataset_id or PSI_DATA_ID['h5']]
+        if len(xi) != data.ndim:
+            raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
+        slices = [_parse_ivalue_selection(*args) for args in zip(reversed(data.shape), xi)]
+        dataset = _read_h5_selection(data, tuple(reversed(slices)), out, dtype)
+        if return_scales:
+            scales = [np.arange(size)[si] for si, size in zip(slices, reversed(data.shape))]
+            return dataset, *scales
+        return dataset
 
 
-def np_interpolate_slice_from_hdf(ifile: PathLike, /,
+def _read_h4_by_ivalue(ifile: PathLike, /,
                        *xi: Union[float, Tuple[float, float], None],
                        dataset_id: Optional[str] = None,
-                       by_index: bool = False,
-                       ):
-    """
-    Interpolate a slice from HDF data using linear interpolation.
-
-    .. note::
-       Slicing routines result in a dimensional reduction. The dimensions
-       that are fixed (i.e. provided as float values in `*xi`) are removed
-       from the output slice, while the dimensions that are not fixed
-       (*i.e.* provided as `None` in `*xi`) are retained.
+                       return_scales: bool = True,
+                       out: Union[np.ndarray, BufferPool, None] = None,
+                       dtype: Any = None,
+                       ) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    """HDF4 (.hdf) version of :func:`read_hdf_by_ivalue`.
 
-    Parameters
-    ----------
-    ifile : PathLike
-        The path to the HDF file to read.
-    *xi : sequence
-        Positional arguments passed-through to reader function.
-    dataset_id : str | None, optional
-        The identifier of the dataset to read.  If ``None``, a default dataset
-        is used (``'Data-Set-2'`` for HDF4 and ``'Data'`` for HDF5).
-        Default is ``None``.
-    by_index : bool, optional
-        If ``True``, use :func:`read_hdf_by_ivalue` to read data by fractional
-        index values.  If ``False``, use :func:`read_hdf_by_value` to read by
-        physical coordinate values.  Default is ``False``.
+    Examples
+    --------
+    >>> from psi_io.psi_io import _read_h4_by_ivalue
+    >>> from psi_data import fetch_mas_data
+    >>> path = fetch_mas_data(hdf=4).cor_br  # doctest: +SKIP
+    >>> f, r_idx, t_idx, p_idx = _read_h4_by_ivalue(path, 2.7, None, None)  # doctest: +SKIP
+    >>> r_idx.shape  # doctest: +SKIP
+    (2,)
+    """
+    with _open_h4(ifile) as hdf:
+        data = hdf.select(dataset_id or PSI_DATA_ID['h4'])
+        ndim, shape = data.info()[1], _cast_shape_tuple(data.info()[2])
+        if len(xi) != ndim:
+            raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
+        slices = [_parse_ivalue_selection(*args) for args in zip(reversed(shape), xi)]
+        dataset = _read_h4_selection(data, tuple(reversed(slices)), out, dtype)
+        if return_scales:
+            scales = [np.arange(size)[si] for si, size in zip(slices, reversed(shape))]
+            return dataset, *scales
+        return dataset
 
-    Returns
-    -------
-    data_slice : np.ndarray
-        The interpolated data slice with fixed dimensions removed.
-    scales : list[np.ndarray]
-        Coordinate scale arrays for the retained (non-fixed) dimensions.
 
-    Raises
-    ------
-    ValueError
-        If the number of dimensions to interpolate over is not supported.
+def _read_h5_scales(ifile: PathLike, /,
+                    dataset_id: Optional[str] = None,
+                    ) -> Tuple[Optional[np.ndarray], ...]:
+    """Read the (read-only) scale of every dimension of an HDF5 dataset, ``None`` where absent.
 
-    Notes
-    -----
-    This function supports linear, bilinear, and trilinear interpolation
-    depending on the number of dimensions fixed in `xi`.
+    The scales are returned in Fortran (*i.e.* PSI scale) order.
 
     Examples
     --------
+    >>> from psi_io.psi_io import _read_h5_scales
     >>> from psi_data import fetch_mas_data
-    >>> from psi_io import np_interpolate_slice_from_hdf
-    >>> from numpy import pi
-    >>> filepath = fetch_mas_data().cor_br
+    >>> [scale.shape for scale in _read_h5_scales(fetch_mas_data().cor_br)]
+    [(255,), (142,), (299,)]
+    """
+    with _open_h5(ifile) as hdf:
+        data = hdf[dataset_id or PSI_DATA_ID['h5']]
+        return tuple(_read_only(dim[0][:]) if dim else None for dim in data.dims)
 
-    Fetch a 2D slice at r=15 from 3D map
 
-    >>> slice_, theta_scale, phi_scale = np_interpolate_slice_from_hdf(filepath, 15, None, None)
-    >>> slice_.shape, theta_scale.shape, phi_scale.shape
-    ((299, 142), (142,), (299,))
+def _read_h4_scales(ifile: PathLike, /,
+                    dataset_id: Optional[str] = None,
+                    ) -> Tuple[Optional[np.ndarray], ...]:
+    """HDF4 (.hdf) version of :func:`_read_h5_scales`."""
+    with _open_h4(ifile) as hdf:
+        data = hdf.select(dataset_id or PSI_DATA_ID['h4'])
+        return tuple(_read_only(hdf.select(k_)[:]) if v_[3] else None
+                     for k_, v_ in reversed(data.dimensions(full=1).items()))
 
-    Fetch a single point from 3D map
 
-    >>> point_value, *_ = np_interpolate_slice_from_hdf(filepath, 1, pi/2, pi)
-    >>> point_value
-    np.float32(-0.2014672)
+def _cached_scales(ifile: PathLike,
+                   dataset_id: Optional[str] = None,
+                   swmr: bool = False) -> Tuple[Optional[np.ndarray], ...]:
+    """Return the scales of a dataset (see :func:`_read_h5_scales`) through the process-wide cache.
 
+    With *swmr*, the scales are read afresh from a file opened for SWMR reading.
     """
-    reader = read_hdf_by_value if not by_index else read_hdf_by_ivalue
-    data, *scales = reader(ifile, *xi, dataset_id=dataset_id, return_scales=True)
-    f_ = np.transpose(data)
-    slice_type = sum([yi is not None for yi in xi])
-    if slice_type == 1:
-        return _np_linear_interpolation(xi, scales, f_).T, *[yi[1] for yi in zip(xi, scales) if yi[0] is None]
-    elif slice_type == 2:
-        return _np_bilinear_interpolation(xi, scales, f_).T, *[yi[1] for yi in zip(xi, scales) if yi[0] is None]
-    elif slice_type == 3:
-        return _np_trilinear_interpolation(xi, scales, f_).T, *[yi[1] for yi in zip(xi, scales) if yi[0] is None]
-    else:
-        raise ValueError("Not a valid number of dimensions for supported linear interpolation methods")
+    if swmr:
+        return _dispatch_by_ext(ifile, _read_h4_scales, _read_h5_scales, dataset_id=dataset_id, swmr_read=True)
+    return _META_CACHE.get(ifile, ('scales', dataset_id),
+                           lambda: _dispatch_by_ext(ifile, _read_h4_scales, _read_h5_scales,
+                                                    dataset_id=dataset_id, pooled=True))
 
 
-def interpolate_positions_from_hdf(ifile, *xi, **kwargs):
-    r"""
-    Interpolate at a list of scale positions using SciPy's
-    :class:`~scipy.interpolate.RegularGridInterpolator`.
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Mark *array* as read-only (so that it can be shared through a cache) and return it."""
+    array.flags.writeable = False
+    return array
 
-    Parameters
-    ----------
-    ifile : PathLike
-        The path to the HDF file to read.
-    *xi : sequence[np.ndarray]
-       Coordinate values for each dimension of the ``n``-dimensional dataset.
-       Each array must have the same length :math:`m`; the function assembles
-       them into an :math:`m \times n` column stack for interpolation.
-    **kwargs
-        Keyword arguments forwarded to :func:`read_hdf_by_value`.
 
-    Returns
-    -------
-    out : np.ndarray
-        The interpolated values at the provided positions.
+def _read_h5_slab(ifile: PathLike, /,
+                  selection: tuple,
+                  dataset_id: Optional[str] = None,
+                  out: Union[np.ndarray, BufferPool, None] = None,
+                  dtype: Any = None,
+                  ) -> np.ndarray:
+    """Read the hyperslab *selection* (a tuple of slices in storage order) of an HDF5 dataset."""
+    with _open_h5(ifile) as hdf:
+        return _read_h5_selection(hdf[dataset_id or PSI_DATA_ID['h5']], selection, out, dtype)
 
-    Notes
-    -----
-    This function reads data from an HDF file, creates a linear interpolator,
-    and interpolates at the provided scale values. For each dimension, the
-    minimum and maximum values from the provided arrays are used to read
-    the necessary subset of data from the HDF file *viz.* to avoid loading
-    the entire dataset into memory.
 
-    Examples
-    --------
-    Import a 3D HDF5 cube.
+def _read_h4_slab(ifile: PathLike, /,
+                  selection: tuple,
+                  dataset_id: Optional[str] = None,
+                  out: Union[np.ndarray, BufferPool, None] = None,
+                  dtype: Any = None,
+                  ) -> np.ndarray:
+    """HDF4 (.hdf) version of :func:`_read_h5_slab`."""
+    with _open_h4(ifile) as hdf:
+        return _read_h4_selection(hdf.select(dataset_id or PSI_DATA_ID['h4']), selection, out, dtype)
 
-    >>> from psi_data import fetch_mas_data
-    >>> from psi_io import interpolate_positions_from_hdf
-    >>> import numpy as np
-    >>> filepath = fetch_mas_data().cor_br
 
-    Set up positions to interpolate.
+@contextmanager
+def _create_h4(ifile: PathLike):
+    """Create (truncating) an HDF4 file for writing and yield the open :class:`pyhdf.SD.SD`."""
+    _except_no_pyhdf()
+    _HANDLE_POOL.evict(ifile)
+    _META_CACHE.evict(ifile)
+    h4file = h4.SD(str(ifile), h4.SDC.WRITE | h4.SDC.CREATE | h4.SDC.TRUNC)
+    try:
+        yield h4file
+    finally:
+        h4file.end()
 
-    >>> r_vals = np.array([15, 20, 25])
-    >>> theta_vals = np.array([np.pi/4, np.pi/2, 3*np.pi/4])
-    >>> phi_vals = np.array([0, np.pi, 2*np.pi])
 
-    Interpolate at the specified positions.
+@contextmanager
+def _create_h5(ifile: PathLike, swmr: bool = False):
+    """Create (truncating) an HDF5 file for writing and yield the open :class:`h5py.File`.
 
-    >>> interpolate_positions_from_hdf(filepath, r_vals, theta_vals, phi_vals)
-    array([-1.44383936e-03, -6.70081301e-04,  8.56632460e-05])
+    With *swmr*, the file is created in the latest file format, so that SWMR writing
+    can be started on it (see :func:`_open_h5_writer`).
     """
-    xi_ = [(np.nanmin(i), np.nanmax(i)) for i in xi]
-    f, *scales = read_hdf_by_value(ifile, *xi_, **kwargs)
-    interpolator = instantiate_linear_interpolator(f, *scales, bounds_error=False)
-    return interpolator(np.stack(xi, axis=len(xi[0].shape)))
+    _HANDLE_POOL.evict(ifile)
+    _META_CACHE.evict(ifile)
+    with h5.File(ifile, "w", libver='latest' if swmr else None) as h5file:
+        yield h5file
 
 
-def interpolate_point_from_1d_slice(xi, scalex, values):
+def _open_h4_writer(ifile: PathLike, mode: Literal['w', 'a']):
+    """Open an HDF4 file for :class:`HdfWriter`, truncating it in mode ``'w'``; return the :class:`pyhdf.SD.SD`."""
+    _except_no_pyhdf()
+    _HANDLE_POOL.evict(ifile)
+    _META_CACHE.evict(ifile)
+    flags = h4.SDC.WRITE | h4.SDC.CREATE
+    return h4.SD(str(ifile), flags | h4.SDC.TRUNC if mode == 'w' else flags)
+
+
+def _open_h5_writer(ifile: PathLike, mode: Literal['w', 'a'], swmr: bool = False) -> h5.File:
+    """HDF5 (.h5) version of :func:`_open_h4_writer`.
+
+    With *swmr*, the file is opened in the latest file format, which single-writer/multiple-reader
+    (SWMR) access requires; SWMR writing itself is started by setting :attr:`h5py.File.swmr_mode`
+    once every object of the file has been created.
     """
-    Interpolate a point from a 1D slice using linear interpolation.
+    _HANDLE_POOL.evict(ifile)
+    _META_CACHE.evict(ifile)
+    return h5.File(ifile, mode, libver='latest' if swmr else None)
+
+
+@contextmanager
+def _create_h4_dataset(h4file,
+                       dataid: str,
+                       shape: Tuple[int, ...],
+                       dtype: np.dtype,
+                       scales: Sequence[Union[np.ndarray, None]] = (),
+                       attrs: Optional[Mapping[str, Any]] = None,
+                       sync_dtype: bool = False,
+                       strict: bool = True,
+                       chunks: ChunkType = None,
+                       compression: Union[Literal['gzip', 'lzf'], int, None] = None,
+                       compression_opts: Optional[int] = None,
+                       shuffle: bool = False,
+                       fletcher32: bool = False,
+                       ):
+    """Create an (empty) HDF4 dataset with its scales and attributes.
+
+    The yielded :class:`pyhdf.SD.SDS` accepts whole (``set``) or hyperslab
+    (``sds[i:j] = ...``) writes, and its access is ended on exit.
 
     Parameters
     ----------
-    xi : float
-        The coordinate value at which to interpolate.
-    scalex : np.ndarray
-        The coordinate scale array for the dimension.
-    values : np.ndarray
-        The 1D data array to interpolate.
+    h4file : pyhdf.SD.SD
+        An HDF4 file opened for writing.
+    dataid : str
+        The name of the dataset to create.
+    shape : tuple[int, ...]
+        The (NumPy-ordered) shape of the dataset.
+    dtype : np.dtype
+        The dtype of the dataset.
+    scales : Sequence[np.ndarray | None], optional
+        The scales of each dimension (in :math:`r, \\theta, \\phi` order);
+        ``None`` entries are left without a scale.
+    attrs : Mapping[str, Any], optional
+        Dataset attributes.
+    sync_dtype, strict, chunks, compression, compression_opts, shuffle, fletcher32
+        See :func:`write_hdf_data`.
+
+    Yields
+    ------
+    sds : pyhdf.SD.SDS
+        The created dataset.  A compressed dataset must be written in a single
+        call (see :func:`_write_h4_sds`).
 
-    Returns
-    -------
-    out : np.ndarray
-        The interpolated scalar value as a zero-dimensional array.
+    Notes
+    -----
+    :py:mod:`pyhdf` copies scale and attribute values element by element into
+    its own buffers, which is faster from a list than from an array: they are
+    converted with :meth:`numpy.ndarray.tolist`.
+    """
+    if chunks or shuffle or fletcher32:
+        raise ValueError("Chunking, shuffle and fletcher32 options are only supported for HDF5 (.h5) files")
+    comp_type, comp_level = _h4_compression(compression, compression_opts)
+    sds_id = h4file.create(dataid, _dtype_to_sdc(np.dtype(dtype)), shape)
+    try:
+        if comp_type is not None:
+            sds_id.setcompress(comp_type, comp_level)
+        for i, scale in enumerate(reversed(scales)):
+            if scale is not None:
+                if sync_dtype:
+                    scale = scale.astype(dtype)
+                sds_id.dim(i).setscale(_dtype_to_sdc(scale.dtype), scale.tolist())
+
+        for k, v in (attrs or {}).items():
+            npv = np.asarray(v)
+            attr_ = sds_id.attr(k)
+            try:
+                val = npv.tolist()
+                if isinstance(val, bytes):
+                    val = val.decode('latin-1')
+                attr_.set(_dtype_to_sdc(npv.dtype), val)
+            except KeyError as e:
+                if strict:
+                    raise KeyError(f"Failed to set attribute '{k}' on dataset '{dataid}'") from e
+                else:
+                    print(f"Warning: Failed to set attribute '{k}' on dataset '{dataid}'; skipping.")
+
+        yield sds_id
+    finally:
+        sds_id.endaccess()
+
+
+def _h4_compression(compression: Union[Literal['gzip', 'lzf'], int, None],
+                    compression_opts: Optional[int] = None) -> Tuple[Optional[int], int]:
+    """Return the :py:mod:`pyhdf` compression type and level matching the h5py-style options.
+
+    HDF4 only provides gzip (deflate) among the h5py filters; as with h5py, an
+    integer *compression* is a gzip level, and the level defaults to ``4``.
 
     Examples
     --------
-    >>> import numpy as np
-    >>> from psi_io.psi_io import interpolate_point_from_1d_slice
-    >>> x = np.linspace(0.0, 1.0, 11)
-    >>> f = x ** 2
-    >>> float(interpolate_point_from_1d_slice(0.5, x, f))
-    0.25
+    >>> from psi_io.psi_io import _h4_compression
+    >>> _h4_compression(None)
+    (None, 0)
+    >>> _h4_compression('gzip', 6)
+    (4, 6)
+    """
+    if compression is None:
+        return None, 0
+    if compression == 'gzip':
+        level = 4 if compression_opts is None else compression_opts
+    elif isinstance(compression, (int, np.integer)) and not isinstance(compression, bool):
+        level = int(compression)
+    else:
+        raise ValueError(f"Only gzip compression is supported for HDF4 (.hdf) files; got {compression!r}")
+    _except_no_pyhdf()
+    return h4.SDC.COMP_DEFLATE, level
+
+
+def _write_h4_sds(sds_id, data: np.ndarray,
+                  compressed: bool = False,
+                  slab_nbytes: int = CONVERT_SLAB_NBYTES,
+                  ) -> None:
+    """Write the whole of *data* to the HDF4 dataset *sds_id*.
+
+    :py:mod:`pyhdf` writes a C-contiguous array in native byte order as is, and
+    converts any other array (*e.g.* a Fortran-ordered or byte-swapped one) to
+    such a copy first.  Those arrays are written one hyperslab at a time, so that
+    the copy is bounded by *slab_nbytes* – except for compressed datasets, which
+    HDF4 requires to be written in a single call.
     """
-    if scalex[0] > scalex[-1]:
-        scalex, values = scalex[::-1], values[::-1]
-    xi_ = int(np.searchsorted(scalex, xi))
-    sx_ = slice(*_check_index_ranges(len(scalex), xi_, xi_))
-    return _np_linear_interpolation([xi], [scalex[sx_]], values[sx_])
+    data = np.asarray(data)
+    if compressed or not data.ndim or (data.flags.c_contiguous and data.dtype.isnative):
+        sds_id.set(data)
+    else:
+        _copy_by_slab(data, sds_id, data.shape, data.dtype.itemsize, slab_nbytes)
+
+
+@contextmanager
+def _create_h5_dataset(h5file: h5.File,
+                       dataid: str,
+                       shape: Tuple[int, ...],
+                       dtype: np.dtype,
+                       scales: Sequence[Union[np.ndarray, None]] = (),
+                       attrs: Optional[Mapping[str, Any]] = None,
+                       data: Optional[np.ndarray] = None,
+                       sync_dtype: bool = False,
+                       strict: bool = True,
+                       chunks: ChunkType = None,
+                       compression: Union[Literal['gzip', 'lzf'], int, None] = None,
+                       compression_opts: Optional[int] = None,
+                       shuffle: bool = False,
+                       fletcher32: bool = False,
+                       shared_scales: Optional[Dict[str, np.ndarray]] = None,
+                       maxshape: Optional[Tuple[Optional[int], ...]] = None,
+                       ):
+    """Create an HDF5 dataset with its scales and attributes.
 
+    Scales are stored as ``dim1, dim2, ...``; when a file holds several
+    datasets, identical scales (equal values and dtype, on the same dimension)
+    are shared and differing ones are stored as ``<dataid>_dim1, ...``.
 
-def interpolate_point_from_2d_slice(xi, yi, scalex, scaley, values):
+    Parameters
+    ----------
+    h5file : h5py.File
+        An HDF5 file opened for writing.
+    dataid : str
+        The name of the dataset to create.
+    shape : tuple[int, ...]
+        The shape of the dataset.
+    dtype : np.dtype
+        The dtype of the dataset.
+    scales : Sequence[np.ndarray | None], optional
+        The scales of each dimension (in :math:`r, \\theta, \\phi` order);
+        ``None`` entries are left without a scale.
+    attrs : Mapping[str, Any], optional
+        Dataset attributes.
+    data : np.ndarray, optional
+        The dataset values.  If ``None``, the dataset is created empty and
+        is expected to be filled by hyperslab writes.
+    sync_dtype, strict, chunks, compression, compression_opts, shuffle, fletcher32
+        See :func:`write_hdf_data`.
+    shared_scales : dict[str, np.ndarray], optional
+        The values of the scale datasets already in the file, by name, used
+        (and updated) in place of reading them back to decide whether a scale
+        can be shared.  A scale differing from ``dimN`` is also shared with
+        any identical ``<id>_dimN`` scale in this mapping.  Default is ``None``
+        (read them from the file, and share ``dimN`` only).
+    maxshape : tuple[int | None, ...], optional
+        The maximum shape of a resizable dataset (``None`` for an unlimited
+        axis); requires a chunked layout.  Default is ``None`` (not resizable).
+
+    Yields
+    ------
+    dataset : h5py.Dataset
+        The created dataset.
     """
-    Interpolate a point from a 2D slice using bilinear interpolation.
+    storage = _h5_storage_options(shape, dtype, chunks=chunks, compression=compression,
+                                  compression_opts=compression_opts, shuffle=shuffle,
+                                  fletcher32=fletcher32)
+    if maxshape is not None:
+        storage['maxshape'] = maxshape
+    dataset = h5file.create_dataset(dataid, data=data, dtype=dtype, shape=shape, **storage)
+
+    def stored(scale_id: str) -> np.ndarray:
+        if shared_scales is None:
+            return h5file[scale_id][:]
+        if scale_id not in shared_scales:
+            shared_scales[scale_id] = h5file[scale_id][:]
+        return shared_scales[scale_id]
+
+    def same(value: np.ndarray, scale: np.ndarray) -> bool:
+        return value.dtype == scale.dtype and np.array_equal(value, scale)
+
+    for i, scale in enumerate(scales):
+        if scale is not None:
+            scale = np.asarray(scale)
+            if sync_dtype:
+                scale = scale.astype(dtype)
+            scale_id = f"dim{i+1}"
+            if scale_id in h5file and not same(stored(scale_id), scale):
+                scale_id = next((name for name, value in (shared_scales or {}).items()
+                                 if name.endswith(f"_dim{i+1}") and same(value, scale)),
+                                f"{dataid}_dim{i+1}")
+            if scale_id not in h5file:
+                h5file.create_dataset(scale_id, data=scale, dtype=scale.dtype, shape=scale.shape)
+                if shared_scales is not None:
+                    shared_scales[scale_id] = scale.copy()
+            dataset.dims[i].attach_scale(h5file[scale_id])
+            dataset.dims[i].label = scale_id
+
+    for key, value in (attrs or {}).items():
+        if key.startswith('DIMENSION'):
+            # Skip HDF5 dimension-scale bookkeeping attributes —
+            # these are managed by attach_scale above and must not
+            # be overwritten with stale object references.
+            continue
+        try:
+            dataset.attrs[key] = value
+        except TypeError as e:
+            if strict:
+                raise TypeError(f"Failed to set attribute '{key}' on dataset '{dataid}'") from e
+            else:
+                print(f"Warning: Failed to set attribute '{key}' on dataset '{dataid}'; skipping.")
+
+    yield dataset
+
+
+def _select_h4_dataset(h4file, dataid: str):
+    """Return an HDF4 dataset and its scales (in :math:`r, \\theta, \\phi` order, ``None`` if absent)."""
+    sds_id = h4file.select(dataid)
+    scales = [h4file.select(k_)[:] if v_[3] else None
+              for k_, v_ in reversed(sds_id.dimensions(full=1).items())]
+    return sds_id, scales
+
+
+def _select_h5_dataset(h5file: h5.File, dataid: str):
+    """Return an HDF5 dataset and its scales (in :math:`r, \\theta, \\phi` order, ``None`` if absent)."""
+    dataset = h5file[dataid]
+    return dataset, [dim[0][:] if dim else None for dim in dataset.dims]
+
+
+def _copy_by_slab(source, target,
+                  shape: Tuple[int, ...],
+                  itemsize: int,
+                  slab_nbytes: int = CONVERT_SLAB_NBYTES,
+                  chunks: Optional[Tuple[int, ...]] = None,
+                  ) -> None:
+    """Copy *source* into *target* one hyperslab (of whole :math:`\\phi` planes) at a time.
 
     Parameters
     ----------
-    xi : float
-        The coordinate value for the first dimension.
-    yi : float
-        The coordinate value for the second dimension.
-    scalex : np.ndarray
-        The coordinate scale array for the first dimension.
-    scaley : np.ndarray
-        The coordinate scale array for the second dimension.
-    values : np.ndarray
-        The 2D data array to interpolate, with shape ``(nx, ny)``.
+    source, target
+        Sliceable HDF4 or HDF5 datasets (or arrays) of the same shape.
+    shape : tuple[int, ...]
+        The shape of the datasets.
+    itemsize : int
+        The size (in bytes) of a single element.
+    slab_nbytes : int, optional
+        The approximate size (in bytes) of the hyperslab held in memory.  At least
+        one plane of the slowest varying axis is always copied at a time, so the
+        budget is only exceeded by a single plane larger than *slab_nbytes*.
+    chunks : tuple[int, ...], optional
+        The chunk shape of *target*; slabs are aligned to whole chunks along
+        the slowest varying axis to avoid rewriting partially filled chunks.
+        When one row of chunks exceeds *slab_nbytes*, the slabs are sized by the
+        budget alone and each chunk is filled over several writes.
+    """
+    for slab in _iter_slabs(shape, itemsize, slab_nbytes, chunks):
+        target[slab] = source[slab]
 
-    Returns
-    -------
-    out : np.ndarray
-        The interpolated scalar value as a zero-dimensional array.
+
+def _iter_slabs(shape: Tuple[int, ...],
+                itemsize: int,
+                slab_nbytes: int = CONVERT_SLAB_NBYTES,
+                chunks: Optional[Tuple[int, ...]] = None,
+                ):
+    """Yield the slices that partition the slowest varying axis into hyperslabs.
+
+    See :func:`_copy_by_slab` for a description of the parameters.  A scalar
+    (0-d) dataset yields a single empty-tuple index.
 
     Examples
     --------
-    >>> import numpy as np
-    >>> from psi_io.psi_io import interpolate_point_from_2d_slice
-    >>> x = np.linspace(0.0, 1.0, 11)
-    >>> y = np.linspace(0.0, 1.0, 11)
-    >>> f = np.outer(x, y)
-    >>> float(interpolate_point_from_2d_slice(0.5, 0.5, x, y, f))
-    0.25
+    >>> from psi_io.psi_io import _iter_slabs
+    >>> list(_iter_slabs((5, 2, 2), itemsize=8, slab_nbytes=64))
+    [slice(0, 2, None), slice(2, 4, None), slice(4, 5, None)]
+    >>> list(_iter_slabs((5, 2, 2), itemsize=8, slab_nbytes=64, chunks=(4, 2, 2)))
+    [slice(0, 2, None), slice(2, 4, None), slice(4, 5, None)]
+    >>> list(_iter_slabs((5, 2, 2), itemsize=8, slab_nbytes=128, chunks=(2, 2, 2)))
+    [slice(0, 4, None), slice(4, 5, None)]
     """
-    values = np.transpose(values)
-    if scalex[0] > scalex[-1]:
-        scalex, values = scalex[::-1], values[::-1, :]
-    if scaley[0] > scaley[-1]:
-        scaley, values = scaley[::-1], values[:, ::-1]
-    xi_, yi_ = int(np.searchsorted(scalex, xi)), int(np.searchsorted(scaley, yi))
-    sx_, sy_ = slice(*_check_index_ranges(len(scalex), xi_, xi_)), slice(*_check_index_ranges(len(scaley), yi_, yi_))
-    return _np_bilinear_interpolation([xi, yi], [scalex[sx_], scaley[sy_]], values[(sx_, sy_)])
-
-
-def _rdhdf_nd(hdf_filename: str,
-              dimensionality: int
-              ) -> Tuple[np.ndarray, ...]:
-    """Read an n-dimensional PSI-style HDF file; shared implementation for `rdhdf_1d/2d/3d`.
+    if not shape:
+        yield ()
+        return
+    plane_nbytes = itemsize * math.prod(shape[1:])
+    step = max(1, slab_nbytes // max(1, plane_nbytes))
+    if chunks and step >= chunks[0]:
+        step -= step % chunks[0]
+    for start in range(0, shape[0], step):
+        yield slice(start, min(start + step, shape[0]))
+
+
+def _stream_convert(ifile: Path,
+                    ofile: Path,
+                    datasets: Sequence[Tuple[str, str]],
+                    slab_nbytes: int = CONVERT_SLAB_NBYTES,
+                    strict: bool = True,
+                    **storage
+                    ) -> Path:
+    """Copy datasets from *ifile* into a newly created *ofile*, streaming by hyperslab.
 
     Parameters
     ----------
-    hdf_filename : PathLike
-        The path to the HDF5 (.h5) or HDF4 (.hdf) file to read.
-    dimensionality : int
-        The expected number of dimensions of the dataset.
+    ifile : Path
+        The source HDF file.
+    ofile : Path
+        The output HDF file; it is created (or truncated) and kept open until
+        every dataset has been written.
+    datasets : Sequence[tuple[str, str]]
+        Pairs of (source, output) dataset identifiers.
+    slab_nbytes : int, optional
+        The approximate size (in bytes) of the hyperslab held in memory;
+        see :func:`_copy_by_slab`.
+    strict : bool, optional
+        See :func:`write_hdf_data`.
+    **storage
+        HDF5 storage options (``chunks``, ``compression``, ...);
+        see :func:`write_hdf_data`.
 
     Returns
     -------
-    out : tuple[np.ndarray, ...]
-        The coordinate scales for each dimension followed by the data array.
+    out : Path
+        The path to the written output file.
+    """
+    if ifile.resolve() == ofile.resolve():
+        raise ValueError(f"Input and output files must differ; got {ifile} for both")
+    meta = {m.name: m for m in read_hdf_meta(ifile)}
+    if ofile.suffix == '.hdf' and storage.get('compression') is not None:
+        # a compressed HDF4 dataset cannot be written by hyperslab, so it is read whole
+        for dataid, _ in datasets:
+            nbytes = int(np.prod(meta[dataid].shape)) * np.dtype(meta[dataid].type).itemsize
+            if nbytes > slab_nbytes:
+                raise ValueError(f"Dataset {dataid!r} of {ifile} ({nbytes} bytes) exceeds slab_nbytes "
+                                 f"({slab_nbytes} bytes); a compressed HDF4 dataset must be written "
+                                 f"in one piece, so raise slab_nbytes or drop compression")
+    select = _select_h4_dataset if ifile.suffix == '.hdf' else _select_h5_dataset
+    create = _create_h4_dataset if ofile.suffix == '.hdf' else _create_h5_dataset
+    with _dispatch_by_ext(ifile, _open_h4, _open_h5) as src, \
+            _dispatch_by_ext(ofile, _create_h4, _create_h5) as dst:
+        for dataid, outid in datasets:
+            dmeta = meta[dataid]
+            source, scales = select(src, dataid)
+            with create(dst, outid, dmeta.shape, dmeta.type, scales,
+                        attrs=dmeta.attr, strict=strict, **storage) as target:
+                if create is _create_h4_dataset and storage.get('compression') is not None:
+                    _write_h4_sds(target, source[...], compressed=True)
+                else:
+                    _copy_by_slab(source, target, dmeta.shape, np.dtype(dmeta.type).itemsize,
+                                  slab_nbytes=slab_nbytes, chunks=getattr(target, 'chunks', None))
+    return ofile
 
-    Raises
-    ------
-    ValueError
-        If the dataset dimensionality does not match ``dimensionality``.
+
+def _write_h4_data(ifile: PathLike, /,
+                   data: np.ndarray,
+                   *scales: Sequence[np.ndarray],
+                   dataset_id: Optional[str] = None,
+                   sync_dtype: bool = False,
+                   strict: bool = True,
+                   chunks: ChunkType = None,
+                   compression: Union[Literal['gzip', 'lzf'], int, None] = None,
+                   compression_opts: Optional[int] = None,
+                   shuffle: bool = False,
+                   fletcher32: bool = False,
+                   pyramid: int = 0,
+                   pyramid_mesh: Optional[MeshLike] = None,
+                   swmr: bool = False,
+                   **kwargs) -> Path:
+    """HDF4 (.hdf) version of :func:`write_hdf_data`.
 
     Examples
     --------
-    >>> from psi_io.psi_io import _rdhdf_nd
-    >>> from psi_data import fetch_mas_data
-    >>> r, t, p, f = _rdhdf_nd(fetch_mas_data().cor_br, dimensionality=3)
-    >>> f.shape
-    (299, 142, 255)
+    >>> import tempfile, numpy as np
+    >>> from pathlib import Path
+    >>> from psi_io.psi_io import _write_h4_data, _read_h4_data
+    >>> f = np.ones((10,), dtype=np.float32)
+    >>> x = np.linspace(0.0, 1.0, 10, dtype=np.float32)
+    >>> with tempfile.TemporaryDirectory() as d:  # doctest: +SKIP
+    ...     _write_h4_data(Path(d) / "out.hdf", f, x)  # doctest: +SKIP
+    ...     data, *_ = _read_h4_data(Path(d) / "out.hdf")  # doctest: +SKIP
+    ...     data.shape  # doctest: +SKIP
+    (10,)
     """
-    f, *scales = read_hdf_data(hdf_filename)
-    if f.ndim != dimensionality:
-        err = f'Expected {dimensionality}D data, got {f.ndim}D data instead.'
-        raise ValueError(err)
-    scales = scales or (np.empty(0) for _ in f.shape)
-    return *scales, f
+    if pyramid:
+        raise ValueError("Pyramid levels are only supported for HDF5 (.h5) files")
+    if swmr:
+        raise ValueError("SWMR is only supported for HDF5 (.h5) files")
+    with _create_h4(ifile) as h4file:
+        with _create_h4_dataset(h4file, dataset_id or PSI_DATA_ID['h4'], data.shape, data.dtype,
+                                scales, attrs=kwargs, sync_dtype=sync_dtype, strict=strict,
+                                chunks=chunks, compression=compression, compression_opts=compression_opts,
+                                shuffle=shuffle, fletcher32=fletcher32) as sds_id:
+            _write_h4_sds(sds_id, data, compressed=compression is not None)
 
+    return ifile
 
-def _wrhdf_nd(hdf_filename: str,
-              data: np.ndarray,
-              *scales: Sequence[Union[np.ndarray, None]],
-              dimensionality: int,
-              sync_dtype: bool = True,
-              **kwargs
-              ) -> None:
-    """Write an n-dimensional PSI-style HDF file; shared implementation for `wrhdf_1d/2d/3d`.
-
-    Parameters
-    ----------
-    hdf_filename : PathLike
-        The path to the HDF5 (.h5) or HDF4 (.hdf) file to write.
-    data : np.ndarray
-        The data array to write.
-    *scales : Sequence[np.ndarray | None]
-        The scales (coordinate arrays) for each dimension.
-    dimensionality : int
-        The expected number of dimensions of the data array.
-    sync_dtype : bool
-        If True, scale dtypes are cast to match the data array dtype.
-    **kwargs
-        Additional keyword arguments forwarded to :func:`write_hdf_data`.
 
-    Raises
-    ------
-    ValueError
-        If the data dimensionality does not match ``dimensionality``.
+def _write_h5_data(ifile: PathLike, /,
+                   data: np.ndarray,
+                   *scales: Sequence[np.ndarray],
+                   dataset_id: Optional[str] = None,
+                   sync_dtype: bool = False,
+                   strict: bool = True,
+                   chunks: ChunkType = None,
+                   compression: Union[Literal['gzip', 'lzf'], int, None] = None,
+                   compression_opts: Optional[int] = None,
+                   shuffle: bool = False,
+                   fletcher32: bool = False,
+                   pyramid: int = 0,
+                   pyramid_mesh: Optional[MeshLike] = None,
+                   swmr: bool = False,
+                   **kwargs) -> Path:
+    """HDF5 (.h5) version of :func:`write_hdf_data`.
 
     Examples
     --------
     >>> import tempfile, numpy as np
     >>> from pathlib import Path
-    >>> from psi_io.psi_io import _wrhdf_nd
-    >>> from psi_io import read_hdf_data
-    >>> f = np.ones((10, 20, 30), dtype=np.float32)
-    >>> r = np.linspace(1.0, 5.0, 10, dtype=np.float32)
-    >>> t = np.linspace(0.0, 3.14, 20, dtype=np.float32)
-    >>> p = np.linspace(0.0, 6.28, 30, dtype=np.float32)
+    >>> from psi_io.psi_io import _write_h5_data, _read_h5_data
+    >>> f = np.ones((10,), dtype=np.float32)
+    >>> x = np.linspace(0.0, 1.0, 10, dtype=np.float32)
     >>> with tempfile.TemporaryDirectory() as d:
-    ...     _wrhdf_nd(Path(d) / "out.h5", f, r, t, p, dimensionality=3)
-    ...     data, *_ = read_hdf_data(Path(d) / "out.h5")
+    ...     _ = _write_h5_data(Path(d) / "out.h5", f, x)
+    ...     data, *_ = _read_h5_data(Path(d) / "out.h5")
     ...     data.shape
-    (10, 20, 30)
+    (10,)
     """
-    if data.ndim != dimensionality:
-        err = f'Expected {dimensionality}D data, got {data.ndim}D data instead.'
-        raise ValueError(err)
-    write_hdf_data(hdf_filename, data, *scales, sync_dtype=sync_dtype, **kwargs)
+    dataset_id = dataset_id or PSI_DATA_ID['h5']
+    with _create_h5(ifile, swmr=swmr) as h5file:
+        # In SWMR mode no object can be created once writing has started: the dataset
+        # (and its overview levels) are created first, and its values written last.
+        with _create_h5_dataset(h5file, dataset_id, data.shape, data.dtype,
+                                scales, attrs=kwargs, data=None if swmr else data, sync_dtype=sync_dtype,
+                                strict=strict, chunks=chunks, compression=compression,
+                                compression_opts=compression_opts, shuffle=shuffle, fletcher32=fletcher32):
+            pass
+        if pyramid:
+            _write_h5_pyramid(h5file, dataset_id, data, scales, pyramid,
+                              mesh=kwargs.get('mesh', 'main') if pyramid_mesh is None else pyramid_mesh,
+                              attrs=kwargs, sync_dtype=sync_dtype, strict=strict, chunks=chunks,
+                              compression=compression, compression_opts=compression_opts,
+                              shuffle=shuffle, fletcher32=fletcher32)
+        if swmr:
+            h5file.swmr_mode = True
+            h5file[dataset_id][...] = data
 
+    return ifile
 
-def _get_scales_nd_h5(ifile: Union[ Path, str], /,
-                      dimensionality: int,
-                      dataset_id: Optional[str] = None,
-                      ):
-    """HDF5 (.h5) version of :func:`get_scales_1d` / :func:`get_scales_2d` / :func:`get_scales_3d`.
 
-    Parameters
-    ----------
-    ifile : PathLike
-        The path to the HDF5 (.h5) file.
-    dimensionality : int
-        The expected number of dimensions of the dataset.
-    dataset_id : str, optional
-        The identifier of the dataset whose scales are read.
-        If ``None``, the default PSI dataset (``'Data'``) is used.
+def _write_h4_meta(ifile: PathLike, /,
+                   meta: Optional[Mapping[str, Mapping[str, Any]]] = None,
+                   **kwargs) -> Path:
+    """HDF4 (.hdf) version of :func:`write_hdf_meta`."""
+    metadata = dict(meta or {})
+    _HANDLE_POOL.evict(ifile)
+    _META_CACHE.evict(ifile)
+    h4file = h4.SD(str(ifile), h4.SDC.READ | h4.SDC.WRITE)
 
-    Returns
-    -------
-    out : tuple[np.ndarray, ...]
-        The coordinate scale arrays for each dimension.
+    _set_h4_attrs(h4file, kwargs)
+    for key, value in metadata.items():
+        _set_h4_attrs(h4file.select(key), dict(value))
+    h4file.end()
 
-    Raises
-    ------
-    ValueError
-        If the dataset dimensionality does not match ``dimensionality``.
-    ValueError
-        If any dimension has no associated scale.
+    return ifile
 
-    Examples
-    --------
-    >>> from psi_io.psi_io import _get_scales_nd_h5
-    >>> from psi_data import fetch_mas_data
-    >>> r, t, p = _get_scales_nd_h5(fetch_mas_data().cor_br, dimensionality=3)
-    >>> r.shape, t.shape, p.shape
-    ((255,), (142,), (299,))
+
+def _set_h4_attrs(target, attrs: Mapping[str, Any]) -> None:
+    """Set the attributes *attrs* on an HDF4 file (global attributes) or SDS."""
+    for k, v in attrs.items():
+        npv = np.asarray(v)
+        attr_ = target.attr(k)
+        val = npv.tolist()
+        if isinstance(val, bytes):
+            val = val.decode('latin-1')
+        attr_.set(_dtype_to_sdc(npv.dtype), val)
+
+
+def _write_h5_meta(ifile: PathLike, /,
+                   meta: Optional[Mapping[str, Mapping[str, Any]]] = None,
+                   **kwargs) -> Path:
+    """HDF5 (.h5) version of :func:`write_hdf_meta`."""
+    metadata = dict(meta or {})
+    _HANDLE_POOL.evict(ifile)
+    _META_CACHE.evict(ifile)
+    with h5.File(ifile, "r+") as h5file:
+        if kwargs:
+            h5file.attrs.update(**kwargs)
+        for key, value in metadata.items():
+            h5file[key].attrs.update(**dict(value))
+    return ifile
+
+
+def _read_h5_sequences(ifile: PathLike, /,
+                       dataset_id: Optional[str] = None,
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+    """HDF5 (.h5) implementation of :func:`read_hdf_sequences`."""
+    with _open_h5(ifile) as hdf:
+        dataset_id = dataset_id or PSI_DATA_ID['h5']
+        scales = _h5_sequence_scales(hdf[dataset_id])
+        if scales is None:
+            raise ValueError(f"{hdf.filename} holds a dataset {dataset_id!r} that is not a sequence dataset")
+        return tuple(scale[:] for scale in scales)
+
+
+def _h5_sequence_scales(dataset: h5.Dataset) -> Optional[Tuple[h5.Dataset, h5.Dataset]]:
+    """Return the sequence and time scales of a sequence dataset, or ``None`` for any other dataset.
+
+    A sequence dataset (see :class:`HdfSequenceWriter`) is resizable along its leading
+    axis, whose dimension (the last one in PSI order) is labelled :data:`SEQUENCE_SCALE_ID`.
+    The scales are found through that dimension, whatever the names of their datasets.
     """
-    with h5.File(ifile, 'r') as hdf:
-        data = hdf[dataset_id or PSI_DATA_ID['h5']]
-        ndim = data.ndim
-        if ndim != dimensionality:
-            err = f'Expected {dimensionality}D data, got {ndim}D data instead.'
-            raise ValueError(err)
-        scales = []
-        for dim in data.dims:
-            if dim:
-                scales.append(dim[0][:])
-            else:
-                raise ValueError(f'Dimension has no scale associated with it.')
-    return tuple(scales)
+    if not dataset.ndim or dataset.maxshape[0] is not None:
+        return None
+    dim = dataset.dims[dataset.ndim - 1]
+    if dim.label != SEQUENCE_SCALE_ID or len(dim) != 2:
+        return None
+    return dim[0], dim[1]
 
 
-def _get_scales_nd_h4(ifile: Union[ Path, str], /,
-                      dimensionality: int,
-                      dataset_id: Optional[str] = None,
-                      ):
-    """HDF4 (.hdf) version of :func:`get_scales_1d` / :func:`get_scales_2d` / :func:`get_scales_3d`.
+def _refresh_h5_dataset(dataset: h5.Dataset) -> None:
+    """Refresh *dataset* and the scales attached to it, to see the data flushed by an SWMR writer.
 
-    Parameters
-    ----------
-    ifile : PathLike
-        The path to the HDF4 (.hdf) file.
-    dimensionality : int
-        The expected number of dimensions of the dataset.
-    dataset_id : str, optional
-        The identifier of the dataset whose scales are read.
-        If ``None``, the default PSI dataset (``'Data-Set-2'``) is used.
+    A file opened more than once in a process shares one view of its metadata, so
+    that a newly opened SWMR handle may still report the extents of an older one.
+    """
+    dataset.refresh()
+    for dim in dataset.dims:
+        for scale in dim.values():
+            scale.refresh()
 
-    Returns
-    -------
-    out : tuple[np.ndarray, ...]
-        The coordinate scale arrays for each dimension.
+
+def _pyramid_id(dataset_id: str, level: int) -> str:
+    """Return the path of overview *level* of *dataset_id* within an HDF5 file.
+
+    Examples
+    --------
+    >>> _pyramid_id('Data', 2)
+    'pyramid/Data/2/Data'
+    """
+    return f"{PYRAMID_GROUP}/{dataset_id}/{level}/{dataset_id}"
+
+
+def _level_dataset_id(ifile: PathLike, dataset_id: Optional[str], level: int) -> Optional[str]:
+    """Return the identifier of the dataset holding overview *level* of *dataset_id*.
 
     Raises
     ------
     ValueError
-        If the dataset dimensionality does not match ``dimensionality``.
-    ValueError
-        If any dimension has no associated scale.
+        If *level* is negative, or positive for an HDF4 file.
+    """
+    if level == 0:
+        return dataset_id
+    if level < 0:
+        raise ValueError(f"level must be non-negative; got {level}")
+    if Path(ifile).suffix != ".h5":
+        raise ValueError("Pyramid levels are only supported for HDF5 (.h5) files")
+    return _pyramid_id(dataset_id or PSI_DATA_ID['h5'], level)
+
+
+def _write_h5_pyramid(h5file: h5.File,
+                      dataid: str,
+                      data: np.ndarray,
+                      scales: Sequence[Union[np.ndarray, None]],
+                      levels: int,
+                      mesh: MeshLike = 'main',
+                      attrs: Optional[Mapping[str, Any]] = None,
+                      chunks: ChunkType = None,
+                      **kwargs):
+    """Write *levels* overview levels of *data* (and its scales) to an open HDF5 file.
+
+    Existing levels of *dataid* are removed first.  The scale datasets of each
+    level are labelled with their full path, so that each level is a regular,
+    self-contained PSI dataset.  Remaining keyword arguments are forwarded to
+    :func:`_create_h5_dataset`.
+    """
+    if isinstance(mesh, np.generic):
+        mesh = mesh.item()
+    flags = tuple(Mesh.parse(mesh, data.ndim))
+    root = f"{PYRAMID_GROUP}/{dataid}"
+    if root in h5file:
+        del h5file[root]
+    for level in range(1, levels + 1):
+        data = coarsen_array(data, flags, order='F').astype(data.dtype, copy=False)
+        scales = [None if scale is None else coarsen_scale(scale, half)
+                  for scale, half in zip(scales, flags)]
+        level_chunks = chunks
+        if isinstance(chunks, tuple):
+            level_chunks = tuple(min(c, n) for c, n in zip(chunks, data.shape))
+        group = h5file.require_group(f"{root}/{level}")
+        with _create_h5_dataset(group, dataid, data.shape, data.dtype, scales, attrs=attrs,
+                                data=data, chunks=level_chunks, **kwargs) as dataset:
+            for dim in dataset.dims:
+                if dim:
+                    dim.label = dim[0].name
+
+
+def _selection_shape(shape: Sequence[int], selection: Sequence[slice]) -> Tuple[int, ...]:
+    """Return the shape of ``array[selection]`` for an array of *shape* and a tuple of slices.
 
     Examples
     --------
-    >>> from psi_io.psi_io import _get_scales_nd_h4
-    >>> from psi_data import fetch_mas_data
-    >>> path = fetch_mas_data(hdf=4).cor_br  # doctest: +SKIP
-    >>> r, t, p = _get_scales_nd_h4(path, dimensionality=3)  # doctest: +SKIP
-    >>> r.shape  # doctest: +SKIP
-    (151,)
+    >>> _selection_shape((10, 5, 3), (slice(2, 7), slice(None)))
+    (5, 5, 3)
     """
-    hdf = h4.SD(str(ifile))
-    data = hdf.select(dataset_id or PSI_DATA_ID['h4'])
-    ndim = data.info()[1]
-    if ndim != dimensionality:
-        err = f'Expected {dimensionality}D data, got {ndim}D data instead.'
-        raise ValueError(err)
-    scales = []
-    for k_, v_ in reversed(data.dimensions(full=1).items()):
-        if v_[3]:
-            scales.append(hdf.select(k_)[:])
-        else:
-            raise ValueError('Dimension has no scale associated with it.')
-    return tuple(scales)
+    sizes = tuple(len(range(*s.indices(n))) for s, n in zip(selection, shape))
+    return sizes + tuple(shape[len(sizes):])
 
 
-def _read_h5_meta(ifile: PathLike, /,
-                  dataset_id: Optional[str] = None
-                  ):
-    """HDF5 (.h5) version of :func:`read_hdf_meta`.
+def _resolve_out(out: Union[np.ndarray, BufferPool, None],
+                 shape: Sequence[int],
+                 dtype: Any,
+                 strict: bool = False) -> np.ndarray:
+    """Return the array to read *shape* into – *out* itself, an array acquired from the pool *out*,
+    or a new array of *dtype* if *out* is ``None``.
 
-    Examples
-    --------
-    >>> from psi_io.psi_io import _read_h5_meta
-    >>> from psi_data import fetch_mas_data
-    >>> meta = _read_h5_meta(fetch_mas_data().cor_br)
-    >>> meta[0].name
-    'Data'
+    Raises
+    ------
+    ValueError
+        If *out* is an array whose shape is not *shape* – or, with *strict*, whose
+        dtype is not *dtype*.
     """
-    with h5.File(ifile, 'r') as hdf:
-        # Raises KeyError if ``dataset_id`` not found
-        # If ``dataset_id`` is None, get all non-scale :class:`h5.Dataset`s
-        if dataset_id:
-            datasets = (dataset_id, hdf[dataset_id]),
-        else:
-            datasets = ((k, v) for k, v in hdf.items() if not v.is_scale)
+    shape = tuple(shape)
+    if out is None:
+        return np.empty(shape, dtype)
+    if isinstance(out, BufferPool):
+        return out.acquire(shape, dtype)
+    if out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, but the selection has shape {shape}")
+    if strict and out.dtype != np.dtype(dtype):
+        raise ValueError(f"out has dtype {out.dtype}, but dtype {np.dtype(dtype)} was requested")
+    return out
 
-        # One should avoid multiple calls to ``dimproxy[0]`` – *e.g.* ``dimproxy[0].dtype`` and
-        # ``dimproxy[0].shape`` – because the __getitem__ method creates and returns a new
-        # :class:`~h5.DimensionProxy` object each time it is called. [Does this matter? Probably not.]
-        return [HdfDataMeta(name=k,
-                            type=v.dtype,
-                            shape=v.shape,
-                            # Exclude HDF5 dimension-scale bookkeeping attributes
-                            # (``DIMENSION_LIST`` / ``DIMENSION_LABELS``).  These are
-                            # managed automatically by ``attach_scale`` and hold object
-                            # references that are not real user attributes; surfacing
-                            # them breaks round-trips such as :func:`convert` to HDF4.
-                            attr={ak: av for ak, av in v.attrs.items()
-                                  if not ak.startswith("DIMENSION")},
-                            scales=[HdfScaleMeta(name=dimproxy.label,
-                                                 type=dim.dtype,
-                                                 shape=dim.shape,
-                                                 attr=dict(dim.attrs),
-                                                 imin=dim[0],
-                                                 imax=dim[-1])
-                                    for dimproxy in v.dims if dimproxy and (dim := dimproxy[0])])
-                for k, v in datasets]
 
+_StorageLayout = namedtuple('_StorageLayout', ['shape', 'dtype', 'chunks', 'compressed', 'cached'])
+"""Storage layout of a dataset, as seen by the read planner (see :func:`_storage_layout`)"""
 
-def _read_h4_meta(ifile: PathLike, /,
-                  dataset_id: Optional[str] = None
-                  ):
-    """HDF4 (.hdf) version of :func:`read_hdf_meta`.
 
-    Examples
-    --------
-    >>> from psi_io.psi_io import _read_h4_meta
-    >>> from psi_data import fetch_mas_data
-    >>> meta = _read_h4_meta(fetch_mas_data(hdf=4).cor_br)  # doctest: +SKIP
-    >>> meta[0].name  # doctest: +SKIP
-    'Data-Set-2'
-    """
-    hdf = h4.SD(str(ifile))
-    # Raises HDF4Error if ``dataset_id`` not found
-    # If ``dataset_id`` is None, get all non-scale :class:`pyhdf.SD.SDS`s
-    if dataset_id:
-        datasets = (dataset_id, hdf.select(dataset_id)),
-    else:
-        datasets = ((k, hdf.select(k)) for k in hdf.datasets().keys() if not hdf.select(k).iscoordvar())
-
-    # The inner list comprehension differs in approach from the HDF5 version because calling
-    # ``dimensions(full=1)`` on an :class:`~pyhdf.SD.SDS` returns a dictionary of dimension
-    # dataset identifiers (keys) and tuples containing dimension metadata (values). Even if no
-    # coordinate-variable datasets are defined, this dictionary is still returned; the only
-    # indication that the datasets returned do not exist is that the "type" field (within the
-    # tuple of dimension metadata) is set to 0.
-
-    # Also, one cannot avoid multiple calls to ``hdf.select(k_)`` within the inner list comprehension
-    # because :class:`~pyhdf.SD.SDS` objects do not define a ``__bool__`` method, and the fallback
-    # behavior of Python is to assess if the __len__ method returns a non-zero value (which, in
-    # this case, always returns 0).
-    return [HdfDataMeta(name=k,
-                        type=SDC_TYPE_CONVERSIONS[v.info()[3]],
-                        shape=_cast_shape_tuple(v.info()[2]),
-                        attr=v.attributes(),
-                        scales=[HdfScaleMeta(name=k_,
-                                             type=SDC_TYPE_CONVERSIONS[v_[3]],
-                                             shape=_cast_shape_tuple(v_[0]),
-                                             attr=hdf.select(k_).attributes(),
-                                             imin=hdf.select(k_)[0],
-                                             imax=hdf.select(k_)[-1])
-                                for k_, v_ in v.dimensions(full=1).items() if v_[3]])
-            for k, v in datasets]
+_ReadCost = namedtuple('_ReadCost', ['nbytes', 'nchunks', 'nrequests', 'cost'])
+"""Estimated I/O of a read strategy (see :class:`ReadPlan`)"""
 
 
-def _read_h5_rtp(ifile: Union[ Path, str], /):
-    """HDF5 (.h5) version of :func:`read_rtp_meta`.
+def _storage_layout(data) -> _StorageLayout:
+    """
+    Return the storage layout of an HDF5 dataset, an HDF4 SDS or an in-memory array.
+
+    The layout holds the shape and dtype of *data* (in storage order), its chunk
+    shape (``None`` if contiguous), whether its chunks are filtered (*e.g.*
+    compressed), and whether it is already in memory (NumPy arrays, including
+    memory maps).  HDF4 SDS cannot be chunked through :py:mod:`pyhdf`; a compressed
+    SDS is decompressed as a whole.
 
     Examples
     --------
-    >>> from psi_io.psi_io import _read_h5_rtp
-    >>> from psi_data import fetch_mas_data
-    >>> meta = _read_h5_rtp(fetch_mas_data().cor_br)
-    >>> sorted(meta.keys())
-    ['p', 'r', 't']
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _storage_layout
+    >>> _storage_layout(np.zeros((2, 3), np.float32))
+    _StorageLayout(shape=(2, 3), dtype=dtype('float32'), chunks=None, compressed=False, cached=True)
     """
-    with h5.File(ifile, 'r') as hdf:
-        return {k: (hdf[v].size, hdf[v][0], hdf[v][-1])
-                for k, v in zip('rtp', PSI_SCALE_ID['h5'])}
+    if isinstance(data, h5.Dataset):
+        compressed = data.id.get_create_plist().get_nfilters() > 0
+        return _StorageLayout(data.shape, data.dtype, data.chunks, compressed, False)
+    if isinstance(data, np.ndarray):
+        return _StorageLayout(data.shape, data.dtype, None, False, True)
+    _, _, dims, sdc_type, _ = data.info()
+    try:
+        compressed = data.getcompress()[0] != h4.SDC.COMP_NONE
+    except h4.HDF4Error:
+        compressed = False
+    return _StorageLayout(_cast_shape_tuple(dims), SDC_TYPE_CONVERSIONS[sdc_type], None, compressed, False)
 
 
-def _read_h4_rtp(ifile: Union[ Path, str], /):
-    """HDF4 (.hdf) version of :func:`read_rtp_meta`.
+def _read_h5_layout(ifile: PathLike, /, dataset_id: Optional[str] = None) -> _StorageLayout:
+    """HDF5 (.h5) reader of the :func:`_storage_layout` of a dataset."""
+    with _open_h5(ifile) as hdf:
+        return _storage_layout(hdf[dataset_id or PSI_DATA_ID['h5']])
 
-    Examples
-    --------
-    >>> from psi_io.psi_io import _read_h4_rtp
-    >>> from psi_data import fetch_mas_data
-    >>> meta = _read_h4_rtp(fetch_mas_data(hdf=4).cor_br)  # doctest: +SKIP
-    >>> sorted(meta.keys())  # doctest: +SKIP
-    ['p', 'r', 't']
+
+def _read_h4_layout(ifile: PathLike, /, dataset_id: Optional[str] = None) -> _StorageLayout:
+    """HDF4 (.hdf) reader of the :func:`_storage_layout` of a dataset."""
+    with _open_h4(ifile) as hdf:
+        return _storage_layout(hdf.select(dataset_id or PSI_DATA_ID['h4']))
+
+
+def _cached_layout(ifile: PathLike, dataset_id: Optional[str] = None, swmr: bool = False) -> _StorageLayout:
+    """Return the :func:`_storage_layout` of a dataset through the process-wide metadata cache.
+
+    With *swmr*, the layout is read afresh from a file opened for SWMR reading.
     """
-    hdf = h4.SD(str(ifile))
-    return {k: (hdf.select(v).info()[2], hdf.select(v)[0], hdf.select(v)[-1])
-            for k, v in zip('ptr', PSI_SCALE_ID['h4'])}
+    if swmr:
+        return _dispatch_by_ext(ifile, _read_h4_layout, _read_h5_layout, dataset_id=dataset_id, swmr_read=True)
+    return _META_CACHE.get(ifile, ('layout', dataset_id),
+                           lambda: _dispatch_by_ext(ifile, _read_h4_layout, _read_h5_layout,
+                                                    dataset_id=dataset_id, pooled=True))
 
 
-def _read_h5_data(ifile: PathLike, /,
-                  dataset_id: Optional[str] = None,
-                  return_scales: bool = True,
-                  ) -> Union[np.ndarray, Tuple[np.ndarray]]:
-    """HDF5 (.h5) version of :func:`read_hdf_data`.
+def _chunk_shape(layout: _StorageLayout) -> Optional[Tuple[int, ...]]:
+    """Return the shape of the unit a dataset is read in – its chunks, or all of it if compressed – or ``None``."""
+    if layout.chunks is None and layout.compressed:
+        return tuple(layout.shape)
+    return layout.chunks
+
+
+def _read_cost(nbytes: int, nchunks: int, nrequests: int, npoints: int = 0) -> _ReadCost:
+    """Return the :class:`_ReadCost` of reading *nbytes* in *nrequests* (and *npoints* point selections)."""
+    cost = nbytes + nrequests*READ_REQUEST_NBYTES + npoints*READ_POINT_NBYTES
+    return _ReadCost(int(nbytes), int(nchunks), int(nrequests), int(cost))
+
+
+def _index_cost(layout: _StorageLayout, indices: Sequence[np.ndarray]) -> _ReadCost:
+    """
+    Estimate the I/O of reading the outer product of sorted, per-axis *indices* (in storage order).
+
+    Chunked (or compressed) datasets are read a whole chunk at a time, once per
+    chunk touched.  Contiguous datasets are read as runs of consecutive elements:
+    a run spans the selected range of the innermost partially selected axis, and
+    every fully selected axis inside it.
 
     Examples
     --------
-    >>> from psi_io.psi_io import _read_h5_data
-    >>> from psi_data import fetch_mas_data
-    >>> data, r, t, p = _read_h5_data(fetch_mas_data().cor_br)
-    >>> data.shape
-    (299, 142, 255)
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _StorageLayout, _index_cost
+    >>> layout = _StorageLayout((4, 10), np.dtype('f4'), None, False, False)
+    >>> _index_cost(layout, [np.arange(1, 3), np.arange(10)])[:3]
+    (80, 0, 1)
+    >>> _index_cost(layout, [np.arange(1, 3), np.arange(0, 10, 2)])[:3]
+    (40, 0, 10)
+    >>> _index_cost(layout._replace(chunks=(2, 5)), [np.arange(1, 3), np.arange(0, 10, 2)])[:3]
+    (160, 4, 4)
     """
-    with h5.File(ifile, 'r') as hdf:
-        data = hdf[dataset_id or PSI_DATA_ID['h5']]
-        dataset = data[:]
-        if return_scales:
-            scales = [dim[0][:] for dim in data.dims if dim]
-            return dataset, *scales
-        return dataset
+    if any(not len(idx) for idx in indices):
+        return _read_cost(0, 0, 0)
+    chunks = _chunk_shape(layout)
+    if chunks is not None:
+        nchunks = math.prod(len(np.unique(idx // c)) for idx, c in zip(indices, chunks))
+        return _read_cost(nchunks*math.prod(chunks)*layout.dtype.itemsize, nchunks, nchunks)
+    nrequests, merged = 1, True
+    for idx, size in zip(reversed(indices), reversed(layout.shape)):
+        nrequests *= 1 + int(np.count_nonzero(np.diff(idx) != 1)) if merged else len(idx)
+        merged = merged and len(idx) == size
+    return _read_cost(math.prod(len(idx) for idx in indices)*layout.dtype.itemsize, 0, nrequests)
+
+
+def _window_cost(layout: _StorageLayout, starts: np.ndarray, stops: np.ndarray) -> _ReadCost:
+    """Estimate the I/O of reading the ``(k, ndim)`` windows ``[starts, stops)`` (in storage order) one by one.
 
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _StorageLayout, _window_cost
+    >>> layout = _StorageLayout((4, 10), np.dtype('f4'), None, False, False)
+    >>> _window_cost(layout, [[0, 0], [2, 3]], [[1, 10], [4, 5]])[:3]
+    (56, 0, 3)
+    """
+    starts, stops = np.atleast_2d(starts), np.atleast_2d(stops)
+    lengths = stops - starts
+    chunks = _chunk_shape(layout)
+    if chunks is not None:
+        chunks = np.asarray(chunks)
+        nchunks = int(np.prod((stops - 1)//chunks - starts//chunks + 1, axis=1).sum())
+        return _read_cost(nchunks*math.prod(chunks)*layout.dtype.itemsize, nchunks, nchunks)
+    nrequests = np.ones(len(starts), dtype=np.int64)
+    merged = np.ones(len(starts), dtype=bool)
+    for axis in reversed(range(lengths.shape[1])):
+        nrequests *= np.where(merged, 1, lengths[:, axis])
+        merged &= lengths[:, axis] == layout.shape[axis]
+    return _read_cost(int(np.prod(lengths, axis=1).sum())*layout.dtype.itemsize, 0, int(nrequests.sum()))
+
+
+def _points_cost(layout: _StorageLayout, coords: np.ndarray) -> _ReadCost:
+    """Estimate the I/O of reading the distinct ``(k, ndim)`` element *coords* (in storage order) as a point selection."""
+    chunks = _chunk_shape(layout)
+    if chunks is None:
+        return _read_cost(len(coords)*layout.dtype.itemsize, 0, len(coords), len(coords))
+    grid = tuple(-(-n // c) for n, c in zip(layout.shape, chunks))
+    nchunks = len(np.unique(np.ravel_multi_index(tuple((coords // chunks).T), grid))) if len(coords) else 0
+    return _read_cost(nchunks*math.prod(chunks)*layout.dtype.itemsize, nchunks, nchunks, len(coords))
+
+
+def _choose_plan(costs: Dict[str, _ReadCost]) -> 'ReadPlan':
+    """Return the :class:`ReadPlan` of the cheapest of *costs* (the first one listed, on ties)."""
+    strategy = min(costs, key=lambda name: costs[name].cost)
+    return ReadPlan(strategy, *costs[strategy], dict(costs))
+
+
+def _union_blocks(indices: np.ndarray) -> List[slice]:
+    """Cover sorted *indices* with hyperslabs, merging runs separated by at most :data:`UNION_MERGE_GAP` indices."""
+    runs = np.split(indices, np.flatnonzero(np.diff(indices) > UNION_MERGE_GAP + 1) + 1)
+    return [slice(int(run[0]), int(run[-1]) + 1) for run in runs]
+
+
+def _plan_selection(layout: _StorageLayout, selection: tuple) -> 'ReadPlan':
+    """
+    Plan the read of ``data[selection]``, whose entries are slices or sorted index arrays.
 
-def _read_h4_data(ifile: PathLike, /,
-                  dataset_id: Optional[str] = None,
-                  return_scales: bool = True,
-                  ) -> Union[np.ndarray, Tuple[np.ndarray]]:
-    """HDF4 (.hdf) version of :func:`read_hdf_data`.
+    The candidate strategies are reading the selection as it is (``'hyperslab'``,
+    or ``'union'`` for index arrays, see :func:`_read_index_union`), and reading its
+    bounding box – if it holds at most :data:`CONVERT_SLAB_NBYTES` – and selecting
+    from it in memory (``'window'``).  Data already in memory are read from the
+    ``'cache'``.
 
     Examples
     --------
-    >>> from psi_io.psi_io import _read_h4_data
-    >>> from psi_data import fetch_mas_data
-    >>> data, *_ = _read_h4_data(fetch_mas_data(hdf=4).cor_br)  # doctest: +SKIP
-    >>> data.shape  # doctest: +SKIP
-    (299, 142, 255)
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _StorageLayout, _plan_selection
+    >>> layout = _StorageLayout((100, 100), np.dtype('f4'), None, False, False)
+    >>> _plan_selection(layout, (slice(None), slice(None, None, 2))).strategy
+    'window'
+    >>> _plan_selection(layout, (slice(None, None, 50), slice(None))).strategy
+    'hyperslab'
     """
-    hdf = h4.SD(str(ifile))
-    data = hdf.select(dataset_id or PSI_DATA_ID['h4'])
-    if return_scales:
-        out = (data[:],
-               *[hdf.select(k_)[:] for k_, v_ in reversed(data.dimensions(full=1).items()) if v_[3]])
+    if layout.cached:
+        return _choose_plan({'cache': _read_cost(0, 0, 0)})
+    selection = tuple(selection) + (slice(None),)*(len(layout.shape) - len(selection))
+    indices = [np.arange(*si.indices(size)) if isinstance(si, slice) else np.asarray(si)
+               for si, size in zip(selection, layout.shape)]
+    if all(isinstance(si, slice) for si in selection):
+        costs = {'hyperslab': _index_cost(layout, indices)}
     else:
-        out = data[:]
-    return out
+        covered = [idx if isinstance(si, slice) or not len(idx)
+                   else np.concatenate([np.arange(block.start, block.stop) for block in _union_blocks(idx)])
+                   for si, idx in zip(selection, indices)]
+        costs = {'union': _index_cost(layout, covered)}
+    if all(len(idx) for idx in indices):
+        window = [np.arange(idx[0], idx[-1] + 1) for idx in indices]
+        if (any(len(w) != len(idx) for w, idx in zip(window, indices))
+                and math.prod(len(w) for w in window)*layout.dtype.itemsize <= CONVERT_SLAB_NBYTES):
+            costs['window'] = _index_cost(layout, window)
+    return _choose_plan(costs)
 
 
-def _read_h5_by_index(ifile: PathLike, /,
-                      *xi: Union[int, Tuple[Union[int, None], Union[int, None]], None],
-                      dataset_id: Optional[str] = None,
-                      return_scales: bool = True,
-                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
-    """HDF5 (.h5) version of :func:`read_hdf_by_index`.
+def _window_selection(selection: tuple, shape: Sequence[int]) -> Tuple[tuple, tuple]:
+    """Split *selection* into its bounding window (of unit-step slices) and the selection within that window.
 
     Examples
     --------
-    >>> from psi_io.psi_io import _read_h5_by_index
-    >>> from psi_data import fetch_mas_data
-    >>> f, r, t, p = _read_h5_by_index(fetch_mas_data().cor_br, 0, None, None)
-    >>> f.shape
-    (299, 142, 1)
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _window_selection
+    >>> _window_selection((slice(2, None, 3), np.array([4, 6])), (10, 8))
+    ((slice(2, 9, None), slice(4, 7, None)), (slice(None, None, 3), array([0, 2])))
     """
-    with h5.File(ifile, 'r') as hdf:
-        data = hdf[dataset_id or PSI_DATA_ID['h5']]
-        if len(xi) != data.ndim:
-            raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
-        slices = [_parse_index_inputs(slice_input) for slice_input in xi]
-        dataset = data[tuple(reversed(slices))]
-        if return_scales:
-            scales = [dim[0][si] for si, dim in zip(slices, data.dims) if dim]
-            return dataset, *scales
-        return dataset
+    window, relative = [], []
+    for si, size in zip(selection, shape):
+        if isinstance(si, slice):
+            indices = range(*si.indices(size))
+            window.append(slice(indices.start, indices[-1] + 1))
+            relative.append(slice(None, None, indices.step))
+        else:
+            window.append(slice(int(si[0]), int(si[-1]) + 1))
+            relative.append(si - si[0])
+    return tuple(window), tuple(relative)
 
-def _read_h4_by_index(ifile: PathLike, /,
-                      *xi: Union[int, Tuple[Union[int, None], Union[int, None]], None],
-                      dataset_id: Optional[str] = None,
-                      return_scales: bool = True,
-                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
-    """HDF4 (.hdf) version of :func:`read_hdf_by_index`.
 
-    Examples
-    --------
-    >>> from psi_io.psi_io import _read_h4_by_index
-    >>> from psi_data import fetch_mas_data
-    >>> path = fetch_mas_data(hdf=4).cor_br  # doctest: +SKIP
-    >>> f, r, t, p = _read_h4_by_index(path, 0, None, None)  # doctest: +SKIP
-    >>> f.shape  # doctest: +SKIP
-    (299, 142, 1)
+def _planned_window(data, selection: tuple) -> Optional[Tuple[tuple, tuple]]:
+    """Return the :func:`_window_selection` of *selection* if the read planner reads it through its bounding box.
+
+    Selections of unit-step slices are read as they are, without planning.
     """
-    hdf = h4.SD(str(ifile))
-    data = hdf.select(dataset_id or PSI_DATA_ID['h4'])
-    ndim = data.info()[1]
-    if len(xi) != ndim:
-        raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
-    slices = [_parse_index_inputs(slice_input) for slice_input in xi]
-    dataset = data[tuple(reversed(slices))]
-    if return_scales:
-        scales = [hdf.select(k_)[si] for si, (k_, v_) in zip(slices, reversed(data.dimensions(full=1).items())) if v_[3]]
-        return dataset, *scales
-    return dataset
+    if all(isinstance(si, slice) and (si.step or 1) == 1 for si in selection):
+        return None
+    layout = _storage_layout(data)
+    if _plan_selection(layout, selection).strategy != 'window':
+        return None
+    selection = tuple(selection) + (slice(None),)*(len(layout.shape) - len(selection))
+    return _window_selection(selection, layout.shape)
 
 
-def _read_h5_by_value(ifile: PathLike, /,
-                      *xi: Union[float, Tuple[float, float], None],
-                      dataset_id: Optional[str] = None,
-                      return_scales: bool = True,
-                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
-    """HDF5 (.h5) version of :func:`read_hdf_by_value`.
+def _default_tile_shape(layout: _StorageLayout) -> Tuple[int, ...]:
+    """Return the tile shape (in PSI order) used by the read planner: the chunk shape, or :data:`INTERP_TILE_SIZE` cells."""
+    if layout.chunks is not None:
+        return tuple(reversed(layout.chunks))
+    return (INTERP_TILE_SIZE,)*len(layout.shape)
+
+
+def _corner_indices(cells: Sequence[Tuple[np.ndarray, np.ndarray]], shape: Sequence[int]) -> np.ndarray:
+    """Return the flat (C order) index, in a dataset of storage *shape*, of the :math:`2^n` corners of every cell.
+
+    *cells* are the per-axis ``(lower, upper)`` indices of :func:`_grid_cells`, in PSI
+    order; the result is a ``(2**n, m)`` array, corner ``k`` taking the upper index
+    along the axes whose bit is set in ``k``.
+    """
+    ndim = len(cells)
+    return np.stack([np.ravel_multi_index(tuple(cells[axis][(k >> axis) & 1] for axis in reversed(range(ndim))),
+                                          tuple(shape))
+                     for k in range(1 << ndim)])
+
+
+def _plan_positions(layout: _StorageLayout,
+                    scales: Sequence[np.ndarray],
+                    xi: np.ndarray,
+                    tile_shape: Optional[Union[int, Sequence[int]]] = None,
+                    points: bool = True) -> 'ReadPlan':
+    """
+    Plan the reads of a linear interpolation at the ``(m, n)`` positions *xi* (in PSI order).
+
+    The candidate strategies are reading the bounding box of the cells of the
+    positions (``'window'``), the tiles of *tile_shape* cells they occupy
+    (``'tiles'``, see :func:`_interpolate_by_tile`), the corners of their cells
+    with an HDF5 point selection (``'points'``, if *points*), and the whole dataset
+    (``'full'``).  Data already in memory are read from the ``'cache'``.
 
     Examples
     --------
-    >>> from psi_io.psi_io import _read_h5_by_value
-    >>> from psi_data import fetch_mas_data
-    >>> f, r, t, p = _read_h5_by_value(fetch_mas_data().cor_br, 15, None, None)
-    >>> f.shape
-    (299, 142, 2)
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _StorageLayout, _plan_positions
+    >>> layout = _StorageLayout((1000, 1000), np.dtype('f4'), None, False, False)
+    >>> x = np.arange(1000.0)
+    >>> _plan_positions(layout, (x, x), np.array([[1.5, 1.5], [998.5, 998.5]])).strategy
+    'points'
+    >>> _plan_positions(layout, (x, x), np.array([[1.5, 1.5], [2.5, 1.5]])).strategy
+    'window'
     """
-    with h5.File(ifile, 'r') as hdf:
-        data = hdf[dataset_id or PSI_DATA_ID['h5']]
-        if len(xi) != data.ndim:
-            raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
-        slices = []
-        for dimproxy, value in zip(data.dims, xi):
-            if dimproxy:
-                slices.append(_parse_value_inputs(dimproxy[0], value))
-            elif value is None:
-                slices.append(slice(None))
-            else:
-                raise ValueError("Cannot slice by value on dimension without scales")
-        dataset = data[tuple(reversed(slices))]
-        if return_scales:
-            scales = [dim[0][si] for si, dim in zip(slices, data.dims) if dim]
-            return dataset, *scales
-        return dataset
+    if layout.cached:
+        return _choose_plan({'cache': _read_cost(0, 0, 0)})
+    shape = np.asarray(layout.shape[::-1])
+    costs = {}
+    if len(xi):
+        cells, _, _ = _grid_cells(scales, xi, np.float64, bounds_error=False)
+        lower = np.stack([cell[0] for cell in cells], axis=-1)
+        upper = np.stack([cell[1] for cell in cells], axis=-1)
+        costs['window'] = _window_cost(layout, lower.min(axis=0)[::-1], upper.max(axis=0)[::-1] + 1)
+        tiles = np.broadcast_to(np.asarray(_default_tile_shape(layout) if tile_shape is None else tile_shape,
+                                           dtype=np.intp), shape.shape)
+        occupied = np.unique(lower // tiles, axis=0)
+        costs['tiles'] = _window_cost(layout, (occupied*tiles)[:, ::-1],
+                                      np.minimum((occupied + 1)*tiles + 1, shape)[:, ::-1])
+        if points:
+            corners = np.unique(_corner_indices(cells, layout.shape))
+            costs['points'] = _points_cost(layout, np.stack(np.unravel_index(corners, layout.shape), axis=-1))
+    else:
+        costs['window'] = _read_cost(0, 0, 0)
+    costs['full'] = _window_cost(layout, np.zeros_like(shape), shape[::-1])
+    return _choose_plan(costs)
 
 
-def _read_h4_by_value(ifile: PathLike, /,
-                      *xi: Union[float, Tuple[float, float], None],
-                      dataset_id: Optional[str] = None,
-                      return_scales: bool = True,
-                      ) -> Union[np.ndarray, Tuple[np.ndarray]]:
-    """HDF4 (.hdf) version of :func:`read_hdf_by_value`.
+def _h5_read_points(dataset: h5.Dataset, coords: np.ndarray, dtype: Any = None) -> np.ndarray:
+    """Read the elements of *dataset* at the ``(k, ndim)`` *coords* with a single HDF5 point selection.
+
+    With *dtype*, HDF5 converts the values as they are read.
 
     Examples
     --------
-    >>> from psi_io.psi_io import _read_h4_by_value
-    >>> from psi_data import fetch_mas_data
-    >>> path = fetch_mas_data(hdf=4).cor_br  # doctest: +SKIP
-    >>> f, r, t, p = _read_h4_by_value(path, 15, None, None)  # doctest: +SKIP
-    >>> f.shape  # doctest: +SKIP
-    (299, 142, 2)
+    >>> import tempfile, numpy as np, h5py
+    >>> from psi_io.psi_io import _h5_read_points
+    >>> with tempfile.TemporaryFile() as fp, h5py.File(fp, 'w') as hdf:
+    ...     dataset = hdf.create_dataset('Data', data=np.arange(12.0).reshape(3, 4))
+    ...     _h5_read_points(dataset, np.array([[0, 1], [2, 3]]))
+    array([ 1., 11.])
     """
-    hdf = h4.SD(str(ifile))
-    data = hdf.select(dataset_id or PSI_DATA_ID['h4'])
-    ndim = data.info()[1]
-    if len(xi) != ndim:
-        raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
-    slices = []
-    for (k_, v_), value in zip(reversed(data.dimensions(full=1).items()), xi):
-        if v_[3] != 0:
-            slices.append(_parse_value_inputs(hdf.select(k_), value))
-        elif value is None:
-            slices.append(slice(None))
-        else:
-            raise ValueError("Cannot slice by value on dimension without scales")
-    dataset = data[tuple(reversed(slices))]
-    if return_scales:
-        scales = [hdf.select(k_)[si] for si, (k_, v_) in zip(slices, reversed(data.dimensions(full=1).items())) if v_[3]]
-        return dataset, *scales
-    return dataset
+    out = np.empty(len(coords), dtype=dataset.dtype.newbyteorder('=') if dtype is None else dtype)
+    if len(coords):
+        space = dataset.id.get_space()
+        space.select_elements(np.ascontiguousarray(coords, dtype=np.uint64))
+        dataset.id.read(h5.h5s.create_simple((len(coords),)), space, out)
+    return out
 
 
-def _read_h5_by_ivalue(ifile: PathLike, /,
-                       *xi: Union[float, Tuple[float, float], None],
-                       dataset_id: Optional[str] = None,
-                       return_scales: bool = True,
-                       ) -> Union[np.ndarray, Tuple[np.ndarray]]:
-    """HDF5 (.h5) version of :func:`read_hdf_by_ivalue`.
+def _interpolate_by_points(xi: np.ndarray,
+                           scales: Sequence[np.ndarray],
+                           read: Callable[[np.ndarray], np.ndarray],
+                           shape: Sequence[int],
+                           engine: Optional[Literal['scipy', 'numpy']] = None,
+                           fill_value: Optional[float] = np.nan) -> np.ndarray:
+    """
+    Interpolate positions from the corners of their cells only, read as one point selection.
+
+    Parameters
+    ----------
+    xi : np.ndarray
+        The ``(m, n)`` positions, in PSI order.
+    scales : Sequence[np.ndarray]
+        The scales of the whole grid, in PSI order.
+    read : Callable
+        Return the values of the dataset at the ``(k, n)`` element coordinates
+        given in storage (*i.e.* reversed PSI) order.
+    shape : Sequence[int]
+        The shape of the dataset, in storage order.
+    engine : {'scipy', 'numpy'} | None, optional
+        The engine whose precision is matched: ``'numpy'`` interpolates in the
+        (floating-point) dtype of the data, ``'scipy'`` in ``float64``.
+    fill_value : float | None, optional
+        The value returned outside the grid; if ``None``, the values are extrapolated.
+
+    Returns
+    -------
+    out : np.ndarray
+        The ``(m,)`` interpolated values.
 
     Examples
     --------
-    >>> from psi_io.psi_io import _read_h5_by_ivalue
-    >>> from psi_data import fetch_mas_data
-    >>> f, r_idx, t_idx, p_idx = _read_h5_by_ivalue(fetch_mas_data().cor_br, 2.7, None, None)
-    >>> r_idx.shape
-    (2,)
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _interpolate_by_points
+    >>> x, data = np.arange(5.0), 2*np.arange(5.0)
+    >>> _interpolate_by_points(np.array([[0.5], [3.25]]), (x,), lambda coords: data[coords[:, 0]], data.shape)
+    array([1. , 6.5])
     """
-    with h5.File(ifile, 'r') as hdf:
-        data = hdf[dataset_id or PSI_DATA_ID['h5']]
-        if len(xi) != data.ndim:
-            raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
-        slices = [_parse_ivalue_inputs(*args) for args in zip(reversed(data.shape), xi)]
-        dataset = data[tuple(reversed(slices))]
-        if return_scales:
-            scales = [np.arange(si.start or 0, si.stop or size) for si, size in zip(slices, reversed(data.shape))]
-            return dataset, *scales
-        return dataset
+    if engine is None:
+        engine = 'scipy' if SCIPY_AVAILABLE else 'numpy'
+    if engine not in INTERP_ENGINES:
+        raise ValueError(f"engine must be one of {list(INTERP_ENGINES)}; got {engine!r}")
+    ndim = len(scales)
+    cells, _, _ = _grid_cells(scales, xi, np.float64, bounds_error=False)
+    corners = _corner_indices(cells, shape)
+    unique, inverse = np.unique(corners, return_inverse=True)
+    values = np.asarray(read(np.stack(np.unravel_index(unique, tuple(shape)), axis=-1)))
+    if engine == 'scipy' or not np.issubdtype(values.dtype, np.inexact):
+        values = values.astype(np.float64)
+    _, factors, outside = _grid_cells(scales, xi, values.dtype, bounds_error=False)
+    values = values[inverse.reshape(corners.shape)]
+    result = np.zeros(len(xi), dtype=values.dtype)
+    for corner in product((0, 1), repeat=ndim):
+        weight = factors[0][corner[0]]
+        for axis in range(1, ndim):
+            weight = weight*factors[axis][corner[axis]]
+        result += weight*values[sum(bit << axis for axis, bit in enumerate(corner))]
+    if fill_value is not None:
+        result[outside] = fill_value
+    return result
+
+
+def _h5_read_direct(dataset: h5.Dataset, selection: Optional[tuple], out: np.ndarray) -> np.ndarray:
+    """Read ``dataset[selection]`` into *out*, without an intermediate array when possible.
+
+    C-contiguous, writeable arrays are filled by HDF5 itself through
+    :meth:`h5py.Dataset.read_direct` (converting the dtype on the fly); any other
+    array is assigned from a regular read.  A *selection* of ``None`` reads the
+    whole dataset.  Strided selections that the read planner reads through their
+    bounding box (see :func:`_planned_window`) are copied from it.
+    """
+    split = None if selection is None else _planned_window(dataset, selection)
+    if split is not None:
+        np.copyto(out, dataset[split[0]][split[1]], casting='unsafe')
+    elif out.flags.c_contiguous and out.flags.writeable and out.size:
+        dataset.read_direct(out, source_sel=selection)
+    else:
+        out[...] = dataset[() if selection is None else selection]
+    return out
 
 
-def _read_h4_by_ivalue(ifile: PathLike, /,
-                       *xi: Union[float, Tuple[float, float], None],
-                       dataset_id: Optional[str] = None,
-                       return_scales: bool = True,
-                       ) -> Union[np.ndarray, Tuple[np.ndarray]]:
-    """HDF4 (.hdf) version of :func:`read_hdf_by_ivalue`.
+def _read_h5_selection(data: Union[h5.Dataset, np.ndarray],
+                       selection: tuple,
+                       out: Union[np.ndarray, BufferPool, None],
+                       dtype: Any = None) -> np.ndarray:
+    """Read ``data[selection]`` from an HDF5 dataset (or its memory map), into *out* if given.
+
+    With *dtype*, the values are converted by HDF5 as they are read into the
+    output array (see :func:`_h5_read_direct`).  Entries of *selection* may also
+    be sorted index arrays (see :func:`_read_index_union`).  Strided selections
+    may instead be read through their bounding box, as chosen by the read planner
+    (see :func:`_plan_selection`).
+    """
+    split = _planned_window(data, selection) if isinstance(data, h5.Dataset) else None
+    if split is not None:
+        return _read_index_union(_read_h5_selection(data, split[0], None, dtype), split[1], out, dtype)
+    if not all(isinstance(si, slice) for si in selection):
+        return _read_index_union(data, selection, out, dtype)
+    if out is None and dtype is None:
+        return data[selection]
+    buffer = _resolve_out(out, _selection_shape(data.shape, selection), dtype or data.dtype,
+                          strict=dtype is not None)
+    if isinstance(data, h5.Dataset):
+        return _h5_read_direct(data, selection, buffer)
+    np.copyto(buffer, data[selection], casting='unsafe')
+    return buffer
+
+
+def _read_h4_selection(data,
+                       selection: tuple,
+                       out: Union[np.ndarray, BufferPool, None],
+                       dtype: Any = None) -> np.ndarray:
+    """Read ``data[selection]`` from an HDF4 SDS, copying it into *out* if given.
+
+    The HDF4 library cannot convert on read: with *dtype*, the selection is read
+    in its stored dtype and then cast.  Entries of *selection* may also be sorted
+    index arrays (see :func:`_read_index_union`), and strided selections may be
+    read through their bounding box, as chosen by the read planner (see
+    :func:`_plan_selection`).
+    """
+    split = _planned_window(data, selection)
+    if split is not None:
+        return _read_index_union(data[split[0]], split[1], out, dtype)
+    if not all(isinstance(si, slice) for si in selection):
+        return _read_index_union(data, selection, out, dtype)
+    dataset = data[selection]
+    if out is None:
+        return dataset if dtype is None else dataset.astype(dtype, copy=False)
+    buffer = _resolve_out(out, dataset.shape, dtype or dataset.dtype, strict=dtype is not None)
+    np.copyto(buffer, dataset, casting='unsafe')
+    return buffer
+
+
+def _read_h4_slabs(data,
+                   selection: tuple,
+                   out: Union[np.ndarray, BufferPool, None],
+                   dtype: Any = None,
+                   slab_nbytes: int = CONVERT_SLAB_NBYTES) -> np.ndarray:
+    """Read ``data[selection]`` from an HDF4 SDS one hyperslab at a time, into *out* if given.
+
+    The selection is split along its slowest varying axis into hyperslabs of at
+    most *slab_nbytes* (but at least one plane), each read from the SDS and copied
+    (cast to *dtype*) into the output array: unlike :func:`_read_h4_selection`,
+    only the output and one hyperslab are held in memory at once.  Selections
+    that are not made of forward slices are read by :func:`_read_h4_selection`.
 
     Examples
     --------
-    >>> from psi_io.psi_io import _read_h4_by_ivalue
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _read_h4_slabs
     >>> from psi_data import fetch_mas_data
-    >>> path = fetch_mas_data(hdf=4).cor_br  # doctest: +SKIP
-    >>> f, r_idx, t_idx, p_idx = _read_h4_by_ivalue(path, 2.7, None, None)  # doctest: +SKIP
-    >>> r_idx.shape  # doctest: +SKIP
-    (2,)
+    >>> import pyhdf.SD as h4  # doctest: +SKIP
+    >>> sds = h4.SD(str(fetch_mas_data(hdf=4).cor_br)).select('Data-Set-2')  # doctest: +SKIP
+    >>> _read_h4_slabs(sds, (slice(None),), None, np.float16, slab_nbytes=1 << 20).dtype  # doctest: +SKIP
+    dtype('float16')
     """
-    hdf = h4.SD(str(ifile))
-    data = hdf.select(dataset_id or PSI_DATA_ID['h4'])
-    ndim, shape = data.info()[1], _cast_shape_tuple(data.info()[2])
-    if len(xi) != ndim:
-        raise ValueError(f"len(xi) must equal the number of scales for {dataset_id}")
-    slices = [_parse_ivalue_inputs(*args) for args in zip(reversed(shape), xi)]
-    dataset = data[tuple(reversed(slices))]
-    if return_scales:
-        scales = [np.arange(si.start or 0, si.stop or size) for si, size in zip(slices, reversed(shape))]
-        return dataset, *scales
-    return dataset
-
+    _, _, dims, sdc_type, _ = data.info()
+    shape = _cast_shape_tuple(dims)
+    selection = tuple(selection) + (slice(None),) * (len(shape) - len(selection))
+    if not all(isinstance(si, slice) and (si.step or 1) > 0 for si in selection):
+        return _read_h4_selection(data, selection, out, dtype)
+    stored = SDC_TYPE_CONVERSIONS[sdc_type]
+    buffer = _resolve_out(out, _selection_shape(shape, selection), dtype or stored, strict=dtype is not None)
+    first, rest = range(*selection[0].indices(shape[0])), selection[1:]
+    plane_nbytes = stored.itemsize * int(np.prod(buffer.shape[1:]))
+    nplanes = max(1, slab_nbytes // max(plane_nbytes, 1))
+    for i in range(0, len(first), nplanes):
+        block = first[i:i + nplanes]
+        np.copyto(buffer[i:i + len(block)], data[(slice(block.start, block.stop, block.step), *rest)],
+                  casting='unsafe')
+    return buffer
+
+
+def _read_index_union(data,
+                      selection: tuple,
+                      out: Union[np.ndarray, BufferPool, None] = None,
+                      dtype: Any = None) -> np.ndarray:
+    """Read the outer product of a selection whose entries are slices or sorted index arrays.
+
+    Each index array is covered by as few hyperslabs as possible – runs of indices
+    separated by at most :data:`UNION_MERGE_GAP` unneeded indices are merged into
+    one block – and only the requested indices are kept from the blocks read.
+    *data* may be any object supporting basic slicing (an HDF5 dataset, an HDF4
+    SDS or a NumPy array).  With *dtype*, HDF5 blocks are converted as they are
+    read; other blocks are cast after reading.
 
-def _write_h4_data(ifile: PathLike, /,
-                   data: np.ndarray,
-                   *scales: Sequence[np.ndarray],
-                   dataset_id: Optional[str] = None,
-                   sync_dtype: bool = False,
-                   strict: bool = True,
-                   **kwargs) -> Path:
-    """HDF4 (.hdf) version of :func:`write_hdf_data`.
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _read_index_union
+    >>> data = np.arange(40).reshape(2, 20)
+    >>> _read_index_union(data, (slice(None), np.array([0, 1, 3, 17])))
+    array([[ 0,  1,  3, 17],
+           [20, 21, 23, 37]])
+    """
+    blocks, keep = [], []
+    for si in selection:
+        if isinstance(si, slice):
+            blocks.append([si])
+            keep.append(None)
+            continue
+        blocks.append(_union_blocks(si))
+        covered = np.concatenate([np.arange(block.start, block.stop) for block in blocks[-1]])
+        keep.append(None if covered.size == si.size else np.searchsorted(covered, si))
+
+    source = data.astype(dtype) if dtype is not None and isinstance(data, h5.Dataset) else data
+
+    def read_blocks(prefix: tuple) -> np.ndarray:
+        axis = len(prefix)
+        if axis == len(blocks):
+            return source[prefix]
+        parts = [read_blocks(prefix + (block,)) for block in blocks[axis]]
+        return parts[0] if len(parts) == 1 else np.concatenate(parts, axis=axis)
+
+    dataset = read_blocks(())
+    for axis, indices in enumerate(keep):
+        if indices is not None:
+            dataset = np.take(dataset, indices, axis=axis)
+    if out is None:
+        return dataset if dtype is None else dataset.astype(dtype, copy=False)
+    buffer = _resolve_out(out, dataset.shape, dtype or dataset.dtype, strict=dtype is not None)
+    np.copyto(buffer, dataset, casting='unsafe')
+    return buffer
+
+
+def _index_union(windows: Sequence[slice], size: int) -> Union[slice, np.ndarray]:
+    """Return the union of bracket *windows* over an axis of *size*: a slice if contiguous, else sorted indices.
 
     Examples
     --------
-    >>> import tempfile, numpy as np
-    >>> from pathlib import Path
-    >>> from psi_io.psi_io import _write_h4_data, _read_h4_data
-    >>> f = np.ones((10,), dtype=np.float32)
-    >>> x = np.linspace(0.0, 1.0, 10, dtype=np.float32)
-    >>> with tempfile.TemporaryDirectory() as d:  # doctest: +SKIP
-    ...     _write_h4_data(Path(d) / "out.hdf", f, x)  # doctest: +SKIP
-    ...     data, *_ = _read_h4_data(Path(d) / "out.hdf")  # doctest: +SKIP
-    ...     data.shape  # doctest: +SKIP
-    (10,)
+    >>> from psi_io.psi_io import _index_union
+    >>> _index_union([slice(2, 4), slice(3, 5)], 10)
+    slice(2, 5, None)
+    >>> _index_union([slice(2, 4), slice(7, 9)], 10)
+    array([2, 3, 7, 8])
     """
-    dataid = dataset_id or PSI_DATA_ID['h4']
-    h4file = h4.SD(str(ifile), h4.SDC.WRITE | h4.SDC.CREATE | h4.SDC.TRUNC)
-    sds_id = h4file.create(dataid, _dtype_to_sdc(data.dtype), data.shape)
+    indices = np.unique(np.concatenate([np.arange(*window.indices(size)) for window in windows]))
+    if indices[-1] - indices[0] + 1 == indices.size:
+        return slice(int(indices[0]), int(indices[-1]) + 1)
+    return indices
 
-    if scales:
-        for i, scale in enumerate(reversed(scales)):
-            if scale is not None:
-                if sync_dtype:
-                    scale = scale.astype(data.dtype)
-                sds_id.dim(i).setscale(_dtype_to_sdc(scale.dtype), scale.tolist())
 
-    if kwargs:
-        for k, v in kwargs.items():
-            npv = np.asarray(v)
-            attr_ = sds_id.attr(k)
-            try:
-                val = npv.tolist()
-                if isinstance(val, bytes):
-                    val = val.decode('latin-1')
-                attr_.set(_dtype_to_sdc(npv.dtype), val)
-            except KeyError as e:
-                if strict:
-                    raise KeyError(f"Failed to set attribute '{k}' on dataset '{dataid}'") from e
-                else:
-                    print(f"Warning: Failed to set attribute '{k}' on dataset '{dataid}'; skipping.")
+def _parse_value_selection(scale, value) -> Union[slice, np.ndarray]:
+    """:func:`_parse_value_inputs`, extended to arrays of target values (see :func:`read_hdf_by_value`)."""
+    if isinstance(value, np.ndarray) and value.ndim:
+        return _index_union([_parse_value_inputs(scale, v) for v in value.ravel()], len(scale))
+    return _parse_value_inputs(scale, value)
 
-    sds_id.set(data)
-    sds_id.endaccess()
-    h4file.end()
 
-    return ifile
+def _parse_ivalue_selection(dimsize: int, value) -> Union[slice, np.ndarray]:
+    """:func:`_parse_ivalue_inputs`, extended to arrays of target values (see :func:`read_hdf_by_ivalue`)."""
+    if isinstance(value, np.ndarray) and value.ndim:
+        return _index_union([_parse_ivalue_inputs(dimsize, float(v)) for v in value.ravel()], dimsize)
+    return _parse_ivalue_inputs(dimsize, value)
 
 
-def _write_h5_data(ifile: PathLike, /,
-                   data: np.ndarray,
-                   *scales: Sequence[np.ndarray],
-                   dataset_id: Optional[str] = None,
-                   sync_dtype: bool = False,
-                   strict: bool = True,
-                   **kwargs) -> Path:
-    """HDF5 (.h5) version of :func:`write_hdf_data`.
+def _h5_memmap(dataset: h5.Dataset) -> Optional[np.memmap]:
+    """
+    Memory-map an HDF5 dataset, if its raw data is stored as a plain array in the file.
+
+    Parameters
+    ----------
+    dataset : h5py.Dataset
+        The dataset to map.
+
+    Returns
+    -------
+    out : np.memmap | None
+        A read-only, C-ordered memory map of the dataset; or ``None`` if the dataset
+        is not eligible *viz.* if it is chunked, compact or external, has filters,
+        is empty or unallocated, is scalar, has a non-numeric dtype, or belongs to a
+        file opened with a driver other than the default (POSIX) one.
 
     Examples
     --------
-    >>> import tempfile, numpy as np
+    >>> import tempfile, numpy as np, h5py
     >>> from pathlib import Path
-    >>> from psi_io.psi_io import _write_h5_data, _read_h5_data
-    >>> f = np.ones((10,), dtype=np.float32)
-    >>> x = np.linspace(0.0, 1.0, 10, dtype=np.float32)
+    >>> from psi_io import write_hdf_data
+    >>> from psi_io.psi_io import _h5_memmap
     >>> with tempfile.TemporaryDirectory() as d:
-    ...     _ = _write_h5_data(Path(d) / "out.h5", f, x)
-    ...     data, *_ = _read_h5_data(Path(d) / "out.h5")
-    ...     data.shape
-    (10,)
+    ...     out = write_hdf_data(Path(d) / "out.h5", np.arange(6.0).reshape(2, 3))
+    ...     with h5py.File(out, 'r') as hdf:
+    ...         mapped = _h5_memmap(hdf['Data'])
+    ...     mapped[1], mapped.flags.writeable
+    (memmap([3., 4., 5.]), False)
     """
-    dataid = dataset_id or PSI_DATA_ID['h5']
-    with h5.File(ifile, "w") as h5file:
-        dataset = h5file.create_dataset(dataid, data=data, dtype=data.dtype, shape=data.shape)
+    if (dataset.file.driver not in ('sec2', 'stdio')
+            or not dataset.shape
+            or not dataset.size
+            or dataset.dtype.hasobject
+            or dataset.dtype.kind not in 'biufc'
+            or dataset.external):
+        return None
+    plist = dataset.id.get_create_plist()
+    if plist.get_layout() != h5.h5d.CONTIGUOUS or plist.get_nfilters():
+        return None
+    offset = dataset.id.get_offset()
+    if offset is None:
+        return None
+    return np.memmap(dataset.file.filename, mode='r', dtype=dataset.dtype,
+                     offset=offset, shape=dataset.shape, order='C')
+
+
+def _auto_chunk_shape(shape: Sequence[int],
+                      itemsize: int,
+                      target_nbytes: int = AUTO_CHUNK_NBYTES
+                      ) -> Tuple[int, ...]:
+    r"""
+    Choose a chunk shape suited to PSI's constant-coordinate slicing patterns.
 
-        if scales:
-            for i, scale in enumerate(scales):
-                if scale is not None:
-                    if sync_dtype:
-                        scale = scale.astype(data.dtype)
-                    h5file.create_dataset(f"dim{i+1}", data=scale, dtype=scale.dtype, shape=scale.shape)
-                    h5file[dataid].dims[i].attach_scale(h5file[f"dim{i+1}"])
-                    h5file[dataid].dims[i].label = f"dim{i+1}"
+    Every axis is chunked to (approximately) the same fraction :math:`f` of its
+    length, with :math:`f` chosen so that a chunk holds about ``target_nbytes``.
+    A surface of constant :math:`r`, :math:`\theta` or :math:`\phi` then reads
+    the fraction :math:`f` of the dataset, regardless of which axis is fixed.
+    Axes too short to be split further are given a chunk length of 1 and the
+    remaining budget is redistributed over the other axes.
 
-        if kwargs:
-            for key, value in kwargs.items():
-                if key.startswith('DIMENSION'):
-                    # Skip HDF5 dimension-scale bookkeeping attributes —
-                    # these are managed by attach_scale above and must not
-                    # be overwritten with stale object references.
-                    continue
-                try:
-                    dataset.attrs[key] = value
-                except TypeError as e:
-                    if strict:
-                        raise TypeError(f"Failed to set attribute '{key}' on dataset '{dataid}'") from e
-                    else:
-                        print(f"Warning: Failed to set attribute '{key}' on dataset '{dataid}'; skipping.")
+    Parameters
+    ----------
+    shape : Sequence[int]
+        The shape of the dataset.
+    itemsize : int
+        The size (in bytes) of a single element.
+    target_nbytes : int, optional
+        The approximate size (in bytes) of a chunk.
+        Default is :data:`AUTO_CHUNK_NBYTES`.
 
-    return ifile
+    Returns
+    -------
+    out : tuple[int, ...]
+        The chunk shape.  Datasets smaller than ``target_nbytes`` are stored
+        as a single chunk.
 
+    Examples
+    --------
+    >>> from psi_io.psi_io import _auto_chunk_shape
+    >>> _auto_chunk_shape((1000, 1000, 1000), 4)
+    (40, 40, 40)
+    >>> _auto_chunk_shape((299, 142, 255), 4)
+    (54, 25, 46)
+    >>> _auto_chunk_shape((30, 20, 10), 4)
+    (30, 20, 10)
+    """
+    shape = tuple(max(1, int(s)) for s in shape)
+    budget = max(1, target_nbytes // max(1, itemsize))
+    if math.prod(shape) <= budget:
+        return shape
+    chunks = [1] * len(shape)
+    free = list(range(len(shape)))
+    while free:
+        fraction = (budget / math.prod(shape[i] for i in free)) ** (1 / len(free))
+        short = [i for i in free if fraction * shape[i] < 1]
+        if not short:
+            for i in free:
+                chunks[i] = min(shape[i], max(1, int(fraction * shape[i])))
+            break
+        free = [i for i in free if i not in short]
+    return tuple(chunks)
+
+
+def _h5_storage_options(shape: Sequence[int],
+                        dtype: np.dtype,
+                        chunks: ChunkType = None,
+                        compression: Union[Literal['gzip', 'lzf'], int, None] = None,
+                        compression_opts: Optional[int] = None,
+                        shuffle: bool = False,
+                        fletcher32: bool = False,
+                        ) -> Dict[str, Any]:
+    """
+    Build the storage keyword arguments for :meth:`h5py.Group.create_dataset`.
 
-def _write_h4_meta(ifile: PathLike, /,
-                   meta: Optional[Mapping[str, Mapping[str, Any]]] = None,
-                   **kwargs) -> Path:
-    """HDF4 (.hdf) version of :func:`write_hdf_meta`."""
-    metadata = dict(meta or {})
-    h4file = h4.SD(str(ifile), h4.SDC.READ | h4.SDC.WRITE)
+    Parameters
+    ----------
+    shape : Sequence[int]
+        The shape of the dataset.
+    dtype : np.dtype
+        The dtype of the dataset.
+    chunks, compression, compression_opts, shuffle, fletcher32
+        See :func:`write_hdf_data`.
 
-    for k, v in kwargs.items():
-        npv = np.asarray(v)
-        attr_ = h4file.attr(k)
-        val = npv.tolist()
-        if isinstance(val, bytes):
-            val = val.decode('latin-1')
-        attr_.set(_dtype_to_sdc(npv.dtype), val)
-    for key, value in metadata.items():
-        sds_id = h4file.select(key)
-        for k, v in dict(value).items():
-            npv = np.asarray(v)
-            attr_ = sds_id.attr(k)
-            val = npv.tolist()
-            if isinstance(val, bytes):
-                val = val.decode('latin-1')
-            attr_.set(_dtype_to_sdc(npv.dtype), val)
-    h4file.end()
+    Returns
+    -------
+    out : dict[str, Any]
+        Keyword arguments describing the dataset layout and filter pipeline.
+        Empty when a contiguous, unfiltered dataset is requested.
 
-    return ifile
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _h5_storage_options
+    >>> _h5_storage_options((10, 10), np.dtype('f4'))
+    {}
+    >>> _h5_storage_options((10, 10), np.dtype('f4'), compression='gzip')
+    {'chunks': (10, 10), 'compression': 'gzip'}
+    """
+    filtered = compression is not None or shuffle or fletcher32
+    if not chunks and not filtered or not len(shape):
+        return {}
+    options: Dict[str, Any] = {}
+    if chunks is None or chunks is False or chunks == 'auto':
+        options['chunks'] = _auto_chunk_shape(shape, np.dtype(dtype).itemsize)
+    elif chunks is True:
+        options['chunks'] = True
+    else:
+        options['chunks'] = tuple(int(c) for c in chunks)
+    if compression is not None:
+        options['compression'] = compression
+    if compression_opts is not None:
+        options['compression_opts'] = compression_opts
+    if shuffle:
+        options['shuffle'] = True
+    if fletcher32:
+        options['fletcher32'] = True
+    return options
+
+
+_SERIES_READERS = MappingProxyType({
+    'interp': np_interpolate_slice_from_hdf,
+    'value': read_hdf_by_value,
+    'ivalue': read_hdf_by_ivalue,
+    'index': read_hdf_by_index,
+})
+"""Mapping of :func:`read_hdf_series` methods to the per-file readers"""
 
 
-def _write_h5_meta(ifile: PathLike, /,
-                   meta: Optional[Mapping[str, Mapping[str, Any]]] = None,
-                   **kwargs) -> Path:
-    """HDF5 (.h5) version of :func:`write_hdf_meta`."""
-    metadata = dict(meta or {})
-    with h5.File(ifile, "r+") as h5file:
-        if kwargs:
-            h5file.attrs.update(**kwargs)
-        for key, value in metadata.items():
-            h5file[key].attrs.update(**dict(value))
-    return ifile
+_H4_LOCK = threading.Lock()
+"""Process-wide lock serializing every threaded :py:mod:`pyhdf` call
+
+The HDF4 library is not thread-safe, so any code that may touch an HDF4 file from
+more than one thread holds this lock around its :py:mod:`pyhdf` calls: the worker
+threads of :func:`read_hdf_series`, the asynchronous readers of :mod:`psi_io.aio`,
+tiled interpolation and :class:`PointQuery`.  The lock is not reentrant, so code
+holding it must not call anything that takes it again."""
+
+
+def _read_series_member(method: str,
+                        ifile: Path,
+                        xi: Sequence,
+                        dataset_id: Optional[str] = None,
+                        ) -> Tuple[np.ndarray, ...]:
+    """Read one file of a :func:`read_hdf_series` sequence; returns ``(data, *scales)``."""
+    reader = _SERIES_READERS[method]
+    if ifile.suffix == '.hdf':
+        with _H4_LOCK:
+            return tuple(reader(ifile, *xi, dataset_id=dataset_id))
+    return tuple(reader(ifile, *xi, dataset_id=dataset_id))
 
 
 def _np_linear_interpolation(xi: Sequence, scales: Sequence, values: np.ndarray):
@@ -2818,6 +7655,365 @@ def _np_trilinear_interpolation(xi, scales, values):
     return c0*(1 - v) + c1*v
 
 
+def _np_multilinear_interpolation(xi: Sequence, scales: Sequence, values: np.ndarray):
+    """
+    Perform linear interpolation over any number of dimensions, to one or many values each.
+
+    Parameters
+    ----------
+    xi : list[float | np.ndarray | None]
+        Target coordinate value(s) for each dimension; ``None`` marks a
+        "free" (not interpolated) dimension.  A scalar removes its dimension
+        from the result, while a 1D array replaces it with one entry per value.
+    scales : list[np.ndarray]
+        Coordinate scale arrays, one per dimension.  A scale need not be
+        contiguous, but must bracket every target value.
+    values : np.ndarray
+        The data array to interpolate.
+
+    Returns
+    -------
+    out : np.ndarray
+        The interpolated data array.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _np_multilinear_interpolation
+    >>> scales = [np.array([0.0, 1.0, 5.0, 6.0]), np.array([0.0, 1.0])]
+    >>> values = np.array([[0.0, 1.0], [2.0, 3.0], [10.0, 11.0], [12.0, 13.0]])
+    >>> _np_multilinear_interpolation([np.array([0.5, 5.5]), None], scales, values)
+    array([[ 1.,  2.],
+           [11., 12.]])
+    >>> _np_multilinear_interpolation([np.array([0.5, 5.5]), 0.5], scales, values)
+    array([ 1.5, 11.5])
+    """
+    for axis in reversed([i for i, v in enumerate(xi) if v is not None]):
+        scale, target = np.asarray(scales[axis]), xi[axis]
+        i = np.clip(np.searchsorted(scale, target, side='right') - 1, 0, scale.size - 2)
+        t = (target - scale[i])/(scale[i + 1] - scale[i])
+        if np.ndim(t):
+            t = np.reshape(t, [-1 if ax == axis else 1 for ax in range(values.ndim)])
+        values = (1 - t)*np.take(values, i, axis=axis) + t*np.take(values, i + 1, axis=axis)
+    return values
+
+
+class _NpGridInterpolator:
+    r"""
+    Vectorised multilinear interpolator on a rectilinear grid, in pure NumPy.
+
+    A stand-in for the ``method='linear'`` case of
+    :class:`~scipy.interpolate.RegularGridInterpolator` – it takes the same
+    constructor arguments, exposes the same ``grid`` and ``values`` attributes,
+    and is called the same way – that does not require SciPy.
+
+    Parameters
+    ----------
+    points : Sequence[np.ndarray]
+        The strictly ascending coordinates of the grid, one 1D array per
+        dimension.  The spacing need not be uniform.
+    values : np.ndarray
+        The data on the grid, of shape ``(len(points[0]), ..., len(points[n-1]), ...)``;
+        trailing dimensions beyond the grid are carried through to the result.
+    method : {'linear'}, optional
+        The interpolation method.  Only ``'linear'`` is supported.
+    bounds_error : bool, optional
+        If ``True`` (default), raise a :exc:`ValueError` for positions outside the grid.
+    fill_value : float | None, optional
+        The value returned at positions outside the grid when ``bounds_error`` is
+        ``False``.  If ``None``, the values are extrapolated.  Default is ``nan``.
+    chunk_size : int, optional
+        The maximum number of positions evaluated at a time.  Default is
+        :data:`INTERP_CHUNK_SIZE`.
+
+    Raises
+    ------
+    ValueError
+        If ``method`` is not ``'linear'``, or if ``points`` do not match the
+        shape of ``values`` or are not strictly ascending.
+
+    Notes
+    -----
+    The cells of the positions of a chunk are found with one :func:`numpy.searchsorted`
+    per dimension, and the :math:`2^n` cell corners are gathered with fancy indexing –
+    which works on any memory layout, *e.g.* the transpose of a Fortran-ordered PSI
+    dataset, without copying it.  The temporaries are thus bounded by ``chunk_size``,
+    however many positions are requested.
+
+    Floating-point data are interpolated in their own precision, *i.e.* ``float32``
+    data yield ``float32`` results (where :class:`~scipy.interpolate.RegularGridInterpolator`
+    upcasts to ``float64``); other data are interpolated in ``float64``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _NpGridInterpolator
+    >>> x, y = np.array([0.0, 1.0, 3.0]), np.array([0.0, 2.0])
+    >>> values = np.add.outer(x, y).astype(np.float32)
+    >>> interpolator = _NpGridInterpolator((x, y), values)
+    >>> interpolator([[0.5, 1.0], [2.0, 0.5]])
+    array([1.5, 2.5], dtype=float32)
+    >>> interpolator((2.0, 1.0))
+    array(3., dtype=float32)
+    """
+
+    __slots__ = ('grid', 'values', 'bounds_error', 'fill_value', 'chunk_size')
+
+    def __init__(self,
+                 points: Sequence[np.ndarray],
+                 values: np.ndarray,
+                 method: str = 'linear',
+                 bounds_error: bool = True,
+                 fill_value: Optional[float] = np.nan,
+                 chunk_size: int = INTERP_CHUNK_SIZE):
+        if method != 'linear':
+            raise ValueError(f"The NumPy engine only supports method='linear'; got {method!r}")
+        values = np.asarray(values)
+        if not np.issubdtype(values.dtype, np.inexact):
+            values = values.astype(np.float64)
+        if len(points) > values.ndim:
+            raise ValueError(f"There are {len(points)} point arrays, but values has {values.ndim} dimensions")
+        grid = tuple(np.asarray(p, dtype=np.float64) for p in points)
+        for axis, (scale, size) in enumerate(zip(grid, values.shape)):
+            if scale.ndim != 1 or scale.size != size:
+                raise ValueError(f"There are {scale.size} points in dimension {axis}, but values has {size} values")
+            if np.any(np.diff(scale) <= 0):
+                raise ValueError(f"The points in dimension {axis} must be strictly ascending")
+        self.grid = grid
+        self.values = values
+        self.bounds_error = bounds_error
+        self.fill_value = fill_value
+        self.chunk_size = int(chunk_size)
+
+    def __call__(self, xi) -> np.ndarray:
+        """Interpolate at the positions *xi*, an ``(..., n)`` array (or a tuple of ``n`` broadcastable arrays)."""
+        ndim = len(self.grid)
+        if isinstance(xi, tuple) and len(xi) == ndim:
+            xi = np.stack(np.broadcast_arrays(*xi), axis=-1)
+        xi = np.asarray(xi, dtype=np.float64)
+        if xi.shape[-1:] != (ndim,):
+            raise ValueError(f"The requested sample points xi have dimension {xi.shape[-1:]}, "
+                             f"but this interpolator has dimension {ndim}")
+        shape, xi = xi.shape[:-1], xi.reshape(-1, ndim)
+        out = np.empty((len(xi), *self.values.shape[ndim:]), dtype=self.values.dtype)
+        for start in range(0, len(xi), self.chunk_size):
+            out[start:start + self.chunk_size] = self._evaluate(xi[start:start + self.chunk_size])
+        return out.reshape((*shape, *self.values.shape[ndim:]))
+
+    def _evaluate(self, xi: np.ndarray) -> np.ndarray:
+        """Interpolate at the ``(m, n)`` positions *xi*."""
+        dtype, ndim = self.values.dtype, len(self.grid)
+        cells, factors, outside = _grid_cells(self.grid, xi, dtype, self.bounds_error)
+
+        broadcast = (slice(None),) + (None,)*(self.values.ndim - ndim)
+        result = np.zeros((len(xi), *self.values.shape[ndim:]), dtype=dtype)
+        for corner in product((0, 1), repeat=ndim):
+            weight = factors[0][corner[0]]
+            for axis in range(1, ndim):
+                weight = weight*factors[axis][corner[axis]]
+            result += weight[broadcast]*self.values[tuple(cells[axis][bit] for axis, bit in enumerate(corner))]
+        if self.fill_value is not None:
+            result[outside] = self.fill_value
+        return result
+
+
+def _grid_cells(grid: Sequence[np.ndarray],
+                xi: np.ndarray,
+                dtype: np.dtype,
+                bounds_error: bool = True):
+    """
+    Locate positions in the cells of a rectilinear grid.
+
+    Parameters
+    ----------
+    grid : Sequence[np.ndarray]
+        The strictly ascending coordinates of the grid, one 1D array per dimension.
+    xi : np.ndarray
+        The ``(m, n)`` positions.
+    dtype : np.dtype
+        The dtype of the weights.
+    bounds_error : bool, optional
+        If ``True`` (default), raise a :exc:`ValueError` for positions outside the grid.
+
+    Returns
+    -------
+    cells : list[tuple[np.ndarray, np.ndarray]]
+        The lower and upper index of the cell of every position, per dimension
+        (both ``0`` along a dimension of size 1).
+    factors : list[tuple[np.ndarray, np.ndarray]]
+        The weights ``(1 - t, t)`` of the lower and upper index, per dimension.
+    outside : np.ndarray
+        The mask of the positions outside the grid (which are extrapolated).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _grid_cells
+    >>> cells, factors, outside = _grid_cells([np.array([0.0, 1.0, 3.0])], np.array([[2.0]]), np.float64)
+    >>> cells, factors
+    ([(array([1]), array([2]))], [(array([0.5]), array([0.5]))])
+    """
+    cells, factors = [], []
+    outside = np.zeros(len(xi), dtype=bool)
+    for axis, scale in enumerate(grid):
+        x = xi[:, axis]
+        out_of_bounds = (x < scale[0]) | (x > scale[-1])
+        if bounds_error and out_of_bounds.any():
+            raise ValueError(f"One of the requested xi is out of bounds in dimension {axis}")
+        outside |= out_of_bounds
+        if scale.size == 1:
+            i, t = np.zeros(len(x), dtype=np.intp), np.zeros(len(x), dtype=dtype)
+            cells.append((i, i))
+        else:
+            i = np.clip(np.searchsorted(scale, x, side='right') - 1, 0, scale.size - 2)
+            t = ((x - scale[i])/(scale[i + 1] - scale[i])).astype(dtype, copy=False)
+            cells.append((i, i + 1))
+        factors.append((1 - t, t))
+    return cells, factors, outside
+
+
+def _linear_interpolator(points: Sequence[np.ndarray],
+                         values: np.ndarray,
+                         engine: Optional[Literal['scipy', 'numpy']] = None,
+                         **kwargs):
+    """
+    Instantiate a linear interpolator on a rectilinear grid with the given engine.
+
+    Parameters
+    ----------
+    points : Sequence[np.ndarray]
+        The coordinates of the grid, one 1D array per dimension.
+    values : np.ndarray
+        The data on the grid.
+    engine : {'scipy', 'numpy'} | None, optional
+        ``'scipy'`` for :class:`~scipy.interpolate.RegularGridInterpolator`,
+        ``'numpy'`` for :class:`_NpGridInterpolator`.  If ``None`` (default),
+        SciPy is used when it is installed, and NumPy otherwise.
+    **kwargs
+        Keyword arguments forwarded to the interpolator.
+
+    Returns
+    -------
+    out : RegularGridInterpolator | _NpGridInterpolator
+        The interpolator.
+
+    Raises
+    ------
+    ValueError
+        If ``engine`` is not one of :data:`INTERP_ENGINES`.
+    ImportError
+        If ``engine`` is ``'scipy'`` and SciPy is not installed.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _linear_interpolator
+    >>> x = np.array([0.0, 1.0, 3.0])
+    >>> _linear_interpolator((x,), 2*x, engine='numpy')([[2.0]])
+    array([4.])
+    """
+    if engine is None:
+        engine = 'scipy' if SCIPY_AVAILABLE else 'numpy'
+    if engine == 'scipy':
+        _except_no_scipy()
+        return RegularGridInterpolator(points, values, **kwargs)
+    if engine == 'numpy':
+        return _NpGridInterpolator(points, values, **kwargs)
+    raise ValueError(f"engine must be one of {list(INTERP_ENGINES)}; got {engine!r}")
+
+
+def _interpolate_by_tile(xi: np.ndarray,
+                         scales: Sequence[np.ndarray],
+                         read: Callable[[Tuple[Tuple[int, int], ...]], np.ndarray],
+                         tile_shape: Union[int, Sequence[int]],
+                         engine: Optional[Literal['scipy', 'numpy']] = None,
+                         workers: Optional[int] = 1,
+                         lock: Optional[Any] = None,
+                         **kwargs) -> np.ndarray:
+    """
+    Interpolate scattered positions tile by tile, reading only the tiles they occupy.
+
+    The positions are binned by the index-space tile of the grid cell they fall in;
+    each occupied tile is read (with its upper boundary, so that its cells are
+    complete), interpolated independently, and its values are scattered back into
+    the order of the positions.
+
+    Parameters
+    ----------
+    xi : np.ndarray
+        The ``(m, n)`` positions, in PSI order.
+    scales : Sequence[np.ndarray]
+        The scales of the whole grid, in PSI order.
+    read : Callable
+        Return the data (in storage, *i.e.* reversed PSI, order) of a window given
+        as ``(start, stop)`` index ranges in PSI order.
+    tile_shape : int | Sequence[int]
+        The number of grid cells of a tile along each dimension (in PSI order).
+    engine : {'scipy', 'numpy'} | None, optional
+        The interpolation engine (see :func:`_linear_interpolator`).
+    workers : int | None, optional
+        The maximum number of tiles evaluated concurrently; ``1`` (default)
+        evaluates them sequentially, and ``None`` uses the thread pool's default.
+    lock : threading.Lock | None, optional
+        A lock held around the calls to *read* (*e.g.* :data:`_H4_LOCK`).
+    **kwargs
+        Keyword arguments forwarded to the interpolator.
+
+    Returns
+    -------
+    out : np.ndarray
+        The ``(m,)`` interpolated values.
+
+    Raises
+    ------
+    ValueError
+        If a tile dimension is not a positive integer.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from psi_io.psi_io import _interpolate_by_tile
+    >>> x = np.arange(10.0)
+    >>> windows = []
+    >>> read = lambda window: windows.append(window) or 2*x[slice(*window[0])]
+    >>> _interpolate_by_tile(np.array([[0.5], [8.5], [1.5]]), (x,), read, 3, engine='numpy')
+    array([ 1., 17.,  3.])
+    >>> windows
+    [((0, 4),), ((6, 10),)]
+    """
+    ndim = len(scales)
+    tile_shape = np.broadcast_to(np.asarray(tile_shape, dtype=np.intp), (ndim,))
+    if np.any(tile_shape < 1):
+        raise ValueError(f"tile_shape must hold positive integers; got {tuple(tile_shape)}")
+    tiles = np.empty(xi.shape, dtype=np.intp)
+    for axis, scale in enumerate(scales):
+        cells = np.clip(np.searchsorted(scale, xi[:, axis], side='right') - 1, 0, max(scale.size - 2, 0))
+        tiles[:, axis] = cells // tile_shape[axis]
+    tiles, inverse = np.unique(tiles, axis=0, return_inverse=True)
+    order = np.argsort(inverse.ravel(), kind='stable')
+    bounds = np.searchsorted(inverse.ravel()[order], np.arange(len(tiles) + 1))
+
+    def evaluate(k):
+        window = tuple((int(tile*size), int(min((tile + 1)*size + 1, scale.size)))
+                       for tile, size, scale in zip(tiles[k], tile_shape, scales))
+        with lock or nullcontext():
+            data = read(window)
+        interpolator = _linear_interpolator([scale[start:stop] for scale, (start, stop) in zip(scales, window)],
+                                            np.asarray(data).T, engine=engine, **kwargs)
+        index = order[bounds[k]:bounds[k + 1]]
+        return index, interpolator(xi[index])
+
+    if workers == 1 or len(tiles) < 2:
+        results = [evaluate(k) for k in range(len(tiles))]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(evaluate, range(len(tiles))))
+    out = np.empty(len(xi), dtype=np.result_type(*(values.dtype for _, values in results)) if results else float)
+    for index, values in results:
+        out[index] = values
+    return out
+
+
 def _check_index_ranges(arr_size: int,
                         i0: Union[int, np.integer],
                         i1: Union[int, np.integer]
@@ -2910,7 +8106,9 @@ def _parse_index_inputs(input: Union[int, slice, Sequence[Union[int, None]], Non
         The index specification to parse:
 
         - *int* — selects a single-element slice ``[n, n+1)``.
-        - *Sequence[int | None]* — unpacked directly into :class:`slice`.
+        - *slice* — returned unchanged.
+        - *Sequence[int | None]* — unpacked directly into :class:`slice`, as
+          ``(start, stop)`` or ``(start, stop, step)``.
         - ``None`` — selects the entire dimension.
 
     Returns
@@ -2922,6 +8120,8 @@ def _parse_index_inputs(input: Union[int, slice, Sequence[Union[int, None]], Non
     ------
     TypeError
         If the input type is unsupported.
+    ValueError
+        If the step is not a positive integer.
 
     Examples
     --------
@@ -2930,17 +8130,24 @@ def _parse_index_inputs(input: Union[int, slice, Sequence[Union[int, None]], Non
     slice(3, 4, None)
     >>> _parse_index_inputs((2, 7))
     slice(2, 7, None)
+    >>> _parse_index_inputs((None, None, 4))
+    slice(None, None, 4)
     >>> _parse_index_inputs(None)
     slice(None, None, None)
     """
     if isinstance(input, int):
         return slice(input, input + 1)
+    elif isinstance(input, slice):
+        slice_ = input
     elif isinstance(input, Sequence):
-        return slice(*input)
+        slice_ = slice(*input)
     elif input is None:
         return slice(None)
     else:
         raise TypeError("Unsupported input type for slicing.")
+    if slice_.step is not None and slice_.step < 1:
+        raise ValueError(f"Slice step must be a positive integer; got {slice_.step}")
+    return slice_
 
 
 def _parse_value_inputs(dimproxy,
@@ -0,0 +1,154 @@
+"""Unit tests for psi_io.aio."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from psi_io import (read_hdf_data,
+                    read_hdf_by_index,
+                    read_hdf_by_value,
+                    read_hdf_by_ivalue,
+                    read_hdf_meta,
+                    np_interpolate_slice_from_hdf,
+                    write_hdf_data,
+                    )
+from psi_io import aio
+from tests.utils import generate_mock_data
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor():
+    yield
+    aio.configure_executor(aio.AIO_MAX_WORKERS)
+    aio.shutdown_executor()
+
+
+class _Probe:
+    """Callable recording the peak number of concurrent calls."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, ifile):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return ifile
+
+
+async def _gather(*coroutines):
+    return await asyncio.gather(*coroutines)
+
+
+# ===========================================================================
+# Readers
+# ===========================================================================
+
+class TestReaders:
+
+    @pytest.mark.parametrize("sync, async_, xi", [
+        (read_hdf_data, aio.read_hdf_data, ()),
+        (read_hdf_by_index, aio.read_hdf_by_index, ((1, 5), None, 2)),
+        (read_hdf_by_value, aio.read_hdf_by_value, (2.5, None, (1.0, 4.0))),
+        (read_hdf_by_ivalue, aio.read_hdf_by_ivalue, (2.5, None, None)),
+        (np_interpolate_slice_from_hdf, aio.np_interpolate_slice_from_hdf, (2.5, None, 3.5)),
+    ])
+    def test_matches_sync(self, generated_files, sync, async_, xi):
+        filepath = generated_files['float32'][3][True]
+        expected = sync(filepath, *xi)
+        result = asyncio.run(async_(filepath, *xi))
+        assert len(result) == len(expected)
+        for array, expected_array in zip(result, expected):
+            assert_array_equal(array, expected_array)
+
+    def test_keyword_arguments(self, generated_files):
+        filepath = generated_files['float64'][3][True]
+        data = asyncio.run(aio.read_hdf_by_index(filepath, 0, None, None, return_scales=False, dtype=np.float32))
+        assert data.dtype == np.float32
+
+    def test_read_hdf_meta(self, generated_files):
+        filepath = generated_files['float32'][2][True]
+        assert asyncio.run(aio.read_hdf_meta(filepath)) == read_hdf_meta(filepath)
+
+    def test_errors_propagate(self, tmp_path):
+        with pytest.raises(ValueError, match="HDF5"):
+            asyncio.run(aio.read_hdf_data(tmp_path / "data.txt"))
+
+
+# ===========================================================================
+# Scheduling
+# ===========================================================================
+
+class TestScheduling:
+
+    def test_same_file_is_serialized(self, tmp_path):
+        probe = _Probe()
+        ifile = tmp_path / "a.h5"
+        asyncio.run(_gather(*(aio._run(probe, ifile) for _ in range(4))))
+        assert probe.peak == 1
+
+    def test_different_files_run_concurrently(self, tmp_path):
+        barrier = threading.Barrier(3, timeout=5)
+        asyncio.run(_gather(*(aio._run(lambda f: barrier.wait(), tmp_path / f"{i}.h5") for i in range(3))))
+
+    def test_slow_file_does_not_hold_workers(self, tmp_path):
+        aio.configure_executor(2)
+        slow, fast = tmp_path / "slow.h5", tmp_path / "fast.h5"
+        finished = []
+
+        async def main():
+            async def read(ifile, delay):
+                await aio._run(lambda f: time.sleep(delay), ifile)
+                finished.append(ifile)
+            await asyncio.gather(*(read(slow, 0.1) for _ in range(4)), read(fast, 0))
+
+        asyncio.run(main())
+        assert finished.index(fast) == 0
+
+    def test_concurrency_limit(self, tmp_path):
+        aio.configure_executor(2)
+        probe = _Probe()
+        asyncio.run(_gather(*(aio._run(probe, tmp_path / f"{i}.h5") for i in range(6))))
+        assert probe.peak == 2
+
+    def test_hdf4_files_share_a_turn(self, tmp_path):
+        probe = _Probe()
+        asyncio.run(_gather(*(aio._run(probe, tmp_path / f"{i}.hdf") for i in range(3))))
+        assert probe.peak == 1
+
+    def test_turns_are_released(self, tmp_path):
+        async def main():
+            await aio._run(lambda f: f, tmp_path / "a.h5")
+            return dict(aio._TURNS[asyncio.get_running_loop()])
+        assert asyncio.run(main()) == {}
+
+    def test_turn_key_does_not_touch_the_filesystem(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(aio.Path, 'resolve', lambda self, *args: pytest.fail("resolve() called"))
+        assert aio._turn_key("a.h5") == aio._turn_key(tmp_path / "sub" / ".." / "a.h5") == str(tmp_path / "a.h5")
+        assert aio._turn_key(tmp_path / "b.hdf") == aio._turn_key("c.hdf") == aio._H4_TURN
+
+    def test_invalid_max_workers(self):
+        with pytest.raises(ValueError, match="max_workers"):
+            aio.configure_executor(0)
+
+    def test_hdf4_reads(self, tmp_path):
+        pytest.importorskip("pyhdf")
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        paths = [write_hdf_data(tmp_path / f"br00{i}.hdf", fdata + i, *sdata) for i in range(3)]
+        results = asyncio.run(_gather(*(aio.read_hdf_by_index(p, None, 2, None, return_scales=False)
+                                        for p in paths)))
+        for i, result in enumerate(results):
+            assert_array_equal(result, (fdata + i)[:, 2:3, :])
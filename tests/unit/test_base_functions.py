@@ -1,5 +1,8 @@
+import os
 from pathlib import Path
 
+import h5py as h5
+
 import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
@@ -14,8 +17,37 @@ from psi_io import (read_hdf_data,
                     read_hdf_by_ivalue,
                     rdhdf_1d, rdhdf_2d, rdhdf_3d,
                     get_scales_1d, get_scales_2d, get_scales_3d,
-                    convert_psih4_to_psih5
+                    convert,
+                    convert_psih4_to_psih5,
+                    iter_hdf_slabs,
+                    read_hdf_scales,
+                    read_hdf_series,
+                    np_interpolate_slice_from_hdf,
+                    configure_handle_pool,
+                    handle_pool_info,
+                    clear_handle_pool,
+                    configure_meta_cache,
+                    meta_cache_info,
+                    clear_meta_cache,
+                    BufferPool,
+                    build_hdf_pyramid,
+                    read_hdf_levels,
+                    coarsen_array,
+                    coarsen_scale,
+                    HdfWriter,
+                    HdfSequenceWriter,
+                    read_hdf_sequences,
+                    interpolate_positions_from_hdf,
+                    instantiate_linear_interpolator,
+                    InterpolationPlan,
+                    PointQuery,
+                    RegridPlan,
+                    regrid_hdf_data,
+                    plan_hdf_read,
                     )
+from psi_io import psi_io as psi_io_module
+from psi_io.psi_io import CONVERT_SLAB_NBYTES, SCIPY_AVAILABLE, _NpGridInterpolator
+from psi_io.psi_io import HdfHandlePool, HdfMetaCache, _auto_chunk_shape, _copy_by_slab, _read_index_union
 from tests.conftest import HDF_VERSION_MAPPINGS
 from tests.utils import generate_data_shape, generate_mock_data
 
@@ -49,6 +81,17 @@ def test_read_rtp_meta(hdf_version, datatype, generated_files):
         assert result[dim] == (esize, 0, esize-1)
 
 
+def test_read_hdf_scales(hdf_version, dimensionality, scales_included, generated_files):
+    result = read_hdf_scales(generated_files['float64'][dimensionality][scales_included])
+    assert len(result) == dimensionality
+    if scales_included:
+        _, *expected = generate_mock_data(dimensionality, 'float64', True)
+        for darray, earray in zip(result, expected):
+            assert_array_equal(darray, earray)
+    else:
+        assert all(scale is None for scale in result)
+
+
 def test_read_hdf_data(hdf_version, datatype, dimensionality, scales_included, generated_files):
     result = read_hdf_data(generated_files[datatype][dimensionality][scales_included])
     expected = generate_mock_data(dimensionality, datatype, scales_included)
@@ -361,3 +404,1509 @@ class TestReadHdfMetaAttr:
         meta_result, *_ = read_hdf_meta(generated_files[datatype][3][True])
         for scale in meta_result.scales:
             assert isinstance(scale.attr, dict)
+
+
+class TestHandlePool:
+
+    @pytest.fixture(autouse=True)
+    def pool(self):
+        configure_handle_pool(4)
+        clear_handle_pool()
+        clear_meta_cache()
+        yield
+        configure_handle_pool(0)
+        clear_handle_pool()
+
+    def test_repeated_reads_hit_pool(self, hdf_version, generated_files):
+        filepath = generated_files['float32'][3][True]
+        for _ in range(3):
+            read_hdf_by_index(filepath, 0, None, None)
+        info = handle_pool_info()
+        assert info.misses == 1
+        assert info.hits == 2
+        assert info.currsize == 1
+
+    def test_pooled_reads_match_unpooled(self, hdf_version, dimensionality, generated_files):
+        filepath = generated_files['float64'][dimensionality][True]
+        pooled = read_hdf_data(filepath)
+        configure_handle_pool(0)
+        unpooled = read_hdf_data(filepath)
+        for parray, uarray in zip(pooled, unpooled):
+            assert_array_equal(parray, uarray)
+
+    def test_lru_eviction_bounds_open_handles(self, hdf_version, datatype, generated_files):
+        for dimensionality in (1, 2, 3):
+            for scales in (True, False):
+                read_hdf_meta(generated_files[datatype][dimensionality][scales])
+        info = handle_pool_info()
+        assert info.currsize == 4
+        assert info.evictions == 2
+
+    def test_write_after_read_replaces_handle(self, tmp_path, hdf_version):
+        fp = tmp_path / f"pooled{HDF_VERSION_MAPPINGS[hdf_version]['extension']}"
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        write_hdf_data(fp, fdata, *sdata)
+        read_hdf_data(fp)
+        write_hdf_data(fp, fdata + 1, *sdata)
+        result, *_ = read_hdf_data(fp)
+        assert_array_equal(result, fdata + 1)
+        assert handle_pool_info().misses == 2
+
+    def test_disabled_pool_holds_no_handles(self, hdf_version, generated_files):
+        configure_handle_pool(0)
+        read_hdf_data(generated_files['float32'][1][True])
+        assert handle_pool_info().currsize == 0
+
+    def test_negative_size_raises(self):
+        with pytest.raises(ValueError):
+            configure_handle_pool(-1)
+
+    def test_evicted_lease_closes_on_release(self, hdf_version, generated_files):
+        pool = HdfHandlePool(maxsize=1)
+        filepath = generated_files['float32'][1][True]
+        with pool.lease(filepath) as handle:
+            pool.evict(filepath)
+            assert filepath not in pool
+            read_hdf_meta(filepath)
+        assert pool.info().currsize == 0
+
+
+class TestChunkedWrite:
+
+    @pytest.mark.parametrize("shape, itemsize", [
+        ((1000, 1000, 1000), 4),
+        ((299, 142, 255), 8),
+        ((2, 5000, 5000), 8),
+        ((100000,), 4),
+    ])
+    def test_auto_chunk_shape_respects_target(self, shape, itemsize):
+        chunks = _auto_chunk_shape(shape, itemsize)
+        assert len(chunks) == len(shape)
+        assert all(1 <= c <= s for c, s in zip(chunks, shape))
+        assert np.prod(chunks) * itemsize <= 1 << 18
+
+    def test_auto_chunk_shape_small_dataset(self):
+        assert _auto_chunk_shape((7, 5, 3), 8) == (7, 5, 3)
+
+    @pytest.mark.parametrize("compression", ['gzip', 'lzf'])
+    def test_compressed_write_and_readback(self, tmp_path, datatype, dimensionality, compression):
+        fp = tmp_path / "compressed.h5"
+        fdata, *sdata = generate_mock_data(dimensionality, datatype, True)
+        write_hdf_data(fp, fdata, *sdata, compression=compression, shuffle=True)
+        result, *scales = read_hdf_data(fp)
+        assert_array_equal(result, fdata)
+        for scale, expected in zip(scales, sdata):
+            assert_array_equal(scale, expected)
+        with h5.File(fp, 'r') as hdf:
+            assert hdf['Data'].compression == compression
+            assert hdf['Data'].chunks == _auto_chunk_shape(fdata.shape, fdata.dtype.itemsize)
+
+    def test_explicit_chunks(self, tmp_path):
+        fp = tmp_path / "chunked.h5"
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        write_hdf_data(fp, fdata, *sdata, chunks=(1, 3, 5), compression='gzip', compression_opts=4)
+        with h5.File(fp, 'r') as hdf:
+            assert hdf['Data'].chunks == (1, 3, 5)
+            assert hdf['Data'].compression_opts == 4
+
+    def test_default_write_is_contiguous(self, tmp_path):
+        fp = tmp_path / "contiguous.h5"
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        write_hdf_data(fp, fdata, *sdata)
+        with h5.File(fp, 'r') as hdf:
+            assert hdf['Data'].chunks is None
+
+    @pytest.mark.parametrize("options", [dict(chunks='auto'), dict(shuffle=True), dict(compression='lzf')])
+    def test_hdf4_rejects_storage_options(self, tmp_path, options):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        with pytest.raises(ValueError):
+            write_hdf_data(tmp_path / "out.hdf", fdata, *sdata, **options)
+
+    @pytest.mark.parametrize("options", [dict(compression='gzip'), dict(compression=9)])
+    def test_hdf4_compressed_write(self, tmp_path, options):
+        pytest.importorskip("pyhdf")
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        fdata = np.asfortranarray(fdata)
+        fp = write_hdf_data(tmp_path / "compressed.hdf", fdata, *sdata, **options)
+        plain = write_hdf_data(tmp_path / "plain.hdf", np.zeros_like(fdata), *sdata)
+        assert fp.stat().st_size < plain.stat().st_size
+        result, *scales = read_hdf_data(fp)
+        assert_array_equal(result, fdata)
+        for scale, expected in zip(scales, sdata):
+            assert_array_equal(scale, expected)
+        converted = convert(fp, tmp_path / "converted.h5")
+        assert_array_equal(read_hdf_data(convert(converted, tmp_path / "roundtrip.hdf", compression='gzip'))[0],
+                           fdata)
+        with pytest.raises(ValueError, match="slab_nbytes"):
+            convert(converted, tmp_path / "large.hdf", compression='gzip', slab_nbytes=fdata.nbytes - 1)
+        assert not (tmp_path / "large.hdf").exists()
+
+    @pytest.mark.parametrize("layout", ['fortran', 'strided', 'swapped'])
+    def test_hdf4_slab_write(self, tmp_path, monkeypatch, layout):
+        pytest.importorskip("pyhdf")
+        import psi_io.psi_io as psi_io_module
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        data = {'fortran': np.asfortranarray(fdata),
+                'strided': np.repeat(fdata, 2, axis=-1)[..., ::2],
+                'swapped': fdata.astype(fdata.dtype.newbyteorder())}[layout]
+        slabs = []
+        copy_by_slab = psi_io_module._copy_by_slab
+        monkeypatch.setattr(psi_io_module, '_copy_by_slab',
+                            lambda *args, **kwargs: slabs.append(args) or copy_by_slab(*args, **kwargs))
+        write_hdf_data(tmp_path / "out.hdf", data, *sdata)
+        assert slabs
+        assert_array_equal(read_hdf_data(tmp_path / "out.hdf")[0], fdata)
+
+    def test_convert_with_compression(self, tmp_path, generated_files):
+        ifile = generated_files['float32'][3][True]
+        ofile = convert(ifile, tmp_path / "converted.h5", compression='gzip')
+        dataset_id = read_hdf_meta(ofile)[0].name
+        assert_array_equal(read_hdf_data(ofile, dataset_id=dataset_id)[0], read_hdf_data(ifile)[0])
+        with h5.File(ofile, 'r') as hdf:
+            assert hdf[dataset_id].compression == 'gzip'
+
+    def test_convert_with_fletcher32(self, tmp_path, generated_files):
+        ifile = generated_files['float32'][3][True]
+        ofile = convert(ifile, tmp_path / "converted.h5", fletcher32=True)
+        dataset_id = read_hdf_meta(ofile)[0].name
+        assert_array_equal(read_hdf_data(ofile, dataset_id=dataset_id)[0], read_hdf_data(ifile)[0])
+        with h5.File(ofile, 'r') as hdf:
+            assert hdf[dataset_id].fletcher32
+
+
+class TestStreamingConvert:
+
+    @pytest.fixture
+    def multi_dataset_file(self, tmp_path):
+        fp = tmp_path / "multi.h5"
+        br, *br_scales = generate_mock_data(3, 'float32', True)
+        with h5.File(fp, 'w') as hdf:
+            for name, data in (('br', br), ('bt', br * 2), ('vr', br[:-1] + 1)):
+                dataset = hdf.create_dataset(name, data=data)
+                dataset.attrs['units'] = name
+                for i, scale in enumerate(br_scales):
+                    scale = scale[:data.shape[::-1][i]]
+                    scale_id = f"{name}_dim{i+1}"
+                    hdf.create_dataset(scale_id, data=scale)
+                    dataset.dims[i].attach_scale(hdf[scale_id])
+        return fp
+
+    @staticmethod
+    def _assert_same_contents(expected_fp, result_fp):
+        expected = {m.name: m for m in read_hdf_meta(expected_fp)}
+        result = {m.name: m for m in read_hdf_meta(result_fp)}
+        assert expected.keys() == result.keys()
+        for name in expected:
+            assert result[name].attr['units'] == expected[name].attr['units']
+            edata, *escales = read_hdf_data(expected_fp, dataset_id=name)
+            rdata, *rscales = read_hdf_data(result_fp, dataset_id=name)
+            assert_array_equal(rdata, edata)
+            for rscale, escale in zip(rscales, escales):
+                assert_array_equal(rscale, escale)
+
+    def test_multi_dataset_roundtrip(self, tmp_path, multi_dataset_file):
+        pytest.importorskip("pyhdf")
+        h4_fp = convert(multi_dataset_file, tmp_path / "multi.hdf", slab_nbytes=1)
+        self._assert_same_contents(multi_dataset_file, h4_fp)
+        h5_fp = convert(h4_fp, tmp_path / "roundtrip.h5", slab_nbytes=1)
+        self._assert_same_contents(multi_dataset_file, h5_fp)
+
+    @pytest.mark.parametrize("slab_nbytes", [1, 1000, 1 << 30])
+    def test_slab_size_does_not_change_result(self, tmp_path, hdf_version, generated_files, slab_nbytes):
+        ifile = generated_files['float64'][3][True]
+        ofile = convert(ifile, tmp_path / "out.h5", slab_nbytes=slab_nbytes)
+        dataset_id = read_hdf_meta(ifile)[0].name
+        assert_array_equal(read_hdf_data(ofile, dataset_id=dataset_id)[0], read_hdf_data(ifile)[0])
+
+    def test_copy_by_slab_bounds_reads(self):
+        source = np.arange(11 * 4 * 3, dtype=np.float64).reshape(11, 4, 3)
+        reads = []
+
+        class Recorder:
+            def __getitem__(self, item):
+                reads.append(source[item].nbytes)
+                return source[item]
+
+        target = np.empty_like(source)
+        _copy_by_slab(Recorder(), target, source.shape, source.itemsize, slab_nbytes=3 * 96)
+        assert_array_equal(target, source)
+        assert max(reads) == 3 * 96
+        assert len(reads) == 4
+
+    def test_copy_by_slab_bounds_reads_of_large_chunks(self, tmp_path):
+        source = np.arange(11 * 4 * 3, dtype=np.float64).reshape(11, 4, 3)
+        reads = []
+
+        class Recorder:
+            def __getitem__(self, item):
+                reads.append(source[item].nbytes)
+                return source[item]
+
+        with h5.File(tmp_path / "chunked.h5", 'w') as hdf:
+            target = hdf.create_dataset('Data', shape=source.shape, dtype=source.dtype,
+                                        chunks=(8, 4, 3), compression='gzip')
+            _copy_by_slab(Recorder(), target, source.shape, source.itemsize, slab_nbytes=3 * 96,
+                          chunks=target.chunks)
+            assert_array_equal(target[...], source)
+        assert max(reads) <= 3 * 96  # a row of chunks holds 8 * 96 bytes
+
+    def test_iter_hdf_slabs(self, hdf_version, generated_files):
+        ifile = generated_files['float64'][3][True]
+        data = read_hdf_data(ifile)[0]
+        plane_nbytes = data[0].nbytes
+        slabs = list(iter_hdf_slabs(ifile, slab_nbytes=2 * plane_nbytes))
+        assert len(slabs) == -(-data.shape[0] // 2)
+        assert max(slab.nbytes for slab in slabs) <= 2 * plane_nbytes
+        assert_array_equal(np.concatenate(slabs), data)
+
+    def test_same_file_raises(self, tmp_path):
+        fp = tmp_path / "same.h5"
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        write_hdf_data(fp, fdata, *sdata)
+        with pytest.raises(ValueError):
+            convert(fp, fp)
+
+
+class TestReadHdfSeries:
+
+    @pytest.fixture
+    def series_files(self, tmp_path, hdf_version):
+        ext = HDF_VERSION_MAPPINGS[hdf_version]['extension']
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        filepaths = []
+        for i in range(5):
+            filepaths.append(write_hdf_data(tmp_path / f"br00{i}{ext}", fdata * (i + 1), *sdata))
+        return filepaths
+
+    @pytest.mark.parametrize("executor, workers", [('thread', None), ('thread', 1), ('process', 2)])
+    @pytest.mark.parametrize("method, xi", [
+        ('interp', (1.5, None, None)),
+        ('interp', (1.5, 1.5, 1.5)),
+        ('value', (None, 1.5, None)),
+        ('ivalue', (None, None, 1.5)),
+        ('index', (0, (1, 3), None)),
+    ])
+    def test_matches_serial_reads(self, series_files, method, xi, executor, workers):
+        reader = {'interp': np_interpolate_slice_from_hdf, 'value': read_hdf_by_value,
+                  'ivalue': read_hdf_by_ivalue, 'index': read_hdf_by_index}[method]
+        data, *scales = read_hdf_series(series_files, *xi, method=method, workers=workers, executor=executor)
+        assert data.shape[0] == len(series_files)
+        for i, filepath in enumerate(series_files):
+            expected, *expected_scales = reader(filepath, *xi)
+            assert_array_equal(data[i], expected)
+            for scale, expected_scale in zip(scales, expected_scales):
+                assert_array_equal(scale, expected_scale)
+
+    def test_glob_is_sorted(self, series_files):
+        pattern = str(series_files[0].parent / f"br*{series_files[0].suffix}")
+        data, *_ = read_hdf_series(pattern, 1.5, None, None)
+        for i in range(len(series_files)):
+            assert_array_equal(data[i], data[0] * (i + 1))
+
+    def test_mismatched_grid_raises(self, tmp_path, series_files):
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        other = write_hdf_data(tmp_path / f"other{series_files[0].suffix}", fdata, sdata[0] * 2, *sdata[1:])
+        with pytest.raises(ValueError):
+            read_hdf_series([*series_files, other], None, None, 1.5, method='value', workers=1)
+
+    def test_invalid_arguments_raise(self, series_files):
+        with pytest.raises(ValueError):
+            read_hdf_series(series_files, 1.5, None, None, method='nearest')
+        with pytest.raises(ValueError):
+            read_hdf_series(series_files, 1.5, None, None, executor='fiber')
+        with pytest.raises(ValueError):
+            read_hdf_series([], 1.5, None, None)
+
+
+class TestMemmapReads:
+
+    def test_read_hdf_data_maps_contiguous_h5(self, tmp_path, datatype, dimensionality):
+        fdata, *sdata = generate_mock_data(dimensionality, datatype, True)
+        fp = write_hdf_data(tmp_path / "contiguous.h5", fdata, *sdata)
+        data, *scales = read_hdf_data(fp, memmap=True)
+        assert isinstance(data, np.memmap)
+        assert not data.flags.writeable
+        assert_array_equal(data, fdata)
+        for scale, expected in zip(scales, sdata):
+            assert_array_equal(scale, expected)
+
+    def test_read_hdf_by_index_returns_view(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        fp = write_hdf_data(tmp_path / "contiguous.h5", fdata, *sdata)
+        data, *scales = read_hdf_by_index(fp, 0, (1, 3), None, memmap=True)
+        expected, *expected_scales = read_hdf_by_index(fp, 0, (1, 3), None)
+        assert isinstance(data, np.memmap)
+        assert_array_equal(data, expected)
+        for scale, expected_scale in zip(scales, expected_scales):
+            assert_array_equal(scale, expected_scale)
+
+    def test_filtered_dataset_falls_back(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        fp = write_hdf_data(tmp_path / "compressed.h5", fdata, *sdata, compression='gzip')
+        data, *_ = read_hdf_data(fp, memmap=True)
+        assert not isinstance(data, np.memmap)
+        assert_array_equal(data, fdata)
+
+    def test_hdf4_falls_back(self, hdf_version, generated_files):
+        filepath = generated_files['float32'][3][True]
+        data, *_ = read_hdf_by_index(filepath, None, 1, None, memmap=True)
+        assert_array_equal(data, read_hdf_by_index(filepath, None, 1, None)[0])
+        if hdf_version == 'h4':
+            assert not isinstance(data, np.memmap)
+
+
+class TestOutBuffers:
+
+    def test_read_hdf_data_fills_out(self, generated_files):
+        filepath = generated_files['float32'][3][True]
+        expected, *expected_scales = read_hdf_data(filepath)
+        out = np.empty(expected.shape, dtype=np.float64)
+        data, *scales = read_hdf_data(filepath, out=out)
+        assert data is out
+        assert_array_equal(out, expected)
+        for scale, expected_scale in zip(scales, expected_scales):
+            assert_array_equal(scale, expected_scale)
+
+    @pytest.mark.parametrize("reader, xi", [
+        (read_hdf_by_index, (0, None, (2, 5))),
+        (read_hdf_by_value, (None, 0.5, None)),
+        (read_hdf_by_ivalue, (None, 1.5, 2.5)),
+    ])
+    def test_readers_fill_out(self, generated_files, reader, xi):
+        filepath = generated_files['float64'][3][True]
+        expected = reader(filepath, *xi, return_scales=False)
+        out = np.full(expected.shape, np.nan)
+        assert reader(filepath, *xi, return_scales=False, out=out) is out
+        assert_array_equal(out, expected)
+
+    def test_non_contiguous_out(self, generated_files):
+        filepath = generated_files['float32'][3][True]
+        expected = read_hdf_by_index(filepath, None, 1, None, return_scales=False)
+        out = np.zeros(expected.shape[::-1]).T
+        read_hdf_by_index(filepath, None, 1, None, return_scales=False, out=out)
+        assert_array_equal(out, expected)
+
+    def test_wrong_shape_raises(self, generated_files):
+        filepath = generated_files['float32'][3][True]
+        with pytest.raises(ValueError, match="shape"):
+            read_hdf_by_index(filepath, 0, None, None, out=np.empty((2, 2, 2)))
+
+    def test_memmap_and_out_are_exclusive(self, tmp_path):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        fp = write_hdf_data(tmp_path / "data.h5", fdata, *sdata)
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            read_hdf_data(fp, memmap=True, out=np.empty(fdata.shape))
+
+    def test_buffer_pool_reuses_arrays(self, generated_files):
+        filepath = generated_files['float32'][3][True]
+        pool = BufferPool()
+        first = read_hdf_by_index(filepath, 0, None, None, return_scales=False, out=pool)
+        expected = first.copy()
+        pool.release(first)
+        second = read_hdf_by_index(filepath, 0, None, None, return_scales=False, out=pool)
+        assert second is first
+        assert_array_equal(second, expected)
+        other = read_hdf_by_index(filepath, 1, None, None, return_scales=False, out=pool)
+        assert other is not second
+
+
+class TestBufferPool:
+
+    def test_acquire_and_release(self):
+        pool = BufferPool(maxbuffers=1)
+        a, b = pool.acquire((3, 4), 'f4'), pool.acquire((3, 4), 'f4')
+        assert a is not b and a.shape == (3, 4) and a.dtype == np.float32
+        pool.release(a)
+        pool.release(b)
+        assert len(pool) == 1
+        assert pool.acquire((3, 4), 'f4') is a
+        assert pool.acquire((3, 4), 'f8') is not b
+
+    def test_release_view(self):
+        pool = BufferPool()
+        a = pool.acquire((3, 4))
+        pool.release(a.T[1:])
+        assert pool.acquire((3, 4)) is a
+
+    def test_release_foreign_or_twice_raises(self):
+        pool = BufferPool()
+        with pytest.raises(ValueError):
+            pool.release(np.empty(3))
+        a = pool.acquire((3,))
+        pool.release(a)
+        with pytest.raises(ValueError):
+            pool.release(a)
+
+    def test_borrow_and_clear(self):
+        pool = BufferPool()
+        with pool.borrow((2,), np.int32) as a:
+            assert a.dtype == np.int32
+        assert len(pool) == 1
+        pool.clear()
+        assert len(pool) == 0
+
+    def test_negative_maxbuffers_raises(self):
+        with pytest.raises(ValueError):
+            BufferPool(-1)
+
+
+class TestMetaCache:
+
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        clear_meta_cache()
+        yield
+        configure_meta_cache(128)
+        clear_meta_cache()
+
+    def test_repeated_value_reads_hit_cache(self, hdf_version, generated_files):
+        filepath = generated_files['float32'][3][True]
+        first = read_hdf_by_value(filepath, 0.5, None, (0.2, 0.7))
+        for _ in range(2):
+            result = read_hdf_by_value(filepath, 0.5, None, (0.2, 0.7))
+        info = meta_cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+        assert info.currsize == 1
+        configure_meta_cache(0)
+        uncached = read_hdf_by_value(filepath, 0.5, None, (0.2, 0.7))
+        for carray, farray, uarray in zip(result, first, uncached):
+            assert_array_equal(carray, uarray)
+            assert_array_equal(farray, uarray)
+        assert meta_cache_info().currsize == 0
+
+    def test_returned_scales_are_writeable_copies(self, generated_files):
+        filepath = generated_files['float64'][2][True]
+        _, x, _ = read_hdf_by_value(filepath, None, 0.5)
+        x[:] = -1
+        _, x, _ = read_hdf_by_value(filepath, None, 0.5)
+        assert np.all(x >= 0)
+
+    def test_rewrite_invalidates(self, tmp_path, hdf_version):
+        fp = tmp_path / f"cached{HDF_VERSION_MAPPINGS[hdf_version]['extension']}"
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        write_hdf_data(fp, fdata, *sdata)
+        _, x, _ = read_hdf_by_value(fp, None, None)
+        write_hdf_data(fp, fdata, sdata[0] + 10, sdata[1])
+        _, x, _ = read_hdf_by_value(fp, None, None)
+        assert_array_equal(x, sdata[0] + 10)
+
+    def test_replaced_file_invalidates(self, tmp_path):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        fp = write_hdf_data(tmp_path / "cached.h5", fdata, *sdata)
+        stat = fp.stat()
+        _, x, _ = read_hdf_by_value(fp, None, None)
+        write_hdf_data(tmp_path / "new.h5", fdata, sdata[0] + 10, sdata[1])
+        os.replace(tmp_path / "new.h5", fp)
+        os.utime(fp, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert (fp.stat().st_mtime_ns, fp.stat().st_size) == (stat.st_mtime_ns, stat.st_size)
+        _, x, _ = read_hdf_by_value(fp, None, None)
+        assert_array_equal(x, sdata[0] + 10)
+
+    def test_uncached_value_reads(self, hdf_version, generated_files):
+        filepath = generated_files['float64'][3][True]
+        xi = (np.array([1.5, 7.2]), None, (0.5, 3.5))
+        expected = read_hdf_by_value(filepath, *xi)
+        configure_meta_cache(0)
+        for result, array in zip(read_hdf_by_value(filepath, *xi), expected):
+            assert_array_equal(result, array)
+        out = np.empty(expected[0].shape, dtype=np.float32)
+        assert read_hdf_by_value(filepath, *xi, return_scales=False, out=out) is out
+        assert_array_equal(out, expected[0])
+        with pytest.raises(ValueError, match="len"):
+            read_hdf_by_value(filepath, None, None)
+
+    def test_read_hdf_meta_returns_copies(self, generated_files):
+        filepath = generated_files['float32'][3][True]
+        read_hdf_meta(filepath)[0].attr['touched'] = True
+        meta = read_hdf_meta(filepath)
+        assert 'touched' not in meta[0].attr
+        assert meta_cache_info().hits == 1
+
+    def test_stale_entry_replaced(self, tmp_path):
+        cache = HdfMetaCache(maxsize=2)
+        fp = tmp_path / "file.h5"
+        fp.write_bytes(b"a")
+        assert cache.get(fp, 'x', lambda: 1) == 1
+        fp.write_bytes(b"bb")
+        assert cache.get(fp, 'x', lambda: 2) == 2
+        assert cache.info().currsize == 1
+        cache.evict(fp)
+        assert fp not in cache
+
+    def test_negative_size_raises(self):
+        with pytest.raises(ValueError):
+            configure_meta_cache(-1)
+
+
+class TestMultiValueSlicing:
+
+    def test_interpolate_stacks_values(self, generated_files):
+        filepath = generated_files['float64'][3][True]
+        radii = np.array([1.3, 8.0, 5.5])
+        shells, r, t, p = np_interpolate_slice_from_hdf(filepath, radii, None, None)
+        assert shells.shape == (len(p), len(t), 3)
+        assert_array_equal(r, radii)
+        # mock data is the sum of the indices, i.e. linear in every dimension
+        expected = np.add.outer(np.add.outer(p, t), radii)
+        np.testing.assert_allclose(shells, expected)
+        for k, radius in enumerate(radii):
+            single, *_ = np_interpolate_slice_from_hdf(filepath, radius, None, None)
+            np.testing.assert_allclose(shells[..., k], single)
+
+    def test_interpolate_mixed_scalar_and_values(self, generated_files):
+        filepath = generated_files['float64'][3][True]
+        result, r, p = np_interpolate_slice_from_hdf(filepath, [2.25, 6.5], 3.5, None)
+        assert result.shape == (len(p), 2)
+        np.testing.assert_allclose(result, p[:, None] + 3.5 + np.array([2.25, 6.5]))
+
+    def test_interpolate_by_index(self, generated_files):
+        filepath = generated_files['float32'][2][True]
+        result, x, y = np_interpolate_slice_from_hdf(filepath, [0.5, 9.75], None, by_index=True)
+        np.testing.assert_allclose(result, np.add.outer(y, [0.5, 9.75]))
+
+    def test_read_by_value_returns_bracket_union(self, generated_files):
+        filepath = generated_files['float32'][3][True]
+        f, r, t, p = read_hdf_by_value(filepath, np.array([1.5, 2.5, 8.0]), None, None)
+        assert_array_equal(r, [1, 2, 3, 7, 8])
+        assert_array_equal(f, read_hdf_by_index(filepath, None, None, None)[0][..., r.astype(int)])
+
+    def test_read_by_ivalue_returns_bracket_union(self, generated_files):
+        filepath = generated_files['float32'][2][True]
+        f, x, y = read_hdf_by_ivalue(filepath, np.array([0.5, 6.5]), None)
+        assert_array_equal(x, [0, 1, 6, 7])
+        assert f.shape == (len(y), 4)
+
+    @pytest.mark.parametrize("gap", [0, 100])
+    def test_index_union_merge_gap(self, monkeypatch, gap):
+        monkeypatch.setattr("psi_io.psi_io.UNION_MERGE_GAP", gap)
+        data = np.arange(60).reshape(3, 20)
+        indices = np.array([0, 1, 5, 6, 18])
+        result = _read_index_union(data, (np.array([0, 2]), indices))
+        assert_array_equal(result, data[np.ix_([0, 2], indices)])
+
+
+class TestStridedReads:
+
+    @pytest.mark.parametrize("xi", [((None, None, 4), None, slice(1, None, 3)),
+                                    (slice(None, None, 2), (2, 11, 5), 4)])
+    def test_read_by_index_matches_subsampled(self, generated_files, xi):
+        filepath = generated_files['float64'][3][True]
+        full, *full_scales = read_hdf_data(filepath)
+        data, *scales = read_hdf_by_index(filepath, *xi)
+        slices = [slice(*x) if isinstance(x, tuple) else slice(x, x + 1) if isinstance(x, int)
+                  else slice(None) if x is None else x for x in xi]
+        assert_array_equal(data, full[tuple(reversed(slices))])
+        for scale, full_scale, si in zip(scales, full_scales, slices):
+            assert_array_equal(scale, full_scale[si])
+
+    def test_strided_read_into_out(self, generated_files):
+        filepath = generated_files['float32'][3][True]
+        expected = read_hdf_by_index(filepath, (None, None, 3), None, (None, None, 2), return_scales=False)
+        out = np.empty(expected.shape, dtype=np.float32)
+        data = read_hdf_by_index(filepath, (None, None, 3), None, (None, None, 2), return_scales=False, out=out)
+        assert data is out
+        assert_array_equal(out, expected)
+
+    def test_strided_memmap(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        fp = write_hdf_data(tmp_path / "contiguous.h5", fdata, *sdata)
+        data, *_ = read_hdf_by_index(fp, (None, None, 2), None, None, memmap=True)
+        assert_array_equal(data, fdata[..., ::2])
+
+    @pytest.mark.parametrize("step", [0, -1])
+    def test_non_positive_step_raises(self, generated_files, step):
+        with pytest.raises(ValueError, match="step"):
+            read_hdf_by_index(generated_files['float32'][3][True], (None, None, step), None, None)
+
+
+class TestPyramid:
+
+    @pytest.fixture
+    def pyramid_file(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        return write_hdf_data(tmp_path / "pyramid.h5", fdata, *sdata, pyramid=2, pyramid_mesh=0b100), fdata, sdata
+
+    def test_levels_are_stored(self, pyramid_file):
+        filepath, fdata, _ = pyramid_file
+        assert read_hdf_levels(filepath) == [(17, 13, 11), (9, 7, 7), (5, 4, 5)]
+        assert [meta.name for meta in read_hdf_meta(filepath)] == ['Data']
+
+    def test_read_level(self, pyramid_file):
+        filepath, fdata, sdata = pyramid_file
+        data, *scales = read_hdf_data(filepath, level=2)
+        assert_array_equal(data, coarsen_array(fdata, 0b100, levels=2))
+        for scale, expected, half in zip(scales, sdata, (True, False, False)):
+            assert_array_equal(scale, coarsen_scale(expected, half, levels=2))
+
+    def test_read_level_by_index(self, pyramid_file):
+        filepath, *_ = pyramid_file
+        full, *full_scales = read_hdf_data(filepath, level=1)
+        data, *scales = read_hdf_by_index(filepath, 2, (None, None, 2), None, level=1)
+        assert_array_equal(data, full[:, ::2, 2:3])
+        assert_array_equal(scales[1], full_scales[1][::2])
+
+    def test_level_memmap(self, pyramid_file):
+        filepath, *_ = pyramid_file
+        data, *_ = read_hdf_data(filepath, level=1, memmap=True)
+        assert isinstance(data, np.memmap)
+        assert_array_equal(data, read_hdf_data(filepath, level=1)[0])
+
+    def test_build_replaces_levels(self, pyramid_file):
+        filepath, fdata, _ = pyramid_file
+        build_hdf_pyramid(filepath, 3, compression='gzip')
+        assert read_hdf_levels(filepath) == [(17, 13, 11), (9, 7, 6), (5, 4, 4), (3, 3, 3)]
+        assert_array_equal(read_hdf_data(filepath, level=3)[0], coarsen_array(fdata, 'main', levels=3))
+
+    def test_even_axes_keep_boundaries(self, tmp_path):
+        r, t, p = np.linspace(1, 2, 8), np.linspace(0, np.pi, 10), np.linspace(0, 2 * np.pi, 12)
+        fdata = np.add.outer(np.add.outer(p, t), r)
+        filepath = write_hdf_data(tmp_path / "even.h5", fdata, r, t, p, pyramid=2)
+        assert read_hdf_levels(filepath) == [(12, 10, 8), (7, 6, 5), (4, 4, 3)]
+        for level in (1, 2):
+            data, *scales = read_hdf_data(filepath, level=level)
+            for scale, expected in zip(scales, (r, t, p)):
+                assert (scale[0], scale[-1]) == (expected[0], expected[-1])
+            assert data[-1, -1, -1] == fdata[-1, -1, -1]
+
+    def test_mesh_attribute_is_used(self, tmp_path):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        filepath = write_hdf_data(tmp_path / "mesh.h5", fdata, *sdata, pyramid=1, mesh=0b10)
+        assert_array_equal(read_hdf_data(filepath, level=1)[0], coarsen_array(fdata, 0b10))
+
+    def test_missing_level_raises(self, pyramid_file):
+        with pytest.raises(KeyError):
+            read_hdf_data(pyramid_file[0], level=3)
+
+    def test_negative_level_raises(self, pyramid_file):
+        with pytest.raises(ValueError, match="level"):
+            read_hdf_by_index(pyramid_file[0], 0, None, None, level=-1)
+
+    def test_hdf4_unsupported(self, tmp_path):
+        pytest.importorskip("pyhdf")
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        with pytest.raises(ValueError, match="HDF5"):
+            write_hdf_data(tmp_path / "out.hdf", fdata, *sdata, pyramid=1)
+        filepath = write_hdf_data(tmp_path / "out.hdf", fdata, *sdata)
+        assert read_hdf_levels(filepath) == [fdata.shape]
+        with pytest.raises(ValueError, match="HDF5"):
+            read_hdf_data(filepath, level=1)
+
+
+class TestReadDtype:
+
+    def test_read_data_converts(self, generated_files):
+        filepath = generated_files['float64'][3][True]
+        expected, *expected_scales = read_hdf_data(filepath)
+        data, *scales = read_hdf_data(filepath, dtype=np.float32)
+        assert data.dtype == np.float32
+        assert_array_equal(data, expected.astype(np.float32))
+        for scale, expected_scale in zip(scales, expected_scales):
+            assert scale.dtype == expected_scale.dtype
+
+    @pytest.mark.parametrize("reader, xi", [(read_hdf_by_index, ((2, 8), None, 3)),
+                                            (read_hdf_by_value, (np.array([1.5, 6.5]), None, None)),
+                                            (read_hdf_by_ivalue, (2.5, (1.0, 4.0), None))])
+    def test_slice_readers_convert(self, generated_files, reader, xi):
+        filepath = generated_files['float32'][3][True]
+        expected = reader(filepath, *xi, return_scales=False)
+        data = reader(filepath, *xi, return_scales=False, dtype='float64')
+        assert data.dtype == np.float64
+        assert_array_equal(data, expected.astype(np.float64))
+
+    def test_h5_converts_during_read(self, tmp_path, monkeypatch):
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        filepath = write_hdf_data(tmp_path / "convert.h5", fdata, *sdata)
+        targets = []
+        read_direct = h5.Dataset.read_direct
+        monkeypatch.setattr(h5.Dataset, 'read_direct',
+                            lambda self, dest, *args, **kwargs: (targets.append(dest.dtype),
+                                                                 read_direct(self, dest, *args, **kwargs)))
+        read_hdf_by_index(filepath, None, (1, 5), None, dtype=np.float32)
+        assert targets == [np.float32]
+
+    def test_pool_acquires_requested_dtype(self, generated_files):
+        filepath = generated_files['float64'][3][True]
+        data = read_hdf_data(filepath, return_scales=False, out=BufferPool(), dtype=np.float32)
+        assert data.dtype == np.float32
+
+    def test_out_dtype_mismatch_raises(self, generated_files):
+        filepath = generated_files['float64'][3][True]
+        out = np.empty(generate_data_shape(3), dtype=np.float64)
+        with pytest.raises(ValueError, match="dtype"):
+            read_hdf_data(filepath, out=out, dtype=np.float32)
+
+    def test_memmap_only_for_stored_dtype(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        filepath = write_hdf_data(tmp_path / "contiguous.h5", fdata, *sdata)
+        assert isinstance(read_hdf_data(filepath, memmap=True, dtype=np.float64)[0], np.memmap)
+        data = read_hdf_data(filepath, memmap=True, dtype=np.float32)[0]
+        assert not isinstance(data, np.memmap)
+        assert_array_equal(data, fdata.astype(np.float32))
+
+
+class TestChunkedH4Read:
+
+    @pytest.fixture
+    def h4file(self, tmp_path):
+        pytest.importorskip("pyhdf")
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        return write_hdf_data(tmp_path / "data.hdf", fdata, *sdata), fdata, sdata
+
+    @pytest.mark.parametrize("dtype", [None, np.float32])
+    def test_matches_whole_read(self, h4file, dtype):
+        filepath, fdata, sdata = h4file
+        data, *scales = read_hdf_data(filepath, chunked=True, dtype=dtype)
+        assert data.dtype == (dtype or fdata.dtype)
+        assert_array_equal(data, fdata.astype(dtype or fdata.dtype))
+        for scale, expected in zip(scales, sdata):
+            assert_array_equal(scale, expected)
+        out = np.empty(fdata.shape, dtype=np.float32)
+        assert read_hdf_data(filepath, return_scales=False, chunked=True, out=out) is out
+        assert_array_equal(out, fdata.astype(np.float32))
+
+    @pytest.mark.parametrize("selection", [(slice(None),),
+                                           (slice(2, 11, 3), slice(1, 5)),
+                                           (slice(0, 0),)])
+    def test_read_h4_slabs(self, h4file, selection):
+        import pyhdf.SD as h4
+        from psi_io.psi_io import _read_h4_slabs
+        filepath, fdata, _ = h4file
+        hdf = h4.SD(str(filepath))
+        try:
+            sds = hdf.select('Data-Set-2')
+            reads = []
+            sds_getitem = type(sds).__getitem__
+            class CountingSDS:
+                info = sds.info
+                def __getitem__(self, item):
+                    reads.append(item)
+                    return sds_getitem(sds, item)
+            data = _read_h4_slabs(CountingSDS(), selection, None, np.float32, slab_nbytes=1)
+        finally:
+            hdf.end()
+        expected = fdata[selection].astype(np.float32)
+        assert_array_equal(data, expected)
+        assert len(reads) == expected.shape[0]
+
+
+class TestNpGridInterpolator:
+
+    @pytest.fixture
+    def grid(self):
+        rng = np.random.default_rng(7)
+        points = [np.sort(rng.uniform(0, 10, n)) for n in (6, 7, 5, 4)]
+        values = rng.standard_normal([p.size for p in points])
+        positions = np.column_stack([rng.uniform(p[0], p[-1], 500) for p in points])
+        return points, values, positions
+
+    @pytest.mark.parametrize("ndim", [1, 2, 3, 4])
+    def test_matches_scipy(self, grid, ndim):
+        interpolate = pytest.importorskip("scipy.interpolate")
+        points, values, positions = grid
+        values = values[(Ellipsis,) + (0,)*(4 - ndim)].copy()
+        expected = interpolate.RegularGridInterpolator(points[:ndim], values)(positions[:, :ndim])
+        result = _NpGridInterpolator(points[:ndim], values, chunk_size=64)(positions[:, :ndim])
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+    def test_preserves_dtype_and_layout(self, grid):
+        points, values, positions = grid
+        values = np.asfortranarray(values[..., 0].astype(np.float32).T).T
+        result = _NpGridInterpolator(points[:3], values)(positions[:, :3].reshape(20, 25, 3))
+        assert result.dtype == np.float32 and result.shape == (20, 25)
+        expected = _NpGridInterpolator(points[:3], values.astype(np.float64))(positions[:, :3])
+        np.testing.assert_allclose(result.ravel(), expected, rtol=1e-5, atol=1e-5)
+        integer = _NpGridInterpolator(points[:1], np.arange(6))([[points[0][0]]])
+        assert integer.dtype == np.float64
+
+    def test_bounds(self):
+        x, y = np.array([0.0, 1.0, 3.0]), np.array([0.0, 2.0])
+        values = np.add.outer(x, y)
+        with pytest.raises(ValueError, match="out of bounds in dimension 1"):
+            _NpGridInterpolator((x, y), values)([[1.0, 3.0]])
+        outside = [[4.0, 1.0], [np.nan, 1.0], [1.0, 1.0]]
+        assert_array_equal(_NpGridInterpolator((x, y), values, bounds_error=False)(outside), [np.nan, np.nan, 2.0])
+        assert_array_equal(_NpGridInterpolator((x, y), values, bounds_error=False, fill_value=-1)(outside)[[0, 2]],
+                           [-1.0, 2.0])
+        assert_array_equal(_NpGridInterpolator((x, y), values, bounds_error=False, fill_value=None)(outside[:1]),
+                           [5.0])
+
+    def test_degenerate_and_trailing_dimensions(self):
+        x = np.array([0.0, 1.0])
+        values = np.arange(6.0).reshape(2, 1, 3)
+        result = _NpGridInterpolator((x, [5.0]), values)([[0.5, 5.0]])
+        assert_array_equal(result, [[1.5, 2.5, 3.5]])
+
+    @pytest.mark.parametrize("kwargs, match", [({'method': 'cubic'}, "method"),
+                                               ({'points': (np.array([0.0, 1.0, 0.5]),)}, "ascending"),
+                                               ({'points': (np.array([0.0, 1.0]),)}, "3 values")])
+    def test_invalid(self, kwargs, match):
+        kwargs = {'points': (np.arange(3.0),), 'values': np.arange(3.0), **kwargs}
+        with pytest.raises(ValueError, match=match):
+            _NpGridInterpolator(**kwargs)
+
+    def test_engines(self, tmp_path, monkeypatch):
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        filepath = write_hdf_data(tmp_path / "data.h5", fdata, *sdata)
+        xi = [np.linspace(s[1], s[-2], 11) for s in sdata]
+        result = interpolate_positions_from_hdf(filepath, *xi, engine='numpy')
+        assert result.dtype == np.float32
+        if SCIPY_AVAILABLE:
+            np.testing.assert_allclose(result, interpolate_positions_from_hdf(filepath, *xi, engine='scipy'),
+                                       rtol=1e-5)
+        monkeypatch.setattr(psi_io_module, 'SCIPY_AVAILABLE', False)
+        assert isinstance(instantiate_linear_interpolator(fdata, *sdata), _NpGridInterpolator)
+        with pytest.raises(ImportError):
+            instantiate_linear_interpolator(fdata, *sdata, engine='scipy')
+        with pytest.raises(ValueError, match="engine"):
+            instantiate_linear_interpolator(fdata, *sdata, engine='torch')
+
+
+class TestInterpolationPlan:
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        paths = [write_hdf_data(tmp_path / f"br00{i}.h5", fdata*(i + 1), *sdata) for i in range(3)]
+        rng = np.random.default_rng(3)
+        xi = [rng.uniform(s[2], s[-3], (4, 5)) for s in sdata]
+        return paths, fdata, sdata, xi
+
+    def test_matches_interpolator(self, files):
+        paths, fdata, sdata, xi = files
+        plan = InterpolationPlan.from_hdf(paths[0], *xi)
+        assert plan.shape == (4, 5) and len(plan) == 20
+        assert plan.matches(*sdata) and not plan.matches(*sdata[:2])
+        for i, path in enumerate(paths):
+            expected = _NpGridInterpolator(sdata, (fdata*(i + 1)).T)(np.stack(xi, axis=-1))
+            result = plan(path)
+            assert result.dtype == np.float32
+            np.testing.assert_allclose(result, expected, rtol=1e-5)
+            np.testing.assert_allclose(plan.apply(fdata*(i + 1)), expected, rtol=1e-5)
+        np.testing.assert_allclose(plan(paths[0], dtype=np.float64),
+                                   _NpGridInterpolator(sdata, fdata.T.astype(np.float64))(np.stack(xi, axis=-1)))
+
+    def test_reads_window_only(self, files, monkeypatch):
+        paths, fdata, sdata, xi = files
+        plan = InterpolationPlan(sdata, *xi)
+        reads = []
+        monkeypatch.setattr(psi_io_module, 'read_hdf_by_index',
+                            lambda *args, **kwargs: reads.append(args[1:]) or read_hdf_by_index(*args, **kwargs))
+        plan(paths[1])
+        assert reads == [plan.window]
+        window_shape = tuple(stop - start for start, stop in reversed(plan.window))
+        assert window_shape != fdata.shape
+        assert_array_equal(plan.apply(fdata[tuple(slice(*w) for w in reversed(plan.window))]), plan.apply(fdata))
+
+    @pytest.mark.parametrize("ndim", [1, 2, 4])
+    def test_dimensionality(self, ndim):
+        rng = np.random.default_rng(ndim)
+        scales = [np.sort(rng.uniform(0, 1, 6)) for _ in range(ndim)]
+        values = rng.standard_normal((6,)*ndim)
+        xi = [rng.uniform(s[0], s[-1], 30) for s in scales]
+        expected = _NpGridInterpolator(scales, values.T)(np.stack(xi, axis=-1))
+        np.testing.assert_allclose(InterpolationPlan(scales, *xi).apply(values), expected, rtol=1e-12)
+
+    def test_bounds_and_errors(self, files):
+        paths, fdata, sdata, xi = files
+        outside = [np.array([x.flat[0], x.flat[1]]) for x in xi]
+        outside[0][0] = sdata[0][-1] + 1
+        with pytest.raises(ValueError, match="out of bounds"):
+            InterpolationPlan(sdata, *outside)
+        assert np.isnan(InterpolationPlan(sdata, *outside, bounds_error=False)(paths[0])[0])
+        with pytest.raises(ValueError, match="coordinate arrays"):
+            InterpolationPlan(sdata, *xi[:2])
+        plan = InterpolationPlan(sdata, *xi)
+        with pytest.raises(ValueError, match="shape"):
+            plan.apply(fdata[:-1, :-1, :-1])
+        other = write_hdf_data(paths[0].with_name("vr001.h5"), fdata, sdata[0]*2, *sdata[1:])
+        with pytest.raises(ValueError, match="grid"):
+            plan(other)
+
+
+class TestTiledInterpolation:
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        filepath = write_hdf_data(tmp_path / "br001.h5", fdata, *sdata)
+        rng = np.random.default_rng(11)
+        xi = [rng.uniform(s[0], s[-1], (6, 7)) for s in sdata]
+        return filepath, fdata, sdata, xi
+
+    @pytest.mark.parametrize("tile_shape, workers", [(1, 1), (4, 3), ((2, 5, 3), None), (1000, 1)])
+    def test_matches_bounding_box(self, source, tile_shape, workers):
+        filepath, fdata, sdata, xi = source
+        expected = interpolate_positions_from_hdf(filepath, *xi, engine='numpy')
+        result = interpolate_positions_from_hdf(filepath, *xi, engine='numpy', tile_shape=tile_shape,
+                                                workers=workers)
+        assert result.shape == (6, 7) and result.dtype == np.float32
+        assert_array_equal(result, expected)
+
+    def test_reads_occupied_tiles(self, source, monkeypatch):
+        filepath, fdata, sdata, _ = source
+        xi = [np.array([s[0], s[-1]]) for s in sdata]
+        windows = []
+        monkeypatch.setattr(psi_io_module, 'read_hdf_by_index',
+                            lambda *args, **kwargs: windows.append(args[1:]) or read_hdf_by_index(*args, **kwargs))
+        result = interpolate_positions_from_hdf(filepath, *xi, engine='numpy', tile_shape=2)
+        last = tuple(((s.size - 2)//2*2, min((s.size - 2)//2*2 + 3, s.size)) for s in sdata)
+        assert sorted(windows) == [((0, 3),)*3, last]
+        assert_array_equal(result, [fdata[0, 0, 0], fdata[-1, -1, -1]])
+
+    def test_outside_and_nan(self, source):
+        filepath, fdata, sdata, xi = source
+        xi = [x.ravel()[:3].copy() for x in xi]
+        xi[0][0], xi[1][1] = sdata[0][-1] + 1, np.nan
+        result = interpolate_positions_from_hdf(filepath, *xi, engine='numpy', tile_shape=3)
+        assert np.isnan(result[:2]).all() and not np.isnan(result[2])
+
+    def test_hdf4(self, tmp_path):
+        pytest.importorskip("pyhdf")
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        filepath = write_hdf_data(tmp_path / "br001.hdf", fdata, *sdata)
+        xi = [np.linspace(s[0], s[-1], 17) for s in sdata]
+        assert_array_equal(interpolate_positions_from_hdf(filepath, *xi, tile_shape=2, workers=4),
+                           interpolate_positions_from_hdf(filepath, *xi))
+
+    def test_invalid_tile_shape(self, source):
+        filepath, fdata, sdata, xi = source
+        with pytest.raises(ValueError, match="tile_shape"):
+            interpolate_positions_from_hdf(filepath, *xi, tile_shape=(2, 0, 2))
+
+
+class TestReadPlanner:
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        r, t, p = np.linspace(1, 2, 100), np.linspace(0, np.pi, 60), np.linspace(0, 2*np.pi, 80)
+        fdata = np.random.default_rng(5).random((80, 60, 100)).astype(np.float32)
+        contiguous = write_hdf_data(tmp_path / "br001.h5", fdata, r, t, p)
+        chunked = write_hdf_data(tmp_path / "br002.h5", fdata, r, t, p, chunks=(8, 20, 25), compression='gzip')
+        return contiguous, chunked, fdata, (r, t, p)
+
+    def test_selection(self, source):
+        contiguous, chunked, fdata, scales = source
+        plan = plan_hdf_read(contiguous, (None, None, 2), 30, None)
+        assert plan.strategy == 'window' and set(plan.alternatives) == {'hyperslab', 'window'}
+        assert (plan.nbytes, plan.nrequests) == (80*99*4, 80)
+        assert plan.alternatives['hyperslab'][:3] == (80*50*4, 0, 80*50)
+        assert plan_hdf_read(contiguous, None, None, (None, None, 40)).strategy == 'hyperslab'
+        plan = plan_hdf_read(chunked, (None, None, 2), 30, None)
+        assert plan.strategy == 'hyperslab' and plan.nchunks == 40
+        assert plan.nbytes == 40*8*20*25*4
+        lines = plan.explain().splitlines()
+        assert len(lines) == 3 and lines[1].startswith('* hyperslab')
+
+    def test_value_and_ivalue(self, source):
+        contiguous, chunked, fdata, (r, t, p) = source
+        assert plan_hdf_read(contiguous, None, None, np.array([0.5, 5.5]), method='value').strategy == 'union'
+        assert plan_hdf_read(contiguous, np.array([1.1, 1.9]), None, None, method='value').strategy == 'window'
+        assert plan_hdf_read(contiguous, np.array([1.5, 50.5]), None, None, method='ivalue').strategy == 'window'
+        data, r_, t_, p_ = read_hdf_by_value(contiguous, np.array([1.1, 1.9]), None, None)
+        index = np.searchsorted(r, r_)
+        assert len(index) == 4 and np.all(np.diff(index) > 0)
+        assert_array_equal(r_, r[index])
+        assert_array_equal(data, fdata[..., index])
+        with pytest.raises(ValueError, match="method"):
+            plan_hdf_read(contiguous, None, None, None, method='slab')
+        with pytest.raises(ValueError, match="len"):
+            plan_hdf_read(contiguous, None, None)
+
+    @pytest.mark.parametrize("xi", [((None, None, 2), 30, None), ((3, 70, 7), (None, None, 4), (1, 60, 3))])
+    def test_reads_follow_plan(self, source, xi):
+        contiguous, chunked, fdata, scales = source
+        expected = fdata[tuple(slice(*x) if isinstance(x, tuple) else slice(x, x + 1) if isinstance(x, int)
+                               else slice(None) for x in reversed(xi))]
+        for filepath in (contiguous, chunked):
+            assert_array_equal(read_hdf_by_index(filepath, *xi, return_scales=False), expected)
+            out = np.empty(expected.shape, dtype=np.float64)
+            assert read_hdf_by_index(filepath, *xi, return_scales=False, out=out, dtype=np.float64) is out
+            assert_array_equal(out, expected)
+
+    def test_positions(self, source):
+        contiguous, chunked, fdata, (r, t, p) = source
+        far = [np.array([1.05, 1.95]), np.array([0.1, 3.0]), np.array([0.2, 6.0])]
+        near = [np.linspace(1.2, 1.3, 50), np.linspace(1.0, 1.1, 50), np.linspace(2.0, 2.1, 50)]
+        plan = plan_hdf_read(chunked, *far, method='positions')
+        assert plan.strategy == 'points'
+        assert plan.nchunks == 2 and set(plan.alternatives) == {'window', 'tiles', 'points', 'full'}
+        assert plan_hdf_read(chunked, *near, method='positions').strategy == 'window'
+        assert plan_hdf_read(contiguous, *near, method='positions').strategy == 'window'
+
+    @pytest.mark.parametrize("engine", ['numpy', 'scipy'])
+    def test_interpolation_strategies(self, source, engine):
+        if engine == 'scipy' and not SCIPY_AVAILABLE:
+            pytest.skip("scipy is not installed")
+        contiguous, chunked, fdata, (r, t, p) = source
+        rng = np.random.default_rng(3)
+        xi = [rng.uniform(s[0], s[-1], (4, 5)) for s in (r, t, p)]
+        xi[0][0, 0] = 3.0
+        expected = interpolate_positions_from_hdf(chunked, *xi, engine=engine, strategy='window')
+        assert np.isnan(expected[0, 0]) and not np.isnan(expected.ravel()[1:]).any()
+        for strategy in ('auto', 'tiles', 'points', 'full'):
+            result = interpolate_positions_from_hdf(chunked, *xi, engine=engine, strategy=strategy)
+            assert result.shape == (4, 5) and result.dtype == expected.dtype
+            np.testing.assert_allclose(result, expected, rtol=1e-6)
+        if engine == 'numpy':
+            assert_array_equal(interpolate_positions_from_hdf(contiguous, *xi, engine=engine, strategy='points'),
+                               expected)
+
+    def test_interpolation_read_options(self, tmp_path):
+        r, t, p = np.linspace(1, 2, 41), np.linspace(0, np.pi, 33), np.linspace(0, 2 * np.pi, 25)
+        fdata = np.random.default_rng(4).random((25, 33, 41))
+        pyramid = write_hdf_data(tmp_path / "pyramid.h5", fdata, r, t, p, pyramid=1, chunks=(5, 5, 5))
+        swmr = write_hdf_data(tmp_path / "swmr.h5", fdata, r, t, p, swmr=True)
+        xi = [np.array([1.05, 1.95]), np.array([0.1, 3.0]), np.array([0.2, 6.0])]
+        coarse, *scales = read_hdf_data(pyramid, level=1)
+        expected = _NpGridInterpolator(scales, coarse.T)(np.stack(xi, axis=-1))
+        for strategy in ('auto', 'window', 'tiles', 'points', 'full'):
+            result = interpolate_positions_from_hdf(pyramid, *xi, engine='numpy', strategy=strategy, level=1)
+            np.testing.assert_allclose(result, expected, rtol=1e-12)
+            np.testing.assert_allclose(interpolate_positions_from_hdf(swmr, *xi, engine='numpy',
+                                                                      strategy=strategy, swmr=True),
+                                       interpolate_positions_from_hdf(swmr, *xi, engine='numpy',
+                                                                      strategy='window'), rtol=1e-12)
+            with pytest.raises(TypeError, match="bogus_kw"):
+                interpolate_positions_from_hdf(pyramid, *xi, strategy=strategy, bogus_kw=1)
+
+    def test_invalid_strategy(self, source, tmp_path):
+        contiguous, chunked, fdata, scales = source
+        xi = [np.array([s[1]]) for s in scales]
+        with pytest.raises(ValueError, match="strategy"):
+            interpolate_positions_from_hdf(contiguous, *xi, strategy='slab')
+        with pytest.raises(ValueError, match="HDF5"):
+            interpolate_positions_from_hdf(tmp_path / "br001.hdf", *xi, strategy='points')
+
+    def test_hdf4(self, tmp_path):
+        pytest.importorskip("pyhdf")
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        filepath = write_hdf_data(tmp_path / "br001.hdf", fdata, *sdata, compression='gzip')
+        plan = plan_hdf_read(filepath, (None, None, 2), None, None)
+        assert plan.strategy == 'hyperslab' and plan.nchunks == 1 and plan.nbytes == fdata.nbytes
+        xi = [np.array([s[0], s[-1]]) for s in sdata]
+        assert 'points' not in plan_hdf_read(filepath, *xi, method='positions').alternatives
+        assert_array_equal(read_hdf_by_index(filepath, (None, None, 2), None, None, return_scales=False),
+                           fdata[..., ::2])
+
+
+class TestPointQuery:
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        r, t, p = np.geomspace(1, 30, 40), np.linspace(0, np.pi, 20), np.linspace(0, 2*np.pi, 30)
+        fdata = np.random.default_rng(7).random((30, 20, 40)).astype(np.float32)
+        rng = np.random.default_rng(8)
+        xi = [rng.uniform(s[0], s[-1], 50) for s in (r, t, p)]
+        return tmp_path, fdata, (r, t, p), xi
+
+    @pytest.mark.parametrize("name, kwargs", [("br001.h5", {}),
+                                              ("br002.h5", {'chunks': (8, 8, 8), 'compression': 'gzip'}),
+                                              ("br001.hdf", {})])
+    def test_matches_interpolation(self, source, name, kwargs):
+        if name.endswith('.hdf'):
+            pytest.importorskip("pyhdf")
+        tmp_path, fdata, scales, xi = source
+        filepath = write_hdf_data(tmp_path / name, fdata, *scales, **kwargs)
+        expected = _NpGridInterpolator(scales, fdata.T.astype(np.float64))(np.stack(xi, axis=-1))
+        with PointQuery(filepath) as query:
+            assert query.ndim == 3
+            result = [query(*x) for x in zip(*xi)]
+            edges = [query(*(s[0] for s in scales)), query(*(s[-1] for s in scales))]
+        assert query.closed and "closed" in repr(query)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+        assert edges == [fdata[0, 0, 0], fdata[-1, -1, -1]]
+
+    def test_open_dataset_and_array(self, source):
+        tmp_path, fdata, scales, xi = source
+        position = [x[0] for x in xi]
+        expected = _NpGridInterpolator(scales, fdata.T.astype(np.float64))(position)
+        with h5.File(write_hdf_data(tmp_path / "br001.h5", fdata, *scales), 'r') as hdf:
+            assert PointQuery(hdf['Data'], *scales)(*position) == pytest.approx(expected)
+        assert PointQuery(fdata, *scales)(*position) == pytest.approx(expected)
+        assert PointQuery(fdata.T, *scales, order='C')(*position) == pytest.approx(expected)
+        with pytest.raises(ValueError, match="scales"):
+            PointQuery(fdata, *scales[:2])
+        with pytest.raises(ValueError, match="path"):
+            PointQuery(tmp_path / "br001.h5", *scales)
+
+    def test_outside_and_nan(self, source):
+        tmp_path, fdata, scales, xi = source
+        inside, outside = [s[1] for s in scales], [scales[0][-1] + 1, *(s[1] for s in scales[1:])]
+        query = PointQuery(fdata, *scales)
+        with pytest.raises(ValueError, match="outside the grid"):
+            query(*outside)
+        assert np.isnan(PointQuery(fdata, *scales, bounds_error=False)(*outside))
+        assert PointQuery(fdata, *scales, bounds_error=False, fill_value=-1.0)(*outside) == -1.0
+        extrapolated = PointQuery(fdata, *scales, bounds_error=False, fill_value=None)(*outside)
+        expected = _NpGridInterpolator(scales, fdata.T.astype(np.float64), bounds_error=False,
+                                       fill_value=None)(outside)
+        assert extrapolated == pytest.approx(expected)
+        assert np.isnan(query(np.nan, *inside[1:]))
+        assert query(*inside) == fdata[1, 1, 1]
+        with pytest.raises(ValueError, match="coordinates"):
+            query(*inside[:2])
+
+    def test_failed_construction_closes_file(self, tmp_path, monkeypatch):
+        import psi_io.psi_io as psi_io_module
+        handles = []
+        open_handle = psi_io_module._open_handle
+        monkeypatch.setattr(psi_io_module, '_open_handle', lambda *args: handles.append(open_handle(*args))
+                            or handles[-1])
+        filepath = write_hdf_data(tmp_path / "br001.h5", np.ones((3, 4, 5)))
+        with pytest.raises(ValueError, match="scale"):
+            PointQuery(filepath)
+        with pytest.raises(ValueError, match="scale"):
+            PointQuery(write_hdf_data(tmp_path / "br002.h5", np.ones((3, 4, 5)), np.arange(5.0)))
+        assert len(handles) == 2 and not any(handle for handle in handles)
+
+    def test_degenerate_axis(self, tmp_path):
+        fdata = np.arange(12.0).reshape(1, 3, 4)
+        scales = (np.arange(4.0), np.arange(3.0), np.array([0.5]))
+        filepath = write_hdf_data(tmp_path / "br001.h5", fdata, *scales)
+        with PointQuery(filepath) as query:
+            assert query(1.5, 2.0, 0.5) == 9.5
+            with pytest.raises(ValueError, match="outside"):
+                query(1.5, 2.0, 0.6)
+
+
+class TestRegrid:
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        filepath = write_hdf_data(tmp_path / "br001.h5", fdata, *sdata)
+        targets = [np.linspace(s[1], s[-2], n) for s, n in zip(sdata, (9, 6, 13))]
+        return filepath, fdata, sdata, targets
+
+    @staticmethod
+    def _expected(fdata, sdata, targets):
+        mesh = np.stack(np.meshgrid(*[t if t is not None else s for t, s in zip(targets, sdata)], indexing='ij'),
+                        axis=-1)
+        return _NpGridInterpolator(sdata, fdata.T.astype(np.float64))(mesh).T
+
+    @pytest.mark.parametrize("slab_nbytes", [1, 1 << 12, CONVERT_SLAB_NBYTES])
+    def test_matches_interpolator(self, source, slab_nbytes):
+        filepath, fdata, sdata, targets = source
+        data, *scales = regrid_hdf_data(filepath, *targets, slab_nbytes=slab_nbytes)
+        assert data.dtype == np.float32 and data.shape == (13, 6, 9)
+        for scale, target in zip(scales, targets):
+            assert_array_equal(scale, target)
+        np.testing.assert_allclose(data, self._expected(fdata, sdata, targets), rtol=1e-5, atol=1e-6)
+
+    def test_kept_axes_and_dtype(self, source):
+        filepath, fdata, sdata, targets = source
+        targets = [None, targets[1], None]
+        data, r, t, p = regrid_hdf_data(filepath, *targets, dtype=np.float64, slab_nbytes=1 << 10)
+        assert data.dtype == np.float64 and data.shape == (fdata.shape[0], 6, fdata.shape[2])
+        assert_array_equal(r, sdata[0]) and assert_array_equal(p, sdata[2])
+        np.testing.assert_allclose(data, self._expected(fdata, sdata, targets), rtol=1e-12)
+
+    def test_plan_reuse_and_out(self, source, tmp_path):
+        filepath, fdata, sdata, targets = source
+        other = write_hdf_data(tmp_path / "vr001.h5", 2*fdata, *sdata)
+        plan = RegridPlan.from_hdf(filepath, *targets)
+        expected = self._expected(fdata, sdata, targets)
+        np.testing.assert_allclose(plan(other), 2*expected, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(plan.apply(fdata), expected, rtol=1e-5, atol=1e-6)
+        window = fdata[tuple(slice(*w) for w in reversed(plan.window))]
+        assert_array_equal(plan.apply(window), plan.apply(fdata))
+        with h5.File(tmp_path / "regrid.h5", 'w') as hdf:
+            dataset = hdf.create_dataset('Data', shape=plan.shape, dtype=np.float32)
+            assert plan(filepath, out=dataset, slab_nbytes=1 << 10) is dataset
+            np.testing.assert_allclose(dataset[...], expected, rtol=1e-5, atol=1e-6)
+        with pytest.raises(ValueError, match="shape"):
+            plan(filepath, out=np.empty((1, 2, 3)))
+        with pytest.raises(ValueError, match="grid"):
+            plan(write_hdf_data(tmp_path / "rho001.h5", fdata, 2*sdata[0], *sdata[1:]))
+
+    def test_bounds(self, source):
+        filepath, fdata, sdata, targets = source
+        wide = np.array([sdata[2][0] - 1, sdata[2][1]])
+        with pytest.raises(ValueError, match="out of bounds in dimension 2"):
+            regrid_hdf_data(filepath, None, None, wide)
+        data, *_ = regrid_hdf_data(filepath, None, None, wide, bounds_error=False)
+        assert np.isnan(data[0]).all() and not np.isnan(data[1]).any()
+        data, *_ = regrid_hdf_data(filepath, None, None, wide, bounds_error=False, fill_value=None)
+        assert not np.isnan(data).any()
+
+    def test_hdf4(self, tmp_path):
+        pytest.importorskip("pyhdf")
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        targets = [np.linspace(s[0], s[-1], 5) for s in sdata]
+        h4, *_ = regrid_hdf_data(write_hdf_data(tmp_path / "br001.hdf", fdata, *sdata), *targets, slab_nbytes=1)
+        h5_, *_ = regrid_hdf_data(write_hdf_data(tmp_path / "br001.h5", fdata, *sdata), *targets)
+        assert_array_equal(h4, h5_)
+
+
+class TestHdfWriter:
+
+    def test_multiple_datasets(self, tmp_path, hdf_version):
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        filepath = tmp_path / f"snapshot{HDF_VERSION_MAPPINGS[hdf_version]['extension']}"
+        with HdfWriter(filepath) as writer:
+            assert writer.add_dataset(fdata, *sdata, dataset_id='br', units='Gauss') == 'br'
+            writer.add_dataset(fdata * 2, *sdata, dataset_id='vr', units='km/s')
+            assert writer.datasets == ('br', 'vr')
+        assert writer.closed
+        assert [meta.name for meta in read_hdf_meta(filepath)] == ['br', 'vr']
+        for dataset_id, factor in (('br', 1), ('vr', 2)):
+            data, *scales = read_hdf_data(filepath, dataset_id=dataset_id)
+            assert_array_equal(data, fdata * factor)
+            for scale, expected in zip(scales, sdata):
+                assert_array_equal(scale, expected)
+
+    def test_shares_equal_scales(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        filepath = tmp_path / "snapshot.h5"
+        with HdfWriter(filepath) as writer:
+            writer.add_dataset(fdata, *sdata, dataset_id='br')
+            writer.add_dataset(fdata, *sdata, dataset_id='bt')
+            writer.add_dataset(fdata, sdata[0] + 1, *sdata[1:], dataset_id='bp')
+        with h5.File(filepath, 'r') as hdf:
+            assert sorted(hdf) == ['bp', 'bp_dim1', 'br', 'bt', 'dim1', 'dim2', 'dim3']
+            assert hdf['bt'].dims[0][0] == hdf['br'].dims[0][0]
+        assert_array_equal(read_hdf_data(filepath, dataset_id='bp')[1], sdata[0] + 1)
+
+    def test_shares_non_default_scales(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        filepath = tmp_path / "snapshot.h5"
+        with HdfWriter(filepath) as writer:
+            writer.add_dataset(fdata, *sdata, dataset_id='br')
+            writer.add_dataset(fdata, *sdata[:2], sdata[2] * 2, dataset_id='vr')
+            writer.add_dataset(fdata, *sdata[:2], sdata[2] * 2, dataset_id='vt')
+        with h5.File(filepath, 'r') as hdf:
+            assert sorted(hdf) == ['br', 'dim1', 'dim2', 'dim3', 'vr', 'vr_dim3', 'vt']
+            assert hdf['vt'].dims[2][0] == hdf['vr'].dims[2][0]
+        assert_array_equal(read_hdf_data(filepath, dataset_id='vt')[3], sdata[2] * 2)
+
+    def test_shares_scales_of_the_same_dtype_and_dimension(self, tmp_path):
+        data, x, y = np.zeros((4, 4)), np.arange(4.0), np.arange(4.0) + 10
+        filepath = tmp_path / "snapshot.h5"
+        with HdfWriter(filepath) as writer:
+            writer.add_dataset(data, x, y, dataset_id='a')
+            writer.add_dataset(data, x.astype(np.float32), y, dataset_id='b')
+            writer.add_dataset(data, y + 1, y + 1, dataset_id='c')
+        with h5.File(filepath, 'r') as hdf:
+            assert sorted(hdf) == ['a', 'b', 'b_dim1', 'c', 'c_dim1', 'c_dim2', 'dim1', 'dim2']
+            assert hdf['b_dim1'].dtype == np.float32
+            assert hdf['c'].dims[1].label == 'c_dim2'
+        assert read_hdf_data(filepath, dataset_id='b')[1].dtype == np.float32
+
+    def test_attributes_are_batched(self, tmp_path, hdf_version):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        filepath = tmp_path / f"snapshot{HDF_VERSION_MAPPINGS[hdf_version]['extension']}"
+        with HdfWriter(filepath) as writer:
+            writer.set_attrs('br', units='Gauss')
+            writer.add_dataset(fdata, *sdata, dataset_id='br', long_name='radial field')
+            writer.set_attrs('br', units='Tesla')
+            writer.set_attrs(run='snapshot')
+        meta, = read_hdf_meta(filepath)
+        assert meta.attr['units'] == 'Tesla'
+        assert meta.attr['long_name'] == 'radial field'
+
+    def test_append_mode(self, tmp_path, hdf_version):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        filepath = write_hdf_data(tmp_path / f"snapshot{HDF_VERSION_MAPPINGS[hdf_version]['extension']}",
+                                  fdata, *sdata, dataset_id='br')
+        with HdfWriter(filepath, mode='a') as writer:
+            writer.add_dataset(fdata + 1, *sdata, dataset_id='bt')
+            with pytest.raises(ValueError, match="already holds"):
+                writer.add_dataset(fdata, *sdata, dataset_id='br')
+        assert {meta.name for meta in read_hdf_meta(filepath)} == {'br', 'bt'}
+        assert_array_equal(read_hdf_data(filepath, dataset_id='br')[0], fdata)
+
+    def test_closed_writer_raises(self, tmp_path):
+        writer = HdfWriter(tmp_path / "closed.h5")
+        writer.close()
+        writer.close()
+        with pytest.raises(ValueError, match="closed"):
+            writer.add_dataset(np.ones(3))
+
+    def test_invalid_mode_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="mode"):
+            HdfWriter(tmp_path / "out.h5", mode='r')
+
+
+# ===========================================================================
+# HdfSequenceWriter
+# ===========================================================================
+
+class TestHdfSequenceWriter:
+
+    def test_appends_entries(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        filepath = tmp_path / "br.h5"
+        with HdfSequenceWriter(filepath) as writer:
+            for i in range(3):
+                assert writer.append(fdata + i, *sdata, sequence=1001 + i, time=0.5 * i, unit='Gauss') == i
+            assert len(writer) == 3
+        sequences, times = read_hdf_sequences(filepath)
+        assert_array_equal(sequences, [1001, 1002, 1003])
+        assert_array_equal(times, [0.0, 0.5, 1.0])
+        data, *scales = read_hdf_by_index(filepath, None, None, None, 2)
+        assert_array_equal(data[0], fdata + 2)
+        for scale, expected in zip(scales, sdata):
+            assert_array_equal(scale, expected)
+        assert_array_equal(scales[-1], [1003])
+        meta, = read_hdf_meta(filepath)
+        assert meta.shape == (3, *fdata.shape)
+        assert meta.attr['unit'] == 'Gauss'
+
+    def test_layout(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        filepath = tmp_path / "br.h5"
+        with HdfSequenceWriter(filepath, compression='gzip') as writer:
+            writer.append(fdata, *sdata, sequence=1)
+        with h5.File(filepath, 'r') as hdf:
+            assert hdf['Data'].chunks == (1, *fdata.shape)
+            assert hdf['Data'].maxshape == (None, *fdata.shape)
+            assert hdf['Data'].compression == 'gzip'
+
+    def test_append_mode_continues_file(self, tmp_path):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        filepath = tmp_path / "br.h5"
+        with HdfSequenceWriter(filepath) as writer:
+            writer.append(fdata, *sdata, sequence=1)
+        with HdfSequenceWriter(filepath) as writer:
+            writer.append(fdata + 1, sequence=2)
+            with pytest.raises(ValueError, match="grid"):
+                writer.append(fdata, sdata[0] + 1, sdata[1], sequence=3)
+        assert_array_equal(read_hdf_sequences(filepath)[0], [1, 2])
+        with HdfSequenceWriter(filepath, mode='w') as writer:
+            assert len(writer) == 0
+
+    def test_several_sequence_datasets(self, tmp_path):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        filepath = tmp_path / "run.h5"
+        for dataset_id, offset in (('br', 0), ('vr', 10), (None, 20)):
+            with HdfSequenceWriter(filepath, dataset_id=dataset_id) as writer:
+                for i in range(2):
+                    writer.append(fdata + offset + i, *sdata, sequence=offset + i + 1, time=offset + i)
+        for dataset_id, offset in (('br', 0), ('vr', 10), (None, 20)):
+            sequences, times = read_hdf_sequences(filepath, dataset_id=dataset_id)
+            assert_array_equal(sequences, [offset + 1, offset + 2])
+            assert_array_equal(times, [offset, offset + 1])
+            assert_array_equal(read_hdf_by_index(filepath, None, None, 1, dataset_id=dataset_id)[0][0],
+                               fdata + offset + 1)
+        with h5.File(filepath, 'r') as hdf:
+            assert {'sequence', 'time', 'br_sequence', 'br_time', 'vr_sequence', 'vr_time'} <= set(hdf)
+
+    def test_rejects_inconsistent_entries(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        with HdfSequenceWriter(tmp_path / "br.h5") as writer:
+            writer.append(fdata, *sdata, sequence=5)
+            with pytest.raises(ValueError, match="increase"):
+                writer.append(fdata, sequence=5)
+            with pytest.raises(ValueError, match="shape"):
+                writer.append(fdata[1:], sequence=6)
+            assert len(writer) == 1
+
+    def test_rejects_scales_after_entry_without_scales(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        with HdfSequenceWriter(tmp_path / "br.h5") as writer:
+            writer.append(fdata, sequence=1)
+            writer.append(fdata, None, None, None, sequence=2)
+            with pytest.raises(ValueError, match="grid"):
+                writer.append(fdata, *sdata, sequence=3)
+            assert len(writer) == 2
+
+    def test_invalid_files_raise(self, tmp_path):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        with pytest.raises(ValueError, match="HDF5"):
+            HdfSequenceWriter(tmp_path / "br.hdf")
+        filepath = write_hdf_data(tmp_path / "br001.h5", fdata, *sdata)
+        with pytest.raises(ValueError, match="not a sequence dataset"):
+            HdfSequenceWriter(filepath)
+        with pytest.raises(ValueError, match="not a sequence dataset"):
+            read_hdf_sequences(filepath)
+
+    def test_closed_writer_raises(self, tmp_path):
+        writer = HdfSequenceWriter(tmp_path / "br.h5")
+        writer.close()
+        writer.close()
+        with pytest.raises(ValueError, match="closed"):
+            writer.append(np.ones(3), sequence=1)
+
+
+_SWMR_WRITER = """
+import sys
+import numpy as np
+from psi_io import HdfSequenceWriter
+scale = np.linspace(0.0, 1.0, 4)
+with HdfSequenceWriter(sys.argv[1], swmr=True) as writer:
+    for sequence in range(1, 4):
+        writer.append(np.full(4, float(sequence), dtype=np.float32), scale, sequence=sequence)
+        print(sequence, flush=True)
+        sys.stdin.readline()
+"""
+
+
+class TestSwmr:
+
+    def test_write_hdf_data(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        filepath = write_hdf_data(tmp_path / "br.h5", fdata, *sdata, swmr=True, unit='Gauss')
+        with h5.File(filepath, 'r') as hdf:
+            assert hdf.id.get_create_plist().get_version()[0] >= 3  # SWMR-capable superblock
+        data, *scales = read_hdf_data(filepath, swmr=True)
+        assert_array_equal(data, fdata)
+        for scale, expected in zip(scales, sdata):
+            assert_array_equal(scale, expected)
+        assert read_hdf_meta(filepath, swmr=True)[0].attr['unit'] == 'Gauss'
+        assert_array_equal(read_hdf_by_index(filepath, 1, None, 2, swmr=True)[0], fdata[2:3, :, 1:2])
+        assert_array_equal(read_hdf_by_value(filepath, 2.5, None, None, swmr=True)[0],
+                           read_hdf_by_value(filepath, 2.5, None, None)[0])
+        assert_array_equal(read_hdf_by_ivalue(filepath, 1.5, None, None, swmr=True)[0],
+                           read_hdf_by_ivalue(filepath, 1.5, None, None)[0])
+        # a pooled handle of the file does not prevent opening it for SWMR reading
+        assert_array_equal(read_hdf_data(filepath, swmr=True)[0], fdata)
+
+    def test_sequence_writer(self, tmp_path):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        filepath = tmp_path / "br.h5"
+        with HdfSequenceWriter(filepath, swmr=True) as writer:
+            assert writer.swmr
+            writer.append(fdata, *sdata, sequence=1, unit='Gauss')
+            writer.append(fdata + 1, sequence=2)
+            with pytest.raises(ValueError, match="SWMR"):
+                writer.append(fdata + 2, sequence=3, unit='Tesla')
+            assert_array_equal(read_hdf_sequences(filepath, swmr=True)[0], [1, 2])
+        with HdfSequenceWriter(filepath, swmr=True) as writer:
+            writer.append(fdata + 2, sequence=3)
+        assert_array_equal(read_hdf_sequences(filepath)[0], [1, 2, 3])
+        assert_array_equal(read_hdf_by_index(filepath, None, None, 2)[0][0], fdata + 2)
+
+    def test_hdf4_raises(self, tmp_path):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        with pytest.raises(ValueError, match="SWMR"):
+            write_hdf_data(tmp_path / "br.hdf", fdata, *sdata, swmr=True)
+        h4file = write_hdf_data(tmp_path / "br.hdf", fdata, *sdata)
+        with pytest.raises(ValueError, match="SWMR"):
+            read_hdf_data(h4file, swmr=True)
+
+    def test_concurrent_reader(self, tmp_path):
+        import subprocess
+        import sys
+        filepath = tmp_path / "br.h5"
+        writer = subprocess.Popen([sys.executable, "-c", _SWMR_WRITER, str(filepath)],
+                                  stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+                                  cwd=Path(__file__).parents[2])
+        try:
+            assert writer.stdout.readline().strip() == '1'
+            with h5.File(filepath, 'r', swmr=True) as hdf:
+                dataset = hdf['Data']
+                assert dataset.shape == (1, 4)
+                for sequence in (2, 3):
+                    writer.stdin.write("\n")
+                    writer.stdin.flush()
+                    assert writer.stdout.readline().strip() == str(sequence)
+                    dataset.refresh()
+                    assert dataset.shape == (sequence, 4)
+                    assert_array_equal(dataset[-1], np.full(4, sequence))
+                    assert_array_equal(read_hdf_sequences(filepath, swmr=True)[0], np.arange(1, sequence + 1))
+            writer.stdin.write("\n")
+            writer.stdin.flush()
+            assert writer.wait(timeout=60) == 0
+        finally:
+            writer.kill()
@@ -0,0 +1,134 @@
+"""Unit tests for psi_io.catalog."""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from psi_io import read_hdf_meta, write_hdf_data
+from psi_io.catalog import CATALOG_NAME, HdfCatalog
+from tests.utils import generate_mock_data
+
+
+@pytest.fixture
+def run_dir(tmp_path):
+    root = tmp_path / "run"
+    fdata, *sdata = generate_mock_data(3, 'float32', True)
+    for quantity in ("vr", "br"):
+        for sequence in (1, 2, 3):
+            (root / quantity).mkdir(parents=True, exist_ok=True)
+            write_hdf_data(root / quantity / f"{quantity}00{sequence}.h5", fdata, *sdata, unit='km/s')
+    write_hdf_data(root / "vr" / "vr004.h5", fdata[1:], *sdata[:2], sdata[2][1:])
+    return root
+
+
+def _names(entries):
+    return [entry.path.name for entry in entries]
+
+
+# ===========================================================================
+# update
+# ===========================================================================
+
+class TestUpdate:
+
+    def test_initial_scan(self, run_dir):
+        with HdfCatalog(run_dir) as catalog:
+            assert tuple(catalog.update(workers=2)) == (7, 0, 0, 0)
+            assert len(catalog) == 7
+        assert (run_dir / CATALOG_NAME).is_file()
+
+    def test_incremental(self, run_dir):
+        with HdfCatalog(run_dir) as catalog:
+            catalog.update(workers=1)
+            assert tuple(catalog.update(workers=1)) == (0, 7, 0, 0)
+
+            touched = run_dir / "br" / "br002.h5"
+            os.utime(touched, ns=(touched.stat().st_atime_ns, touched.stat().st_mtime_ns + 10**9))
+            (run_dir / "vr" / "vr004.h5").unlink()
+            fdata, *sdata = generate_mock_data(2, 'float64', True)
+            write_hdf_data(run_dir / "vr" / "vr005.h5", fdata, *sdata)
+            assert tuple(catalog.update(workers=1)) == (2, 5, 1, 0)
+            assert _names(catalog.query('vr')) == ['vr001.h5', 'vr002.h5', 'vr003.h5', 'vr005.h5']
+            assert tuple(catalog.update(workers=1, force=True)) == (7, 0, 0, 0)
+
+    def test_persists(self, run_dir, tmp_path):
+        with HdfCatalog(run_dir, catalog=tmp_path / "index" / "run.sqlite") as catalog:
+            catalog.update(workers=1)
+        with HdfCatalog(run_dir, catalog=tmp_path / "index" / "run.sqlite") as catalog:
+            assert len(catalog) == 7
+            assert len(catalog.query('br')) == 3
+
+    def test_failures_are_recorded(self, run_dir):
+        bad = run_dir / "vr" / "vr006.h5"
+        bad.write_bytes(b"not an hdf file")
+        with HdfCatalog(run_dir) as catalog:
+            assert catalog.update(workers=1).failed == 1
+            assert list(catalog.errors) == [bad]
+            assert catalog.query(sequence=6) == []
+            assert catalog.update(workers=1).scanned == 0
+
+    def test_pattern_and_extensions(self, run_dir):
+        (run_dir / "notes.txt").write_text("not an hdf file")
+        with HdfCatalog(run_dir, pattern="br/*") as catalog:
+            assert catalog.update(workers=1).scanned == 3
+
+    def test_invalid_root(self, tmp_path):
+        with pytest.raises(NotADirectoryError):
+            HdfCatalog(tmp_path / "missing")
+
+    def test_closed_catalog_raises(self, run_dir):
+        catalog = HdfCatalog(run_dir)
+        catalog.close()
+        catalog.close()
+        assert "closed" in repr(catalog)
+        with pytest.raises(ValueError, match="closed"):
+            catalog.query()
+
+
+# ===========================================================================
+# query
+# ===========================================================================
+
+class TestQuery:
+
+    @pytest.fixture
+    def catalog(self, run_dir):
+        with HdfCatalog(run_dir) as catalog:
+            catalog.update(workers=1)
+            yield catalog
+
+    def test_filters(self, catalog):
+        shape = read_hdf_meta(catalog.root / "vr" / "vr001.h5")[0].shape
+        assert _names(catalog.query('vr', sequence=(2, None))) == ['vr002.h5', 'vr003.h5', 'vr004.h5']
+        assert _names(catalog.query(['br', 'VR'], sequence=(None, 1))) == ['br001.h5', 'vr001.h5']
+        assert _names(catalog.query('vr', sequence=3)) == ['vr003.h5']
+        assert len(catalog.query(shape=shape)) == 6
+        assert _names(catalog.query('vr', shape=shape, sequence=(2, 4))) == ['vr002.h5', 'vr003.h5']
+        assert len(catalog.query(dtype=np.dtype('>f4'))) == 7
+        assert catalog.query(dtype=np.float64) == []
+        assert len(catalog.query(dataset_id='Data')) == 7
+
+    def test_entry_matches_metadata(self, catalog):
+        entry, = catalog.query('br', sequence=2)
+        meta, = read_hdf_meta(entry.path)
+        assert (entry.quantity, entry.sequence, entry.name) == ('br', 2, meta.name)
+        assert entry.type == meta.type
+        assert entry.shape == meta.shape
+        assert entry.attr == {'unit': 'km/s'}
+        for scale, expected in zip(entry.scales, meta.scales):
+            assert (scale.name, scale.shape, scale.imin, scale.imax) == \
+                   (expected.name, expected.shape, expected.imin, expected.imax)
+
+    def test_hdf4_scales_in_psi_order(self, tmp_path):
+        pytest.importorskip("pyhdf")
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        write_hdf_data(tmp_path / "br001.hdf", fdata, *sdata)
+        write_hdf_data(tmp_path / "br001.h5", fdata, *sdata)
+        with HdfCatalog(tmp_path) as catalog:
+            catalog.update(workers=1)
+            h4, h5 = sorted(catalog.query('br'), key=lambda entry: entry.path.suffix, reverse=True)
+        assert h4.shape == h5.shape
+        assert [(s.shape, s.imin, s.imax) for s in h4.scales] == [(s.shape, s.imin, s.imax) for s in h5.scales]
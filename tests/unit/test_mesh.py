@@ -11,6 +11,8 @@ from psi_io.mesh import (
     _MESH_CODE_REVERSE_MAPPING,
     _average_adjacent,
     _remesh_array,
+    coarsen_array,
+    coarsen_scale,
     remesh_array,
 )
 
@@ -388,3 +390,73 @@ class TestRemeshArray:
     def test_main_to_half_raises(self):
         with pytest.raises(ValueError, match="HALF"):
             remesh_array(np.ones((4, 5, 6)), imesh=0b000, omesh=0b100)
+
+
+class TestCoarsenArray:
+    """Tests for coarsen_array / coarsen_scale."""
+
+    @pytest.mark.parametrize("n, expected", [(6, 4), (7, 4), (2, 2), (1, 1)])
+    def test_main_axis_size(self, n, expected):
+        assert coarsen_array(np.ones(n), imesh='main').shape == (expected,)
+
+    @pytest.mark.parametrize("n, expected", [(7, 5), (8, 5), (3, 3), (2, 2)])
+    def test_half_axis_size(self, n, expected):
+        # a half mesh of n points belongs to a main mesh of n - 1 nodes
+        assert coarsen_array(np.ones(n), imesh='half').shape == (expected,)
+
+    @pytest.mark.parametrize("imesh", [0b000, 0b100, 0b011, 0b111])
+    def test_linear_field_is_reproduced_on_coarse_scales(self, imesh):
+        # Block averages of a linear field equal the field at the coarse coordinates
+        mesh = Mesh.parse(imesh, 3)
+        scales = [np.arange(n + half) - 0.5 * half for n, half in zip((9, 8, 11), mesh)]
+        r, t, p = scales
+        data = (2.0 * r[None, None, :] + 3.0 * t[None, :, None] - p[:, None, None])
+        coarse = [coarsen_scale(scale, half) for scale, half in zip(scales, mesh)]
+        expected = (2.0 * coarse[0][None, None, :] + 3.0 * coarse[1][None, :, None] - coarse[2][:, None, None])
+        assert_allclose(coarsen_array(data, imesh), expected)
+
+    def test_coarse_half_mesh_can_be_remeshed(self):
+        br = np.ones((16, 12, 11))
+        coarse = coarsen_array(br, imesh=0b100)
+        assert remesh_array(coarse, imesh=0b100, omesh='main').shape == coarsen_array(np.ones((16, 12, 10))).shape
+
+    def test_levels_compose(self):
+        data = np.random.default_rng(0).random((9, 10, 13))
+        assert_allclose(coarsen_array(data, 0b101, levels=2), coarsen_array(coarsen_array(data, 0b101), 0b101))
+
+    def test_c_order(self):
+        assert coarsen_array(np.ones((11, 12, 16)), imesh=0b100, order='C').shape == (7, 7, 9)
+
+    @pytest.mark.parametrize("n", [6, 7, 10])
+    def test_boundaries_are_kept(self, n):
+        scale = np.linspace(0.0, 2 * np.pi, n)
+        half = np.concatenate([[-0.1], 0.5 * (scale[1:] + scale[:-1]), [2 * np.pi + 0.1]])
+        for levels in (1, 2):
+            coarse = coarsen_scale(scale, levels=levels)
+            assert (coarse[0], coarse[-1]) == (0.0, 2 * np.pi)
+            coarse_half = coarsen_scale(half, half=True, levels=levels)
+            assert coarse_half.size == coarse.size + 1
+            assert_allclose(coarse_half[[0, -1]] + coarse_half[[1, -2]], half[[0, -1]] + half[[1, -2]])
+            assert np.all((coarse_half[1:-1] > coarse[:-1]) & (coarse_half[1:-1] < coarse[1:]))
+
+    @pytest.mark.parametrize("n", [5, 6, 7, 10, 13])
+    def test_half_scale_is_centred_on_coarse_cells(self, n):
+        def half_mesh(main):
+            centres = 0.5 * (main[1:] + main[:-1])
+            return np.concatenate([[2 * main[0] - centres[0]], centres, [2 * main[-1] - centres[-1]]])
+
+        scale = np.linspace(1.0, 2.5, n)
+        for levels in (1, 2):
+            coarse = coarsen_scale(scale, levels=levels)
+            assert_allclose(coarsen_scale(half_mesh(scale), half=True, levels=levels), half_mesh(coarse))
+
+    def test_even_axis_keeps_last_node(self):
+        assert_allclose(coarsen_array(np.array([0., 4., 0., 4., 0., 4.])), [0., 2., 2., 4.])
+        assert_allclose(coarsen_array(np.array([-1., 1., 3., 5., 7., 9., 11.]), imesh='half'),
+                        [-2., 2., 6., 9., 11.])
+
+    def test_main_scale_is_subset(self):
+        scale = np.linspace(1.0, 2.0, 9, dtype=np.float32)
+        coarse = coarsen_scale(scale, levels=2)
+        assert coarse.dtype == np.float32
+        assert_allclose(coarse, scale[::4])
@@ -10,6 +10,7 @@ import h5py
 
 from psi_io.mesh import Mesh
 from psi_io.units import MAS_b, PSI_rsun, PSI_angle
+from psi_io.psi_io import BufferPool, clear_meta_cache, meta_cache_info
 from psi_io.mhd_io import (
     _HDF_EXT_MAPPING,
     METADATA_SCHEMA,
@@ -205,6 +206,18 @@ class TestParseISliceArgs:
                                         shape=(10, 20, 30), remesh=(False, False, False)))
         assert slices[0] == slice(0, 1)
 
+    def test_strided_slice_is_normalized(self):
+        slices = list(_parse_islice_args((None, None, 4), (2, None, 3), None,
+                                        shape=(10, 20, 30), remesh=(False, True, False)))
+        assert slices[0] == slice(0, 10, 4)
+        # the remeshed axis keeps the extra element needed for averaging
+        assert slices[1] == slice(2, 20, 3)
+
+    def test_non_positive_step_raises(self):
+        with pytest.raises(ValueError, match="positive"):
+            list(_parse_islice_args(slice(None, None, -1), None, None,
+                                   shape=(10, 20, 30), remesh=(False, False, False)))
+
 
 # ===========================================================================
 # PsiData factory
@@ -787,6 +800,38 @@ class TestCacheModes:
         assert reader.cached == reader.data_cached is True
         reader.close()
 
+    def test_mmap_cache_maps_at_construction(self, psi_h5_mas_file):
+        reader = PsiData(psi_h5_mas_file, model='mas', cache='mmap')
+        assert isinstance(reader._vcache, np.memmap)
+        assert not reader._vcache.flags.writeable
+        assert isinstance(reader.scales.r._vcache, np.memmap)
+        eager = PsiData(psi_h5_mas_file, model='mas', cache='eager')
+        np.testing.assert_array_equal(reader.read(0, None, (2, 5), scales=False).value,
+                                      eager.read(0, None, (2, 5), scales=False).value)
+        reader.close()
+        eager.close()
+
+    def test_mmap_cache_falls_back_for_chunked_data(self, tmp_path):
+        fpath = tmp_path / "br001001.h5"
+        with h5py.File(fpath, 'w') as f:
+            ds = f.create_dataset("Data", data=np.ones((8, 9, 7), dtype=np.float32), compression='gzip')
+            for i, (label, size) in enumerate([("dim1", 7), ("dim2", 9), ("dim3", 8)]):
+                sc = f.create_dataset(label, data=np.linspace(0.0, 1.0, size, dtype=np.float32))
+                ds.dims[i].attach_scale(sc)
+                ds.dims[i].label = label
+        reader = PsiData(fpath, model='mas', cache='mmap')
+        assert not reader.data_cached
+        reader.read(scales=False)
+        assert reader.data_cached
+        assert not isinstance(reader._vcache, np.memmap)
+        reader.close()
+
+    def test_cache_setter_to_mmap_maps(self, psi_h5_mas_file):
+        reader = PsiData(psi_h5_mas_file, model='mas', cache='lazy')
+        reader.cache = 'mmap'
+        assert isinstance(reader._vcache, np.memmap)
+        reader.close()
+
 
 # ===========================================================================
 # clear() selective flags and recursion
@@ -911,6 +956,128 @@ class TestInterp:
         reader.close()
 
 
+class TestInterpNumpyEngine:
+    def test_matches_default_engine(self, psi_h5_mas_file):
+        reader = PsiData(psi_h5_mas_file, model='mas')
+        positions = np.column_stack([[0.2, 0.5], [0.3, 0.6], [0.4, 0.7]])
+        result = reader.interp(positions, engine='numpy')
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result.value, 1.0, rtol=1e-6)
+        reader.close()
+
+    def test_cached_engine(self, psi_h5_mas_file):
+        from psi_io.psi_io import _NpGridInterpolator
+        reader = PsiData(psi_h5_mas_file, model='mas', cache='lazy')
+        positions = np.column_stack([[0.5], [0.5], [0.5]])
+        reader.load()
+        reader.interp(positions, engine='numpy')
+        assert isinstance(reader._icache, _NpGridInterpolator)
+        reader.interp(positions)
+        assert isinstance(reader._icache, _NpGridInterpolator)
+        if _HAS_SCIPY:
+            reader.interp(positions, engine='scipy')
+            assert not isinstance(reader._icache, _NpGridInterpolator)
+        reader.close()
+
+
+    def test_interpolation_plan(self, psi_h5_mas_file):
+        from psi_io import InterpolationPlan
+        reader = PsiData(psi_h5_mas_file, model='mas')
+        positions = np.column_stack([[0.2, 0.5], [0.3, 0.6], [0.4, 0.7]])
+        plan = InterpolationPlan([scale[:] for scale in reader.scales], *positions.T)
+        result = reader.interp(plan, unit='Gauss')
+        assert result.unit == u.Gauss
+        np.testing.assert_allclose(result, reader.interp(positions, unit='Gauss', engine='numpy'), rtol=1e-6)
+        with pytest.raises(ValueError, match="grid"):
+            reader.interp(InterpolationPlan([scale[:][:-1] for scale in reader.scales], *positions.T))
+        reader.close()
+
+
+    def test_tiled(self, psi_h5_mas_file):
+        reader = PsiData(psi_h5_mas_file, model='mas')
+        positions = np.column_stack([[0.05, 0.5, 0.95], [0.1, 0.6, 0.9], [0.2, 0.7, 0.99]])
+        result = reader.interp(positions, unit='Gauss', engine='numpy', tile_shape=2, workers=2)
+        np.testing.assert_allclose(result, reader.interp(positions, unit='Gauss', engine='numpy'), rtol=1e-6)
+        with pytest.raises(ValueError, match="outside the grid"):
+            reader.interp(positions + 1, tile_shape=2)
+        assert np.isnan(reader.interp(positions + 1, tile_shape=2, engine='numpy', bounds_error=False)).all()
+        reader.close()
+
+    @pytest.mark.parametrize("cache", [None, 'lazy'])
+    def test_strategies(self, ramp_h5_file, cache):
+        positions = np.column_stack([[0.05, 0.5, 0.95], [0.1, 0.6, 0.9], [0.2, 0.7, 0.99]])
+        with PsiData(ramp_h5_file, model='mas', cache=cache) as reader:
+            expected = reader.interp(positions, engine='numpy', strategy='window')
+            for strategy in ('auto', 'tiles', 'points', 'full'):
+                result = reader.interp(positions, engine='numpy', strategy=strategy)
+                assert result.unit == expected.unit
+                np.testing.assert_allclose(result, expected, rtol=1e-6)
+            with pytest.raises(ValueError, match="outside the grid"):
+                reader.interp(positions + 1, strategy='points')
+            assert np.isnan(reader.interp(positions + 1, strategy='points', bounds_error=False)).all()
+            with pytest.raises(ValueError, match="strategy"):
+                reader.interp(positions, strategy='slab')
+
+    @pytest.mark.parametrize("cache", [None, 'eager'])
+    def test_point_query(self, ramp_h5_file, cache):
+        positions = np.column_stack([[0.05, 0.5, 0.95], [0.1, 0.6, 0.9], [0.2, 0.7, 0.99]])
+        with PsiData(ramp_h5_file, model='mas', cache=cache) as reader:
+            expected = reader.interp(positions, engine='numpy').value
+            with reader.point_query() as query:
+                result = [query(*position) for position in positions]
+            assert np.isnan(reader.point_query(bounds_error=False)(*(positions[0] + 1)))
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
+# ===========================================================================
+# regrid() method
+# ===========================================================================
+
+class TestRegrid:
+    @pytest.fixture
+    def reader(self, tmp_path):
+        fpath = tmp_path / "br001001.h5"
+        r, t, p = np.linspace(1.0, 2.0, 7), np.linspace(0.0, 3.0, 9), np.linspace(0.0, 6.0, 8)
+        data = np.add.outer(np.add.outer(p, t), r).astype(np.float32)
+        with h5py.File(fpath, 'w') as f:
+            ds = f.create_dataset("Data", data=data)
+            for i, (label, scale) in enumerate([("dim1", r), ("dim2", t), ("dim3", p)]):
+                sc = f.create_dataset(label, data=scale.astype(np.float32))
+                ds.dims[i].attach_scale(sc)
+                ds.dims[i].label = label
+        reader = PsiData(fpath, model='mas')
+        yield reader
+        reader.close()
+
+    def test_linear_field_is_reproduced(self, reader):
+        r, p = np.linspace(1.1, 1.9, 4), np.linspace(0.5, 5.5, 3)
+        data, r_, t_, p_ = reader.regrid(r, None, p, slab_nbytes=1)
+        assert data.shape == (3, 9, 4) and data.dtype == np.float32
+        assert r_.unit == reader.scales.r.unit and np.allclose(r_.value, r)
+        expected = np.add.outer(np.add.outer(p, t_.value), r)
+        np.testing.assert_allclose(data.value, expected, rtol=1e-5)
+
+    def test_units_order_and_out(self, reader):
+        r = np.linspace(1.1, 1.9, 4)
+        data = reader.regrid(r, scales=False, unit='Gauss', order='C')
+        assert data.unit == u.Gauss and data.shape == (4, 9, 8)
+        out = np.empty((8, 9, 4), dtype=np.float64)
+        result = reader.regrid(r, scales=False, out=out, dtype='float64')
+        assert np.shares_memory(result, out)
+        np.testing.assert_allclose(result.to_value(u.Gauss), data.value.T, rtol=1e-5)
+
+    def test_plan(self, reader):
+        from psi_io import RegridPlan
+        scales = [scale[:] for scale in reader.scales]
+        plan = RegridPlan(scales, np.linspace(1.1, 1.9, 4), None, None)
+        np.testing.assert_array_equal(reader.regrid(plan, scales=False),
+                                      reader.regrid(np.linspace(1.1, 1.9, 4), scales=False))
+        with pytest.raises(ValueError, match="grid"):
+            reader.regrid(RegridPlan([s[:-1] for s in scales], None, None, None))
+        with pytest.raises(ValueError, match="out of bounds"):
+            reader.regrid(np.array([0.5, 1.5]))
+
+
 # ===========================================================================
 # vslice() method
 # ===========================================================================
@@ -1013,3 +1180,338 @@ class TestCoordinateScaleReaders:
     def test_scale_values_monotonically_increasing(self, mas_reader):
         r = mas_reader.scales.r.read()
         assert np.all(np.diff(r.value) > 0)
+
+
+# ===========================================================================
+# Caller-supplied output buffers
+# ===========================================================================
+
+@pytest.fixture(scope='module')
+def ramp_h5_file(tmp_path_factory):
+    """MAS br file (br002001.h5) whose data varies along every axis."""
+    fpath = tmp_path_factory.mktemp("mhd_io_out") / "br002001.h5"
+    nr, nt, np_ = 7, 9, 8
+    data = np.arange(np_ * nt * nr, dtype=np.float32).reshape(np_, nt, nr)
+    with h5py.File(fpath, 'w') as f:
+        ds = f.create_dataset("Data", data=data)
+        for i, (label, size) in enumerate([("dim1", nr), ("dim2", nt), ("dim3", np_)]):
+            sc = f.create_dataset(label, data=np.linspace(0.0, 1.0, size, dtype=np.float32))
+            ds.dims[i].attach_scale(sc)
+            ds.dims[i].label = label
+    return fpath
+
+
+class TestReadOut:
+    @pytest.mark.parametrize("cache", [None, 'eager'])
+    def test_read_fills_out(self, ramp_h5_file, cache):
+        with PsiData(ramp_h5_file, model='mas', cache=cache) as reader:
+            expected, *expected_scales = reader.read(1, (2, 6), None)
+            out = np.empty(expected.shape, dtype=np.float32)
+            data, *scales = reader.read(1, (2, 6), None, out=out)
+        assert np.shares_memory(data, out)
+        assert data.unit == expected.unit
+        assert np.array_equal(data, expected)
+        for scale, expected_scale in zip(scales, expected_scales):
+            assert np.array_equal(scale, expected_scale)
+
+    def test_read_converts_units_in_place(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            expected = reader.read(None, 3, None, unit='Gauss', scales=False)
+            out = np.empty(expected.shape)
+            data = reader.read(None, 3, None, unit='Gauss', scales=False, out=out)
+        assert data.unit == u.Gauss
+        assert np.shares_memory(data, out)
+        assert np.allclose(data, expected)
+
+    def test_read_transposed_order(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            expected = reader.read(order='C', scales=False)
+            out = np.empty(expected.shape, dtype=np.float32)
+            reader.read(order='C', scales=False, out=out)
+        assert np.array_equal(out, expected.value)
+
+    def test_read_remeshed_is_copied(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            expected = reader.read(mesh='main', scales=False)
+            out = np.empty(expected.shape, dtype=np.float32)
+            data = reader.read(mesh='main', scales=False, out=out)
+        assert np.shares_memory(data, out)
+        assert np.allclose(out, expected.value)
+
+    def test_vslice_fills_out(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            expected = reader.vslice(0.4, None, None, scales=False)
+            out = np.empty(expected.shape)
+            data = reader.vslice(0.4, None, None, scales=False, out=out)
+        assert np.shares_memory(data, out)
+        assert np.allclose(out, expected.value)
+
+    def test_buffer_pool_steady_state(self, ramp_h5_file):
+        pool = BufferPool()
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            first = reader.read(None, None, 0, scales=False, out=pool)
+            buffer = first.base
+            pool.release(first)
+            for i in range(1, 4):
+                data = reader.read(None, None, i, scales=False, out=pool)
+                assert data.base is buffer
+                assert np.array_equal(data, reader.read(None, None, i, scales=False))
+                pool.release(data)
+
+    def test_wrong_shape_raises(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            with pytest.raises(ValueError, match="shape"):
+                reader.read(scales=False, out=np.empty((2, 2, 2), dtype=np.float32))
+
+    def test_integer_out_raises(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            with pytest.raises(TypeError):
+                reader.read(scales=False, out=np.empty(reader.shape[::-1], dtype=np.int32))
+
+
+class TestScaleCache:
+    def test_uncached_scales_read_once_per_file(self, ramp_h5_file):
+        clear_meta_cache()
+        with PsiData(ramp_h5_file, model='mas', cache=None) as reader:
+            for _ in range(3):
+                reader.vslice(0.4, None, None, scales=False)
+            assert not any(scale.data_cached for scale in reader.scales)
+            assert meta_cache_info().misses == len(reader.scales)
+            r = reader.scales.r.read()
+        assert np.array_equal(r.value, np.linspace(0.0, 1.0, 7, dtype=np.float32))
+
+    def test_lazy_scales_cache_shared_values(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas', cache='lazy') as reader:
+            reader.vslice(0.4, None, None)
+            assert reader.scales.r.data_cached
+            assert not reader.scales.r._vcache.flags.writeable
+
+
+# ===========================================================================
+# Strided reads
+# ===========================================================================
+
+class TestStridedRead:
+    @pytest.mark.parametrize("cache", [None, 'eager'])
+    @pytest.mark.parametrize("mesh", [None, 'main'])
+    def test_matches_subsampled_full_read(self, ramp_h5_file, cache, mesh):
+        with PsiData(ramp_h5_file, model='mas', cache=cache) as reader:
+            full, *full_scales = reader.read(mesh=mesh)
+            data, r, t, p = reader.read((None, None, 2), (1, None, 3), slice(None, None, 2), mesh=mesh)
+        assert np.allclose(data, full[::2, 1::3, ::2])
+        for scale, full_scale, si in zip((r, t, p), full_scales, (slice(None, None, 2), slice(1, None, 3), slice(None, None, 2))):
+            assert np.allclose(scale, full_scale[si])
+
+    def test_strided_read_into_out(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            expected = reader.read((None, None, 3), None, (1, 7, 2), scales=False)
+            out = np.empty(expected.shape, dtype=np.float32)
+            data = reader.read((None, None, 3), None, (1, 7, 2), scales=False, out=out)
+        assert np.shares_memory(data, out)
+        assert np.array_equal(out, expected.value)
+
+
+# ===========================================================================
+# Pyramid levels
+# ===========================================================================
+
+@pytest.fixture
+def pyramid_h5_file(tmp_path, ramp_h5_file):
+    from psi_io import build_hdf_pyramid
+    fpath = tmp_path / ramp_h5_file.name
+    fpath.write_bytes(ramp_h5_file.read_bytes())
+    return build_hdf_pyramid(fpath, 2, mesh=0b100)
+
+
+class TestPyramidLevels:
+    def test_level_reader_shares_metadata(self, pyramid_h5_file):
+        with PsiData(pyramid_h5_file, model='mas') as reader:
+            overview = reader.level(1)
+            assert overview.shape == (5, 5, 5)
+            assert (overview.name, overview.unit, overview.mesh) == (reader.name, reader.unit, reader.mesh)
+            assert reader.level(1) is overview
+            assert reader.level(0) is reader
+        assert overview._ref is None
+
+    def test_read_level(self, pyramid_h5_file):
+        from psi_io.mesh import coarsen_array
+        with PsiData(pyramid_h5_file, model='mas') as reader:
+            full = reader.read(scales=False)
+            data, r, t, p = reader.read(level=1)
+            remeshed = reader.read(None, (1, 3), None, level=2, mesh='main', scales=False)
+        assert np.allclose(data.value, coarsen_array(full.value, reader.mesh))
+        assert (r.size, t.size, p.size) == (5, 5, 5)
+        assert remeshed.shape == (3, 2, 3)
+
+    def test_hdf4_level_raises(self, tmp_path):
+        pytest.importorskip("pyhdf")
+        from psi_io import write_hdf_data
+        fpath = write_hdf_data(tmp_path / "br002001.hdf", np.ones((8, 9, 7), dtype=np.float32),
+                               np.linspace(0, 1, 7, dtype=np.float32),
+                               np.linspace(0, 1, 9, dtype=np.float32),
+                               np.linspace(0, 1, 8, dtype=np.float32))
+        with PsiData(fpath, model='mas') as reader:
+            with pytest.raises(ValueError, match="HDF5"):
+                reader.read(level=1)
+
+
+class TestReadDtype:
+    @pytest.mark.parametrize("cache", [None, 'lazy'])
+    def test_read_converts(self, ramp_h5_file, cache):
+        with PsiData(ramp_h5_file, model='mas', cache=cache) as reader:
+            expected, *expected_scales = reader.read(None, (2, 6), 1)
+            data, *scales = reader.read(None, (2, 6), 1, dtype=np.float64)
+        assert data.dtype == np.float64
+        assert np.array_equal(data, expected)
+        assert [scale.dtype for scale in scales] == [scale.dtype for scale in expected_scales]
+
+    def test_remeshed_and_strided_read(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            expected = reader.read((None, None, 2), None, None, mesh='main', scales=False)
+            data = reader.read((None, None, 2), None, None, mesh='main', scales=False, dtype='float64')
+        assert data.dtype == np.float64
+        assert np.allclose(data, expected)
+
+    def test_vslice_converts(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            expected = reader.vslice(0.4, None, None, scales=False)
+            data = reader.vslice(0.4, None, None, scales=False, dtype=np.float16)
+        assert data.dtype == np.float16
+        assert np.allclose(data.value, expected.value, rtol=1e-3)
+
+    def test_load_converts_cache(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas', cache='mmap') as reader:
+            reader.load(dtype=np.float64)
+            assert reader._vcache.dtype == np.float64
+            assert not isinstance(reader._vcache, np.memmap)
+            assert reader.read(scales=False).dtype == np.float64
+
+    def test_out_dtype_mismatch_raises(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            out = np.empty(reader.shape[::-1], dtype=np.float32)
+            with pytest.raises(ValueError, match="dtype"):
+                reader.read(scales=False, out=out, dtype=np.float64)
+
+    def test_integer_dtype_raises(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            with pytest.raises(TypeError, match="floating-point"):
+                reader.read(dtype=np.int32)
+
+
+# ===========================================================================
+# Sequence files
+# ===========================================================================
+
+@pytest.fixture
+def sequence_h5_file(tmp_path, ramp_h5_file):
+    """Sequence file (br.h5) holding three entries of the ramp data, offset by 100 * index."""
+    from psi_io import HdfSequenceWriter, read_hdf_data
+    data, *scales = read_hdf_data(ramp_h5_file)
+    fpath = tmp_path / "br.h5"
+    with HdfSequenceWriter(fpath) as writer:
+        for i, sequence in enumerate((2001, 2002, 2004)):
+            writer.append(data + 100 * i, *scales, sequence=sequence, time=1.5 * i)
+    return fpath
+
+
+class TestSequenceFile:
+    def test_factory_returns_sequence_reader(self, sequence_h5_file, ramp_h5_file):
+        from psi_io.mhd_io import H5SequenceData
+        with PsiData(sequence_h5_file, model='mas') as reader:
+            assert isinstance(reader, H5SequenceData)
+            assert reader.sequence == 2001
+            assert list(reader.sequences) == [2001, 2002, 2004]
+            assert reader.times.tolist() == [0.0, 1.5, 3.0]
+        with PsiData(ramp_h5_file, model='mas') as reader:
+            assert type(reader) is H5Data
+
+    @pytest.mark.parametrize("cache", [None, 'lazy', 'eager', 'mmap'])
+    def test_read_by_sequence(self, sequence_h5_file, ramp_h5_file, cache):
+        with PsiData(ramp_h5_file, model='mas') as ramp:
+            expected, *expected_scales = ramp.read()
+            expected_slice = ramp.read(None, (2, 6), 1, scales=False)
+            expected_meta = (ramp.shape, ramp.name, ramp.unit, ramp.mesh)
+        with PsiData(sequence_h5_file, model='mas', sequence=2004, cache=cache) as reader:
+            assert (reader.shape, reader.name, reader.unit, reader.mesh) == expected_meta
+            assert reader.time == 3.0
+            data, *scales = reader.read()
+            assert np.array_equal(data.value, expected.value + 200)
+            for scale, expected_scale in zip(scales, expected_scales):
+                assert np.array_equal(scale, expected_scale)
+            assert np.array_equal(reader.read(None, (2, 6), 1, scales=False).value, expected_slice.value + 200)
+            assert np.array_equal(reader.read(None, (2, 6), 1, scales=False, dtype=np.float64).value,
+                                  expected_slice.value + 200)
+
+    def test_switch_sequence(self, sequence_h5_file):
+        with PsiData(sequence_h5_file, model='mas') as reader:
+            first = reader.read(scales=False)
+            first_slice = reader.vslice(0.5, None, None, scales=False)
+            assert reader.data_cached
+            reader.sequence = 2002
+            assert not reader.data_cached
+            assert np.array_equal(reader.read(scales=False).value, first.value + 100)
+            assert np.allclose(reader.vslice(0.5, None, None, scales=False).value, first_slice.value + 100)
+
+    def test_missing_sequence_raises(self, sequence_h5_file):
+        with pytest.raises(KeyError, match="2003"):
+            PsiData(sequence_h5_file, model='mas', sequence=2003)
+        with PsiData(sequence_h5_file, model='mas') as reader:
+            with pytest.raises(KeyError, match="2005"):
+                reader.sequence = 2005
+            assert reader.sequence == 2001
+
+
+class TestSwmrReading:
+    def test_refresh_follows_writer(self, tmp_path, ramp_h5_file):
+        from psi_io import HdfSequenceWriter, read_hdf_data
+        data, *scales = read_hdf_data(ramp_h5_file)
+        fpath = tmp_path / "br.h5"
+        with HdfSequenceWriter(fpath, swmr=True) as writer:
+            writer.append(data, *scales, sequence=1)
+            with PsiData(fpath, model='mas', swmr=True, cache='eager') as reader:
+                assert list(reader.sequences) == [1]
+                writer.append(data + 1, sequence=2)
+                assert list(reader.sequences) == [1, 2]
+                reader.sequence = 2
+                assert np.array_equal(reader.read(scales=False).value, data + 1)
+                assert reader.refresh() is reader
+                assert reader.data_cached
+
+    def test_per_sequence_file(self, ramp_h5_file):
+        with PsiData(ramp_h5_file, model='mas') as ramp:
+            expected = ramp.read(scales=False)
+        with PsiData(ramp_h5_file, model='mas', swmr=True) as reader:
+            assert np.array_equal(reader.refresh().read(scales=False).value, expected.value)
+
+    def test_hdf4_raises(self, tmp_path):
+        pytest.importorskip("pyhdf")
+        from psi_io import write_hdf_data
+        fpath = write_hdf_data(tmp_path / "br002001.hdf", np.ones((8, 9, 7), dtype=np.float32))
+        with pytest.raises(ValueError, match="SWMR"):
+            PsiData(fpath, model='mas', swmr=True)
+
+
+class TestH4SlabReads:
+    @pytest.fixture
+    def h4_ramp_file(self, tmp_path, ramp_h5_file):
+        pytest.importorskip("pyhdf")
+        from psi_io import read_hdf_data, write_hdf_data
+        data, *scales = read_hdf_data(ramp_h5_file)
+        return write_hdf_data(tmp_path / "br002001.hdf", data.astype(np.float64), *scales)
+
+    def test_reads_stream_by_slab(self, h4_ramp_file, ramp_h5_file, monkeypatch):
+        import psi_io.mhd_io as mhd_io_module
+        calls = []
+        read_h4_slabs = mhd_io_module._read_h4_slabs
+        monkeypatch.setattr(mhd_io_module, '_read_h4_slabs',
+                            lambda *args, **kwargs: calls.append(args[1]) or read_h4_slabs(*args, **kwargs))
+        with PsiData(ramp_h5_file, model='mas') as ramp:
+            expected = ramp.read(None, (2, 6), 1, scales=False)
+        with PsiData(h4_ramp_file, model='mas', cache=None) as reader:
+            data = reader.read(None, (2, 6), 1, scales=False, dtype=np.float32)
+            assert data.dtype == np.float32
+            assert np.array_equal(data.value, expected.value)
+        assert calls
+        with PsiData(h4_ramp_file, model='mas', cache='lazy') as reader:
+            reader.load(dtype=np.float32)
+            assert reader.read(scales=False).dtype == np.float32
@@ -0,0 +1,153 @@
+"""Unit tests for psi_io.migrate."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+from numpy.testing import assert_array_equal
+
+pytest.importorskip("pyhdf")
+
+from psi_io import read_hdf_data, write_hdf_data
+from psi_io.migrate import (
+    MANIFEST_NAME,
+    dataset_checksums,
+    main,
+    migrate_hdf4_to_hdf5,
+)
+from tests.utils import generate_mock_data
+
+
+@pytest.fixture
+def hdf4_tree(tmp_path):
+    root = tmp_path / "runs"
+    for i, sub in enumerate(("run1", "run1", "run2/helio")):
+        fdata, *sdata = generate_mock_data(3, 'float32', True)
+        (root / sub).mkdir(parents=True, exist_ok=True)
+        write_hdf_data(root / sub / f"br00{i}.hdf", fdata + i, *sdata, units='Gauss')
+    return root
+
+
+# ===========================================================================
+# dataset_checksums
+# ===========================================================================
+
+class TestDatasetChecksums:
+
+    def test_format_independent(self, tmp_path):
+        fdata, *sdata = generate_mock_data(3, 'float64', True)
+        h4 = write_hdf_data(tmp_path / "a.hdf", fdata, *sdata, dataset_id='x')
+        h5 = write_hdf_data(tmp_path / "a.h5", fdata, *sdata, dataset_id='x', compression='gzip')
+        assert dataset_checksums(h4) == dataset_checksums(h5, slab_nbytes=1)
+
+    def test_detects_changed_values(self, tmp_path):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        a = write_hdf_data(tmp_path / "a.h5", fdata, *sdata)
+        fdata[0, 0] += 1
+        b = write_hdf_data(tmp_path / "b.h5", fdata, *sdata)
+        assert dataset_checksums(a) != dataset_checksums(b)
+
+    def test_detects_changed_scales(self, tmp_path):
+        fdata, *sdata = generate_mock_data(2, 'float32', True)
+        a = write_hdf_data(tmp_path / "a.h5", fdata, *sdata)
+        b = write_hdf_data(tmp_path / "b.h5", fdata, sdata[0] * 2, sdata[1])
+        assert dataset_checksums(a) != dataset_checksums(b)
+
+
+# ===========================================================================
+# migrate_hdf4_to_hdf5
+# ===========================================================================
+
+class TestMigrate:
+
+    def test_converts_tree(self, tmp_path, hdf4_tree):
+        dest = tmp_path / "out"
+        records = migrate_hdf4_to_hdf5(hdf4_tree, dest, workers=2)
+        assert [r.status for r in records] == ['converted'] * 3
+        for record in records:
+            assert record.output.endswith('.h5')
+            assert os.path.relpath(record.output, dest)[:-3] == os.path.relpath(record.source, hdf4_tree)[:-4]
+            expected, *_ = read_hdf_data(record.source)
+            result, *_ = read_hdf_data(record.output, dataset_id='Data-Set-2')
+            assert_array_equal(result, expected)
+        assert not list(dest.rglob("*.partial.h5"))
+
+    def test_psi_mode_renames_dataset(self, tmp_path, hdf4_tree):
+        records = migrate_hdf4_to_hdf5(hdf4_tree, tmp_path / "out", psi=True, workers=1)
+        for record in records:
+            assert_array_equal(read_hdf_data(record.output)[0], read_hdf_data(record.source)[0])
+            assert list(record.checksums) == ['Data']
+
+    def test_resumes_from_manifest(self, tmp_path, hdf4_tree):
+        dest = tmp_path / "out"
+        migrate_hdf4_to_hdf5(hdf4_tree, dest, workers=1)
+        records = migrate_hdf4_to_hdf5(hdf4_tree, dest, workers=1)
+        assert [r.status for r in records] == ['skipped'] * 3
+
+        touched = hdf4_tree / "run2" / "helio" / "br002.hdf"
+        os.utime(touched, ns=(touched.stat().st_atime_ns, touched.stat().st_mtime_ns + 10**9))
+        records = migrate_hdf4_to_hdf5(hdf4_tree, dest, workers=1)
+        assert [r.status for r in records] == ['skipped', 'skipped', 'converted']
+
+        entries = [json.loads(line) for line in (dest / MANIFEST_NAME).read_text().splitlines()]
+        assert len(entries) == 4
+
+    def test_force_reconverts(self, tmp_path, hdf4_tree):
+        migrate_hdf4_to_hdf5(hdf4_tree, tmp_path / "out", workers=1)
+        records = migrate_hdf4_to_hdf5(hdf4_tree, tmp_path / "out", workers=1, force=True)
+        assert [r.status for r in records] == ['converted'] * 3
+
+    def test_glob_source(self, tmp_path, hdf4_tree):
+        records = migrate_hdf4_to_hdf5(str(hdf4_tree / "run1" / "*.hdf"), tmp_path / "out", workers=1)
+        assert len(records) == 2
+        assert all((tmp_path / "out" / f"br00{i}.h5").is_file() for i in range(2))
+
+    def test_failure_is_recorded_and_retried(self, tmp_path, hdf4_tree):
+        bad = hdf4_tree / "run1" / "bad.hdf"
+        bad.write_bytes(b"not an hdf file")
+        records = {r.source: r for r in migrate_hdf4_to_hdf5(hdf4_tree, tmp_path / "out", workers=1)}
+        assert records[str(bad)].status == 'failed'
+        assert records[str(bad)].error
+        assert not (tmp_path / "out" / "run1" / "bad.h5").exists()
+        records = {r.source: r for r in migrate_hdf4_to_hdf5(hdf4_tree, tmp_path / "out", workers=1)}
+        assert records[str(bad)].status == 'failed'
+        assert sum(r.status == 'skipped' for r in records.values()) == 3
+
+    def test_unexpected_errors_propagate(self, tmp_path, hdf4_tree, monkeypatch):
+        import psi_io.migrate as migrate_module
+
+        def broken(*args, **kwargs):
+            raise TypeError("bug")
+
+        monkeypatch.setattr(migrate_module, 'convert', broken)
+        with pytest.raises(TypeError, match="bug"):
+            migrate_hdf4_to_hdf5(hdf4_tree, tmp_path / "out", workers=1)
+
+    def test_compression_options(self, tmp_path, hdf4_tree):
+        import h5py as h5
+        records = migrate_hdf4_to_hdf5(hdf4_tree, tmp_path / "out", workers=1,
+                                       compression='gzip', shuffle=True)
+        with h5.File(records[0].output, 'r') as hdf:
+            assert hdf['Data-Set-2'].compression == 'gzip'
+
+
+# ===========================================================================
+# Command-line entry point
+# ===========================================================================
+
+def test_main(tmp_path, hdf4_tree, capsys):
+    assert main([str(hdf4_tree), str(tmp_path / "out"), "-j", "1", "--psi"]) == 0
+    assert "3 converted, 0 skipped, 0 failed" in capsys.readouterr().out
+    assert main([str(hdf4_tree), str(tmp_path / "out"), "-j", "1", "--psi"]) == 0
+    assert "0 converted, 3 skipped, 0 failed" in capsys.readouterr().out
+
+
+def test_main_storage_options(tmp_path, hdf4_tree):
+    import h5py as h5
+    assert main([str(hdf4_tree), str(tmp_path / "out"), "-j", "1", "--psi",
+                 "--compression", "gzip", "--shuffle", "--fletcher32"]) == 0
+    with h5.File(tmp_path / "out" / "run1" / "br000.h5", 'r') as hdf:
+        assert hdf['Data'].compression == 'gzip'
+        assert hdf['Data'].shuffle and hdf['Data'].fletcher32